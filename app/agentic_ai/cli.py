@@ -293,6 +293,7 @@ def _handle_cmd_prompt(session_state: dict) -> None:
         fact_check_results=session_state.get("fact_check_results", []),
         search_results=session_state.get("search_results", {}),
         scraped_pages=session_state.get("scraped_pages", []),
+        formatted_data_sources=session_state.get("formatted_data_sources", ""),
     )
     print_section("Current System Prompt")
     print(prompt)
@@ -17,6 +17,20 @@ SEARCH_TIMEOUT_PER_QUERY = 35.0
 SCRAPE_TIMEOUT_PER_PAGE = 30.0
 FACT_CHECK_TIMEOUT = 30.0
 
+# per-request deadline: run_fact_check puts it in state and nodes/tools size
+# their timeouts from what is left, skipping optional work when it runs low
+REQUEST_DEADLINE_SECONDS = 90.0
+ADJUDICATION_RESERVE_SECONDS = 25.0   # below this, stop gathering and adjudicate
+RETRY_MIN_REMAINING_SECONDS = 45.0    # below this, prepare_retry won't start a retry
+ADJUDICATION_MIN_TIMEOUT = 10.0       # adjudication attempts never get less than this
+MIN_CALL_TIMEOUT = 2.0                # floor for deadline-clamped tool timeouts
+
+# hedged requests to the custom search server (opt-in): when a call runs past
+# the observed latency quantile, fire one backup and take whichever returns first
+SEARCH_HEDGING_ENABLED = False
+SEARCH_HEDGE_QUANTILE = 0.95
+SEARCH_HEDGE_MAX_RATIO = 0.1       # at most ~10% extra requests
+
 # web search domain configuration
 DOMAIN_SEARCHES: dict[str, dict] = {
     "geral": {
@@ -42,6 +56,62 @@ DOMAIN_SEARCHES: dict[str, dict] = {
 # link expansion settings
 LINK_SCRAPE_TIMEOUT_PER_URL = 30.0
 MAX_LINKS_TO_EXPAND = 5
+# first wait_for_async pass only waits this long: links ready by then are
+# injected and slower ones keep running for the next pass (which waits for all)
+LINK_SOFT_WAIT_SECONDS = 5.0
+# fired link tasks nobody collected (run failed or took another path) are
+# cancelled and dropped after this long; the registry never holds more
+# than MAX_PENDING_LINK_TASKS (oldest evicted first)
+LINK_TASK_TTL_SECONDS = 300.0
+MAX_PENDING_LINK_TASKS = 256
+
+# speculative first-round prefetch: format_input fires fact-check + web searches
+# on the claim text while the first context_agent LLM call runs; the tool node
+# adds the finished results to state as sources
+SPECULATIVE_PREFETCH_ENABLED = True
+PREFETCH_QUERY_MAX_CHARS = 200
+# prefetches of runs that end without taking them are discarded by the run;
+# anything left behind is cancelled and dropped after this long, and the
+# registry never holds more than MAX_PENDING_PREFETCH_TASKS (oldest first)
+PREFETCH_TASK_TTL_SECONDS = 120.0
+MAX_PENDING_PREFETCH_TASKS = 256
+
+# message-history compaction for the context agent: tool results older than
+# the last HISTORY_KEEP_RECENT_TOOL_ROUNDS rounds are already rendered in the
+# system prompt and are sent as short receipts; recent ones are compacted too
+# when the history exceeds HISTORY_TOKEN_BUDGET
+HISTORY_COMPACTION_ENABLED = True
+HISTORY_KEEP_RECENT_TOOL_ROUNDS = 1
+HISTORY_TOKEN_BUDGET = 8000
+
+# offline prompt-size estimate used by the token budgets (no tokenizer call)
+CHARS_PER_TOKEN = 4
+
+# adjudication prompt: when the rendered sources exceed this many tokens the
+# lowest-value ones (duplicate urls, lower reliability tier, worse search rank)
+# are left out; kept sources keep their run-wide [N] numbers
+ADJUDICATION_CONTEXT_TOKEN_BUDGET = 12000
+
+# lexical (BM25) relevance of sources to the input: the agent and adjudication
+# prompts list the most relevant sources first in each section, and adjudication
+# leaves out those scoring below RELEVANCE_MIN_SCORE_RATIO x the best one (the
+# RELEVANCE_MIN_SOURCES best are always kept). scraped pages are scored on their
+# first RELEVANCE_SCRAPE_CHARS.
+# kinds in RELEVANCE_EXEMPT_KINDS are ranked but never left out: a fact-check
+# written in english or a trusted outlet's paraphrase can share no terms with the input
+RELEVANCE_RANKING_ENABLED = True
+RELEVANCE_MIN_SCORE_RATIO = 0.1
+RELEVANCE_MIN_SOURCES = 8
+RELEVANCE_SCRAPE_CHARS = 2000
+RELEVANCE_EXEMPT_KINDS = frozenset({"fact_check", "especifico"})
+
+# near-duplicate collapsing in the tool node: search hits / scraped pages with the
+# same normalized url (AMP folded) or MinHash-estimated text similarity of at least
+# NEAR_DUPLICATE_THRESHOLD keep only their most reliable entry. texts shorter than
+# NEAR_DUPLICATE_MIN_TOKENS tokens are only compared by url
+NEAR_DUPLICATE_COLLAPSE_ENABLED = True
+NEAR_DUPLICATE_THRESHOLD = 0.7
+NEAR_DUPLICATE_MIN_TOKENS = 8
 
 # default LLM model for the context agent
 DEFAULT_MODEL = "gemini-2.5-flash-lite"
@@ -14,12 +14,14 @@ from typing import Optional
 from langgraph.graph import END
 from langchain_core.messages import HumanMessage, RemoveMessage
 
-from app.agentic_ai.config import MAX_RETRY_COUNT
+from app.agentic_ai.config import MAX_RETRY_COUNT, RETRY_MIN_REMAINING_SECONDS
 from app.agentic_ai.prompts.context_formatter import (
+    ContextFormatter,
     build_source_reference_list,
     filter_cited_references,
 )
 from app.agentic_ai.state import ContextAgentState
+from app.agentic_ai.utils.deadline import has_budget, remaining
 from app.models.agenticai import FactCheckApiContext, GoogleSearchContext, WebScrapeContext
 from app.models.factchecking import FactCheckResult, VerdictTypeEnum
 
@@ -112,13 +114,16 @@ def _get_cited_numbers(
     search_results: dict[str, list[GoogleSearchContext]],
     scraped_pages: list[WebScrapeContext],
     adjudication_result: FactCheckResult,
+    numbering: Optional[dict[str, int]] = None,
 ) -> set[int]:
     """find which [N] source numbers were cited in the adjudication output.
 
     reuses build_source_reference_list (numbering) and filter_cited_references
     (regex extraction) from context_formatter.
     """
-    refs = build_source_reference_list(fact_check_results, search_results, scraped_pages)
+    refs = build_source_reference_list(
+        fact_check_results, search_results, scraped_pages, numbering=numbering
+    )
     texts = [adjudication_result.overall_summary or ""]
     for ds in adjudication_result.results:
         for cv in ds.claim_verdicts:
@@ -136,6 +141,7 @@ def _filter_to_cited_sources(
     search_results: dict[str, list[GoogleSearchContext]],
     scraped_pages: list[WebScrapeContext],
     cited: set[int],
+    numbering: Optional[dict[str, int]] = None,
 ) -> tuple[
     list[FactCheckApiContext],
     dict[str, list[GoogleSearchContext]],
@@ -144,8 +150,22 @@ def _filter_to_cited_sources(
     """keep only sources whose [N] number is in cited. returns (fc, search, scraped).
 
     walks sources in the same order as build_source_reference_list so the
-    counter-to-source mapping is consistent.
+    counter-to-source mapping is consistent. with an incremental numbering
+    (ContextFormatter.numbering) each source is looked up by id instead.
     """
+    if numbering is not None:
+        def _is_cited(entry) -> bool:
+            return numbering.get(entry.id) in cited
+
+        return (
+            [e for e in fact_check_results if _is_cited(e)],
+            {
+                key: [e for e in search_results.get(key, []) if _is_cited(e)]
+                for key in (*_SOURCE_DOMAIN_ORDER, "geral")
+            },
+            [e for e in scraped_pages if _is_cited(e)],
+        )
+
     counter = 1
 
     retained_fc = []
@@ -188,6 +208,14 @@ async def prepare_retry_node(state: ContextAgentState) -> dict:
         logger.info("prepare_retry: no retry needed")
         return {}
 
+    deadline = state.get("deadline")
+    if not has_budget(deadline, RETRY_MIN_REMAINING_SECONDS):
+        logger.info(
+            f"prepare_retry: skipping retry, only {remaining(deadline):.1f}s left "
+            f"(need {RETRY_MIN_REMAINING_SECONDS}s)"
+        )
+        return {}
+
     messages = state.get("messages", [])
     used_queries = _extract_used_queries(messages)
     tool_summaries = _extract_tool_summaries(messages)
@@ -203,8 +231,12 @@ async def prepare_retry_node(state: ContextAgentState) -> dict:
     fc = state.get("fact_check_results", [])
     sr = state.get("search_results", {})
     sp = state.get("scraped_pages", [])
-    cited = _get_cited_numbers(fc, sr, sp, result)
-    retained_fc, retained_search, retained_scraped = _filter_to_cited_sources(fc, sr, sp, cited)
+    formatter = state.get("context_formatter")
+    numbering = formatter.numbering if formatter is not None else None
+    cited = _get_cited_numbers(fc, sr, sp, result, numbering=numbering)
+    retained_fc, retained_search, retained_scraped = _filter_to_cited_sources(
+        fc, sr, sp, cited, numbering=numbering
+    )
 
     retained_total = (
         len(retained_fc)
@@ -234,6 +266,8 @@ async def prepare_retry_node(state: ContextAgentState) -> dict:
         "fact_check_results": retained_fc,
         "search_results": retained_search,
         "scraped_pages": retained_scraped,
+        # retained sources are renumbered from [1] for the retry's adjudication
+        "context_formatter": ContextFormatter(),
     }
 
 
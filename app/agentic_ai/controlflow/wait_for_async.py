@@ -1,10 +1,16 @@
 """
-wait_for_async node — awaits pending link expansion tasks and injects
-results as DataSource objects into the graph state.
+wait_for_async node — collects link expansion results and injects them
+as DataSource objects into the graph state.
 
-collects all results at once via await_link_expansion, rebuilds the
-formatted_data_sources string with priority headers, and sends a
-system notification to the context agent.
+the first pass only waits LINK_SOFT_WAIT_SECONDS: links that finished by
+then are injected and slower ones keep running, so one slow URL (apify
+fallback) doesn't hold back the rest. pending_async_count stays > 0, and
+when the agent next stops calling tools check_edges routes back here for a
+final pass that waits for the remaining links (bounded by the per-URL
+timeout and the request deadline).
+
+each pass rebuilds the formatted_data_sources string with priority headers
+and sends a system notification to the context agent.
 """
 
 from __future__ import annotations
@@ -13,17 +19,39 @@ import logging
 
 from langchain_core.messages import HumanMessage
 
+from app.agentic_ai.config import (
+    ADJUDICATION_RESERVE_SECONDS,
+    LINK_SCRAPE_TIMEOUT_PER_URL,
+    LINK_SOFT_WAIT_SECONDS,
+)
 from app.agentic_ai.state import ContextAgentState
 from app.agentic_ai.nodes.format_input import _format_data_sources
-from app.agentic_ai.utils.link_expander import await_link_expansion
+from app.agentic_ai.utils.deadline import clamp_timeout, has_budget
+from app.agentic_ai.utils.link_expander import await_link_expansion, collect_link_expansion
 
 logger = logging.getLogger(__name__)
 
 
 async def wait_for_async_node(state: ContextAgentState) -> dict:
-    """await pending link expansion and inject results into state."""
+    """collect pending link expansion results and inject them into state."""
     run_id = state.get("run_id", "")
-    new_sources = await await_link_expansion(run_id)
+    deadline = state.get("deadline")
+    wait_count = state.get("async_wait_count", 0)
+
+    # links are scraped concurrently, so one per-URL timeout bounds the whole batch
+    timeout = (
+        clamp_timeout(LINK_SCRAPE_TIMEOUT_PER_URL, deadline, reserve=ADJUDICATION_RESERVE_SECONDS)
+        if deadline is not None else None
+    )
+
+    # soft pass only while there will be another agent turn to use late links
+    soft = wait_count == 0 and has_budget(deadline, ADJUDICATION_RESERVE_SECONDS)
+    if soft:
+        soft_timeout = LINK_SOFT_WAIT_SECONDS if timeout is None else min(LINK_SOFT_WAIT_SECONDS, timeout)
+        new_sources, still_pending = await collect_link_expansion(run_id, timeout=soft_timeout)
+    else:
+        new_sources = await await_link_expansion(run_id, timeout=timeout)
+        still_pending = 0
     successful = [ds for ds in new_sources if ds.original_text]
 
     # rebuild formatted_data_sources with original + new link sources
@@ -39,12 +67,21 @@ async def wait_for_async_node(state: ContextAgentState) -> dict:
             "IMPORTANTE: Considere este conteudo adicional na sua analise.\n\n"
             f"{expanded_formatted}"
         )
+    elif still_pending:
+        msg = "[sistema] Nenhum link expandido ainda. Continue com as fontes disponiveis."
     else:
         msg = "[sistema] Nenhum link expandido. Continue com as fontes disponiveis."
 
+    if still_pending:
+        msg += (
+            f"\n\n[sistema] {still_pending} link(s) ainda em processamento; "
+            "o conteudo sera enviado quando estiver pronto."
+        )
+
     return {
         "messages": [HumanMessage(content=msg)],
-        "pending_async_count": 0,
+        "pending_async_count": still_pending,
+        "async_wait_count": wait_count + 1,
         "data_sources": successful,  # appended via operator.add reducer
         "formatted_data_sources": formatted,  # last-write-wins (rebuilt from all sources)
     }
@@ -11,8 +11,8 @@ from __future__ import annotations
 import json
 import logging
 from typing import Any
-from uuid import uuid4
 
+from langchain_core.messages import ToolMessage
 from langchain_core.tools import tool
 from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import ToolNode, tools_condition
@@ -29,9 +29,18 @@ from app.agentic_ai.state import ContextAgentState, _merge_search_results
 from app.agentic_ai.nodes.context_agent import make_context_agent_node
 from app.agentic_ai.nodes.adjudication import make_adjudication_node
 from app.agentic_ai.nodes.check_edges import check_edges as check_edges_router
-from app.agentic_ai.nodes.format_input import format_input_node
+from app.agentic_ai.nodes.format_input import (
+    format_input_node,
+    make_format_input_node,
+    take_prefetch_results,
+)
 from app.agentic_ai.nodes.retry_context_agent import make_retry_context_agent_node
 from app.agentic_ai.controlflow.wait_for_async import wait_for_async_node
+from app.agentic_ai.config import (
+    ADJUDICATION_RESERVE_SECONDS,
+    NEAR_DUPLICATE_COLLAPSE_ENABLED,
+    SPECULATIVE_PREFETCH_ENABLED,
+)
 from app.agentic_ai.controlflow.prepare_retry import (
     prepare_retry_node,
     route_after_prepare_retry,
@@ -41,6 +50,8 @@ from app.agentic_ai.tools.protocols import (
     WebSearchProtocol,
     PageScraperProtocol,
 )
+from app.agentic_ai.utils.deadline import deadline_scope, has_budget, remaining
+from app.agentic_ai.utils.near_duplicates import collapse_near_duplicates
 
 logger = logging.getLogger(__name__)
 
@@ -50,10 +61,15 @@ def _make_tools(
     web_searcher: WebSearchProtocol,
     page_scraper: PageScraperProtocol,
 ) -> list:
-    """create LangChain @tool functions that delegate to protocol implementations."""
+    """create LangChain @tool functions that delegate to protocol implementations.
+
+    each tool returns (content, artifact): content is the compact JSON string the
+    LLM sees, artifact is the typed result list/dict that tool_node_with_state_update
+    appends to state as-is (no serialize/parse round-trip, no dropped fields).
+    """
 
-    @tool
-    async def search_fact_check_api(queries: list[str]) -> str:
+    @tool(response_format="content_and_artifact")
+    async def search_fact_check_api(queries: list[str]) -> tuple[str, list[FactCheckApiContext]]:
         """search fact-checking databases for existing verdicts on claims.
         returns results classified as 'Muito confiável'.
         queries: list of search query strings."""
@@ -70,20 +86,21 @@ def _make_tools(
             }
             for r in results
         ]
-        return json.dumps(
+        content = json.dumps(
             {
                 "results": items,
                 "_summary": {"total_results": len(items)},
             },
             ensure_ascii=False,
         )
+        return content, list(results)
 
-    @tool
+    @tool(response_format="content_and_artifact")
     async def search_web(
         queries: list[str],
         max_results_specific_search: int = 12,
         max_results_general: int = 7,
-    ) -> str:
+    ) -> tuple[str, dict[str, list[GoogleSearchContext]]]:
         """search the web across general and domain-specific sources (unified).
         queries: list with exactly 1 search query string. only one query per call is allowed.
         max_results_specific_search: max results for domain-specific sources (default 15).
@@ -106,15 +123,16 @@ def _make_tools(
         total = sum(len(entries) for entries in output.values())
         per_domain = {k: len(v) for k, v in output.items() if v}
         output["_summary"] = {"total_results": total, "per_domain": per_domain}
-        return json.dumps(output, ensure_ascii=False)
+        return json.dumps(output, ensure_ascii=False), results
 
-    @tool
-    async def scrape_pages(targets: list[dict]) -> str:
+    @tool(response_format="content_and_artifact")
+    async def scrape_pages(targets: list[dict]) -> tuple[str, list[WebScrapeContext]]:
         """extract full content from web pages.
         targets: list of objects with 'url' and 'title' fields."""
         parsed_targets = [ScrapeTarget(url=t["url"], title=t["title"]) for t in targets]
         results = await page_scraper.scrape(parsed_targets)
-        return json.dumps(
+        # the LLM only needs a preview; the full content goes to state via the artifact
+        content = json.dumps(
             [
                 {
                     "id": r.id,
@@ -127,6 +145,7 @@ def _make_tools(
             ],
             ensure_ascii=False,
         )
+        return content, list(results)
 
     # attach protocol refs so tool_node_with_state_update can access them
     search_fact_check_api._protocol = fact_checker  # type: ignore[attr-defined]
@@ -141,98 +160,64 @@ def _make_tool_node_with_state_update(
     fact_checker: FactCheckSearchProtocol,
     web_searcher: WebSearchProtocol,
     page_scraper: PageScraperProtocol,
+    collapse: bool = NEAR_DUPLICATE_COLLAPSE_ENABLED,
 ) -> Any:
     """
     create a node that runs the ToolNode and also updates typed state fields.
 
     LangGraph's built-in ToolNode only updates the messages list.
-    this wrapper additionally parses tool results and appends to the
-    typed context lists in state.
+    this wrapper additionally takes each ToolMessage's typed artifact and
+    appends it to the typed context lists in state, together with the
+    speculative prefetch results once they have finished, collapsing
+    near-duplicate sources into their most reliable copy when collapse is on.
     """
     tool_node = ToolNode(tools)
 
     async def tool_node_with_state_update(state: ContextAgentState) -> dict:
-        # run the actual tool node
-        result = await tool_node.ainvoke(state)
+        # run the actual tool node; tools size their timeouts from the request deadline
+        with deadline_scope(state.get("deadline")):
+            result = await tool_node.ainvoke(state)
         messages = result.get("messages", [])
 
-        # parse tool outputs and accumulate into typed state
+        # accumulate typed artifacts into state
         new_fact_checks: list[FactCheckApiContext] = []
         new_search_results: dict[str, list[GoogleSearchContext]] = {}
         new_scraped: list[WebScrapeContext] = []
 
         for msg in messages:
-            if not hasattr(msg, "name") or not hasattr(msg, "content"):
-                continue
-
-            try:
-                data = json.loads(msg.content) if isinstance(msg.content, str) else msg.content
-            except (json.JSONDecodeError, TypeError):
+            artifact = getattr(msg, "artifact", None)
+            if artifact is None:
+                # tool errored (ToolNode returns an error message without artifact)
                 continue
 
             if msg.name == "search_fact_check_api":
-                items = data.get("results", data) if isinstance(data, dict) else data
-                if isinstance(items, list):
-                    from app.models.agenticai import SourceReliability as SR
-
-                    for item in items:
-                        new_fact_checks.append(
-                            FactCheckApiContext(
-                                id=item.get("id", str(uuid4())),
-                                url=item.get("url", ""),
-                                parent_id=None,
-                                reliability=SR.MUITO_CONFIAVEL,
-                                title=item.get("title", ""),
-                                publisher=item.get("publisher", ""),
-                                rating=item.get("rating", ""),
-                                claim_text=item.get("claim_text", ""),
-                                review_date=item.get("review_date"),
-                            )
-                        )
-
+                new_fact_checks.extend(artifact)
             elif msg.name == "search_web":
-                if isinstance(data, dict):
-                    from app.models.agenticai import SourceReliability
-                    from app.agentic_ai.config import DOMAIN_SEARCHES
-
-                    for domain_key, entries in data.items():
-                        if domain_key == "_summary":
-                            continue
-                        reliability = DOMAIN_SEARCHES.get(
-                            domain_key, {}
-                        ).get("reliability", SourceReliability.NEUTRO)
-                        if domain_key not in new_search_results:
-                            new_search_results[domain_key] = []
-                        for item in entries:
-                            new_search_results[domain_key].append(
-                                GoogleSearchContext(
-                                    id=item.get("id", str(uuid4())),
-                                    url=item.get("url", ""),
-                                    parent_id=None,
-                                    reliability=reliability,
-                                    title=item.get("title", ""),
-                                    snippet=item.get("snippet", ""),
-                                    domain=item.get("domain", ""),
-                                )
-                            )
-
+                new_search_results = _merge_search_results(new_search_results, artifact)
             elif msg.name == "scrape_pages":
-                if isinstance(data, list):
-                    from app.models.agenticai import SourceReliability
-
-                    for item in data:
-                        new_scraped.append(
-                            WebScrapeContext(
-                                id=item.get("id", str(uuid4())),
-                                url=item.get("url", ""),
-                                parent_id=None,
-                                reliability=SourceReliability.POUCO_CONFIAVEL,
-                                title=item.get("title", ""),
-                                content=item.get("content_preview", ""),
-                                extraction_status=item.get("extraction_status", ""),
-                                extraction_tool="",
-                            )
-                        )
+                new_scraped.extend(artifact)
+
+        # finished speculative searches join as sources, minus urls already gathered
+        prefetched_fc, prefetched_search = take_prefetch_results(state.get("run_id", ""))
+        if prefetched_fc or prefetched_search:
+            seen_urls = {
+                e.url
+                for entries in (
+                    state.get("fact_check_results", []),
+                    new_fact_checks,
+                    *state.get("search_results", {}).values(),
+                    *new_search_results.values(),
+                )
+                for e in entries
+            }
+            new_fact_checks.extend(e for e in prefetched_fc if e.url not in seen_urls)
+            new_search_results = _merge_search_results(
+                new_search_results,
+                {
+                    key: [e for e in entries if e.url not in seen_urls]
+                    for key, entries in prefetched_search.items()
+                },
+            )
 
         # count actual new items (not just truthy dict with empty lists)
         new_search_count = sum(len(v) for v in new_search_results.values())
@@ -241,7 +226,7 @@ def _make_tool_node_with_state_update(
         existing_scraped = len(state.get("scraped_pages", []))
 
         logger.debug(
-            f"tool_node parsed: {len(new_fact_checks)} new fact_check, "
+            f"tool_node collected: {len(new_fact_checks)} new fact_check, "
             f"{new_search_count} new search, {len(new_scraped)} new scraped "
             f"(state has {existing_fc} fc, {existing_search} search, {existing_scraped} scraped)"
         )
@@ -256,11 +241,79 @@ def _make_tool_node_with_state_update(
         if new_scraped:
             update["scraped_pages"] = state.get("scraped_pages", []) + new_scraped
 
+        if collapse and len(update) > 1:
+            # existing lists are already collapsed, so only kinds with new entries can
+            # change; their entries were already numbered for the agent and always stay
+            presented = {
+                e.id
+                for entries in (
+                    state.get("fact_check_results", []),
+                    *state.get("search_results", {}).values(),
+                    state.get("scraped_pages", []),
+                )
+                for e in entries
+            }
+            fc, sr, sp, collapsed = collapse_near_duplicates(
+                update.get("fact_check_results", state.get("fact_check_results", [])),
+                update.get("search_results", state.get("search_results", {})),
+                update.get("scraped_pages", state.get("scraped_pages", [])),
+                state.get("collapsed_sources", {}),
+                presented,
+            )
+            for key, value in (("fact_check_results", fc), ("search_results", sr), ("scraped_pages", sp)):
+                if key in update:
+                    update[key] = value
+            if collapsed != state.get("collapsed_sources", {}):
+                update["collapsed_sources"] = collapsed
+                logger.debug(
+                    f"tool_node collapsed near-duplicates: "
+                    f"{sum(len(m) for m in collapsed.values())} source(s) "
+                    f"into {len(collapsed)} representative(s)"
+                )
+
         return update
 
     return tool_node_with_state_update
 
 
+def _out_of_budget(state: ContextAgentState) -> bool:
+    """true when the request deadline leaves only enough time to adjudicate."""
+    deadline = state.get("deadline")
+    if has_budget(deadline, ADJUDICATION_RESERVE_SECONDS):
+        return False
+    logger.warning(
+        f"deadline: {remaining(deadline):.1f}s left, skipping further evidence gathering"
+    )
+    return True
+
+
+def _route_to_adjudication(state: ContextAgentState) -> str:
+    """still collect pending link expansion (bounded by the deadline), then adjudicate."""
+    if state.get("pending_async_count", 0) > 0:
+        return "wait_for_async"
+    return "adjudication"
+
+
+async def _skip_tools_node(state: ContextAgentState) -> dict:
+    """
+    answer the agent's pending tool calls without running them.
+
+    used when the deadline leaves no time for the tools: every tool call gets
+    a reply, so the history adjudication and a retry see stays well-formed.
+    """
+    last_msg = state["messages"][-1]
+    return {
+        "messages": [
+            ToolMessage(
+                content="skipped: not enough time left before the request deadline",
+                tool_call_id=call["id"],
+                name=call["name"],
+            )
+            for call in last_msg.tool_calls
+        ]
+    }
+
+
 def _make_route_after_agent(tools_node_name: str):
     """create a router for an agent node that directs to the correct tools node."""
 
@@ -271,6 +324,8 @@ def _make_route_after_agent(tools_node_name: str):
         ) if last_msg else False
 
         if has_tool_calls:
+            if _out_of_budget(state):
+                return "skip_tools"
             return tools_node_name
 
         edge = check_edges_router(state)
@@ -281,12 +336,24 @@ def _make_route_after_agent(tools_node_name: str):
     return router
 
 
+def _make_route_to_agent(agent_node_name: str):
+    """create a router back to the agent that jumps to adjudication when time is short."""
+
+    def router(state: ContextAgentState) -> str:
+        if _out_of_budget(state):
+            return _route_to_adjudication(state)
+        return agent_node_name
+
+    return router
+
+
 def build_graph(
     model: Any,
     fact_checker: FactCheckSearchProtocol,
     web_searcher: WebSearchProtocol,
     page_scraper: PageScraperProtocol,
     adjudication_model: Any = None,
+    speculative_prefetch: bool = SPECULATIVE_PREFETCH_ENABLED,
 ):
     """
     build and compile the context search loop graph.
@@ -297,6 +364,8 @@ def build_graph(
         web_searcher: web search implementation
         page_scraper: page scraper implementation
         adjudication_model: optional LLM for adjudication (defaults to model)
+        speculative_prefetch: warm search caches from format_input while the
+            first context_agent call runs
 
     returns:
         compiled LangGraph graph
@@ -313,9 +382,13 @@ def build_graph(
 
     graph = StateGraph(ContextAgentState)
 
-    graph.add_node("format_input", format_input_node)
+    if speculative_prefetch:
+        graph.add_node("format_input", make_format_input_node(fact_checker, web_searcher))
+    else:
+        graph.add_node("format_input", format_input_node)
     graph.add_node("context_agent", context_agent_node)
     graph.add_node("tools", tool_node)
+    graph.add_node("skip_tools", _skip_tools_node)
     graph.add_node("wait_for_async", wait_for_async_node)
     graph.add_node("adjudication", adjudication_node)
     graph.add_node("prepare_retry", prepare_retry_node)
@@ -331,16 +404,49 @@ def build_graph(
         _make_route_after_agent("tools"),
         {
             "tools": "tools",
+            "skip_tools": "skip_tools",
+            "wait_for_async": "wait_for_async",
+            "adjudication": "adjudication",
+        },
+    )
+
+    # tool calls skipped for the deadline: collect pending links, then adjudicate
+    graph.add_conditional_edges(
+        "skip_tools",
+        _route_to_adjudication,
+        {
+            "wait_for_async": "wait_for_async",
+            "adjudication": "adjudication",
+        },
+    )
+
+    # after tools: back to context_agent, unless the deadline is close
+    graph.add_conditional_edges(
+        "tools",
+        _make_route_to_agent("context_agent"),
+        {
+            "context_agent": "context_agent",
             "wait_for_async": "wait_for_async",
             "adjudication": "adjudication",
         },
     )
 
-    # after tools: always go back to context_agent
-    graph.add_edge("tools", "context_agent")
+    # after wait_for_async: go back to context_agent, unless the deadline is close
+    # (then drain links still loading from a soft pass before adjudicating)
+    def _route_after_wait(state: ContextAgentState) -> str:
+        if _out_of_budget(state):
+            return _route_to_adjudication(state)
+        return "context_agent"
 
-    # after wait_for_async: go back to context_agent
-    graph.add_edge("wait_for_async", "context_agent")
+    graph.add_conditional_edges(
+        "wait_for_async",
+        _route_after_wait,
+        {
+            "context_agent": "context_agent",
+            "wait_for_async": "wait_for_async",
+            "adjudication": "adjudication",
+        },
+    )
 
     # adjudication -> prepare_retry (normal) or END (on timeout error)
     def _route_after_adjudication(state: ContextAgentState) -> str:
@@ -365,11 +471,20 @@ def build_graph(
         _make_route_after_agent("retry_tools"),
         {
             "retry_tools": "retry_tools",
+            "skip_tools": "skip_tools",
+            "wait_for_async": "wait_for_async",
+            "adjudication": "adjudication",
+        },
+    )
+    graph.add_conditional_edges(
+        "retry_tools",
+        _make_route_to_agent("retry_context_agent"),
+        {
+            "retry_context_agent": "retry_context_agent",
             "wait_for_async": "wait_for_async",
             "adjudication": "adjudication",
         },
     )
-    graph.add_edge("retry_tools", "retry_context_agent")
 
     return graph.compile()
 
@@ -16,9 +16,15 @@ from uuid import uuid4
 
 from langchain_core.messages import HumanMessage, SystemMessage
 
-from app.agentic_ai.config import ADJUDICATION_MAX_RETRIES, ADJUDICATION_TIMEOUT
+from app.agentic_ai.config import (
+    ADJUDICATION_MAX_RETRIES,
+    ADJUDICATION_MIN_TIMEOUT,
+    ADJUDICATION_TIMEOUT,
+)
 from app.agentic_ai.prompts.adjudication_prompt import build_adjudication_prompt
 from app.agentic_ai.state import ContextAgentState
+from app.agentic_ai.utils.deadline import has_budget, remaining
+from app.clients.governor import governed
 from app.models.factchecking import (
     ClaimVerdict,
     DataSourceResult,
@@ -118,6 +124,15 @@ def _make_timeout_error_result(attempts: int, timeout: float) -> FactCheckResult
     )
 
 
+def _attempt_timeout(deadline: float | None) -> float:
+    """per-attempt timeout: ADJUDICATION_TIMEOUT, shrunk to the request deadline
+    but never below ADJUDICATION_MIN_TIMEOUT — a verdict is the one thing we can't skip."""
+    left = remaining(deadline)
+    if left is None:
+        return ADJUDICATION_TIMEOUT
+    return min(ADJUDICATION_TIMEOUT, max(ADJUDICATION_MIN_TIMEOUT, left))
+
+
 def make_adjudication_node(model: Any):
     """factory that returns the adjudication node function."""
 
@@ -133,6 +148,7 @@ def make_adjudication_node(model: Any):
             scraped_pages=state.get("scraped_pages", []),
             has_audio=has_audio,
             deep_fake_verification_result=deep_fake_data,
+            formatter=state.get("context_formatter"),
         )
 
         fc_count = len(state.get("fact_check_results", []))
@@ -151,33 +167,39 @@ def make_adjudication_node(model: Any):
 
         total_attempts = 1 + ADJUDICATION_MAX_RETRIES
         result: LLMAdjudicationOutput | None = None
+        deadline = state.get("deadline")
 
         for attempt in range(total_attempts):
+            attempt_timeout = _attempt_timeout(deadline)
             try:
                 logger.info(
                     f"adjudication node: invoking LLM (attempt {attempt + 1}/{total_attempts})"
                 )
-                result = await asyncio.wait_for(
-                    structured_model.ainvoke(messages),
-                    timeout=ADJUDICATION_TIMEOUT,
-                )
+                # a GovernorTimeout (queue full) is a TimeoutError and retries the same way
+                async with governed("vertex"):
+                    result = await asyncio.wait_for(
+                        structured_model.ainvoke(messages),
+                        timeout=attempt_timeout,
+                    )
                 break  # success — exit retry loop
             except asyncio.TimeoutError:
                 logger.warning(
                     f"adjudication node: attempt {attempt + 1}/{total_attempts} "
-                    f"timed out after {ADJUDICATION_TIMEOUT}s"
+                    f"timed out after {attempt_timeout}s"
                 )
-                if attempt < ADJUDICATION_MAX_RETRIES:
+                # retry only while the request deadline still fits another attempt
+                if attempt < ADJUDICATION_MAX_RETRIES and has_budget(deadline, ADJUDICATION_MIN_TIMEOUT):
                     continue
-                # all retries exhausted
+                # all retries exhausted (or out of time)
+                attempts_made = attempt + 1
                 error_msg = (
-                    f"Adjudication timed out after {total_attempts} attempt(s) "
-                    f"({ADJUDICATION_TIMEOUT}s each)"
+                    f"Adjudication timed out after {attempts_made} attempt(s) "
+                    f"({attempt_timeout}s each)"
                 )
                 logger.error(f"adjudication node: {error_msg}")
                 return {
                     "adjudication_result": _make_timeout_error_result(
-                        total_attempts, ADJUDICATION_TIMEOUT
+                        attempts_made, attempt_timeout
                     ),
                     "adjudication_error": error_msg,
                 }
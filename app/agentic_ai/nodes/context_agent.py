@@ -13,18 +13,22 @@ from typing import Any
 
 from langchain_core.messages import AIMessage, SystemMessage
 
+from app.agentic_ai.config import HISTORY_COMPACTION_ENABLED
 from app.agentic_ai.prompts.system_prompt import build_system_prompt
+from app.agentic_ai.utils.history import compact_history
+from app.clients.governor import GovernorTimeout, governed
 from app.agentic_ai.state import ContextAgentState
 
 logger = logging.getLogger(__name__)
 
 
-def make_context_agent_node(model: Any):
+def make_context_agent_node(model: Any, compact: bool = HISTORY_COMPACTION_ENABLED):
     """
     factory that returns a context_agent node function.
 
     the returned function rebuilds the system prompt from state on each call,
-    invokes the LLM, and updates iteration_count.
+    invokes the LLM, and updates iteration_count. with compact, tool results
+    already rendered in the system prompt are sent as short receipts.
     """
 
     async def context_agent_node(state: ContextAgentState) -> dict:
@@ -33,17 +37,30 @@ def make_context_agent_node(model: Any):
             fact_check_results=state.get("fact_check_results", []),
             search_results=state.get("search_results", {}),
             scraped_pages=state.get("scraped_pages", []),
+            formatter=state.get("context_formatter"),
+            formatted_data_sources=state.get("formatted_data_sources", ""),
         )
 
         # build messages: system + conversation history (skip old system messages)
-        messages = [SystemMessage(content=system_prompt)]
-        for msg in state.get("messages", []):
-            if not isinstance(msg, SystemMessage):
-                messages.append(msg)
-
-        response = await model.ainvoke(messages)
+        history = [m for m in state.get("messages", []) if not isinstance(m, SystemMessage)]
+        if compact:
+            formatter = state.get("context_formatter")
+            history = compact_history(
+                history,
+                numbering=formatter.numbering if formatter is not None else None,
+            )
+        messages = [SystemMessage(content=system_prompt), *history]
 
         new_iteration = state.get("iteration_count", 0) + 1
+        try:
+            async with governed("vertex"):
+                response = await model.ainvoke(messages)
+        except GovernorTimeout as e:
+            # no vertex capacity before the deadline: without new tool calls the
+            # router moves on to adjudication with the evidence gathered so far
+            logger.warning(f"context_agent: {e}, proceeding with gathered context")
+            return {"iteration_count": new_iteration}
+
         logger.info(f"context_agent iteration {new_iteration}, "
                      f"tool_calls={len(response.tool_calls) if hasattr(response, 'tool_calls') else 0}")
 
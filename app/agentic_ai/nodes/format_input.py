@@ -5,22 +5,56 @@ formatted string for the context agent prompt.
 also handles link extraction and async expansion:
 - links-only input → blocks and awaits expansion here
 - text + links → fires async expansion, context_agent starts in parallel
+
+make_format_input_node() additionally fires a speculative first-round
+prefetch: fact-check + web searches on the claim text run in the background
+while the first context_agent LLM call is in flight. the tool node takes the
+finished results (take_prefetch_results) and adds them to state as sources,
+so the work is used even when the agent phrases its own queries differently.
+the prefetch runs inside the request deadline, and the run discards whatever
+it did not take when it ends (discard_prefetch).
 """
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import re
+import time
 import uuid
+from collections import OrderedDict
+from typing import Optional
 
 from langchain_core.messages import HumanMessage
 
+from app.agentic_ai.config import (
+    MAX_PENDING_PREFETCH_TASKS,
+    PREFETCH_QUERY_MAX_CHARS,
+    PREFETCH_TASK_TTL_SECONDS,
+)
 from app.agentic_ai.state import ContextAgentState
+from app.agentic_ai.tools.protocols import FactCheckSearchProtocol, WebSearchProtocol
+from app.agentic_ai.utils.deadline import current_deadline, deadline_scope, remaining
 from app.agentic_ai.utils.link_expander import (
     expand_all_links,
     fire_link_expansion,
 )
 from app.ai.pipeline.link_context_expander import extract_links
+from app.models.agenticai import FactCheckApiContext, GoogleSearchContext
 from app.models.commondata import DataSource
 
+logger = logging.getLogger(__name__)
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_MIN_PREFETCH_QUERY_CHARS = 40
+
+# run_id → (registered_at, task) until the tool node takes the results or the
+# run discards them; also keeps strong refs so tasks aren't garbage-collected
+# mid-flight. ordered oldest → newest for TTL and size-cap eviction
+_prefetch_tasks: OrderedDict[str, tuple[float, asyncio.Task]] = OrderedDict()
+
+PrefetchResults = tuple[list[FactCheckApiContext], dict[str, list[GoogleSearchContext]]]
+
 
 def _is_links_only(text: str, urls: list[str]) -> bool:
     """check if original text contains only URLs with no meaningful claim text."""
@@ -99,3 +133,159 @@ async def format_input_node(state: ContextAgentState) -> dict:
     )]
 
     return result
+
+
+# ---------------------------------------------------------------------------
+# speculative first-round prefetch
+# ---------------------------------------------------------------------------
+
+def _derive_prefetch_query(data_sources: list[DataSource]) -> str:
+    """build a search query from the leading sentence(s) of the original_text sources.
+
+    URLs are stripped; sentences are taken until the query is long enough to be
+    specific, then capped at PREFETCH_QUERY_MAX_CHARS on a word boundary.
+    returns "" when there is no claim text (e.g. links-only input).
+    """
+    texts: list[str] = []
+    for ds in data_sources:
+        if ds.source_type != "original_text":
+            continue
+        text = ds.original_text
+        for url in extract_links(text):
+            text = text.replace(url, " ")
+        texts.append(text)
+
+    text = " ".join(" ".join(texts).split())
+    if not text.strip(" \t\n\r,;:.!?"):
+        return ""
+
+    query = ""
+    for sentence in _SENTENCE_SPLIT_RE.split(text):
+        query = f"{query} {sentence}".strip()
+        if len(query) >= _MIN_PREFETCH_QUERY_CHARS:
+            break
+
+    if len(query) > PREFETCH_QUERY_MAX_CHARS:
+        query = query[:PREFETCH_QUERY_MAX_CHARS].rsplit(" ", 1)[0]
+    return query
+
+
+async def _run_prefetch(
+    query: str,
+    fact_checker: Optional[FactCheckSearchProtocol],
+    web_searcher: Optional[WebSearchProtocol],
+) -> PrefetchResults:
+    """
+    run the speculative searches; a failed search contributes no results.
+    nothing is returned once the request deadline (deadline_scope) has passed.
+    """
+
+    async def _none():
+        return None
+
+    searches = asyncio.gather(
+        fact_checker.search([query]) if fact_checker is not None else _none(),
+        web_searcher.search([query]) if web_searcher is not None else _none(),
+        return_exceptions=True,
+    )
+    try:
+        fact_checks, search_results = await asyncio.wait_for(
+            searches, timeout=remaining(current_deadline()),
+        )
+    except asyncio.TimeoutError:
+        logger.debug("speculative prefetch ran past the request deadline")
+        return [], {}
+    for r in (fact_checks, search_results):
+        if isinstance(r, Exception):
+            logger.debug(f"speculative prefetch failed: {type(r).__name__}: {r}")
+
+    return (
+        list(fact_checks) if isinstance(fact_checks, list) else [],
+        dict(search_results) if isinstance(search_results, dict) else {},
+    )
+
+
+def fire_speculative_prefetch(
+    data_sources: list[DataSource],
+    fact_checker: Optional[FactCheckSearchProtocol],
+    web_searcher: Optional[WebSearchProtocol],
+    run_id: str = "",
+) -> Optional[asyncio.Task]:
+    """fire-and-forget the first-round searches for the claim text. returns the task, if any."""
+    if fact_checker is None and web_searcher is None:
+        return None
+
+    query = _derive_prefetch_query(data_sources)
+    if not query:
+        return None
+
+    # the task inherits the caller's deadline_scope
+    task = asyncio.create_task(_run_prefetch(query, fact_checker, web_searcher))
+    discard_prefetch(run_id)
+    _prefetch_tasks[run_id or str(uuid.uuid4())] = (time.monotonic(), task)
+    _sweep_prefetch_tasks()
+    logger.debug(f"fired speculative prefetch for query: {query[:80]}")
+    return task
+
+
+def _sweep_prefetch_tasks() -> None:
+    """cancel and drop expired prefetches, then the oldest ones beyond the cap."""
+    cutoff = time.monotonic() - PREFETCH_TASK_TTL_SECONDS
+    while _prefetch_tasks:
+        run_id, (registered_at, task) = next(iter(_prefetch_tasks.items()))
+        if registered_at > cutoff:
+            break
+        del _prefetch_tasks[run_id]
+        task.cancel()
+
+    while len(_prefetch_tasks) > MAX_PENDING_PREFETCH_TASKS:
+        _run_id, (_registered_at, task) = _prefetch_tasks.popitem(last=False)
+        task.cancel()
+
+
+def take_prefetch_results(run_id: str) -> PrefetchResults:
+    """
+    results of the run's prefetch if it has finished, else ([], {}).
+
+    never waits: an unfinished prefetch stays registered for the next tool
+    round. finished results are handed out once.
+    """
+    _sweep_prefetch_tasks()
+    entry = _prefetch_tasks.get(run_id)
+    if entry is None or not entry[1].done():
+        return [], {}
+    task = _prefetch_tasks.pop(run_id)[1]
+    if task.cancelled() or task.exception() is not None:
+        return [], {}
+    return task.result()
+
+
+def discard_prefetch(run_id: str) -> None:
+    """cancel and forget the run's prefetch, if any. called when the run ends."""
+    entry = _prefetch_tasks.pop(run_id, None)
+    if entry is not None:
+        entry[1].cancel()
+
+
+def reset_prefetch_tasks() -> None:
+    """cancel and forget all prefetch tasks — useful for tests."""
+    for _registered_at, task in _prefetch_tasks.values():
+        task.cancel()
+    _prefetch_tasks.clear()
+
+
+def make_format_input_node(
+    fact_checker: Optional[FactCheckSearchProtocol] = None,
+    web_searcher: Optional[WebSearchProtocol] = None,
+):
+    """create a format_input node that also fires the speculative first-round prefetch."""
+
+    async def format_input_with_prefetch(state: ContextAgentState) -> dict:
+        result = await format_input_node(state)
+        with deadline_scope(state.get("deadline")):
+            fire_speculative_prefetch(
+                state.get("data_sources", []), fact_checker, web_searcher, result["run_id"]
+            )
+        return result
+
+    return format_input_with_prefetch
@@ -15,6 +15,7 @@ from langchain_core.messages import SystemMessage
 from app.agentic_ai.config import MAX_RETRY_ITERATIONS
 from app.agentic_ai.prompts.retry_system_prompt import build_retry_system_prompt
 from app.agentic_ai.state import ContextAgentState
+from app.clients.governor import GovernorTimeout, governed
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +35,15 @@ def make_retry_context_agent_node(model: Any):
             if not isinstance(msg, SystemMessage):
                 messages.append(msg)
 
-        response = await model.ainvoke(messages)
         new_iteration = state.get("iteration_count", 0) + 1
+        try:
+            async with governed("vertex"):
+                response = await model.ainvoke(messages)
+        except GovernorTimeout as e:
+            # no vertex capacity before the deadline: without new tool calls the
+            # router moves on to adjudication with the evidence gathered so far
+            logger.warning(f"retry_context_agent: {e}, proceeding with gathered context")
+            return {"iteration_count": new_iteration}
 
         logger.info(f"retry_context_agent iteration {new_iteration}, "
                      f"tool_calls={len(response.tool_calls) if hasattr(response, 'tool_calls') else 0}")
@@ -8,7 +8,10 @@ the LLM must extract claims AND adjudicate them in a single pass.
 
 from __future__ import annotations
 
-from app.agentic_ai.prompts.context_formatter import format_context
+from app.agentic_ai.config import ADJUDICATION_CONTEXT_TOKEN_BUDGET, RELEVANCE_RANKING_ENABLED
+from app.agentic_ai.prompts.context_formatter import ContextFormatter
+from app.agentic_ai.prompts.relevance import exempt_ids, irrelevant_ids, score_sources
+from app.agentic_ai.prompts.source_budget import drop_sources, select_sources
 from app.agentic_ai.prompts.utils import get_current_date
 from app.models.agenticai import (
     FactCheckApiContext,
@@ -173,6 +176,11 @@ Retorne sua analise como um objeto JSON estruturado conforme especificado.
 """
 
 
+OMITTED_SOURCES_NOTE = """
+
+({omitted} fonte(s) pouco relevante(s) ou de menor prioridade omitida(s) para limitar o tamanho do prompt)"""
+
+
 AUDIO_SCRIPT_BLOCK = """
 
 ## Roteiro de Audio (OBRIGATORIO para esta requisicao)
@@ -270,13 +278,56 @@ def build_adjudication_prompt(
     scraped_pages: list[WebScrapeContext],
     has_audio: bool = False,
     deep_fake_verification_result: dict | None = None,
+    formatter: ContextFormatter | None = None,
+    token_budget: int | None = ADJUDICATION_CONTEXT_TOKEN_BUDGET,
+    rank_by_relevance: bool = RELEVANCE_RANKING_ENABLED,
 ) -> tuple[str, str]:
-    """build the (system_prompt, user_prompt) pair for the adjudication LLM."""
+    """build the (system_prompt, user_prompt) pair for the adjudication LLM.
+
+    with rank_by_relevance, sources are scored (BM25) against the original
+    content: irrelevant ones (never fact-checks or trusted-site hits) are left
+    out and each section lists the most relevant first. sources beyond token_budget (None: no limit) are left
+    out by select_sources. every source is numbered first, so the kept ones
+    keep the [N] that build_source_reference_list gives them.
+    """
     current_date = get_current_date()
 
-    formatted_context = format_context(
-        fact_check_results, search_results, scraped_pages
+    # a fresh formatter numbers a single batch exactly like format_context
+    if formatter is None:
+        formatter = ContextFormatter()
+    numbering = formatter.number(fact_check_results, search_results, scraped_pages)
+
+    relevance: dict[str, float] = {}
+    omitted = 0
+    if rank_by_relevance:
+        relevance = score_sources(
+            fact_check_results, search_results, scraped_pages, formatted_data_sources
+        )
+        irrelevant = irrelevant_ids(
+            relevance,
+            exempt=exempt_ids(fact_check_results, search_results, scraped_pages),
+        )
+        if irrelevant:
+            fact_check_results, search_results, scraped_pages = drop_sources(
+                fact_check_results, search_results, scraped_pages, irrelevant
+            )
+            omitted += len(irrelevant)
+
+    if token_budget is not None:
+        selection = select_sources(
+            fact_check_results, search_results, scraped_pages, numbering, token_budget,
+            relevance=relevance,
+        )
+        fact_check_results = selection.fact_check_results
+        search_results = selection.search_results
+        scraped_pages = selection.scraped_pages
+        omitted += len(selection.dropped_ids)
+
+    formatted_context = formatter.format(
+        fact_check_results, search_results, scraped_pages, relevance=relevance
     )
+    if omitted:
+        formatted_context += OMITTED_SOURCES_NOTE.format(omitted=omitted)
 
     system = ADJUDICATION_SYSTEM_PROMPT.format(current_date=current_date)
     if has_audio:
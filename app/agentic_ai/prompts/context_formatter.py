@@ -6,6 +6,8 @@ produces globally-numbered entries so the agent can reference [N] unambiguously.
 
 from __future__ import annotations
 
+from typing import Any, Iterator, Optional
+
 from app.models.agenticai import (
     FactCheckApiContext,
     GoogleSearchContext,
@@ -13,76 +15,93 @@ from app.models.agenticai import (
 )
 
 
-def format_context(
+def _render_fact_check(number: int, entry: FactCheckApiContext) -> str:
+    return (
+        f"[{number}] Publisher: {entry.publisher} | Rating: {entry.rating}\n"
+        f"    URL: {entry.url}\n"
+        f"    Afirmação verificada: \"{entry.claim_text}\"\n"
+        f"    Data da revisão: {entry.review_date or 'N/A'}"
+    )
+
+
+def _render_search(number: int, entry: GoogleSearchContext) -> str:
+    return (
+        f"[{number}] Title: \"{entry.title}\"\n"
+        f"    URL: {entry.url} | Domain: {entry.domain}\n"
+        f"    Snippet: \"{entry.snippet}\""
+    )
+
+
+def _render_scrape(number: int, entry: WebScrapeContext) -> str:
+    content_preview = entry.content[:500] if entry.content else "(vazio)"
+    return (
+        f"[{number}] Title: \"{entry.title}\" | URL: {entry.url}\n"
+        f"    Status: {entry.extraction_status} | "
+        f"Ferramenta: {entry.extraction_tool}\n"
+        f"    Conteúdo (primeiros 500 chars): \"{content_preview}\""
+    )
+
+
+_RENDERERS = {
+    "fact_check": _render_fact_check,
+    "especifico": _render_search,
+    "geral": _render_search,
+    "scraped": _render_scrape,
+}
+
+
+def render_source(kind: str, number: int, entry: Any) -> str:
+    """the prompt block for one source of the given kind, numbered [number]."""
+    return _RENDERERS[kind](number, entry)
+
+
+def iter_sources(
     fact_check_results: list[FactCheckApiContext],
     search_results: dict[str, list[GoogleSearchContext]],
     scraped_pages: list[WebScrapeContext],
-) -> str:
-    """build the formatted context string with global numbering."""
+) -> Iterator[tuple[str, Any]]:
+    """yield (kind, entry) in the canonical [N] order shared by every consumer."""
+    for entry in fact_check_results:
+        yield "fact_check", entry
+    for entry in search_results.get("especifico", []):
+        yield "especifico", entry
+    for entry in search_results.get("geral", []):
+        yield "geral", entry
+    for entry in scraped_pages:
+        yield "scraped", entry
+
+
+def _reference_title(kind: str, entry: Any) -> str:
+    if kind == "fact_check":
+        return f"{entry.publisher}: {entry.claim_text[:80]}" if entry.claim_text else entry.publisher
+    return entry.title
+
+
+def _assemble_sections(blocks: dict[str, list[str]]) -> str:
+    """group rendered entries under their reliability headers."""
     sections: list[str] = []
-    counter = 1
 
     # === muito confiável ===
     muito_confiavel_lines: list[str] = []
-
-    # fact-check API results
-    if fact_check_results:
+    if blocks["fact_check"]:
         muito_confiavel_lines.append("### Fact-Check API")
-        for entry in fact_check_results:
-            muito_confiavel_lines.append(
-                f"[{counter}] Publisher: {entry.publisher} | Rating: {entry.rating}\n"
-                f"    URL: {entry.url}\n"
-                f"    Afirmação verificada: \"{entry.claim_text}\"\n"
-                f"    Data da revisão: {entry.review_date or 'N/A'}"
-            )
-            counter += 1
-
-    # domain-specific search results (muito confiável)
-    entries = search_results.get("especifico", [])
-    if entries:
+        muito_confiavel_lines.extend(blocks["fact_check"])
+    if blocks["especifico"]:
         muito_confiavel_lines.append("### Busca Web — Sites específicos")
-        for entry in entries:
-            muito_confiavel_lines.append(
-                f"[{counter}] Title: \"{entry.title}\"\n"
-                f"    URL: {entry.url} | Domain: {entry.domain}\n"
-                f"    Snippet: \"{entry.snippet}\""
-            )
-            counter += 1
-
+        muito_confiavel_lines.extend(blocks["especifico"])
     if muito_confiavel_lines:
         sections.append(
             "## Fontes — Muito confiável\n\n" + "\n\n".join(muito_confiavel_lines)
         )
 
     # === neutro (general web search only) ===
-    neutro_lines: list[str] = []
-
-    geral_entries = search_results.get("geral", [])
-    if geral_entries:
-        neutro_lines.append("### Busca Web — Geral")
-        for entry in geral_entries:
-            neutro_lines.append(
-                f"[{counter}] Title: \"{entry.title}\"\n"
-                f"    URL: {entry.url} | Domain: {entry.domain}\n"
-                f"    Snippet: \"{entry.snippet}\""
-            )
-            counter += 1
-
-    if neutro_lines:
+    if blocks["geral"]:
+        neutro_lines = ["### Busca Web — Geral", *blocks["geral"]]
         sections.append("## Fontes — Neutro\n\n" + "\n\n".join(neutro_lines))
 
     # === pouco confiável (scraped pages) ===
-    if scraped_pages:
-        pouco_lines = ["### Conteúdo Extraído de Páginas"]
-        for entry in scraped_pages:
-            content_preview = entry.content[:500] if entry.content else "(vazio)"
-            pouco_lines.append(
-                f"[{counter}] Title: \"{entry.title}\" | URL: {entry.url}\n"
-                f"    Status: {entry.extraction_status} | "
-                f"Ferramenta: {entry.extraction_tool}\n"
-                f"    Conteúdo (primeiros 500 chars): \"{content_preview}\""
-            )
-            counter += 1
+    if blocks["scraped"]:
+        pouco_lines = ["### Conteúdo Extraído de Páginas", *blocks["scraped"]]
         sections.append(
             "## Fontes — Pouco confiável\n\n" + "\n\n".join(pouco_lines)
         )
@@ -93,36 +112,163 @@ def format_context(
     return "\n\n".join(sections)
 
 
-def build_source_reference_list(
+def _order_blocks(
+    blocks: dict[str, list[tuple[str, str]]],
+    relevance: Optional[dict[str, float]],
+) -> dict[str, list[str]]:
+    """rendered blocks per kind, most relevant first when relevance (id → score) is given.
+
+    only the listing order changes — each block keeps its [N].
+    """
+    ordered: dict[str, list[str]] = {}
+    for kind, entries in blocks.items():
+        if relevance:
+            entries = sorted(entries, key=lambda e: -relevance.get(e[0], 0.0))
+        ordered[kind] = [block for _id, block in entries]
+    return ordered
+
+
+def format_context(
     fact_check_results: list[FactCheckApiContext],
     search_results: dict[str, list[GoogleSearchContext]],
     scraped_pages: list[WebScrapeContext],
-) -> list[tuple[int, str, str]]:
-    """build a compact (number, title, url) list using the same ordering as format_context.
+    relevance: Optional[dict[str, float]] = None,
+) -> str:
+    """build the formatted context string with global numbering.
 
-    the numbering matches the [N] references the LLM uses in adjudication justifications.
+    with relevance (entry id → score), each section lists its most relevant
+    entries first; numbering is unaffected.
     """
-    refs: list[tuple[int, str, str]] = []
+    blocks: dict[str, list[tuple[str, str]]] = {kind: [] for kind in _RENDERERS}
     counter = 1
-
-    for entry in fact_check_results:
-        title = f"{entry.publisher}: {entry.claim_text[:80]}" if entry.claim_text else entry.publisher
-        refs.append((counter, title, entry.url))
+    for kind, entry in iter_sources(fact_check_results, search_results, scraped_pages):
+        blocks[kind].append((entry.id, render_source(kind, counter, entry)))
         counter += 1
+    return _assemble_sections(_order_blocks(blocks, relevance))
 
-    for entry in search_results.get("especifico", []):
-        refs.append((counter, entry.title, entry.url))
-        counter += 1
 
-    for entry in search_results.get("geral", []):
-        refs.append((counter, entry.title, entry.url))
-        counter += 1
+class ContextFormatter:
+    """incremental, append-only formatter shared by every node of a run.
 
-    for entry in scraped_pages:
-        refs.append((counter, entry.title, entry.url))
-        counter += 1
+    each source gets its [N] once, the first time it is seen (keyed by entry id),
+    so numbering stays stable across agent iterations, adjudication and the
+    final citations. rendered entries are cached, so a call only formats the
+    sources that arrived since the previous one.
+
+    a single batch is numbered in the same order as format_context, so a run
+    whose sources all arrive at once gets identical output.
+    """
+
+    def __init__(self, numbering: Optional[dict[str, int]] = None):
+        self._numbers: dict[str, int] = dict(numbering or {})
+        self._blocks: dict[str, str] = {}
+        self._last_key: Optional[tuple[str, ...]] = None
+        self._last_text: str = ""
+
+    @property
+    def numbering(self) -> dict[str, int]:
+        """entry id → [N] for every source numbered so far."""
+        return dict(self._numbers)
+
+    def __len__(self) -> int:
+        return len(self._numbers)
+
+    def _sync(
+        self,
+        fact_check_results: list[FactCheckApiContext],
+        search_results: dict[str, list[GoogleSearchContext]],
+        scraped_pages: list[WebScrapeContext],
+    ) -> list[tuple[str, int, Any]]:
+        """number unseen sources and return (kind, number, entry) in canonical order."""
+        items: list[tuple[str, int, Any]] = []
+        next_number = max(self._numbers.values(), default=0) + 1
+        for kind, entry in iter_sources(fact_check_results, search_results, scraped_pages):
+            number = self._numbers.get(entry.id)
+            if number is None:
+                number = next_number
+                self._numbers[entry.id] = number
+                next_number += 1
+            items.append((kind, number, entry))
+        return items
+
+    def number(
+        self,
+        fact_check_results: list[FactCheckApiContext],
+        search_results: dict[str, list[GoogleSearchContext]],
+        scraped_pages: list[WebScrapeContext],
+    ) -> dict[str, int]:
+        """number any unseen sources without rendering them; returns the numbering."""
+        self._sync(fact_check_results, search_results, scraped_pages)
+        return self.numbering
+
+    def format(
+        self,
+        fact_check_results: list[FactCheckApiContext],
+        search_results: dict[str, list[GoogleSearchContext]],
+        scraped_pages: list[WebScrapeContext],
+        relevance: Optional[dict[str, float]] = None,
+    ) -> str:
+        """formatted context for the current sources, rendering only the delta.
+
+        relevance (entry id → score) lists each section's most relevant entries first.
+        """
+        items = self._sync(fact_check_results, search_results, scraped_pages)
+        key = tuple(entry.id for _, _, entry in items)
+        if key == self._last_key and not relevance:
+            return self._last_text
 
-    return refs
+        blocks: dict[str, list[tuple[str, str]]] = {kind: [] for kind in _RENDERERS}
+        for kind, number, entry in items:
+            block = self._blocks.get(entry.id)
+            if block is None:
+                block = render_source(kind, number, entry)
+                self._blocks[entry.id] = block
+            blocks[kind].append((entry.id, block))
+
+        text = _assemble_sections(_order_blocks(blocks, relevance))
+        if relevance:
+            return text
+        self._last_key = key
+        self._last_text = text
+        return text
+
+    def references(
+        self,
+        fact_check_results: list[FactCheckApiContext],
+        search_results: dict[str, list[GoogleSearchContext]],
+        scraped_pages: list[WebScrapeContext],
+    ) -> list[tuple[int, str, str]]:
+        """(number, title, url) for the current sources, sorted by number."""
+        items = self._sync(fact_check_results, search_results, scraped_pages)
+        refs = [
+            (number, _reference_title(kind, entry), entry.url)
+            for kind, number, entry in items
+        ]
+        return sorted(refs, key=lambda ref: ref[0])
+
+
+def build_source_reference_list(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    numbering: Optional[dict[str, int]] = None,
+) -> list[tuple[int, str, str]]:
+    """build a compact (number, title, url) list using the same ordering as format_context.
+
+    the numbering matches the [N] references the LLM uses in adjudication justifications.
+    pass the run's ContextFormatter.numbering when sources were numbered incrementally.
+    """
+    if numbering is not None:
+        return ContextFormatter(numbering).references(
+            fact_check_results, search_results, scraped_pages
+        )
+
+    return [
+        (counter, _reference_title(kind, entry), entry.url)
+        for counter, (kind, entry) in enumerate(
+            iter_sources(fact_check_results, search_results, scraped_pages), start=1
+        )
+    ]
 
 
 def filter_cited_references(
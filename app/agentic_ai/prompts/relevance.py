@@ -0,0 +1,161 @@
+"""
+local lexical relevance of gathered sources to the claims being checked.
+
+a small BM25 (Okapi) scorer in pure python: the corpus is a run's sources
+(dozens, not thousands), so tokenizing and scoring them costs well under a
+millisecond and needs neither a model nor a network call.
+
+text is tokenized for portuguese: lowercased, accents folded (ação → acao),
+split on non-alphanumerics, with common stopwords dropped. each source is
+represented by the text the LLM sees for it — title + snippet for search
+hits, claim + title for fact-checks, title + the start of the page for
+scraped pages — and scored against formatted_data_sources.
+
+fact-checks and trusted-site hits (RELEVANCE_EXEMPT_KINDS) are ranked like
+everything else but never cut: low lexical overlap there usually means
+another language or wording, not an unrelated source.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections import Counter
+from typing import AbstractSet, Any, Iterable
+
+from app.agentic_ai.config import (
+    RELEVANCE_EXEMPT_KINDS,
+    RELEVANCE_MIN_SCORE_RATIO,
+    RELEVANCE_MIN_SOURCES,
+    RELEVANCE_SCRAPE_CHARS,
+)
+from app.agentic_ai.prompts.context_formatter import iter_sources
+from app.models.agenticai import (
+    FactCheckApiContext,
+    GoogleSearchContext,
+    WebScrapeContext,
+)
+
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# accent-folded portuguese function words (plus the few english ones that show
+# up in titles); content words are left alone even when very common
+_STOPWORDS = frozenset("""
+a ao aos as ate com como da das de dela dele deles do dos e ela elas ele eles
+em entre era eram essa esse esta estao este eu foi foram ha isso isto ja la
+lhe mais mas me mesmo meu minha muito na nas nem no nos nossa nosso num numa
+o os ou para pela pelas pelo pelos por qual quando que quem se sem ser seu
+sua suas seus so sob sobre tambem te tem tinha to tu um uma umas uns vai voce
+sao estava pode podem sera seria ter teve nao sim
+the of and to in is for on with by at from that this it an are was be
+http https www com br html
+""".split())
+
+
+def fold(text: str) -> str:
+    """lowercase and strip accents (NFKD, combining marks dropped)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+def tokenize(text: str) -> list[str]:
+    """accent-folded, stopword-free tokens of at least two characters."""
+    return [
+        tok for tok in _TOKEN_RE.findall(fold(text))
+        if len(tok) > 1 and tok not in _STOPWORDS
+    ]
+
+
+def bm25_scores(
+    query_tokens: Iterable[str],
+    documents: list[list[str]],
+    k1: float = BM25_K1,
+    b: float = BM25_B,
+) -> list[float]:
+    """BM25 score of every tokenized document for the (deduplicated) query terms."""
+    if not documents:
+        return []
+    terms = set(query_tokens)
+    n_docs = len(documents)
+    avg_len = (sum(len(d) for d in documents) / n_docs) or 1.0
+
+    doc_freq: Counter[str] = Counter()
+    for doc in documents:
+        doc_freq.update(terms.intersection(doc))
+    idf = {
+        term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        for term, df in doc_freq.items()
+    }
+
+    scores: list[float] = []
+    for doc in documents:
+        tf = Counter(doc)
+        norm = k1 * (1 - b + b * len(doc) / avg_len)
+        scores.append(sum(
+            weight * tf[term] * (k1 + 1) / (tf[term] + norm)
+            for term, weight in idf.items()
+            if term in tf
+        ))
+    return scores
+
+
+def _source_text(kind: str, entry: Any) -> str:
+    if kind == "fact_check":
+        return f"{entry.claim_text} {entry.title}"
+    if kind == "scraped":
+        return f"{entry.title} {(entry.content or '')[:RELEVANCE_SCRAPE_CHARS]}"
+    return f"{entry.title} {entry.snippet}"
+
+
+def score_sources(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    query: str,
+) -> dict[str, float]:
+    """entry id → BM25 relevance to query. empty when the query has no usable terms."""
+    query_tokens = tokenize(query)
+    if not query_tokens:
+        return {}
+    items = list(iter_sources(fact_check_results, search_results, scraped_pages))
+    scores = bm25_scores(query_tokens, [tokenize(_source_text(k, e)) for k, e in items])
+    return {entry.id: score for (_kind, entry), score in zip(items, scores)}
+
+
+def exempt_ids(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    kinds: AbstractSet[str] = RELEVANCE_EXEMPT_KINDS,
+) -> set[str]:
+    """ids of the sources whose kind (fact_check, a search domain key, scraped) is in kinds."""
+    return {
+        entry.id
+        for kind, entry in iter_sources(fact_check_results, search_results, scraped_pages)
+        if kind in kinds
+    }
+
+
+def irrelevant_ids(
+    relevance: dict[str, float],
+    min_ratio: float = RELEVANCE_MIN_SCORE_RATIO,
+    min_sources: int = RELEVANCE_MIN_SOURCES,
+    exempt: AbstractSet[str] = frozenset(),
+) -> set[str]:
+    """
+    ids scoring below min_ratio × the best score, except those in exempt.
+
+    the min_sources best-scoring sources are always kept, so a claim phrased
+    differently from its coverage (or in another language) still has
+    evidence. nothing is cut when no source matches at all.
+    """
+    best = max(relevance.values(), default=0.0)
+    if best <= 0 or len(relevance) <= min_sources:
+        return set()
+    ranked = sorted(relevance, key=lambda i: relevance[i], reverse=True)
+    floor = best * min_ratio
+    return {i for i in ranked[min_sources:] if relevance[i] < floor and i not in exempt}
@@ -0,0 +1,147 @@
+"""
+token-budgeted source selection for the adjudication prompt.
+
+heavy runs accumulate dozens of search hits and scraped pages; rendering all
+of them makes the adjudication prompt long enough to push the call toward
+ADJUDICATION_TIMEOUT. select_sources estimates each rendered entry offline
+and, when the total is over budget, leaves out the lowest-value ones:
+
+1. duplicates — a url already covered by a higher-value source
+2. lower tier — scraped pages (least reliable first), then general
+   search, then trusted-site search; fact-checks go last
+3. lower lexical relevance to the input, when scores are given
+4. worse search rank (position) within a tier
+5. later arrivals
+
+the kept sources are returned in their original order and must be rendered
+with the run's numbering, so [N] still matches build_source_reference_list.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from app.agentic_ai.config import ADJUDICATION_CONTEXT_TOKEN_BUDGET
+from app.agentic_ai.prompts.context_formatter import iter_sources, render_source
+from app.agentic_ai.utils.tokens import estimate_tokens
+from app.clients.page_content_cache import canonicalize_url
+from app.models.agenticai import (
+    FactCheckApiContext,
+    GoogleSearchContext,
+    SourceReliability,
+    WebScrapeContext,
+)
+
+logger = logging.getLogger(__name__)
+
+_KIND_TIER = {"fact_check": 0, "especifico": 1, "geral": 2}
+# scraped pages rank below every search tier, ordered by their reliability
+_SCRAPED_TIER = {
+    SourceReliability.MUITO_CONFIAVEL: 3,
+    SourceReliability.NEUTRO: 4,
+    SourceReliability.POUCO_CONFIAVEL: 5,
+}
+
+
+@dataclass
+class SourceSelection:
+    """sources that fit the budget, plus what was left out."""
+    fact_check_results: list[FactCheckApiContext]
+    search_results: dict[str, list[GoogleSearchContext]]
+    scraped_pages: list[WebScrapeContext]
+    tokens: int = 0
+    dropped_ids: list[str] = field(default_factory=list)
+
+
+def _tier(kind: str, entry: Any) -> int:
+    if kind in _KIND_TIER:
+        return _KIND_TIER[kind]
+    return _SCRAPED_TIER.get(entry.reliability, 5)
+
+
+def _rank(entry: Any) -> int:
+    """search position (1 = top hit); unranked entries sort first within their tier."""
+    return getattr(entry, "position", 0) or 0
+
+
+def drop_sources(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    ids: set[str],
+) -> tuple[list[FactCheckApiContext], dict[str, list[GoogleSearchContext]], list[WebScrapeContext]]:
+    """the three source collections without the entries whose id is in ids."""
+    return (
+        [e for e in fact_check_results if e.id not in ids],
+        {key: [e for e in entries if e.id not in ids] for key, entries in search_results.items()},
+        [e for e in scraped_pages if e.id not in ids],
+    )
+
+
+def select_sources(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    numbering: dict[str, int],
+    token_budget: int = ADJUDICATION_CONTEXT_TOKEN_BUDGET,
+    relevance: Optional[dict[str, float]] = None,
+) -> SourceSelection:
+    """
+    highest-value sources whose rendered entries fit in token_budget.
+
+    numbering must already cover every source (ContextFormatter.number) so
+    the estimates use the real [N] prefixes. relevance (entry id → score)
+    orders sources within a tier. when everything fits, the inputs are
+    returned unchanged.
+    """
+    items = list(iter_sources(fact_check_results, search_results, scraped_pages))
+    costs = [
+        estimate_tokens(render_source(kind, numbering.get(entry.id, 0), entry))
+        for kind, entry in items
+    ]
+    total = sum(costs)
+    if total <= token_budget:
+        return SourceSelection(fact_check_results, search_results, scraped_pages, tokens=total)
+
+    # best first: tier, relevance, rank, then arrival order; duplicates of
+    # an already-seen url are pushed behind everything else
+    relevance = relevance or {}
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (
+            _tier(*items[i]),
+            -relevance.get(items[i][1].id, 0.0),
+            _rank(items[i][1]),
+            i,
+        ),
+    )
+    seen_urls: set[str] = set()
+    unique: list[int] = []
+    duplicates: list[int] = []
+    for i in order:
+        url = canonicalize_url(items[i][1].url) if items[i][1].url else ""
+        if url and url in seen_urls:
+            duplicates.append(i)
+        else:
+            seen_urls.add(url)
+            unique.append(i)
+
+    kept: set[int] = set()
+    used = 0
+    for i in unique + duplicates:
+        if used + costs[i] <= token_budget:
+            kept.add(i)
+            used += costs[i]
+
+    dropped_ids = [entry.id for i, (_kind, entry) in enumerate(items) if i not in kept]
+    logger.info(
+        f"adjudication source budget: kept {len(kept)}/{len(items)} source(s), "
+        f"~{used}/{total} tokens (budget {token_budget})"
+    )
+
+    fc, search, scraped = drop_sources(
+        fact_check_results, search_results, scraped_pages, set(dropped_ids)
+    )
+    return SourceSelection(fc, search, scraped, tokens=used, dropped_ids=dropped_ids)
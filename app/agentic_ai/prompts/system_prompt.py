@@ -4,8 +4,9 @@ system prompt template and builder for the context agent.
 
 from __future__ import annotations
 
-from app.agentic_ai.config import MAX_ITERATIONS
-from app.agentic_ai.prompts.context_formatter import format_context
+from app.agentic_ai.config import MAX_ITERATIONS, RELEVANCE_RANKING_ENABLED
+from app.agentic_ai.prompts.context_formatter import ContextFormatter, format_context
+from app.agentic_ai.prompts.relevance import score_sources
 from app.agentic_ai.prompts.utils import get_current_date
 from app.models.agenticai import (
     FactCheckApiContext,
@@ -95,9 +96,29 @@ def build_system_prompt(
     search_results: dict[str, list[GoogleSearchContext]],
     scraped_pages: list[WebScrapeContext],
     max_iterations: int = MAX_ITERATIONS,
+    formatter: ContextFormatter | None = None,
+    formatted_data_sources: str = "",
+    rank_by_relevance: bool = RELEVANCE_RANKING_ENABLED,
 ) -> str:
-    """assemble the full system prompt with current state."""
-    formatted = format_context(fact_check_results, search_results, scraped_pages)
+    """assemble the full system prompt with current state.
+
+    with rank_by_relevance and the formatted input, each section of the
+    gathered sources lists the most relevant (BM25) to the input first.
+    """
+    relevance: dict[str, float] = {}
+    if rank_by_relevance and formatted_data_sources:
+        relevance = score_sources(
+            fact_check_results, search_results, scraped_pages, formatted_data_sources
+        )
+
+    if formatter is not None:
+        formatted = formatter.format(
+            fact_check_results, search_results, scraped_pages, relevance=relevance
+        )
+    else:
+        formatted = format_context(
+            fact_check_results, search_results, scraped_pages, relevance=relevance
+        )
 
     return SYSTEM_PROMPT_TEMPLATE.format(
         current_date=get_current_date(),
@@ -9,7 +9,10 @@ usage from FastAPI or any async caller:
 
 from __future__ import annotations
 
+import threading
+import uuid
 from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
 
 from app.models.commondata import DataSource
 from app.models.agenticai import FactCheckApiContext, GoogleSearchContext, WebScrapeContext
@@ -18,7 +21,11 @@ from app.agentic_ai.config import (
     DEFAULT_MODEL,
     ADJUDICATION_MODEL,
     ADJUDICATION_THINKING_BUDGET,
+    REQUEST_DEADLINE_SECONDS,
 )
+from app.agentic_ai.nodes.format_input import discard_prefetch
+from app.agentic_ai.prompts.context_formatter import ContextFormatter
+from app.agentic_ai.utils.deadline import make_deadline
 from app.observability.logger.logger import get_logger
 
 
@@ -30,23 +37,51 @@ class GraphOutput:
     search_results: dict[str, list[GoogleSearchContext]] = field(default_factory=dict)
     scraped_pages: list[WebScrapeContext] = field(default_factory=list)
     error: str | None = None
+    # entry id → [N] as seen by adjudication (None: plain format_context order)
+    source_numbers: dict[str, int] | None = None
+    # near-duplicate sources left out: representative url → member urls
+    collapsed_sources: dict[str, list[str]] = field(default_factory=dict)
+
+
+@dataclass
+class GraphEvent:
+    """progress event emitted by stream_fact_check for each node transition."""
+    node: str
+    data: dict = field(default_factory=dict)
+    output: GraphOutput | None = None
+
 
 logger = get_logger(__name__)
 
 
-def _build_graph():
+@dataclass(frozen=True)
+class GraphConfig:
+    """model configuration that identifies a compiled graph in the registry."""
+    model: str = DEFAULT_MODEL
+    adjudication_model: str = ADJUDICATION_MODEL
+    adjudication_thinking_budget: int = ADJUDICATION_THINKING_BUDGET
+
+
+# process-wide registry: compiled graphs are stateless and safe to share
+# across concurrent ainvoke calls, so each worker builds them once per config
+_graph_registry: dict[GraphConfig, Any] = {}
+_active_config = GraphConfig()
+_registry_lock = threading.Lock()
+
+
+def _build_graph(config: GraphConfig = GraphConfig()):
     """build the context agent graph with real tool implementations."""
-    from app.llms.vertex import make_vertex_chat
+    from app.llms.vertex import get_vertex_chat
     from app.agentic_ai.graph import build_graph
     from app.agentic_ai.tools.fact_check_search import FactCheckSearchTool
     from app.agentic_ai.tools.web_search import WebSearchTool
     from app.agentic_ai.tools.page_scraper import PageScraperTool
 
-    model = make_vertex_chat(DEFAULT_MODEL, temperature=0)
-    adj_model = make_vertex_chat(
-        ADJUDICATION_MODEL,
+    model = get_vertex_chat(config.model, temperature=0)
+    adj_model = get_vertex_chat(
+        config.adjudication_model,
         temperature=0,
-        thinking_budget=ADJUDICATION_THINKING_BUDGET,
+        thinking_budget=config.adjudication_thinking_budget,
     )
     fact_checker = FactCheckSearchTool()
     web_searcher = WebSearchTool()
@@ -55,47 +90,81 @@ def _build_graph():
     return build_graph(model, fact_checker, web_searcher, page_scraper, adj_model)
 
 
-# ---------------------------------------------------------------------------
-# public API
-# ---------------------------------------------------------------------------
+def get_graph(config: GraphConfig | None = None):
+    """return the compiled graph for config (defaults to the active one), building it once."""
+    config = config or _active_config
+    graph = _graph_registry.get(config)
+    if graph is not None:
+        return graph
 
-async def run_fact_check(
-    data_sources: list[DataSource],
-    deep_fake_verification_result=None,
-) -> GraphOutput:
-    """run the full agentic fact-checking graph on a list of DataSources.
+    with _registry_lock:
+        graph = _graph_registry.get(config)
+        if graph is None:
+            logger.info(f"compiling fact-check graph for {config}")
+            graph = _build_graph(config)
+            _graph_registry[config] = graph
+    return graph
 
-    args:
-        data_sources: one or more DataSource objects to verify.
 
-    returns:
-        GraphOutput with FactCheckResult and collected source lists for citation mapping.
+def swap_graph_config(config: GraphConfig) -> GraphConfig:
+    """hot-swap the active graph config. returns the previous config.
+
+    the new graph is compiled before the switch, so requests never wait on it;
+    in-flight runs keep the graph they already hold.
     """
-    from app.agentic_ai.graph import extract_output
+    global _active_config
+    get_graph(config)
+    with _registry_lock:
+        previous = _active_config
+        _active_config = config
+    logger.info(f"active fact-check graph config swapped: {previous} -> {config}")
+    return previous
 
-    graph = _build_graph()
 
+def clear_graph_registry() -> None:
+    """drop all compiled graphs and reset the active config — useful for tests."""
+    global _active_config
+    with _registry_lock:
+        _graph_registry.clear()
+        _active_config = GraphConfig()
+
+
+def _build_initial_state(
+    data_sources: list[DataSource],
+    deep_fake_verification_result=None,
+    deadline: float | None = None,
+) -> dict:
+    """initial graph state for a fact-check run."""
     has_audio = any(ds.source_type == "audio_transcript" for ds in data_sources)
 
-    initial_state = {
+    return {
+        "run_id": str(uuid.uuid4()),
         "messages": [],
         "data_sources": data_sources,
         "fact_check_results": [],
         "search_results": {},
         "scraped_pages": [],
+        "collapsed_sources": {},
+        "context_formatter": ContextFormatter(),
         "iteration_count": 0,
         "pending_async_count": 0,
+        "async_wait_count": 0,
         "formatted_data_sources": "",
         "adjudication_result": None,
         "retry_count": 0,
         "retry_context": None,
+        "deadline": deadline,
         "has_audio": has_audio,
         "deep_fake_verification_result": (
             deep_fake_verification_result.model_dump() if deep_fake_verification_result else None
         ),
     }
 
-    final_state = await graph.ainvoke(initial_state)
+
+def _to_graph_output(final_state: dict) -> GraphOutput:
+    """convert the final graph state into a GraphOutput."""
+    from app.agentic_ai.graph import extract_output
+
     output = extract_output(final_state)
 
     # extract source lists and error from graph state
@@ -103,6 +172,8 @@ async def run_fact_check(
     sr_results = final_state.get("search_results", {})
     sp_results = final_state.get("scraped_pages", [])
     adj_error = final_state.get("adjudication_error")
+    formatter = final_state.get("context_formatter")
+    collapsed = final_state.get("collapsed_sources") or {}
 
     if isinstance(output, FactCheckResult):
         return GraphOutput(
@@ -111,6 +182,8 @@ async def run_fact_check(
             search_results=sr_results,
             scraped_pages=sp_results,
             error=adj_error,
+            source_numbers=formatter.numbering if formatter is not None else None,
+            collapsed_sources=collapsed,
         )
 
     # fallback: no adjudication result (shouldn't happen in production)
@@ -121,4 +194,116 @@ async def run_fact_check(
         search_results=sr_results,
         scraped_pages=sp_results,
         error=adj_error,
+        collapsed_sources=collapsed,
     )
+
+
+def _summarize_tool_call(tool_call: dict) -> dict:
+    """tool name plus its queries (search tools) or target count (scrape_pages)."""
+    args = tool_call.get("args", {})
+    if "queries" in args:
+        return {"name": tool_call["name"], "queries": args["queries"]}
+    return {"name": tool_call["name"], "targets": len(args.get("targets", []))}
+
+
+def summarize_node_update(node: str, update: dict) -> dict:
+    """compact, JSON-safe summary of a node's state update for progress events."""
+    update = update or {}
+    summary: dict[str, Any] = {}
+
+    if node == "format_input":
+        summary["pending_links"] = update.get("pending_async_count", 0)
+        summary["expanded_links"] = len(update.get("data_sources", []))
+
+    elif node in ("context_agent", "retry_context_agent"):
+        summary["iteration"] = update.get("iteration_count", 0)
+        messages = update.get("messages", [])
+        tool_calls = (getattr(messages[-1], "tool_calls", None) or []) if messages else []
+        summary["tool_calls"] = [_summarize_tool_call(tc) for tc in tool_calls]
+
+    elif node in ("tools", "retry_tools"):
+        summary["tool_results"] = len(update.get("messages", []))
+        if "fact_check_results" in update:
+            summary["fact_check_total"] = len(update["fact_check_results"])
+        if "search_results" in update:
+            summary["search_total"] = sum(len(v) for v in update["search_results"].values())
+        if "scraped_pages" in update:
+            summary["scraped_total"] = len(update["scraped_pages"])
+        if "collapsed_sources" in update:
+            summary["collapsed_total"] = sum(len(m) for m in update["collapsed_sources"].values())
+
+    elif node == "wait_for_async":
+        summary["expanded_links"] = len(update.get("data_sources", []))
+
+    elif node == "adjudication":
+        result = update.get("adjudication_result")
+        summary["claims"] = (
+            sum(len(r.claim_verdicts) for r in result.results) if result else 0
+        )
+        if update.get("adjudication_error"):
+            summary["error"] = update["adjudication_error"]
+
+    elif node == "prepare_retry":
+        summary["retry"] = "retry_count" in update
+        if "retry_count" in update:
+            summary["retry_count"] = update["retry_count"]
+
+    return summary
+
+
+# ---------------------------------------------------------------------------
+# public API
+# ---------------------------------------------------------------------------
+
+async def run_fact_check(
+    data_sources: list[DataSource],
+    deep_fake_verification_result=None,
+    budget_seconds: float | None = REQUEST_DEADLINE_SECONDS,
+) -> GraphOutput:
+    """run the full agentic fact-checking graph on a list of DataSources.
+
+    args:
+        data_sources: one or more DataSource objects to verify.
+        budget_seconds: end-to-end latency budget; nodes and tools size their
+            timeouts from what is left. None disables the deadline.
+
+    returns:
+        GraphOutput with FactCheckResult and collected source lists for citation mapping.
+    """
+    graph = get_graph()
+    deadline = make_deadline(budget_seconds)
+    initial_state = _build_initial_state(data_sources, deep_fake_verification_result, deadline)
+
+    try:
+        final_state = await graph.ainvoke(initial_state)
+    finally:
+        discard_prefetch(initial_state["run_id"])
+    return _to_graph_output(final_state)
+
+
+async def stream_fact_check(
+    data_sources: list[DataSource],
+    deep_fake_verification_result=None,
+    budget_seconds: float | None = REQUEST_DEADLINE_SECONDS,
+) -> AsyncIterator[GraphEvent]:
+    """run the graph and yield a GraphEvent per node transition.
+
+    the last event has node="done" and carries the GraphOutput,
+    equivalent to what run_fact_check would return.
+    """
+    graph = get_graph()
+    deadline = make_deadline(budget_seconds)
+    initial_state = _build_initial_state(data_sources, deep_fake_verification_result, deadline)
+
+    final_state: dict = initial_state
+    try:
+        async for mode, chunk in graph.astream(initial_state, stream_mode=["updates", "values"]):
+            if mode == "values":
+                final_state = chunk
+                continue
+            for node, update in chunk.items():
+                yield GraphEvent(node=node, data=summarize_node_update(node, update))
+    finally:
+        discard_prefetch(initial_state["run_id"])
+
+    yield GraphEvent(node="done", data={}, output=_to_graph_output(final_state))
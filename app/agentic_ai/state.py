@@ -12,6 +12,7 @@ from typing import Annotated, Any, Optional
 
 from langgraph.graph import MessagesState
 
+from app.agentic_ai.prompts.context_formatter import ContextFormatter
 from app.models.agenticai import (
     FactCheckApiContext,
     GoogleSearchContext,
@@ -44,9 +45,18 @@ class ContextAgentState(MessagesState):
     search_results: dict[str, list[GoogleSearchContext]]
     scraped_pages: list[WebScrapeContext]
 
+    # near-duplicates collapsed by the tool node: representative url → member urls
+    collapsed_sources: dict[str, list[str]]
+
+    # incremental formatter holding the run's stable [N] numbering and rendered
+    # entries (mutated in place by the prompt builders, replaced by prepare_retry)
+    context_formatter: ContextFormatter
+
     # control flow
     iteration_count: int
     pending_async_count: int
+    # wait_for_async passes so far (only the first one uses the soft deadline)
+    async_wait_count: int
 
     # structured input data sources (append-only so wait_for_async can add link sources)
     data_sources: Annotated[list[DataSource], operator.add]
@@ -57,6 +67,9 @@ class ContextAgentState(MessagesState):
     # unique id linking format_input (fires task) to wait_for_async (awaits task)
     run_id: str
 
+    # absolute time.monotonic() deadline for the whole request (None: no budget)
+    deadline: Optional[float]
+
     # adjudication output (set once by the adjudication node)
     adjudication_result: Optional[FactCheckResult]
 
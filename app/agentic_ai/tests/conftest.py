@@ -0,0 +1,70 @@
+"""shared source factories for the agentic_ai tests."""
+
+from app.models.agenticai import (
+    FactCheckApiContext,
+    GoogleSearchContext,
+    SourceReliability,
+    WebScrapeContext,
+)
+
+
+def _make_fact_check(
+    id="fc-1",
+    url=None,
+    claim_text="test claim",
+    publisher="Lupa",
+    rating="Falso",
+    title="FC Title",
+):
+    return FactCheckApiContext(
+        id=id,
+        url=url or f"https://lupa.uol.com.br/{id}",
+        parent_id=None,
+        reliability=SourceReliability.MUITO_CONFIAVEL,
+        title=title,
+        publisher=publisher,
+        rating=rating,
+        claim_text=claim_text,
+        review_date="2025-01-10",
+    )
+
+
+def _make_search(
+    id="gs-1",
+    domain_key="geral",
+    url=None,
+    title="Search Title",
+    snippet="snippet " * 20,
+    position=1,
+):
+    return GoogleSearchContext(
+        id=id,
+        url=url or f"https://example.com/{id}",
+        parent_id=None,
+        reliability=(
+            SourceReliability.MUITO_CONFIAVEL if domain_key == "especifico" else SourceReliability.NEUTRO
+        ),
+        title=title,
+        snippet=snippet,
+        domain="example.com",
+        position=position,
+    )
+
+
+def _make_scrape(
+    id="sc-1",
+    url=None,
+    title="Scraped Page",
+    content="page content " * 100,
+    reliability=SourceReliability.POUCO_CONFIAVEL,
+):
+    return WebScrapeContext(
+        id=id,
+        url=url or f"https://example.com/page-{id}",
+        parent_id=None,
+        reliability=reliability,
+        title=title,
+        content=content,
+        extraction_status="success",
+        extraction_tool="beautifulsoup",
+    )
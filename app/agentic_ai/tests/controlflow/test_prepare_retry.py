@@ -500,6 +500,53 @@ async def test_prepare_retry_overwrites_sources():
     assert result["scraped_pages"] == []
 
 
+def test_filter_to_cited_sources_with_incremental_numbering():
+    # geral arrived first ([1]), the fact check later ([2])
+    fc = _make_fc("fc-1")
+    gs = _make_gs("ge-1", "geral", "bbc.com")
+
+    r_fc, r_search, r_scraped = _filter_to_cited_sources(
+        [fc], {"geral": [gs]}, [], {2}, numbering={"ge-1": 1, "fc-1": 2},
+    )
+    assert [e.id for e in r_fc] == ["fc-1"]
+    assert r_search["geral"] == []
+
+
+@pytest.mark.asyncio
+async def test_prepare_retry_uses_and_resets_context_formatter():
+    from app.agentic_ai.prompts.context_formatter import ContextFormatter
+
+    fc = _make_fc("fc-1")
+    gs = _make_gs("ge-1", "geral", "bbc.com")
+    state = _make_state(
+        verdict_strings=["Fontes insuficientes para verificar"],
+        fact_check_results=[fc],
+        search_results={"geral": [gs]},
+        scraped_pages=[],
+    )
+    state["context_formatter"] = ContextFormatter({"ge-1": 1, "fc-1": 2})
+    state["adjudication_result"].results[0].claim_verdicts[0].justification = "See [1]."
+
+    result = await prepare_retry_node(state)
+
+    assert result["fact_check_results"] == []
+    assert [e.id for e in result["search_results"]["geral"]] == ["ge-1"]
+    assert len(result["context_formatter"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_prepare_retry_skipped_when_deadline_is_close():
+    import time
+
+    state = _make_state(verdict_strings=["Fontes insuficientes para verificar"])
+    state["deadline"] = time.monotonic() + 5.0
+
+    result = await prepare_retry_node(state)
+
+    assert result == {}
+    assert route_after_prepare_retry({**state, **result}) == END
+
+
 # --- _extract_tool_summaries tests ---
 
 import json
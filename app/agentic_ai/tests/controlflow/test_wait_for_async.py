@@ -0,0 +1,88 @@
+"""tests for the wait_for_async node: soft first pass and final drain."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.agentic_ai.controlflow.wait_for_async import wait_for_async_node
+from app.agentic_ai.utils.link_expander import LinkExpansion, _pending_link_tasks
+from app.models.commondata import DataSource
+
+
+def _link_source(url: str) -> DataSource:
+    return DataSource(
+        id=f"link-{url}",
+        source_type="link_context",
+        original_text=f"content of {url}",
+        metadata={"url": url},
+    )
+
+
+def _state(run_id: str, **overrides) -> dict:
+    state = {
+        "run_id": run_id,
+        "data_sources": [],
+        "pending_async_count": 2,
+        "async_wait_count": 0,
+        "deadline": None,
+    }
+    state.update(overrides)
+    return state
+
+
+async def _register(run_id: str, release: asyncio.Event) -> asyncio.Task:
+    async def fast():
+        return _link_source("https://fast.com")
+
+    async def slow():
+        await release.wait()
+        return _link_source("https://slow.com")
+
+    slow_task = asyncio.create_task(slow())
+    _pending_link_tasks[run_id] = LinkExpansion([asyncio.create_task(fast()), slow_task])
+    return slow_task
+
+
+@pytest.mark.asyncio
+async def test_first_pass_injects_ready_links_and_leaves_slow_ones(monkeypatch):
+    monkeypatch.setattr("app.agentic_ai.controlflow.wait_for_async.LINK_SOFT_WAIT_SECONDS", 0.05)
+    release = asyncio.Event()
+    slow_task = await _register("soft-run", release)
+
+    result = await wait_for_async_node(_state("soft-run"))
+
+    assert [ds.metadata["url"] for ds in result["data_sources"]] == ["https://fast.com"]
+    assert result["pending_async_count"] == 1
+    assert result["async_wait_count"] == 1
+    assert "ainda em processamento" in result["messages"][0].content
+    assert not slow_task.done()
+
+    # the next pass waits for the late link
+    release.set()
+    result = await wait_for_async_node(
+        _state("soft-run", pending_async_count=1, async_wait_count=1, data_sources=result["data_sources"])
+    )
+
+    assert [ds.metadata["url"] for ds in result["data_sources"]] == ["https://slow.com"]
+    assert result["pending_async_count"] == 0
+    assert "https://fast.com" in result["formatted_data_sources"]
+    assert "https://slow.com" in result["formatted_data_sources"]
+    assert "soft-run" not in _pending_link_tasks
+
+
+@pytest.mark.asyncio
+async def test_no_soft_pass_when_deadline_is_close(monkeypatch):
+    monkeypatch.setattr("app.agentic_ai.controlflow.wait_for_async.LINK_SOFT_WAIT_SECONDS", 0.05)
+    monkeypatch.setattr("app.agentic_ai.controlflow.wait_for_async.ADJUDICATION_RESERVE_SECONDS", 0.5)
+    monkeypatch.setattr("app.agentic_ai.utils.deadline.MIN_CALL_TIMEOUT", 0.05)
+    release = asyncio.Event()
+    slow_task = await _register("late-run", release)
+
+    result = await wait_for_async_node(_state("late-run", deadline=time.monotonic() + 0.3))
+    await asyncio.sleep(0)
+
+    # final pass: what finished is kept, the rest is abandoned
+    assert [ds.metadata["url"] for ds in result["data_sources"]] == ["https://fast.com"]
+    assert result["pending_async_count"] == 0
+    assert slow_task.cancelled()
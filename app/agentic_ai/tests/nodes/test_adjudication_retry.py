@@ -400,3 +400,37 @@ async def test_graph_routes_to_end_on_adjudication_error():
     assert "timed out" in final_state["adjudication_error"]
     assert isinstance(final_state["adjudication_result"], FactCheckResult)
     assert final_state["adjudication_result"].results[0].claim_verdicts == []
+
+
+# ---- test: request deadline ----
+
+@pytest.mark.asyncio
+async def test_no_retry_when_deadline_exhausted():
+    """past the request deadline a timed-out attempt is not retried."""
+    import time
+
+    async def _slow(messages):
+        await asyncio.sleep(100)
+
+    model, structured = _make_mock_model(ainvoke_side_effect=_slow)
+
+    with patch("app.agentic_ai.nodes.adjudication.ADJUDICATION_TIMEOUT", 0.1), \
+         patch("app.agentic_ai.nodes.adjudication.ADJUDICATION_MIN_TIMEOUT", 0.05), \
+         patch("app.agentic_ai.nodes.adjudication.ADJUDICATION_MAX_RETRIES", 2):
+        node = make_adjudication_node(model)
+        result = await node(_make_state(deadline=time.monotonic() - 1))
+
+    assert structured.ainvoke.call_count == 1
+    assert "1 attempt(s)" in result["adjudication_error"]
+
+
+def test_attempt_timeout_shrinks_to_deadline():
+    import time
+    from app.agentic_ai.nodes.adjudication import _attempt_timeout
+
+    with patch("app.agentic_ai.nodes.adjudication.ADJUDICATION_TIMEOUT", 20.0), \
+         patch("app.agentic_ai.nodes.adjudication.ADJUDICATION_MIN_TIMEOUT", 5.0):
+        assert _attempt_timeout(None) == 20.0
+        assert _attempt_timeout(time.monotonic() + 100) == 20.0
+        assert 11.0 < _attempt_timeout(time.monotonic() + 12) <= 12.0
+        assert _attempt_timeout(time.monotonic() - 1) == 5.0
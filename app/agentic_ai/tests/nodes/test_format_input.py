@@ -1,5 +1,7 @@
 """tests for the format_input node."""
 
+import asyncio
+import time
 from unittest.mock import patch, AsyncMock
 
 import pytest
@@ -8,8 +10,15 @@ from langchain_core.messages import HumanMessage
 from app.models.commondata import DataSource
 from app.agentic_ai.nodes.format_input import (
     _format_data_sources,
+    _derive_prefetch_query,
     _is_links_only,
+    _prefetch_tasks,
+    discard_prefetch,
+    fire_speculative_prefetch,
     format_input_node,
+    make_format_input_node,
+    reset_prefetch_tasks,
+    take_prefetch_results,
 )
 
 
@@ -190,3 +199,153 @@ async def test_format_input_text_plus_links_fires(mock_extract, mock_fire):
 
     mock_fire.assert_called_once()
     assert result.get("pending_async_count") == 1
+
+
+# --- speculative prefetch ---
+
+def test_derive_prefetch_query_takes_leading_sentences():
+    ds = DataSource(
+        id="ds-1", source_type="original_text",
+        original_text="Vacina X causa autismo. Estudo saiu ontem. Compartilhe com todos!",
+    )
+    query = _derive_prefetch_query([ds])
+    assert query == "Vacina X causa autismo. Estudo saiu ontem."
+
+
+def test_derive_prefetch_query_strips_urls_and_caps_length():
+    ds = DataSource(
+        id="ds-1", source_type="original_text",
+        original_text="https://a.com/x " + "palavra " * 100,
+    )
+    query = _derive_prefetch_query([ds])
+    assert "https://" not in query
+    assert 0 < len(query) <= 200
+    assert not query.endswith(" ")
+
+
+def test_derive_prefetch_query_empty_for_links_only():
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="https://a.com")
+    assert _derive_prefetch_query([ds]) == ""
+
+
+def test_derive_prefetch_query_ignores_other_source_types():
+    ds = DataSource(id="i-1", source_type="image", original_text="ocr text")
+    assert _derive_prefetch_query([ds]) == ""
+
+
+@pytest.mark.asyncio
+async def test_fire_speculative_prefetch_runs_both_searches():
+    fact_checker = AsyncMock()
+    web_searcher = AsyncMock()
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim about something")
+
+    task = fire_speculative_prefetch([ds], fact_checker, web_searcher)
+    await task
+
+    fact_checker.search.assert_awaited_once_with(["claim about something"])
+    web_searcher.search.assert_awaited_once_with(["claim about something"])
+
+
+@pytest.mark.asyncio
+async def test_fire_speculative_prefetch_swallows_errors():
+    fact_checker = AsyncMock()
+    fact_checker.search.side_effect = RuntimeError("api down")
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim")
+
+    task = fire_speculative_prefetch([ds], fact_checker, None)
+    await task  # must not raise
+
+
+@pytest.mark.asyncio
+async def test_fire_speculative_prefetch_skips_without_query():
+    fact_checker = AsyncMock()
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="https://a.com")
+
+    assert fire_speculative_prefetch([ds], fact_checker, None) is None
+    fact_checker.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_make_format_input_node_fires_prefetch_and_formats():
+    fact_checker = AsyncMock()
+    web_searcher = AsyncMock()
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="just text")
+    node = make_format_input_node(fact_checker, web_searcher)
+
+    with patch(
+        "app.agentic_ai.nodes.format_input.fire_speculative_prefetch",
+        wraps=fire_speculative_prefetch,
+    ) as mock_fire:
+        result = await node({"data_sources": [ds]})
+
+    mock_fire.assert_called_once_with([ds], fact_checker, web_searcher, result["run_id"])
+    assert result["formatted_data_sources"] == ds.to_llm_string()
+
+
+@pytest.mark.asyncio
+async def test_take_prefetch_results_hands_finished_results_out_once():
+    reset_prefetch_tasks()
+    fact_checker = AsyncMock()
+    fact_checker.search.return_value = ["fc"]
+    web_searcher = AsyncMock()
+    web_searcher.search.side_effect = RuntimeError("api down")
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim about something")
+
+    task = fire_speculative_prefetch([ds], fact_checker, web_searcher, "run-1")
+    assert take_prefetch_results("run-1") == ([], {})  # not finished yet: never waits
+    await task
+
+    assert take_prefetch_results("run-1") == (["fc"], {})
+    assert take_prefetch_results("run-1") == ([], {})
+    reset_prefetch_tasks()
+
+
+async def _hang(queries):
+    await asyncio.sleep(10)
+    return {"geral": ["late"]}
+
+
+@pytest.mark.asyncio
+async def test_discard_prefetch_cancels_the_runs_task():
+    reset_prefetch_tasks()
+    web_searcher = AsyncMock()
+    web_searcher.search.side_effect = _hang
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim about something")
+
+    task = fire_speculative_prefetch([ds], None, web_searcher, "run-1")
+    discard_prefetch("run-1")
+    await asyncio.sleep(0)
+
+    assert "run-1" not in _prefetch_tasks
+    assert task.cancelled()
+    discard_prefetch("run-1")  # already gone: no-op
+
+
+@pytest.mark.asyncio
+async def test_expired_prefetch_is_cancelled_and_dropped(monkeypatch):
+    reset_prefetch_tasks()
+    monkeypatch.setattr("app.agentic_ai.nodes.format_input.PREFETCH_TASK_TTL_SECONDS", 0.0)
+    web_searcher = AsyncMock()
+    web_searcher.search.side_effect = _hang
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim about something")
+
+    task = fire_speculative_prefetch([ds], None, web_searcher, "run-1")
+    assert take_prefetch_results("run-1") == ([], {})
+    await asyncio.sleep(0)
+    assert "run-1" not in _prefetch_tasks
+    assert task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_bounded_by_the_request_deadline():
+    reset_prefetch_tasks()
+    web_searcher = AsyncMock()
+    web_searcher.search.side_effect = _hang
+    ds = DataSource(id="ds-1", source_type="original_text", original_text="claim about something")
+    node = make_format_input_node(None, web_searcher)
+
+    await node({"data_sources": [ds], "run_id": "run-1", "deadline": time.monotonic() + 0.05})
+    task = _prefetch_tasks["run-1"][1]
+
+    assert await asyncio.wait_for(task, timeout=1) == ([], {})
+    reset_prefetch_tasks()
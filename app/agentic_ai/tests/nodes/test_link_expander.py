@@ -12,6 +12,11 @@ from app.agentic_ai.utils.link_expander import (
     fire_link_expansion,
     await_link_expansion,
     _pending_link_tasks,
+    _inflight_scrapes,
+    _LinkTaskRegistry,
+    LinkExpansion,
+    collect_link_expansion,
+    get_link_task_stats,
 )
 from app.agentic_ai.config import MAX_LINKS_TO_EXPAND
 from app.ai.context.web.models import WebContentResult
@@ -107,6 +112,69 @@ async def test_expand_all_links_partial_failure(mock_expand):
     assert results[0].metadata["url"] == "https://good.com"
 
 
+# --- singleflight across runs ---
+
+
+@pytest.mark.asyncio
+@patch("app.agentic_ai.utils.link_expander.expand_link_context")
+async def test_concurrent_runs_share_one_scrape(mock_expand):
+    async def slow_expand(url):
+        await asyncio.sleep(0.05)
+        return _make_web_result(url=url)
+
+    mock_expand.side_effect = slow_expand
+
+    results = await asyncio.gather(
+        expand_all_links(["https://example.com/news"], "run-a", "pt-BR", None),
+        expand_all_links(["https://example.com/news/?utm_source=zap"], "run-b", "pt-BR", None),
+    )
+
+    assert mock_expand.call_count == 1
+    assert [len(r) for r in results] == [1, 1]
+    assert results[1][0].metadata["parent_source_id"] == "run-b"
+    assert not _inflight_scrapes
+
+
+@pytest.mark.asyncio
+@patch("app.agentic_ai.utils.link_expander.expand_link_context")
+async def test_timed_out_run_does_not_cancel_shared_scrape(mock_expand):
+    async def slow_expand(url):
+        await asyncio.sleep(0.1)
+        return _make_web_result(url=url)
+
+    mock_expand.side_effect = slow_expand
+
+    impatient, patient = await asyncio.gather(
+        _scrape_single_url("https://example.com/a", "run-a", "pt-BR", None, timeout=0.01),
+        _scrape_single_url("https://example.com/a", "run-b", "pt-BR", None, timeout=5),
+    )
+
+    assert impatient is None
+    assert patient is not None
+    assert mock_expand.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("app.agentic_ai.utils.link_expander.expand_link_context")
+async def test_shared_scrape_cancelled_when_last_run_leaves(mock_expand):
+    cancelled = asyncio.Event()
+
+    async def slow_expand(url):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_expand.side_effect = slow_expand
+
+    ds = await _scrape_single_url("https://example.com/a", "run-a", "pt-BR", None, timeout=0.01)
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+    assert ds is None
+    assert not _inflight_scrapes
+
+
 # --- fire_link_expansion + await_link_expansion ---
 
 
@@ -141,7 +209,7 @@ async def test_await_task_exception():
     async def failing():
         raise RuntimeError("boom")
 
-    _pending_link_tasks[run_id] = asyncio.create_task(failing())
+    _pending_link_tasks[run_id] = LinkExpansion([asyncio.create_task(failing())])
     # let the task start
     await asyncio.sleep(0)
 
@@ -150,6 +218,76 @@ async def test_await_task_exception():
     assert run_id not in _pending_link_tasks
 
 
+@pytest.mark.asyncio
+async def test_await_with_timeout_cancels_late_task():
+    run_id = "test-timeout-run"
+
+    async def slow():
+        await asyncio.sleep(100)
+
+    task = asyncio.create_task(slow())
+    _pending_link_tasks[run_id] = LinkExpansion([task])
+
+    results = await await_link_expansion(run_id, timeout=0.01)
+    await asyncio.sleep(0)
+    assert results == []
+    assert task.cancelled()
+    assert run_id not in _pending_link_tasks
+
+
+def _link_source(url):
+    return DataSource(
+        id=f"link-{url}", source_type="link_context", original_text=f"content of {url}",
+        metadata={"url": url}, locale="pt-BR",
+    )
+
+
+@pytest.mark.asyncio
+async def test_await_with_timeout_keeps_finished_links():
+    async def fast():
+        return _link_source("https://fast.com")
+
+    async def slow():
+        await asyncio.sleep(100)
+
+    slow_task = asyncio.create_task(slow())
+    _pending_link_tasks["partial-run"] = LinkExpansion([asyncio.create_task(fast()), slow_task])
+
+    results = await await_link_expansion("partial-run", timeout=0.05)
+    await asyncio.sleep(0)
+
+    assert [ds.metadata["url"] for ds in results] == ["https://fast.com"]
+    assert slow_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_collect_returns_ready_links_and_keeps_slow_ones_running():
+    release = asyncio.Event()
+
+    async def fast():
+        return _link_source("https://fast.com")
+
+    async def slow():
+        await release.wait()
+        return _link_source("https://slow.com")
+
+    run_id = "progressive-run"
+    _pending_link_tasks[run_id] = LinkExpansion(
+        [asyncio.create_task(slow()), asyncio.create_task(fast())]
+    )
+
+    ready, still_pending = await collect_link_expansion(run_id, timeout=0.05)
+    assert [ds.metadata["url"] for ds in ready] == ["https://fast.com"]
+    assert still_pending == 1
+    assert run_id in _pending_link_tasks
+
+    release.set()
+    late, still_pending = await collect_link_expansion(run_id, timeout=1)
+    assert [ds.metadata["url"] for ds in late] == ["https://slow.com"]
+    assert still_pending == 0
+    assert run_id not in _pending_link_tasks
+
+
 def test_fire_with_no_urls():
     count = fire_link_expansion("empty-run", [], "p-1", "pt-BR", None)
     assert count == 0
@@ -168,6 +306,61 @@ async def test_max_links_respected(mock_expand):
     assert mock_expand.call_count == MAX_LINKS_TO_EXPAND
 
 
+# --- registry eviction ---
+
+
+async def _sleeper():
+    await asyncio.sleep(100)
+
+
+@pytest.mark.asyncio
+async def test_registry_evicts_and_cancels_expired_tasks():
+    registry = _LinkTaskRegistry(ttl=0.01, max_size=10)
+    orphan = asyncio.create_task(_sleeper())
+    registry["orphan-run"] = orphan
+
+    await asyncio.sleep(0.02)
+    fresh = asyncio.create_task(_sleeper())
+    registry["fresh-run"] = fresh
+    await asyncio.sleep(0)
+
+    assert "orphan-run" not in registry
+    assert orphan.cancelled()
+    assert registry.pop("fresh-run") is fresh
+    assert registry.stats()["evicted_expired"] == 1
+    fresh.cancel()
+
+
+@pytest.mark.asyncio
+async def test_registry_caps_size_evicting_oldest():
+    registry = _LinkTaskRegistry(ttl=60, max_size=2)
+    tasks = [asyncio.create_task(_sleeper()) for _ in range(3)]
+    for i, task in enumerate(tasks):
+        registry[f"run-{i}"] = task
+    await asyncio.sleep(0)
+
+    assert len(registry) == 2
+    assert "run-0" not in registry
+    assert tasks[0].cancelled()
+    stats = registry.stats()
+    assert stats["evicted_overflow"] == 1
+    assert stats["cancelled"] == 1
+    assert stats["pending"] == 2
+    registry.clear()
+
+
+@pytest.mark.asyncio
+@patch("app.agentic_ai.utils.link_expander.expand_link_context")
+async def test_link_task_stats_track_fired_tasks(mock_expand):
+    mock_expand.return_value = _make_web_result()
+
+    fire_link_expansion("stats-run", ["https://a.com"], "p-1", "pt-BR", None)
+    assert get_link_task_stats()["pending"] >= 1
+
+    await await_link_expansion("stats-run")
+    assert "stats-run" not in _pending_link_tasks
+
+
 # --- expand_link_context (integration — real network calls) ---
 
 
@@ -1,11 +1,14 @@
 """tests for retry_context_agent node."""
 
+import contextlib
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from langchain_core.messages import AIMessage
 
 from app.agentic_ai.nodes.retry_context_agent import make_retry_context_agent_node
+from app.clients.governor import GovernorTimeout
 
 
 def _make_mock_model():
@@ -58,3 +61,26 @@ async def test_retry_agent_increments_iteration():
     state["iteration_count"] = 1
     result = await node(state)
     assert result["iteration_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_agent_governor_timeout_moves_on_without_response():
+    @contextlib.asynccontextmanager
+    async def _exhausted(upstream):
+        raise GovernorTimeout(f"{upstream}: no capacity before deadline")
+        yield
+
+    model = _make_mock_model()
+    node = make_retry_context_agent_node(model)
+    state = {
+        "messages": [],
+        "formatted_data_sources": "",
+        "iteration_count": 1,
+        "retry_context": "",
+    }
+
+    with patch("app.agentic_ai.nodes.retry_context_agent.governed", _exhausted):
+        result = await node(state)
+
+    assert result == {"iteration_count": 2}
+    model.ainvoke.assert_not_called()
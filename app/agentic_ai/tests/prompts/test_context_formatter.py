@@ -7,6 +7,7 @@ from app.models.agenticai import (
     SourceReliability,
 )
 from app.agentic_ai.prompts.context_formatter import (
+    ContextFormatter,
     format_context,
     build_source_reference_list,
     filter_cited_references,
@@ -369,3 +370,94 @@ def test_adjudication_prompt_numbering_matches_ref_list():
         assert prompt_urls[num] == url, (
             f"URL mismatch at [{num}]: prompt={prompt_urls[num]}, ref_list={url}"
         )
+
+
+# --- ContextFormatter (incremental numbering) ---
+
+def test_formatter_single_batch_matches_format_context():
+    fc = [_make_fact_check()]
+    search = {"especifico": [_make_search("es-1", "especifico", "g1.globo.com")],
+              "geral": [_make_search("ge-1", "geral", "bbc.com")]}
+    sc = [_make_scrape()]
+
+    formatter = ContextFormatter()
+    assert formatter.format(fc, search, sc) == format_context(fc, search, sc)
+    assert formatter.references(fc, search, sc) == build_source_reference_list(fc, search, sc)
+
+
+def test_formatter_keeps_numbers_stable_when_earlier_sections_grow():
+    ge = _make_search("ge-1", "geral", "bbc.com")
+    formatter = ContextFormatter()
+    first = formatter.format([], {"geral": [ge]}, [])
+    assert "[1] Title" in first
+
+    # a fact check arriving later would be [1] in format_context; here it is appended
+    fc = _make_fact_check("fc-1")
+    second = formatter.format([fc], {"geral": [ge]}, [])
+    assert "[2] Publisher: Lupa" in second
+    assert "[1] Title: \"Search Title\"" in second
+    # still grouped by reliability: fact check section comes first
+    assert second.index("Fact-Check API") < second.index("Busca Web — Geral")
+    assert formatter.numbering == {"ge-1": 1, "fc-1": 2}
+
+
+def test_formatter_references_sorted_by_number():
+    ge = _make_search("ge-1", "geral", "bbc.com")
+    fc = _make_fact_check("fc-1")
+    formatter = ContextFormatter()
+    formatter.format([], {"geral": [ge]}, [])
+
+    refs = formatter.references([fc], {"geral": [ge]}, [])
+    assert [(n, url) for n, _, url in refs] == [
+        (1, "https://bbc.com/test"),
+        (2, "https://lupa.uol.com.br/test"),
+    ]
+
+
+def test_formatter_renders_only_new_entries(monkeypatch):
+    import app.agentic_ai.prompts.context_formatter as cf
+
+    calls: list[str] = []
+    original = cf._render_search
+
+    def counting(number, entry):
+        calls.append(entry.id)
+        return original(number, entry)
+
+    monkeypatch.setitem(cf._RENDERERS, "geral", counting)
+    formatter = ContextFormatter()
+    g1 = _make_search("ge-1", "geral", "bbc.com")
+    g2 = _make_search("ge-2", "geral", "cnn.com")
+
+    formatter.format([], {"geral": [g1]}, [])
+    formatter.format([], {"geral": [g1, g2]}, [])
+    formatter.format([], {"geral": [g1, g2]}, [])
+    assert calls == ["ge-1", "ge-2"]
+
+
+def test_build_source_reference_list_with_numbering():
+    fc = _make_fact_check("fc-1")
+    ge = _make_search("ge-1", "geral", "bbc.com")
+    refs = build_source_reference_list([fc], {"geral": [ge]}, [], numbering={"ge-1": 1, "fc-1": 2})
+    assert [(n, url) for n, _, url in refs] == [
+        (1, "https://bbc.com/test"),
+        (2, "https://lupa.uol.com.br/test"),
+    ]
+
+
+def test_adjudication_prompt_uses_formatter_numbering():
+    from app.agentic_ai.prompts.adjudication_prompt import build_adjudication_prompt
+
+    ge = _make_search("ge-1", "geral", "bbc.com")
+    fc = _make_fact_check("fc-1")
+    formatter = ContextFormatter({"ge-1": 1})
+
+    _, user_prompt = build_adjudication_prompt(
+        formatted_data_sources="Test claim text",
+        fact_check_results=[fc],
+        search_results={"geral": [ge]},
+        scraped_pages=[],
+        formatter=formatter,
+    )
+    assert "[2] Publisher: Lupa" in user_prompt
+    assert "[1] Title" in user_prompt
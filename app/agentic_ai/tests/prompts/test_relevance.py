@@ -0,0 +1,111 @@
+"""tests for lexical (BM25) source relevance."""
+
+from app.agentic_ai.prompts.adjudication_prompt import build_adjudication_prompt
+from app.agentic_ai.prompts.context_formatter import ContextFormatter, format_context
+from app.agentic_ai.prompts.relevance import (
+    bm25_scores,
+    exempt_ids,
+    fold,
+    irrelevant_ids,
+    score_sources,
+    tokenize,
+)
+from app.agentic_ai.tests.conftest import _make_fact_check, _make_scrape, _make_search
+
+CLAIM = "Governo anuncia vacinação obrigatória contra dengue em São Paulo"
+
+
+def test_fold_and_tokenize_handle_accents_and_stopwords():
+    assert fold("Vacinação em São Paulo") == "vacinacao em sao paulo"
+    assert tokenize("A vacinação NÃO é obrigatória em São Paulo!") == [
+        "vacinacao", "obrigatoria", "paulo",
+    ]
+
+
+def test_bm25_prefers_matching_and_rarer_terms():
+    docs = [
+        tokenize("vacina dengue sao paulo"),
+        tokenize("futebol campeonato paulista"),
+        tokenize("dengue casos aumentam"),
+    ]
+    scores = bm25_scores(tokenize("vacina contra dengue"), docs)
+    assert scores[0] > scores[2] > scores[1] == 0.0
+    assert bm25_scores(["dengue"], []) == []
+
+
+def test_score_sources_covers_every_kind():
+    fc = [_make_fact_check("fc-1", claim_text="vacina da dengue obrigatória")]
+    search = {"geral": [_make_search("ge-1", title="Receita de bolo", snippet="como fazer bolo de cenoura")]}
+    scraped = [_make_scrape(
+        "sc-1", title="Dengue", content="Secretaria de São Paulo confirma vacinação contra dengue.",
+    )]
+
+    scores = score_sources(fc, search, scraped, CLAIM)
+    assert set(scores) == {"fc-1", "ge-1", "sc-1"}
+    assert scores["ge-1"] == 0.0
+    assert scores["fc-1"] > 0 and scores["sc-1"] > 0
+    assert score_sources(fc, search, scraped, "https://x.com") == {}
+
+
+def test_irrelevant_ids_keeps_a_minimum_and_skips_when_nothing_matches():
+    relevance = {"a": 10.0, "b": 5.0, "c": 0.5, "d": 0.0}
+    assert irrelevant_ids(relevance, min_ratio=0.1, min_sources=2) == {"c", "d"}
+    assert irrelevant_ids(relevance, min_ratio=0.1, min_sources=3) == {"d"}
+    assert irrelevant_ids(relevance, min_ratio=0.1, min_sources=4) == set()
+    assert irrelevant_ids({"a": 0.0, "b": 0.0}, min_sources=0) == set()
+    assert irrelevant_ids(relevance, min_ratio=0.1, min_sources=2, exempt={"c"}) == {"d"}
+
+
+def test_format_context_orders_by_relevance_without_renumbering():
+    first = _make_search("ge-1", title="Receita de bolo", snippet="bolo")
+    second = _make_search("ge-2", title="Vacina da dengue", snippet="dengue em sao paulo")
+    search = {"geral": [first, second]}
+
+    plain = format_context([], search, [])
+    assert plain.index("[1]") < plain.index("[2]")
+
+    ranked = format_context([], search, [], relevance={"ge-1": 0.0, "ge-2": 3.0})
+    assert ranked.index("[2] Title: \"Vacina da dengue\"") < ranked.index("[1] Title: \"Receita de bolo\"")
+
+    formatter = ContextFormatter()
+    assert formatter.format([], search, [], relevance={"ge-2": 3.0}) == ranked
+    assert formatter.format([], search, []) == plain
+
+
+def test_adjudication_prompt_leaves_out_irrelevant_sources():
+    relevant = _make_search("ge-1", title="Vacina contra dengue", snippet="São Paulo anuncia vacinação obrigatória")
+    unrelated = _make_search("ge-2", title="Receita de bolo", snippet="como fazer bolo de cenoura")
+    filler = [_make_search(f"ge-{i}", title="Dengue", snippet=f"vacinação dengue {i}") for i in range(3, 12)]
+    search = {"geral": [unrelated, relevant, *filler]}
+
+    _, user_prompt = build_adjudication_prompt(
+        formatted_data_sources=CLAIM,
+        fact_check_results=[],
+        search_results=search,
+        scraped_pages=[],
+        token_budget=None,
+    )
+    assert "Receita de bolo" not in user_prompt
+    assert "[2] Title: \"Vacina contra dengue\"" in user_prompt
+    assert "omitida(s)" in user_prompt
+
+
+def test_adjudication_prompt_keeps_low_overlap_fact_checks():
+    english = _make_fact_check(
+        "fc-1", url="https://factcheck.org/dengue", publisher="FactCheck.org",
+        claim_text="Brazil did not make the shot compulsory nationwide", rating="False",
+    )
+    unrelated = _make_search("ge-2", title="Receita de bolo", snippet="como fazer bolo de cenoura")
+    filler = [_make_search(f"ge-{i}", title="Dengue", snippet=f"vacinação dengue {i}") for i in range(3, 12)]
+
+    assert exempt_ids([english], {"geral": [unrelated]}, []) == {"fc-1"}
+
+    _, user_prompt = build_adjudication_prompt(
+        formatted_data_sources=CLAIM,
+        fact_check_results=[english],
+        search_results={"geral": [unrelated, *filler]},
+        scraped_pages=[],
+        token_budget=None,
+    )
+    assert "Brazil did not make the shot compulsory nationwide" in user_prompt
+    assert "Receita de bolo" not in user_prompt
@@ -0,0 +1,122 @@
+"""tests for token-budgeted adjudication source selection."""
+
+import re
+
+from app.agentic_ai.prompts.adjudication_prompt import build_adjudication_prompt
+from app.agentic_ai.prompts.context_formatter import (
+    ContextFormatter,
+    build_source_reference_list,
+)
+from app.agentic_ai.prompts.source_budget import select_sources
+from app.agentic_ai.tests.conftest import _make_fact_check, _make_scrape, _make_search
+from app.models.agenticai import SourceReliability
+
+
+def _all_ids(selection) -> list[str]:
+    return (
+        [e.id for e in selection.fact_check_results]
+        + [e.id for entries in selection.search_results.values() for e in entries]
+        + [e.id for e in selection.scraped_pages]
+    )
+
+
+def _sources():
+    fc = [_make_fact_check("fc-1")]
+    search = {
+        "especifico": [_make_search("es-1", "especifico")],
+        "geral": [_make_search("ge-1", "geral", position=1), _make_search("ge-2", "geral", position=5)],
+    }
+    scraped = [_make_scrape("sc-1")]
+    numbering = ContextFormatter().number(fc, search, scraped)
+    return fc, search, scraped, numbering
+
+
+def test_everything_fits_returns_inputs_unchanged():
+    fc, search, scraped, numbering = _sources()
+    selection = select_sources(fc, search, scraped, numbering, token_budget=10**6)
+
+    assert selection.fact_check_results is fc
+    assert selection.search_results is search
+    assert selection.scraped_pages is scraped
+    assert selection.dropped_ids == []
+
+
+def test_drops_lowest_tier_then_worst_rank_first():
+    fc, search, scraped, numbering = _sources()
+    full = select_sources(fc, search, scraped, numbering, token_budget=10**6).tokens
+
+    # the scraped page is the largest and least reliable entry
+    selection = select_sources(fc, search, scraped, numbering, token_budget=full - 1)
+    assert selection.dropped_ids == ["sc-1"]
+
+    selection = select_sources(fc, search, scraped, numbering, token_budget=full - 200)
+    assert "ge-2" in selection.dropped_ids
+    assert "ge-1" not in selection.dropped_ids
+    assert selection.fact_check_results == fc
+    assert selection.tokens <= full - 200
+
+
+def test_trusted_scraped_pages_still_drop_before_search():
+    fc = []
+    search = {"geral": [_make_search("ge-1", "geral", position=9)]}
+    scraped = [
+        _make_scrape("sc-1", reliability=SourceReliability.MUITO_CONFIAVEL),
+        _make_scrape("sc-2", reliability=SourceReliability.NEUTRO),
+    ]
+    numbering = ContextFormatter().number(fc, search, scraped)
+    full = select_sources(fc, search, scraped, numbering, token_budget=10**6).tokens
+
+    selection = select_sources(fc, search, scraped, numbering, token_budget=full - 1)
+    assert selection.dropped_ids == ["sc-2"]
+
+    selection = select_sources(fc, search, scraped, numbering, token_budget=full // 2)
+    assert selection.dropped_ids == ["sc-1", "sc-2"]
+    assert _all_ids(selection) == ["ge-1"]
+
+
+def test_duplicate_urls_are_dropped_before_unique_sources():
+    shared = "https://g1.globo.com/story"
+    fc = []
+    search = {
+        "especifico": [_make_search("es-1", "especifico", url=shared)],
+        "geral": [_make_search("ge-1", "geral", url=shared + "?utm_source=x"), _make_search("ge-2", "geral", position=3)],
+    }
+    numbering = ContextFormatter().number(fc, search, [])
+    full = select_sources(fc, search, [], numbering, token_budget=10**6).tokens
+
+    selection = select_sources(fc, search, [], numbering, token_budget=full - 1)
+    assert selection.dropped_ids == ["ge-1"]
+    assert _all_ids(selection) == ["es-1", "ge-2"]
+
+
+def test_adjudication_prompt_keeps_reference_numbering_when_trimmed():
+    fc, search, scraped, numbering = _sources()
+    full = select_sources(fc, search, scraped, numbering, token_budget=10**6).tokens
+
+    _, user_prompt = build_adjudication_prompt(
+        formatted_data_sources="Test claim text",
+        fact_check_results=fc,
+        search_results=search,
+        scraped_pages=scraped,
+        token_budget=full - 200,
+    )
+    refs = {n: url for n, _title, url in build_source_reference_list(fc, search, scraped)}
+
+    prompt_numbers = {int(m) for m in re.findall(r"^\[(\d+)\]", user_prompt, re.MULTILINE)}
+    assert prompt_numbers < set(refs)
+    for number in prompt_numbers:
+        assert refs[number] in user_prompt
+    assert "omitida(s)" in user_prompt
+
+
+def test_adjudication_prompt_without_budget_includes_everything():
+    fc, search, scraped, _ = _sources()
+    _, user_prompt = build_adjudication_prompt(
+        formatted_data_sources="Test claim text",
+        fact_check_results=fc,
+        search_results=search,
+        scraped_pages=scraped,
+        token_budget=None,
+    )
+    assert {int(m) for m in re.findall(r"^\[(\d+)\]", user_prompt, re.MULTILINE)} == {1, 2, 3, 4, 5}
+    assert "omitida" not in user_prompt
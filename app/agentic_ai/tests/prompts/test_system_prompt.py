@@ -1,6 +1,8 @@
 """tests for system_prompt builder."""
 
+from app.agentic_ai.prompts.context_formatter import ContextFormatter
 from app.agentic_ai.prompts.system_prompt import build_system_prompt
+from app.agentic_ai.tests.conftest import _make_search
 
 
 def test_prompt_contains_iteration_info():
@@ -57,3 +59,30 @@ def test_prompt_contains_adaptive_strategy():
     )
     assert "_summary" in prompt
     assert "POUCOS resultados" in prompt
+
+
+def test_prompt_lists_most_relevant_sources_first():
+    claim = "Governo anuncia vacinação obrigatória contra dengue em São Paulo"
+    search = {"geral": [
+        _make_search("ge-1", title="Receita de bolo", snippet="como fazer bolo de cenoura"),
+        _make_search("ge-2", title="Vacina da dengue", snippet="vacinação obrigatória em São Paulo"),
+    ]}
+
+    def _build(**kwargs):
+        return build_system_prompt(
+            iteration_count=1,
+            fact_check_results=[],
+            search_results=search,
+            scraped_pages=[],
+            formatter=ContextFormatter(),
+            formatted_data_sources=claim,
+            **kwargs,
+        )
+
+    ranked = _build()
+    assert ranked.index("Vacina da dengue") < ranked.index("Receita de bolo")
+    # numbering follows arrival order either way
+    assert '[2] Title: "Vacina da dengue"' in ranked
+
+    unranked = _build(rank_by_relevance=False)
+    assert unranked.index("Receita de bolo") < unranked.index("Vacina da dengue")
@@ -21,7 +21,13 @@ from app.models.factchecking import (
     LLMClaimVerdict,
 )
 from app.models.commondata import DataSource
-from app.agentic_ai.graph import build_graph, extract_output
+from app.agentic_ai.graph import (
+    _make_route_after_agent,
+    _skip_tools_node,
+    _make_route_to_agent,
+    build_graph,
+    extract_output,
+)
 
 
 class MockFactChecker:
@@ -279,3 +285,305 @@ async def test_graph_retries_on_all_insufficient():
     assert isinstance(result, FactCheckResult)
     # second adjudication should produce "Falso"
     assert result.results[0].claim_verdicts[0].verdict == "Falso"
+
+
+
+@pytest.mark.asyncio
+async def test_tool_node_keeps_typed_artifacts_in_state():
+    """tool results reach state as the original objects; the LLM gets a compact preview."""
+    from langchain_core.messages import AIMessage, ToolMessage
+
+    page = WebScrapeContext(
+        id="sc-1",
+        url="https://example.com/page",
+        parent_id=None,
+        reliability=SourceReliability.POUCO_CONFIAVEL,
+        title="Page",
+        content="x" * 2000,
+        extraction_status="success",
+        extraction_tool="beautifulsoup",
+    )
+
+    class FullScraper:
+        async def scrape(self, targets):
+            return [page]
+
+    call = AIMessage(
+        content="",
+        tool_calls=[
+            {"name": "search_fact_check_api", "args": {"queries": ["q"]}, "id": "c1"},
+            {"name": "search_web", "args": {"queries": ["q"]}, "id": "c2"},
+            {"name": "scrape_pages", "args": {"targets": [{"url": page.url, "title": "Page"}]}, "id": "c3"},
+        ],
+    )
+    model = MagicMock()
+    bound = AsyncMock()
+    bound.ainvoke = AsyncMock(side_effect=[call, AIMessage(content="Done.")])
+    model.bind_tools = MagicMock(return_value=bound)
+
+    graph = build_graph(
+        model, MockFactChecker(), MockWebSearcher(), FullScraper(), _make_mock_adjudication_model()
+    )
+    final_state = await graph.ainvoke({
+        "messages": [],
+        "data_sources": [DataSource(id="ds-1", source_type="original_text", original_text="Test claim")],
+        "fact_check_results": [],
+        "search_results": {},
+        "scraped_pages": [],
+        "iteration_count": 0,
+        "pending_async_count": 0,
+        "formatted_data_sources": "",
+        "run_id": "test-run-artifacts",
+        "adjudication_result": None,
+        "retry_count": 0,
+        "retry_context": None,
+    })
+
+    # full objects in state, including fields never sent to the LLM
+    assert final_state["scraped_pages"][0] is page
+    assert final_state["fact_check_results"][0].id == "fc-1"
+    assert final_state["search_results"]["geral"][0].id == "gs-1"
+
+    scrape_msg = next(
+        m for m in final_state["messages"]
+        if isinstance(m, ToolMessage) and m.name == "scrape_pages"
+    )
+    assert len(json.loads(scrape_msg.content)[0]["content_preview"]) == 500
+
+
+@pytest.mark.asyncio
+async def test_tool_node_collapses_duplicates_across_domain_keys():
+    """the same page from geral and especifico reaches state once, as the reliable copy."""
+    from langchain_core.messages import AIMessage
+
+    def hit(id, key):
+        return GoogleSearchContext(
+            id=id,
+            url="https://g1.globo.com/story.ghtml" + ("?amp" if key == "geral" else ""),
+            parent_id=None,
+            reliability=(
+                SourceReliability.MUITO_CONFIAVEL if key == "especifico" else SourceReliability.NEUTRO
+            ),
+            title="Story",
+            snippet="snippet",
+        )
+
+    class DuplicatingSearcher:
+        async def search(self, queries, max_results_specific_search=5, max_results_general=5):
+            return {"geral": [hit("ge-1", "geral")], "especifico": [hit("es-1", "especifico")]}
+
+    call = AIMessage(
+        content="",
+        tool_calls=[{"name": "search_web", "args": {"queries": ["q"]}, "id": "c1"}],
+    )
+    model = MagicMock()
+    bound = AsyncMock()
+    bound.ainvoke = AsyncMock(side_effect=[call, AIMessage(content="Done.")])
+    model.bind_tools = MagicMock(return_value=bound)
+
+    graph = build_graph(
+        model, MockFactChecker(), DuplicatingSearcher(), MockScraper(), _make_mock_adjudication_model()
+    )
+    final_state = await graph.ainvoke({
+        "messages": [],
+        "data_sources": [DataSource(id="ds-1", source_type="original_text", original_text="Test claim")],
+        "fact_check_results": [],
+        "search_results": {},
+        "scraped_pages": [],
+        "iteration_count": 0,
+        "pending_async_count": 0,
+        "formatted_data_sources": "",
+        "run_id": "test-run-collapse",
+        "adjudication_result": None,
+        "retry_count": 0,
+        "retry_context": None,
+    })
+
+    assert [e.id for e in final_state["search_results"]["especifico"]] == ["es-1"]
+    assert final_state["search_results"]["geral"] == []
+    assert final_state["collapsed_sources"] == {
+        "https://g1.globo.com/story.ghtml": ["https://g1.globo.com/story.ghtml?amp"]
+    }
+
+
+@pytest.mark.asyncio
+async def test_tool_node_adds_prefetched_sources_to_state():
+    """the speculative prefetch's results reach state even when the agent's query differs."""
+    from langchain_core.messages import AIMessage
+
+    class QueryEchoSearcher:
+        async def search(self, queries, max_results_specific_search=5, max_results_general=5):
+            return {"geral": [
+                GoogleSearchContext(
+                    id=f"gs-{queries[0]}",
+                    url=f"https://test.com/{queries[0].replace(' ', '-')}",
+                    parent_id=None,
+                    reliability=SourceReliability.NEUTRO,
+                    title=queries[0],
+                    snippet="snippet",
+                    domain="test.com",
+                )
+            ]}
+
+    call = AIMessage(
+        content="",
+        tool_calls=[{"name": "search_web", "args": {"queries": ["agent query"]}, "id": "c1"}],
+    )
+    model = MagicMock()
+    bound = AsyncMock()
+    bound.ainvoke = AsyncMock(side_effect=[call, AIMessage(content="Done.")])
+    model.bind_tools = MagicMock(return_value=bound)
+
+    graph = build_graph(
+        model, MockFactChecker(), QueryEchoSearcher(), MockScraper(), _make_mock_adjudication_model()
+    )
+    final_state = await graph.ainvoke({
+        "messages": [],
+        "data_sources": [DataSource(id="ds-1", source_type="original_text", original_text="claim text")],
+        "fact_check_results": [],
+        "search_results": {},
+        "scraped_pages": [],
+        "iteration_count": 0,
+        "pending_async_count": 0,
+        "formatted_data_sources": "",
+        "run_id": "test-run-prefetch",
+        "adjudication_result": None,
+        "retry_count": 0,
+        "retry_context": None,
+    })
+
+    assert [e.id for e in final_state["search_results"]["geral"]] == ["gs-agent query", "gs-claim text"]
+    assert [e.id for e in final_state["fact_check_results"]] == ["fc-1"]
+
+
+# ---- deadline routing ----
+
+def _routing_state(deadline, pending=0, tool_calls=True):
+    msg = MagicMock()
+    msg.tool_calls = [{"name": "scrape_pages", "args": {}, "id": "1"}] if tool_calls else []
+    return {
+        "messages": [msg],
+        "deadline": deadline,
+        "pending_async_count": pending,
+        "iteration_count": 1,
+        "retry_count": 0,
+    }
+
+
+def test_route_after_agent_runs_tools_with_budget():
+    import time
+    router = _make_route_after_agent("tools")
+    assert router(_routing_state(None)) == "tools"
+    assert router(_routing_state(time.monotonic() + 300)) == "tools"
+
+
+def test_route_after_agent_skips_tools_when_deadline_close():
+    import time
+    router = _make_route_after_agent("tools")
+    assert router(_routing_state(time.monotonic() + 1)) == "skip_tools"
+    assert router(_routing_state(time.monotonic() + 1, pending=1)) == "skip_tools"
+
+
+@pytest.mark.asyncio
+async def test_skip_tools_answers_every_pending_tool_call():
+    from langchain_core.messages import AIMessage, ToolMessage
+
+    agent_msg = AIMessage(content="", tool_calls=[
+        {"name": "search_web", "args": {"queries": ["q"]}, "id": "call-1"},
+        {"name": "scrape_pages", "args": {"targets": []}, "id": "call-2"},
+    ])
+
+    update = await _skip_tools_node({"messages": [agent_msg]})
+
+    replies = update["messages"]
+    assert all(isinstance(m, ToolMessage) for m in replies)
+    assert [(m.tool_call_id, m.name) for m in replies] == [
+        ("call-1", "search_web"), ("call-2", "scrape_pages"),
+    ]
+    assert set(update) == {"messages"}
+
+
+@pytest.mark.asyncio
+async def test_graph_answers_skipped_tool_calls_before_adjudication():
+    import time
+    from langchain_core.messages import AIMessage, ToolMessage
+
+    call = AIMessage(
+        content="",
+        tool_calls=[{"name": "search_web", "args": {"queries": ["q"]}, "id": "c1"}],
+    )
+    model = MagicMock()
+    bound = AsyncMock()
+    bound.ainvoke = AsyncMock(return_value=call)
+    model.bind_tools = MagicMock(return_value=bound)
+    web_searcher = MockWebSearcher()
+    web_searcher.search = AsyncMock()
+
+    graph = build_graph(
+        model, MockFactChecker(), web_searcher, MockScraper(), _make_mock_adjudication_model(),
+        speculative_prefetch=False,
+    )
+    final_state = await graph.ainvoke({
+        "messages": [],
+        "data_sources": [DataSource(id="ds-1", source_type="original_text", original_text="Test claim")],
+        "fact_check_results": [],
+        "search_results": {},
+        "scraped_pages": [],
+        "iteration_count": 0,
+        "pending_async_count": 0,
+        "formatted_data_sources": "",
+        "deadline": time.monotonic() + 1,
+        "run_id": "test-run-skip-tools",
+        "adjudication_result": None,
+        "retry_count": 0,
+        "retry_context": None,
+    })
+
+    web_searcher.search.assert_not_called()
+    assert final_state["adjudication_result"] is not None
+    reply = final_state["messages"][-1]
+    assert isinstance(reply, ToolMessage) and reply.tool_call_id == "c1"
+
+
+@pytest.mark.asyncio
+async def test_graph_adjudicates_when_agent_cannot_get_vertex_capacity():
+    import contextlib
+    from unittest.mock import patch
+    from app.clients.governor import GovernorTimeout
+
+    @contextlib.asynccontextmanager
+    async def _exhausted(upstream):
+        raise GovernorTimeout(f"{upstream}: no capacity before deadline")
+        yield
+
+    model = _make_mock_model()
+    graph = build_graph(
+        model, MockFactChecker(), MockWebSearcher(), MockScraper(), _make_mock_adjudication_model(),
+        speculative_prefetch=False,
+    )
+    with patch("app.agentic_ai.nodes.context_agent.governed", _exhausted):
+        final_state = await graph.ainvoke({
+            "messages": [],
+            "data_sources": [DataSource(id="ds-1", source_type="original_text", original_text="Test claim")],
+            "fact_check_results": [],
+            "search_results": {},
+            "scraped_pages": [],
+            "iteration_count": 0,
+            "pending_async_count": 0,
+            "formatted_data_sources": "",
+            "run_id": "test-run-governor-timeout",
+            "adjudication_result": None,
+            "retry_count": 0,
+            "retry_context": None,
+        })
+
+    model.bind_tools.return_value.ainvoke.assert_not_called()
+    assert final_state["iteration_count"] == 1
+    assert isinstance(extract_output(final_state), FactCheckResult)
+
+
+def test_route_after_tools_jumps_to_adjudication_when_deadline_close():
+    import time
+    router = _make_route_to_agent("context_agent")
+    assert router(_routing_state(None)) == "context_agent"
+    assert router(_routing_state(time.monotonic() + 1)) == "adjudication"
@@ -4,7 +4,8 @@ covers:
 - run_fact_check returns GraphOutput with FactCheckResult on successful graph invocation
 - run_fact_check returns fallback FactCheckResult when graph returns ContextNodeOutput
 - initial state passed to graph contains the provided data_sources
-- _build_graph builds a fresh graph per call
+- get_graph builds the graph once per config and reuses it
+- swap_graph_config hot-swaps the active graph
 - data_sources are forwarded without mutation
 - GraphOutput includes source lists from graph state
 """
@@ -22,7 +23,20 @@ from app.models.factchecking import (
     DataSourceResult,
     FactCheckResult,
 )
-from app.agentic_ai.run import GraphOutput
+from app.agentic_ai.run import (
+    GraphConfig,
+    GraphOutput,
+    clear_graph_registry,
+    get_graph,
+    swap_graph_config,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_graph_registry():
+    clear_graph_registry()
+    yield
+    clear_graph_registry()
 
 
 # ---- helpers ----
@@ -149,11 +163,36 @@ async def test_run_fact_check_initial_state_has_correct_defaults():
     assert captured_state["retry_context"] is None
 
 
-# ---- test: fresh graph per call ----
+@pytest.mark.asyncio
+async def test_run_fact_check_sets_request_deadline():
+    """the request budget becomes an absolute deadline in the initial state."""
+    import time
+
+    captured_state = {}
+
+    async def _capture(state):
+        captured_state.update(state)
+        return {"adjudication_result": _make_fact_check_result()}
+
+    mock_graph = MagicMock()
+    mock_graph.ainvoke = _capture
+
+    with patch("app.agentic_ai.run._build_graph", return_value=mock_graph), \
+         patch("app.agentic_ai.graph.extract_output", return_value=_make_fact_check_result()):
+        from app.agentic_ai.run import run_fact_check
+        before = time.monotonic()
+        await run_fact_check([_make_data_source()], budget_seconds=60.0)
+        assert before + 59.0 < captured_state["deadline"] <= time.monotonic() + 60.0
+
+        await run_fact_check([_make_data_source()], budget_seconds=None)
+        assert captured_state["deadline"] is None
+
+
+# ---- test: graph registry ----
 
 @pytest.mark.asyncio
-async def test_build_graph_called_every_time():
-    """_build_graph should be called on every run_fact_check invocation."""
+async def test_build_graph_called_once_across_runs():
+    """the compiled graph is built on first use and reused by later runs."""
     mock_graph = MagicMock()
     mock_graph.ainvoke = AsyncMock(return_value={"adjudication_result": _make_fact_check_result()})
 
@@ -164,7 +203,55 @@ async def test_build_graph_called_every_time():
         await run_fact_check([_make_data_source()])
         await run_fact_check([_make_data_source()])
 
-    assert mock_build.call_count == 3
+    assert mock_build.call_count == 1
+    assert mock_graph.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_runs_share_one_graph():
+    """concurrent requests reuse the same compiled graph."""
+    mock_graph = MagicMock()
+    mock_graph.ainvoke = AsyncMock(return_value={"adjudication_result": _make_fact_check_result()})
+
+    with patch("app.agentic_ai.run._build_graph", return_value=mock_graph) as mock_build, \
+         patch("app.agentic_ai.graph.extract_output", return_value=_make_fact_check_result()):
+        from app.agentic_ai.run import run_fact_check
+        await asyncio.gather(*(run_fact_check([_make_data_source()]) for _ in range(5)))
+
+    assert mock_build.call_count == 1
+
+
+def test_get_graph_keyed_by_config():
+    """different configs get different graphs, same config hits the registry."""
+    graphs = {}
+
+    def _fake_build(config):
+        graphs[config] = MagicMock(name=config.model)
+        return graphs[config]
+
+    other = GraphConfig(model="other-model")
+    with patch("app.agentic_ai.run._build_graph", side_effect=_fake_build) as mock_build:
+        default_graph = get_graph()
+        assert get_graph() is default_graph
+        other_graph = get_graph(other)
+
+    assert other_graph is not default_graph
+    assert other_graph is graphs[other]
+    assert mock_build.call_count == 2
+
+
+def test_swap_graph_config_changes_active_graph():
+    """swap_graph_config compiles the new graph and makes it the default."""
+    new_config = GraphConfig(model="swapped-model")
+
+    with patch("app.agentic_ai.run._build_graph", side_effect=lambda c: MagicMock(name=c.model)):
+        old_graph = get_graph()
+        previous = swap_graph_config(new_config)
+        new_graph = get_graph()
+
+    assert previous == GraphConfig()
+    assert new_graph is not old_graph
+    assert new_graph is get_graph(new_config)
 
 
 # ---- test: multiple data sources ----
@@ -191,3 +278,49 @@ async def test_run_fact_check_with_multiple_data_sources():
     assert len(captured_state["data_sources"]) == 2
     assert captured_state["data_sources"][0].id == "ds-1"
     assert captured_state["data_sources"][1].id == "ds-2"
+
+
+# ---- test: streaming ----
+
+@pytest.mark.asyncio
+async def test_stream_fact_check_yields_node_events_then_output():
+    """stream_fact_check yields one event per node update and a final 'done' event."""
+    from langchain_core.messages import AIMessage
+    from app.agentic_ai.run import stream_fact_check
+
+    final = _make_fact_check_result()
+    agent_msg = AIMessage(
+        content="",
+        tool_calls=[{"name": "search_web", "args": {"queries": ["q1"]}, "id": "tc-1"}],
+    )
+
+    async def _astream(state, stream_mode):
+        yield "updates", {"format_input": {"pending_async_count": 2}}
+        yield "updates", {"context_agent": {"messages": [agent_msg], "iteration_count": 1}}
+        yield "updates", {"adjudication": {"adjudication_result": final}}
+        yield "values", {**state, "adjudication_result": final}
+
+    mock_graph = MagicMock()
+    mock_graph.astream = _astream
+
+    with patch("app.agentic_ai.run._build_graph", return_value=mock_graph):
+        events = [e async for e in stream_fact_check([_make_data_source()])]
+
+    assert [e.node for e in events] == ["format_input", "context_agent", "adjudication", "done"]
+    assert events[0].data == {"pending_links": 2, "expanded_links": 0}
+    assert events[1].data["tool_calls"] == [{"name": "search_web", "queries": ["q1"]}]
+    assert events[2].data["claims"] == 1
+    assert events[-1].output.result is final
+
+
+def test_summarize_node_update_tools_counts():
+    """tool node summaries report accumulated source totals."""
+    from app.agentic_ai.run import summarize_node_update
+
+    summary = summarize_node_update("tools", {
+        "messages": [MagicMock(), MagicMock()],
+        "fact_check_results": [MagicMock()],
+        "search_results": {"geral": [MagicMock(), MagicMock()], "especifico": [MagicMock()]},
+    })
+
+    assert summary == {"tool_results": 2, "fact_check_total": 1, "search_total": 3}
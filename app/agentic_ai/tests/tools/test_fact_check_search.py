@@ -134,12 +134,10 @@ async def test_search_deduplicates_urls_across_queries():
     mock_response.json.return_value = api_response
     mock_response.raise_for_status = MagicMock()
 
-    with patch("app.agentic_ai.tools.fact_check_search.httpx.AsyncClient") as mock_client_cls:
+    with patch("app.agentic_ai.tools.fact_check_search.get_http_client") as mock_get_client:
         mock_client = AsyncMock()
         mock_client.get = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-        mock_client_cls.return_value = mock_client
+        mock_get_client.return_value = mock_client
 
         tool = FactCheckSearchTool(api_key="test-key", max_results=10)
         results = await tool.search(["query1", "query2"])
@@ -8,6 +8,15 @@ from app.agentic_ai.tools.web_search import (
     _build_query_with_trusted_domains,
     _custom_search,
 )
+from app.clients.web_search_cache import reset_l1_cache
+
+
+@pytest.fixture(autouse=True)
+def _clean_search_cache():
+    """keep the in-process search cache from leaking results between tests."""
+    reset_l1_cache()
+    yield
+    reset_l1_cache()
 
 
 def test_build_query_with_trusted_domains_empty():
@@ -100,6 +109,43 @@ async def test_search_allows_same_url_across_domain_keys():
             assert results[key][0].url == "https://shared.com/article"
 
 
+@pytest.mark.asyncio
+async def test_search_batches_redis_round_trips():
+    """all domain searches of a tool call share one pipelined GET and one pipelined SET."""
+    items = [{"link": "https://a.com", "title": "A", "snippet": "s", "displayLink": "a.com"}]
+
+    with patch("app.agentic_ai.tools.web_search._custom_search", new_callable=AsyncMock) as mock_search, \
+         patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock) as mock_mget, \
+         patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock) as mock_mset:
+        mock_search.return_value = items
+        mock_mget.side_effect = lambda keys: [(None, None)] * len(keys)
+        tool = WebSearchTool()
+        await tool.search(["q1", "q2"])
+
+        mock_mget.assert_awaited_once()
+        assert len(mock_mget.call_args.args[0]) == 4
+        mock_mset.assert_awaited_once()
+        assert len(mock_mset.call_args.args[0]) == 4
+        assert mock_search.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_search_error_in_one_domain_keeps_others():
+    items = [{"link": "https://a.com", "title": "A", "snippet": "s", "displayLink": "a.com"}]
+
+    async def fake_search(query, *, num, domains, timeout):
+        if domains:
+            raise Exception("server down")
+        return items
+
+    with patch("app.agentic_ai.tools.web_search._custom_search", new_callable=AsyncMock, side_effect=fake_search):
+        tool = WebSearchTool()
+        results = await tool.search(["q"])
+
+        assert [e.url for e in results["geral"]] == ["https://a.com"]
+        assert results["especifico"] == []
+
+
 @pytest.mark.asyncio
 async def test_custom_search_sends_domains_params():
     mock_response = MagicMock()
@@ -107,11 +153,10 @@ async def test_custom_search_sends_domains_params():
     mock_response.json.return_value = {"results": []}
 
     with patch.dict("os.environ", {"WEB_SERCH_SERVER_URL": "http://127.0.0.1:6050"}):
-        with patch("app.agentic_ai.tools.web_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.agentic_ai.tools.web_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.get.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await _custom_search(
                 "climate",
@@ -0,0 +1,68 @@
+"""tests for per-request deadline helpers."""
+
+import asyncio
+import time
+
+import pytest
+
+from app.agentic_ai.config import MIN_CALL_TIMEOUT
+from app.agentic_ai.utils.deadline import (
+    clamp_timeout,
+    current_deadline,
+    deadline_scope,
+    has_budget,
+    make_deadline,
+    remaining,
+)
+
+
+def test_make_deadline_none_means_no_budget():
+    assert make_deadline(None) is None
+    assert remaining(None) is None
+    assert has_budget(None, 1000.0)
+
+
+def test_remaining_counts_down_and_never_negative():
+    deadline = make_deadline(10.0)
+    assert 9.0 < remaining(deadline) <= 10.0
+    assert remaining(time.monotonic() - 5) == 0.0
+
+
+def test_has_budget():
+    deadline = make_deadline(30.0)
+    assert has_budget(deadline, 20.0)
+    assert not has_budget(deadline, 40.0)
+
+
+def test_clamp_timeout_without_deadline_returns_default():
+    assert clamp_timeout(35.0) == 35.0
+
+
+def test_clamp_timeout_shrinks_to_remaining_minus_reserve():
+    timeout = clamp_timeout(35.0, make_deadline(30.0), reserve=10.0)
+    assert 19.0 < timeout <= 20.0
+
+
+def test_clamp_timeout_never_below_floor():
+    assert clamp_timeout(35.0, time.monotonic() - 1, reserve=10.0) == MIN_CALL_TIMEOUT
+
+
+def test_deadline_scope_publishes_to_clamp_and_resets():
+    deadline = make_deadline(15.0)
+    with deadline_scope(deadline):
+        assert current_deadline() == deadline
+        assert clamp_timeout(35.0) <= 15.0
+    assert current_deadline() is None
+    assert clamp_timeout(35.0) == 35.0
+
+
+@pytest.mark.asyncio
+async def test_deadline_scope_inherited_by_child_tasks():
+    deadline = make_deadline(15.0)
+
+    async def child():
+        return current_deadline()
+
+    with deadline_scope(deadline):
+        seen = await asyncio.gather(asyncio.create_task(child()))
+    assert seen == [deadline]
@@ -0,0 +1,91 @@
+"""tests for message-history compaction."""
+
+import json
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from app.agentic_ai.tests.conftest import _make_scrape, _make_search
+from app.agentic_ai.utils.history import compact_history, estimate_tokens, tool_receipt
+
+
+def _search_round(call_id: str, ids: list[str]) -> list:
+    """an AIMessage calling search_web plus its ToolMessage."""
+    entries = [_make_search(i) for i in ids]
+    content = json.dumps({
+        "geral": [{"id": e.id, "title": e.title, "snippet": e.snippet} for e in entries],
+        "_summary": {"total_results": len(entries), "per_domain": {"geral": len(entries)}},
+    })
+    return [
+        AIMessage(content="", tool_calls=[{"id": call_id, "name": "search_web", "args": {"queries": ["q"]}}]),
+        ToolMessage(
+            content=content,
+            tool_call_id=call_id,
+            name="search_web",
+            artifact={"geral": entries},
+            id=f"msg-{call_id}",
+        ),
+    ]
+
+
+def test_older_rounds_become_receipts_and_last_round_is_kept():
+    history = [HumanMessage(content="claim")] + _search_round("c1", ["a", "b"]) + _search_round("c2", ["c"])
+
+    compacted = compact_history(history, numbering={"a": 1, "b": 2, "c": 3}, token_budget=10**6)
+
+    receipt = json.loads(compacted[2].content)
+    assert receipt["_compacted"] is True
+    assert receipt["ids"] == ["a", "b"]
+    assert receipt["refs"] == [1, 2]
+    assert receipt["_summary"]["total_results"] == 2
+    assert compacted[4] is history[4]
+    assert compacted[0] is history[0] and compacted[1] is history[1]
+
+
+def test_receipt_keeps_tool_call_pairing_and_message_id():
+    msg = _search_round("c1", ["a"])[1]
+    receipt = tool_receipt(msg)
+
+    assert receipt.tool_call_id == "c1"
+    assert receipt.name == "search_web"
+    assert receipt.id == "msg-c1"
+    assert len(receipt.content) < len(msg.content)
+
+
+def test_receipt_for_list_content_counts_entries():
+    msg = ToolMessage(
+        content=json.dumps([{"id": "p1", "content_preview": "x" * 500}]),
+        tool_call_id="c1",
+        name="scrape_pages",
+        artifact=[_make_scrape("p1")],
+    )
+    receipt = json.loads(tool_receipt(msg).content)
+    assert receipt["ids"] == ["p1"]
+    assert receipt["_summary"] == {"total_results": 1}
+
+
+def test_over_budget_compacts_recent_round_too():
+    history = [HumanMessage(content="claim")] + _search_round("c1", ["a", "b", "c"])
+
+    assert compact_history(history, token_budget=10**6)[2] is history[2]
+    compacted = compact_history(history, token_budget=50)
+    assert json.loads(compacted[2].content)["_compacted"] is True
+    assert estimate_tokens(compacted) < estimate_tokens(history)
+
+
+def test_error_tool_messages_are_left_alone():
+    error = ToolMessage(content="Error: boom", tool_call_id="c1", name="search_web", status="error")
+    history = [
+        AIMessage(content="", tool_calls=[{"id": "c1", "name": "search_web", "args": {}}]),
+        error,
+    ] + _search_round("c2", ["a"])
+
+    compacted = compact_history(history, token_budget=0)
+    assert compacted[1] is error
+
+
+def test_input_list_is_not_mutated():
+    history = _search_round("c1", ["a"]) + _search_round("c2", ["b"])
+    original = list(history)
+
+    compact_history(history)
+    assert history == original
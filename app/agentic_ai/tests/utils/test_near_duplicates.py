@@ -0,0 +1,131 @@
+"""tests for near-duplicate source collapsing."""
+
+import pytest
+
+from app.agentic_ai.tests.conftest import _make_fact_check, _make_scrape, _make_search
+from app.agentic_ai.utils.near_duplicates import (
+    collapse_near_duplicates,
+    estimated_jaccard,
+    minhash,
+    normalize_url,
+    reset_signature_cache,
+)
+
+STORY = (
+    "O Ministério da Saúde confirmou nesta terça-feira a ampliação da vacinação "
+    "contra a dengue para adolescentes de 10 a 14 anos em todos os estados do país"
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_signatures():
+    reset_signature_cache()
+    yield
+    reset_signature_cache()
+
+
+def test_normalize_url_folds_amp_variants():
+    canonical = normalize_url("https://g1.globo.com/saude/noticia/2025/dengue.ghtml")
+    assert normalize_url("https://g1.globo.com/saude/noticia/2025/dengue.ghtml?amp") == canonical
+    assert normalize_url("https://g1.globo.com/amp/saude/noticia/2025/dengue.ghtml") == canonical
+    assert normalize_url("https://amp.g1.globo.com/saude/noticia/2025/dengue.ghtml/") == canonical
+    assert normalize_url("https://site.com/story.amp.html") == normalize_url("https://site.com/story.html")
+
+
+def test_minhash_estimates_similarity():
+    same = minhash(STORY)
+    edited = minhash(STORY.replace("nesta terça-feira", "hoje"))
+    other = minhash(
+        "Campeonato Brasileiro tem rodada decisiva neste domingo com clássicos "
+        "no Rio de Janeiro e em São Paulo pela liderança da tabela"
+    )
+    assert estimated_jaccard(same, minhash(STORY)) == 1.0
+    assert estimated_jaccard(same, edited) > 0.5
+    assert estimated_jaccard(same, other) < 0.2
+    assert minhash("texto curto demais") is None
+
+
+def test_syndicated_copies_keep_the_most_reliable():
+    search = {
+        "especifico": [_make_search("es-1", "especifico", url="https://folha.uol.com.br/dengue", snippet=STORY, position=3)],
+        "geral": [
+            _make_search("ge-1", url="https://portal-regional.com.br/dengue", snippet=STORY, position=1),
+            _make_search("ge-2", url="https://outro.com/futebol", snippet="Rodada decisiva do campeonato brasileiro neste domingo com clássicos no Rio"),
+        ],
+    }
+
+    _, collapsed_search, _, record = collapse_near_duplicates([], search, [])
+
+    assert [e.id for e in collapsed_search["especifico"]] == ["es-1"]
+    assert [e.id for e in collapsed_search["geral"]] == ["ge-2"]
+    assert record == {"https://folha.uol.com.br/dengue": ["https://portal-regional.com.br/dengue"]}
+
+
+def test_same_page_across_domain_keys_and_amp_is_collapsed():
+    search = {
+        "especifico": [_make_search("es-1", "especifico", url="https://g1.globo.com/x.ghtml", snippet="curto")],
+        "geral": [_make_search("ge-1", url="https://g1.globo.com/amp/x.ghtml", snippet="outro texto curto")],
+    }
+    _, collapsed_search, _, record = collapse_near_duplicates([], search, [])
+
+    assert [e.id for e in collapsed_search["especifico"]] == ["es-1"]
+    assert collapsed_search["geral"] == []
+    assert record == {"https://g1.globo.com/x.ghtml": ["https://g1.globo.com/amp/x.ghtml"]}
+
+
+def test_fact_checks_are_only_collapsed_by_url():
+    fact_checks = [
+        _make_fact_check("fc-1", url="https://lupa.uol.com.br/a", claim_text=STORY),
+        _make_fact_check("fc-2", url="https://aosfatos.org/b", claim_text=STORY, publisher="Aos Fatos"),
+        _make_fact_check("fc-3", url="https://lupa.uol.com.br/a?utm_source=x", claim_text=STORY),
+    ]
+    kept, _, _, record = collapse_near_duplicates(fact_checks, {}, [])
+
+    assert [e.id for e in kept] == ["fc-1", "fc-2"]
+    assert record == {"https://lupa.uol.com.br/a": ["https://lupa.uol.com.br/a?utm_source=x"]}
+
+
+def test_presented_entries_stay_representatives():
+    first = _make_search("ge-1", url="https://a.com/dengue", snippet=STORY)
+    second = _make_search("ge-2", url="https://b.com/dengue", snippet=STORY, position=2)
+    _, search, _, record = collapse_near_duplicates([], {"geral": [first, second]}, [])
+    assert record == {"https://a.com/dengue": ["https://b.com/dengue"]}
+
+    # more reliable, but ge-1 was already numbered for the agent: the newcomer collapses
+    better = _make_search("es-1", "especifico", url="https://g1.globo.com/dengue", snippet=STORY)
+    _, search, _, record = collapse_near_duplicates(
+        [], {"geral": search["geral"], "especifico": [better]}, [], record, presented={"ge-1"}
+    )
+    assert search == {"geral": [first], "especifico": []}
+    assert record == {"https://a.com/dengue": ["https://b.com/dengue", "https://g1.globo.com/dengue"]}
+
+
+def test_better_arrival_in_the_same_round_becomes_representative():
+    first = _make_search("ge-1", url="https://a.com/dengue", snippet=STORY)
+    better = _make_search("es-1", "especifico", url="https://g1.globo.com/dengue", snippet=STORY)
+    _, search, _, record = collapse_near_duplicates([], {"geral": [first], "especifico": [better]}, [])
+    assert search == {"geral": [], "especifico": [better]}
+    assert record == {"https://g1.globo.com/dengue": ["https://a.com/dengue"]}
+
+
+def test_presented_entries_bridged_by_a_new_arrival_are_both_kept():
+    # same url as a, same text as b
+    a = _make_search("ge-1", url="https://a.com/x", snippet="curto")
+    b = _make_search("ge-2", url="https://b.com/dengue", snippet=STORY)
+    bridge = _make_search("ge-3", url="https://a.com/x?amp", snippet=STORY)
+    _, search, _, _ = collapse_near_duplicates(
+        [], {"geral": [a, b, bridge]}, [], presented={"ge-1", "ge-2"}
+    )
+    assert [e.id for e in search["geral"]] == ["ge-1", "ge-2"]
+
+
+def test_scraped_pages_are_not_collapsed_into_search_hits():
+    page = _make_scrape(
+        "sc-1", url="https://folha.uol.com.br/dengue", title="Vacina da dengue", content=STORY,
+    )
+    search = {"especifico": [_make_search("es-1", "especifico", url="https://folha.uol.com.br/dengue", snippet=STORY)]}
+
+    _, kept_search, kept_pages, record = collapse_near_duplicates([], search, [page])
+    assert kept_pages == [page]
+    assert kept_search["especifico"][0].id == "es-1"
+    assert record == {}
@@ -12,6 +12,11 @@ from typing import Optional
 
 import httpx
 
+from app.agentic_ai.config import ADJUDICATION_RESERVE_SECONDS
+from app.agentic_ai.utils.deadline import clamp_timeout
+from app.clients.fact_check_cache import cached_fact_check_search
+from app.clients.governor import governed
+from app.clients.http_pool import get_http_client
 from app.models.agenticai import FactCheckApiContext, SourceReliability
 from app.ai.context.factcheckapi.google_factcheck_gatherer import (
     map_english_rating_to_portuguese,
@@ -30,10 +35,13 @@ class FactCheckSearchTool:
         api_key: Optional[str] = None,
         max_results: int = 10,
         timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY", "")
         self.max_results = max_results
         self.timeout = timeout
+        # injected client wins; otherwise the shared pool for the fact check api
+        self._http_client = http_client
 
     async def search(self, queries: list[str]) -> list[FactCheckApiContext]:
         """run all queries concurrently and return merged results."""
@@ -66,14 +74,8 @@ class FactCheckSearchTool:
             logger.warning("missing GOOGLE_API_KEY, skipping fact-check search")
             return []
 
-        params = {"query": query, "key": self.api_key}
-
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(BASE_URL, params=params)
-                response.raise_for_status()
-
-            data = response.json()
+            data = await cached_fact_check_search(query, original_search_fn=self._fetch)
             return self._parse_response(data)
 
         except httpx.TimeoutException:
@@ -86,6 +88,16 @@ class FactCheckSearchTool:
             logger.error(f"fact-check api unexpected error: {e}")
             return []
 
+    async def _fetch(self, query: str) -> dict:
+        """raw API call for a single query; raises on http errors."""
+        params = {"query": query, "key": self.api_key}
+        client = self._http_client or get_http_client("fact_check_api")
+        timeout = clamp_timeout(self.timeout, reserve=ADJUDICATION_RESERVE_SECONDS)
+        async with governed("fact_check_api"):
+            response = await client.get(BASE_URL, params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
     def _parse_response(self, data: dict) -> list[FactCheckApiContext]:
         """parse API response into FactCheckApiContext objects."""
         results: list[FactCheckApiContext] = []
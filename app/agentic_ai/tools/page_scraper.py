@@ -11,7 +11,8 @@ from uuid import uuid4
 from app.models.agenticai import ScrapeTarget, WebScrapeContext, SourceReliability
 from app.ai.context.web.apify_utils import scrapeGenericUrl
 
-from app.agentic_ai.config import SCRAPE_TIMEOUT_PER_PAGE
+from app.agentic_ai.config import ADJUDICATION_RESERVE_SECONDS, SCRAPE_TIMEOUT_PER_PAGE
+from app.agentic_ai.utils.deadline import clamp_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class PageScraperTool:
         try:
             raw = await asyncio.wait_for(
                 scrapeGenericUrl(target.url),
-                timeout=self.timeout,
+                timeout=clamp_timeout(self.timeout, reserve=ADJUDICATION_RESERVE_SECONDS),
             )
 
             success = raw.get("success", False)
@@ -5,19 +5,27 @@ reuses google_search() from app.ai.context.web.google_search
 and trusted domains from app.config.trusted_domains.
 """
 
-import asyncio
 import logging
 import os
 from urllib.parse import urlparse
 from uuid import uuid4
 
-import httpx
-
+from app.clients.governor import governed
+from app.clients.hedging import get_hedger
+from app.clients.http_pool import get_http_client
 from app.models.agenticai import GoogleSearchContext, SourceReliability
 from app.config.trusted_domains import get_trusted_domains
-from app.clients.web_search_cache import cached_custom_search
-
-from app.agentic_ai.config import DOMAIN_SEARCHES, SEARCH_TIMEOUT_PER_QUERY
+from app.clients.web_search_cache import SearchRequest, cached_custom_search_many
+
+from app.agentic_ai.config import (
+    ADJUDICATION_RESERVE_SECONDS,
+    DOMAIN_SEARCHES,
+    SEARCH_HEDGE_MAX_RATIO,
+    SEARCH_HEDGE_QUANTILE,
+    SEARCH_HEDGING_ENABLED,
+    SEARCH_TIMEOUT_PER_QUERY,
+)
+from app.agentic_ai.utils.deadline import clamp_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -56,8 +64,8 @@ class WebSearchTool:
             key: [] for key in DOMAIN_SEARCHES
         }
 
-        tasks = []
-        task_keys = []
+        searches: list[SearchRequest] = []
+        search_cfgs: list[tuple[str, SourceReliability]] = []
 
         for query in queries:
             for domain_key, domain_cfg in DOMAIN_SEARCHES.items():
@@ -68,26 +76,31 @@ class WebSearchTool:
                 max_cfg = domain_cfg.get("max_results_per_call")
                 final_max_results = max_cfg if max_cfg else base_max
 
-                tasks.append(
-                    self._search_single(
+                # for general search, use trusted domains via server params
+                searches.append(
+                    SearchRequest(
                         query=query,
-                        domain_key=domain_key,
-                        site_search=domain_cfg["site_search"],
-                        site_search_filter=domain_cfg["site_search_filter"],
+                        num=min(final_max_results, 50),
                         domains=domain_cfg.get("domains"),
-                        reliability=domain_cfg["reliability"],
-                        max_results=final_max_results,
                     )
                 )
-                task_keys.append(domain_key)
+                search_cfgs.append((domain_key, domain_cfg["reliability"]))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # one batched cache lookup for the whole tool call; only misses hit the server
+        try:
+            timeout = clamp_timeout(self.timeout, reserve=ADJUDICATION_RESERVE_SECONDS)
+            outcomes = await _cached_custom_search_many(searches, timeout=timeout)
+        except Exception as e:
+            logger.error(f"web search unexpected error: {e!r}", exc_info=True)
+            outcomes = [e] * len(searches)
 
-        for key, result in zip(task_keys, results):
-            if isinstance(result, list):
-                merged[key].extend(result)
-            elif isinstance(result, Exception):
-                logger.error(f"web search error for {key}: {result}")
+        for (domain_key, reliability), outcome in zip(search_cfgs, outcomes):
+            if isinstance(outcome, WebSearchError):
+                logger.error(f"web search error ({domain_key}): {outcome!r}")
+            elif isinstance(outcome, BaseException):
+                logger.error(f"web search unexpected error ({domain_key}): {outcome!r}")
+            else:
+                merged[domain_key].extend(_to_search_contexts(outcome, reliability))
 
         # dedup by URL within each domain key — keeps first occurrence
         total_before = sum(len(v) for v in merged.values())
@@ -108,56 +121,33 @@ class WebSearchTool:
         )
         return merged
 
-    async def _search_single(
-        self,
-        query: str,
-        domain_key: str,
-        site_search: str | None,
-        site_search_filter: str | None,
-        domains: list[str] | None,
-        reliability: SourceReliability,
-        max_results: int,
-    ) -> list[GoogleSearchContext]:
-        """execute a single search against one domain configuration."""
-        try:
-            effective_query = query
-
-            # for general search, use trusted domains via server params
-            items = await _cached_custom_search(
-                query=effective_query,
-                num=min(max_results, 50),
-                domains=domains,
-                timeout=self.timeout,
-            )
-
-            results: list[GoogleSearchContext] = []
-            for position, item in enumerate(items, 1):
-                url = item.get("link", "")
-                title = item.get("title", "")
-                if not url:
-                    continue
-
-                results.append(
-                    GoogleSearchContext(
-                        id=str(uuid4()),
-                        url=url,
-                        parent_id=None,
-                        reliability=reliability,
-                        title=title,
-                        snippet=item.get("snippet", ""),
-                        domain=item.get("displayLink", ""),
-                        position=position,
-                    )
-                )
 
-            return results
+def _to_search_contexts(
+    items: list[dict],
+    reliability: SourceReliability,
+) -> list[GoogleSearchContext]:
+    """map raw search server items to GoogleSearchContext, skipping items without a link."""
+    results: list[GoogleSearchContext] = []
+    for position, item in enumerate(items, 1):
+        url = item.get("link", "")
+        title = item.get("title", "")
+        if not url:
+            continue
+
+        results.append(
+            GoogleSearchContext(
+                id=str(uuid4()),
+                url=url,
+                parent_id=None,
+                reliability=reliability,
+                title=title,
+                snippet=item.get("snippet", ""),
+                domain=item.get("displayLink", ""),
+                position=position,
+            )
+        )
 
-        except WebSearchError as e:
-            logger.error(f"web search error ({domain_key}): {e!r}", exc_info=True)
-            return []
-        except Exception as e:
-            logger.error(f"web search unexpected error ({domain_key}): {e!r}", exc_info=True)
-            return []
+    return results
 
 
 async def _custom_search(
@@ -185,15 +175,30 @@ async def _custom_search(
     for domain in domain_params:
         params.append(("domains", domain))
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(f"{base_url}/search", params=params)
+    client = get_http_client("search_server")
 
-    if response.status_code != 200:
-        raise WebSearchError(
-            f"search server returned {response.status_code}: {response.text[:200]}"
+    async def _request() -> dict:
+        response = await client.get(f"{base_url}/search", params=params, timeout=timeout)
+        if response.status_code != 200:
+            raise WebSearchError(
+                f"search server returned {response.status_code}: {response.text[:200]}"
+            )
+        return response.json()
+
+    if SEARCH_HEDGING_ENABLED:
+        # a slow tail here stalls the whole agent iteration — race a backup past p95;
+        # the pair shares one timeout and each attempt takes its own governor slot
+        hedger = get_hedger(
+            f"search_server:{base_url}",
+            quantile=SEARCH_HEDGE_QUANTILE,
+            max_hedge_ratio=SEARCH_HEDGE_MAX_RATIO,
         )
-
-    data = response.json()
+        data = await hedger.run(
+            _request, timeout=timeout, slot=lambda: governed("search_server")
+        )
+    else:
+        async with governed("search_server"):
+            data = await _request()
     results = data.get("results", []) or []
 
     mapped: list[dict] = []
@@ -214,18 +219,14 @@ async def _custom_search(
     return mapped
 
 
-async def _cached_custom_search(
-    query: str,
+async def _cached_custom_search_many(
+    searches: list[SearchRequest],
     *,
-    num: int,
-    domains: list[str] | None,
     timeout: float,
-) -> list[dict]:
-    """cache-through wrapper that delegates to cached_custom_search."""
-    return await cached_custom_search(
-        query,
-        num=num,
-        domains=domains,
+) -> list[list[dict] | BaseException]:
+    """batched cache-through wrapper that delegates to cached_custom_search_many."""
+    return await cached_custom_search_many(
+        searches,
         timeout=timeout,
         original_search_fn=_custom_search,
     )
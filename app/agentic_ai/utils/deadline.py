@@ -0,0 +1,76 @@
+"""
+per-request deadline helpers.
+
+run_fact_check stores an absolute time.monotonic() deadline in
+ContextAgentState["deadline"]. routers and nodes read it from state; tools
+can't see state, so the tool node also publishes it through a contextvar
+(child tasks inherit it) and tools size their timeouts with
+clamp_timeout().
+
+a missing deadline (None) means "no budget" — every helper then falls back
+to the fixed per-call constants, which keeps the CLI and tests unchanged.
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from app.agentic_ai.config import MIN_CALL_TIMEOUT
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar("fact_check_deadline", default=None)
+
+
+def make_deadline(budget_seconds: Optional[float]) -> Optional[float]:
+    """absolute deadline budget_seconds from now, or None for no budget."""
+    if budget_seconds is None:
+        return None
+    return time.monotonic() + budget_seconds
+
+
+def remaining(deadline: Optional[float]) -> Optional[float]:
+    """seconds left until deadline (never negative), or None without a deadline."""
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def has_budget(deadline: Optional[float], needed: float) -> bool:
+    """true when there is no deadline or at least `needed` seconds remain."""
+    left = remaining(deadline)
+    return left is None or left >= needed
+
+
+def clamp_timeout(
+    default: float,
+    deadline: Optional[float] = None,
+    reserve: float = 0.0,
+) -> float:
+    """default, shrunk to what the deadline allows after `reserve` seconds.
+
+    uses the contextvar deadline when none is passed. never goes below
+    MIN_CALL_TIMEOUT so a late call fails fast instead of with a zero timeout.
+    """
+    if deadline is None:
+        deadline = _current_deadline.get()
+    left = remaining(deadline)
+    if left is None:
+        return default
+    return max(MIN_CALL_TIMEOUT, min(default, left - reserve))
+
+
+def current_deadline() -> Optional[float]:
+    """deadline published by the enclosing deadline_scope, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """publish deadline to code (and tasks spawned) inside the block."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,135 @@
+"""
+message-history compaction for the context agent.
+
+every tool result is stored twice: as the raw JSON ToolMessage the LLM saw
+when the tool returned, and as typed entries in state that the system
+prompt renders (with [N] numbers) on every iteration. once a tool round is
+behind us its raw JSON only repeats what the prompt already shows, so
+compact_history swaps it for a short receipt: the entry ids, their [N]
+numbers and the tool's _summary counts.
+
+receipts keep the original tool_call_id, name and message id, so tool-call
+pairing is untouched. compaction only shapes the LLM input; the messages in
+state stay as they are.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Optional
+
+from langchain_core.messages import BaseMessage, ToolMessage
+
+from app.agentic_ai.config import HISTORY_KEEP_RECENT_TOOL_ROUNDS, HISTORY_TOKEN_BUDGET
+from app.agentic_ai.utils.tokens import estimate_tokens as estimate_text_tokens
+
+logger = logging.getLogger(__name__)
+
+RECEIPT_NOTE = "conteudo completo nas fontes do prompt de sistema"
+
+
+def _content_text(msg: BaseMessage) -> str:
+    content = msg.content
+    if isinstance(content, str):
+        return content
+    # multimodal content: count text parts only
+    return "".join(
+        part.get("text", "") if isinstance(part, dict) else str(part)
+        for part in content
+    )
+
+
+def estimate_tokens(messages: list[BaseMessage]) -> int:
+    """rough token count of the messages' content."""
+    return sum(estimate_text_tokens(_content_text(m)) for m in messages)
+
+
+def _artifact_ids(artifact: Any) -> list[str]:
+    """entry ids from a tool artifact (list of entries or domain → list dict)."""
+    if isinstance(artifact, dict):
+        entries = [e for group in artifact.values() for e in group]
+    else:
+        entries = list(artifact)
+    return [e.id for e in entries if getattr(e, "id", None)]
+
+
+def _is_compactable(msg: BaseMessage) -> bool:
+    """successful tool results only — errors carry no artifact and are short anyway."""
+    return (
+        isinstance(msg, ToolMessage)
+        and getattr(msg, "artifact", None) is not None
+        and not _is_receipt(msg)
+    )
+
+
+def _is_receipt(msg: ToolMessage) -> bool:
+    return isinstance(msg.content, str) and msg.content.startswith('{"_compacted"')
+
+
+def tool_receipt(
+    msg: ToolMessage,
+    numbering: Optional[dict[str, int]] = None,
+) -> ToolMessage:
+    """short stand-in for an absorbed tool result: counts, ids and the tool's _summary."""
+    ids = _artifact_ids(msg.artifact)
+    receipt: dict[str, Any] = {"_compacted": True, "ids": ids}
+    if numbering:
+        receipt["refs"] = sorted(numbering[i] for i in ids if i in numbering)
+
+    summary: Any = None
+    try:
+        summary = json.loads(msg.content).get("_summary")
+    except (ValueError, TypeError, AttributeError):
+        pass  # scrape_pages returns a bare list
+    receipt["_summary"] = summary if isinstance(summary, dict) else {"total_results": len(ids)}
+    receipt["note"] = RECEIPT_NOTE
+
+    return msg.model_copy(update={"content": json.dumps(receipt, ensure_ascii=False)})
+
+
+def _recent_cutoff(messages: list[BaseMessage], keep_rounds: int) -> int:
+    """index of the first message of the last keep_rounds tool rounds."""
+    if keep_rounds <= 0:
+        return len(messages)
+    seen = 0
+    for i in range(len(messages) - 1, -1, -1):
+        if getattr(messages[i], "tool_calls", None):
+            seen += 1
+            if seen == keep_rounds:
+                return i
+    return 0
+
+
+def compact_history(
+    messages: list[BaseMessage],
+    *,
+    numbering: Optional[dict[str, int]] = None,
+    token_budget: int = HISTORY_TOKEN_BUDGET,
+    keep_recent_rounds: int = HISTORY_KEEP_RECENT_TOOL_ROUNDS,
+) -> list[BaseMessage]:
+    """
+    messages with absorbed tool results replaced by receipts.
+
+    tool results older than the last keep_recent_rounds rounds are always
+    compacted. if the history is still over token_budget, the recent ones
+    are compacted too, oldest first. other messages are never changed.
+    """
+    compacted = list(messages)
+    cutoff = _recent_cutoff(compacted, keep_recent_rounds)
+
+    for i in range(cutoff):
+        if _is_compactable(compacted[i]):
+            compacted[i] = tool_receipt(compacted[i], numbering)
+
+    if estimate_tokens(compacted) > token_budget:
+        for i in range(cutoff, len(compacted)):
+            if _is_compactable(compacted[i]):
+                compacted[i] = tool_receipt(compacted[i], numbering)
+                if estimate_tokens(compacted) <= token_budget:
+                    break
+
+    before, after = estimate_tokens(messages), estimate_tokens(compacted)
+    if after < before:
+        logger.debug(f"history compaction: ~{before} → ~{after} tokens")
+    return compacted
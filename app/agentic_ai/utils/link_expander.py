@@ -1,31 +1,178 @@
 """
 async link expansion with fire-and-forget task registry.
 
-provides pure-async link scraping using asyncio.gather for concurrency.
-uses a module-level dict to store asyncio.Task objects keyed by run_id,
-since tasks can't be serialized into LangGraph state.
+provides pure-async link scraping with one task per URL. the tasks fired
+for a run are kept as a LinkExpansion in a module-level registry keyed by
+run_id, since tasks can't be serialized into LangGraph state. results are
+collected as they finish: wait_for_async can take what is ready by a soft
+deadline and leave the rest running for a later pass. tasks that are never
+collected (the run failed or skipped wait_for_async) are cancelled and
+evicted after LINK_TASK_TTL_SECONDS, and the registry is capped at
+MAX_PENDING_LINK_TASKS, so orphans can't pin scraped pages in memory.
 
 flow:
-  format_input → fire_link_expansion(run_id, urls, ...) → stores Task in registry
-  wait_for_async → await_link_expansion(run_id) → pops and awaits Task
+  format_input → fire_link_expansion(run_id, urls, ...) → stores LinkExpansion in registry
+  wait_for_async → collect_link_expansion(run_id, timeout) → finished results,
+                   unfinished tasks go back to the registry
+
+scrapes are single-flight across the worker: concurrent runs expanding the
+same canonical URL await one shared scrape task. each run holds a reference;
+a run that times out or is cancelled only drops its reference, and the
+shared scrape is cancelled when the last one is gone.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import OrderedDict
 from typing import Optional
 from uuid import uuid4
 
-from app.agentic_ai.config import LINK_SCRAPE_TIMEOUT_PER_URL, MAX_LINKS_TO_EXPAND
+from app.agentic_ai.config import (
+    LINK_SCRAPE_TIMEOUT_PER_URL,
+    LINK_TASK_TTL_SECONDS,
+    MAX_LINKS_TO_EXPAND,
+    MAX_PENDING_LINK_TASKS,
+)
 from app.ai.context.web.apify_utils import scrapeGenericUrl
 from app.ai.context.web.models import WebContentResult
+from app.clients.page_content_cache import canonicalize_url
 from app.models.commondata import DataSource
 
 logger = logging.getLogger(__name__)
 
-# side-channel: run_id → asyncio.Task mapping (not serializable into state)
-_pending_link_tasks: dict[str, asyncio.Task] = {}
+
+class LinkExpansion:
+    """the per-URL scrape tasks fired for one run, collected as they finish."""
+
+    def __init__(self, tasks: list[asyncio.Task]):
+        # uncollected tasks, in URL order
+        self.tasks = list(tasks)
+
+    def done(self) -> bool:
+        return all(task.done() for task in self.tasks)
+
+    def cancel(self) -> None:
+        for task in self.tasks:
+            task.cancel()
+
+    async def collect(self, timeout: Optional[float] = None) -> list[DataSource]:
+        """wait up to timeout (None: all) and take the results finished by then.
+
+        finished tasks are removed from self.tasks; the rest keep running.
+        """
+        if self.tasks:
+            await asyncio.wait(self.tasks, timeout=timeout)
+
+        finished = [task for task in self.tasks if task.done()]
+        self.tasks = [task for task in self.tasks if not task.done()]
+
+        sources: list[DataSource] = []
+        for task in finished:
+            if task.cancelled():
+                continue
+            error = task.exception()
+            if error is not None:
+                logger.error(f"link expansion task failed: {type(error).__name__}: {error}")
+                continue
+            if isinstance(task.result(), DataSource):
+                sources.append(task.result())
+        return sources
+
+
+class _LinkTaskRegistry:
+    """run_id → LinkExpansion with TTL eviction and a size cap.
+
+    supports the dict operations the graph uses (item assignment, pop, in,
+    len). expired and overflowing entries are evicted lazily on every
+    insert and pop; evicted tasks that are still running are cancelled.
+    """
+
+    def __init__(self, ttl: float = LINK_TASK_TTL_SECONDS, max_size: int = MAX_PENDING_LINK_TASKS):
+        self.ttl = ttl
+        self.max_size = max_size
+        # run_id → (registered_at, expansion); ordered oldest → newest
+        self._tasks: OrderedDict[str, tuple[float, LinkExpansion]] = OrderedDict()
+        self.evicted_expired = 0
+        self.evicted_overflow = 0
+        self.cancelled = 0
+
+    def __setitem__(self, run_id: str, task: LinkExpansion) -> None:
+        previous = self._tasks.pop(run_id, None)
+        if previous is not None and previous[1] is not task:
+            self._discard(run_id, previous[1])
+        self._tasks[run_id] = (time.monotonic(), task)
+        self.sweep()
+
+    def pop(self, run_id: str, default: Optional[LinkExpansion] = None) -> Optional[LinkExpansion]:
+        entry = self._tasks.pop(run_id, None)
+        self.sweep()
+        return entry[1] if entry is not None else default
+
+    def __contains__(self, run_id: object) -> bool:
+        return run_id in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def sweep(self) -> None:
+        """evict expired entries, then the oldest ones beyond max_size."""
+        cutoff = time.monotonic() - self.ttl
+        while self._tasks:
+            run_id, (registered_at, task) = next(iter(self._tasks.items()))
+            if registered_at > cutoff:
+                break
+            del self._tasks[run_id]
+            self.evicted_expired += 1
+            self._discard(run_id, task)
+
+        while len(self._tasks) > self.max_size:
+            run_id, (_registered_at, task) = self._tasks.popitem(last=False)
+            self.evicted_overflow += 1
+            self._discard(run_id, task)
+
+    def _discard(self, run_id: str, task: LinkExpansion) -> None:
+        if not task.done():
+            task.cancel()
+            self.cancelled += 1
+        logger.warning(f"evicted uncollected link expansion task (run_id={run_id})")
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._tasks),
+            "running": sum(1 for _, task in self._tasks.values() if not task.done()),
+            "evicted_expired": self.evicted_expired,
+            "evicted_overflow": self.evicted_overflow,
+            "cancelled": self.cancelled,
+        }
+
+    def clear(self) -> None:
+        for _registered_at, task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+        self._tasks.clear()
+        self.evicted_expired = self.evicted_overflow = self.cancelled = 0
+
+
+# side-channel: run_id → LinkExpansion mapping (not serializable into state)
+_pending_link_tasks = _LinkTaskRegistry()
+
+
+class _InflightScrape:
+    """a shared scrape task plus the number of runs currently awaiting it."""
+
+    __slots__ = ("task", "waiters", "abandoned")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+        self.abandoned = False
+
+
+# singleflight: (canonical url, loop id) → scrape shared by concurrent runs
+_inflight_scrapes: dict[tuple[str, int], _InflightScrape] = {}
 
 
 async def expand_link_context(url: str) -> WebContentResult:
@@ -38,6 +185,35 @@ async def expand_link_context(url: str) -> WebContentResult:
     return WebContentResult.from_dict(data=result_dict, url=url)
 
 
+async def _expand_link_shared(url: str) -> WebContentResult:
+    """expand_link_context, joining an identical scrape already in flight."""
+    key = (canonicalize_url(url), id(asyncio.get_running_loop()))
+
+    flight = _inflight_scrapes.get(key)
+    if flight is None or flight.abandoned or flight.task.done():
+        flight = _InflightScrape(asyncio.ensure_future(expand_link_context(url)))
+        _inflight_scrapes[key] = flight
+
+        def _forget(_task: asyncio.Task, key=key, flight=flight) -> None:
+            if _inflight_scrapes.get(key) is flight:
+                del _inflight_scrapes[key]
+
+        flight.task.add_done_callback(_forget)
+    else:
+        logger.info(f"joining in-flight scrape for {url[:80]}")
+
+    flight.waiters += 1
+    try:
+        # shield: one run timing out must not cancel the scrape for the others
+        return await asyncio.shield(flight.task)
+    finally:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            # nobody is left to use the result
+            flight.abandoned = True
+            flight.task.cancel()
+
+
 async def _scrape_single_url(
     url: str,
     parent_source_id: str,
@@ -47,7 +223,7 @@ async def _scrape_single_url(
 ) -> Optional[DataSource]:
     """scrape a single URL with timeout. returns None on any failure."""
     try:
-        result = await asyncio.wait_for(expand_link_context(url), timeout=timeout)
+        result = await asyncio.wait_for(_expand_link_shared(url), timeout=timeout)
     except (asyncio.TimeoutError, Exception) as e:
         logger.warning(f"link scrape failed for {url[:80]}: {type(e).__name__}: {e}")
         return None
@@ -108,28 +284,72 @@ def fire_link_expansion(
     locale: str,
     timestamp: Optional[str],
 ) -> int:
-    """fire-and-forget: create asyncio.Task, store in registry, return URL count."""
+    """fire-and-forget: one task per URL, stored in the registry. returns URL count."""
     limited = urls[:MAX_LINKS_TO_EXPAND]
     if not limited:
         return 0
 
-    task = asyncio.create_task(
-        expand_all_links(limited, parent_source_id, locale, timestamp)
-    )
-    _pending_link_tasks[run_id] = task
+    _pending_link_tasks[run_id] = LinkExpansion([
+        asyncio.create_task(_scrape_single_url(url, parent_source_id, locale, timestamp))
+        for url in limited
+    ])
     logger.info(f"fired link expansion for {len(limited)} URLs (run_id={run_id})")
     return len(limited)
 
 
-async def await_link_expansion(run_id: str) -> list[DataSource]:
-    """pop task from registry and await it. returns [] on missing key or failure."""
-    task = _pending_link_tasks.pop(run_id, None)
-    if task is None:
+async def collect_link_expansion(
+    run_id: str,
+    timeout: Optional[float] = None,
+) -> tuple[list[DataSource], int]:
+    """take the run's link results finished within timeout.
+
+    returns (sources, still_pending). unfinished tasks stay registered and
+    keep running, so a later call picks them up.
+    """
+    expansion = _pending_link_tasks.pop(run_id, None)
+    if expansion is None:
+        logger.info(f"no pending link task for run_id={run_id}")
+        return [], 0
+
+    sources = await expansion.collect(timeout)
+    still_pending = len(expansion.tasks)
+    if still_pending:
+        _pending_link_tasks[run_id] = expansion
+        logger.info(
+            f"link expansion: {len(sources)} ready, {still_pending} still running (run_id={run_id})"
+        )
+    return sources, still_pending
+
+
+async def await_link_expansion(
+    run_id: str,
+    timeout: Optional[float] = None,
+) -> list[DataSource]:
+    """pop the run's link tasks and await them. returns [] on missing key.
+
+    with a timeout, tasks still running when it expires are cancelled — their
+    results would arrive too late to be used — and what finished is returned.
+    """
+    expansion = _pending_link_tasks.pop(run_id, None)
+    if expansion is None:
         logger.info(f"no pending link task for run_id={run_id}")
         return []
 
-    try:
-        return await task
-    except Exception as e:
-        logger.error(f"link expansion task failed: {type(e).__name__}: {e}")
-        return []
+    sources = await expansion.collect(timeout)
+    if expansion.tasks:
+        logger.warning(
+            f"link expansion: abandoned {len(expansion.tasks)} link(s) after {timeout:.1f}s "
+            f"(run_id={run_id})"
+        )
+        expansion.cancel()
+    return sources
+
+
+def get_link_task_stats() -> dict:
+    """gauges for the link task registry: pending/running tasks and evictions."""
+    return _pending_link_tasks.stats()
+
+
+def reset_link_task_registry() -> None:
+    """cancel and forget every registered link task — useful for tests."""
+    _pending_link_tasks.clear()
@@ -0,0 +1,258 @@
+"""
+near-duplicate collapsing of gathered sources.
+
+search dedup is exact-url and per domain key, so syndicated copies of the
+same agency story (g1 / estadao / folha), AMP vs canonical urls and a page
+returned by both `geral` and `especifico` all reach the LLM separately.
+
+collapse_near_duplicates clusters entries that share a normalized url
+(canonicalize_url plus AMP variants folded) or whose text is a near
+duplicate: MinHash signatures over word 3-shingles, LSH banding to find
+candidate pairs, and an estimated Jaccard similarity >=
+NEAR_DUPLICATE_THRESHOLD to confirm them. each cluster keeps its most
+reliable entry (then best search rank, then earliest) and the collapsed
+members are reported as representative url → member urls.
+
+entries already presented to the agent (earlier rounds, numbered [N] in its
+prompt and history receipts) are never dropped: a cluster that has one keeps
+it as the representative and only the new arrivals are collapsed into it.
+
+clusters never mix source kinds: search hits are compared with each other
+across domain keys, scraped pages with each other, and fact-checks only by
+url — two publishers checking the same hoax are independent verdicts, and a
+scraped page carries full content that its search hit does not.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import OrderedDict
+from typing import AbstractSet, Any, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.agentic_ai.config import (
+    NEAR_DUPLICATE_MIN_TOKENS,
+    NEAR_DUPLICATE_THRESHOLD,
+)
+from app.agentic_ai.prompts.relevance import tokenize
+from app.clients.page_content_cache import canonicalize_url
+from app.models.agenticai import (
+    FactCheckApiContext,
+    GoogleSearchContext,
+    SourceReliability,
+    WebScrapeContext,
+)
+
+_NUM_PERM = 32
+_BANDS = 8                      # 8 bands x 4 rows: candidates from ~0.6 jaccard
+_ROWS = _NUM_PERM // _BANDS
+_SHINGLE = 3
+_SCRAPE_CHARS = 3000            # scraped pages are fingerprinted on their start
+_MERSENNE = (1 << 61) - 1
+
+# fixed (a, b) pairs so signatures are stable across processes
+_PERMUTATIONS = [
+    ((0x9E3779B97F4A7C15 * (i + 1)) % _MERSENNE | 1, (0xC2B2AE3D27D4EB4F * (i + 7)) % _MERSENNE)
+    for i in range(_NUM_PERM)
+]
+
+_RELIABILITY_RANK = {
+    SourceReliability.MUITO_CONFIAVEL: 0,
+    SourceReliability.NEUTRO: 1,
+    SourceReliability.POUCO_CONFIAVEL: 2,
+}
+
+# signatures are reused across tool rounds instead of being recomputed for
+# the whole state; keyed by entry id plus a checksum of the fingerprinted text
+_MAX_CACHED_SIGNATURES = 4096
+_signatures: OrderedDict[tuple[str, int], Optional[tuple[int, ...]]] = OrderedDict()
+
+_AMP_QUERY_PARAMS = {"amp", "outputtype", "amp_js_v", "usqp"}
+
+
+def normalize_url(url: str) -> str:
+    """canonical url with AMP variants (amp. host, /amp path, ?amp) folded in."""
+    parts = urlsplit(canonicalize_url(url))
+    host = parts.netloc
+    if host.startswith("amp."):
+        host = host[len("amp."):]
+
+    segments = [s for s in parts.path.split("/") if s and s != "amp"]
+    if segments and segments[-1].endswith(".amp"):
+        segments[-1] = segments[-1][: -len(".amp")]
+    if segments and segments[-1].endswith(".amp.html"):
+        segments[-1] = segments[-1][: -len(".amp.html")] + ".html"
+    path = "/" + "/".join(segments)
+
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _AMP_QUERY_PARAMS
+    ]
+    return urlunsplit((parts.scheme, host, path, urlencode(query), ""))
+
+
+def _shingles(tokens: list[str]) -> set[int]:
+    if len(tokens) < _SHINGLE:
+        return {zlib.crc32(t.encode()) for t in tokens}
+    return {
+        zlib.crc32(" ".join(tokens[i:i + _SHINGLE]).encode())
+        for i in range(len(tokens) - _SHINGLE + 1)
+    }
+
+
+def minhash(text: str) -> Optional[tuple[int, ...]]:
+    """MinHash signature of text, or None when it is too short to compare."""
+    tokens = tokenize(text)
+    if len(tokens) < NEAR_DUPLICATE_MIN_TOKENS:
+        return None
+    shingles = _shingles(tokens)
+    return tuple(
+        min((a * s + b) % _MERSENNE for s in shingles)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def estimated_jaccard(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    """share of matching signature slots — an unbiased Jaccard estimate."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def _entry_text(entry: Any) -> str:
+    if isinstance(entry, WebScrapeContext):
+        return f"{entry.title} {(entry.content or '')[:_SCRAPE_CHARS]}"
+    return f"{entry.title} {entry.snippet}"
+
+
+def _signature(entry: Any) -> Optional[tuple[int, ...]]:
+    text = _entry_text(entry)
+    key = (entry.id, zlib.crc32(text.encode()))
+    if key in _signatures:
+        _signatures.move_to_end(key)
+        return _signatures[key]
+    sig = minhash(text)
+    _signatures[key] = sig
+    while len(_signatures) > _MAX_CACHED_SIGNATURES:
+        _signatures.popitem(last=False)
+    return sig
+
+
+def reset_signature_cache() -> None:
+    """forget cached signatures — useful for tests."""
+    _signatures.clear()
+
+
+def _preference(entry: Any, index: int) -> tuple[int, int, int]:
+    """lower is better: most reliable, then best search rank, then earliest."""
+    position = getattr(entry, "position", 0) or 0
+    return (_RELIABILITY_RANK.get(entry.reliability, 3), position or 1 << 30, index)
+
+
+def _clusters(entries: list[Any], compare_text: bool) -> list[int]:
+    """union-find parent of each entry: same normalized url or near-duplicate text."""
+    parent = list(range(len(entries)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+
+    by_url: dict[str, int] = {}
+    for i, entry in enumerate(entries):
+        if not entry.url:
+            continue
+        key = normalize_url(entry.url)
+        if key in by_url:
+            union(by_url[key], i)
+        else:
+            by_url[key] = i
+
+    if compare_text:
+        signatures = [_signature(e) for e in entries]
+        buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        for i, sig in enumerate(signatures):
+            if sig is None:
+                continue
+            for band in range(_BANDS):
+                key = (band, sig[band * _ROWS:(band + 1) * _ROWS])
+                for j in buckets.setdefault(key, []):
+                    if find(i) != find(j) and estimated_jaccard(sig, signatures[j]) >= NEAR_DUPLICATE_THRESHOLD:
+                        union(i, j)
+                buckets[key].append(i)
+
+    return [find(i) for i in range(len(entries))]
+
+
+def _collapse(
+    entries: list[Any],
+    compare_text: bool,
+    collapsed: dict[str, list[str]],
+    presented: AbstractSet[str] = frozenset(),
+) -> set[int]:
+    """indexes of the entries to keep; members are recorded under their representative's url."""
+    roots = _clusters(entries, compare_text)
+    groups: dict[int, list[int]] = {}
+    for i, root in enumerate(roots):
+        groups.setdefault(root, []).append(i)
+
+    keep: set[int] = set()
+    for members in groups.values():
+        shown = [i for i in members if entries[i].id in presented]
+        best = min(shown or members, key=lambda i: _preference(entries[i], i))
+        # a new arrival can bridge two earlier clusters: both stay
+        keep.update(shown)
+        keep.add(best)
+        rep_url = entries[best].url
+        for i in members:
+            if i in keep:
+                continue
+            url = entries[i].url
+            # an earlier round may have collapsed sources into this member
+            moved = collapsed.pop(url, []) if url != rep_url else []
+            record = collapsed.setdefault(rep_url, [])
+            for member_url in (url, *moved):
+                if member_url != rep_url and member_url not in record:
+                    record.append(member_url)
+    return keep
+
+
+def collapse_near_duplicates(
+    fact_check_results: list[FactCheckApiContext],
+    search_results: dict[str, list[GoogleSearchContext]],
+    scraped_pages: list[WebScrapeContext],
+    collapsed: Optional[dict[str, list[str]]] = None,
+    presented: AbstractSet[str] = frozenset(),
+) -> tuple[
+    list[FactCheckApiContext],
+    dict[str, list[GoogleSearchContext]],
+    list[WebScrapeContext],
+    dict[str, list[str]],
+]:
+    """
+    the source lists with near-duplicates collapsed, plus the updated
+    representative url → collapsed member urls record (collapsed is not mutated).
+
+    presented holds the ids already shown to the agent; those entries are
+    always kept. order is preserved; a representative keeps its domain key.
+    """
+    record = {url: list(members) for url, members in (collapsed or {}).items()}
+
+    keep_fc = _collapse(fact_check_results, compare_text=False, collapsed=record, presented=presented)
+    fact_checks = [e for i, e in enumerate(fact_check_results) if i in keep_fc]
+
+    flat = [(key, e) for key, entries in search_results.items() for e in entries]
+    keep_search = _collapse([e for _, e in flat], compare_text=True, collapsed=record, presented=presented)
+    search: dict[str, list[GoogleSearchContext]] = {key: [] for key in search_results}
+    for i, (key, entry) in enumerate(flat):
+        if i in keep_search:
+            search[key].append(entry)
+
+    keep_scraped = _collapse(scraped_pages, compare_text=True, collapsed=record, presented=presented)
+    scraped = [e for i, e in enumerate(scraped_pages) if i in keep_scraped]
+
+    return fact_checks, search, scraped, record
@@ -0,0 +1,15 @@
+"""
+offline token estimates for prompt budgeting.
+
+a chars-per-token ratio is close enough to size prompts against a budget and
+costs nothing — no tokenizer download and no count_tokens round trip.
+"""
+
+from __future__ import annotations
+
+from app.agentic_ai.config import CHARS_PER_TOKEN
+
+
+def estimate_tokens(text: str) -> int:
+    """rough token count of text (len / CHARS_PER_TOKEN, rounded up)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
@@ -21,6 +21,9 @@ import asyncio
 from typing import List, Optional
 import httpx
 
+from app.clients.fact_check_cache import cached_fact_check_search
+from app.clients.governor import governed
+from app.clients.http_pool import get_http_client, close_http_clients
 from app.models import ExtractedClaim, Citation
 
 logger = logging.getLogger(__name__)
@@ -104,7 +107,8 @@ class GoogleFactCheckGatherer:
         self,
         api_key: Optional[str] = None,
         max_results: int = 10,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the Google Fact-Check gatherer.
@@ -113,6 +117,7 @@ class GoogleFactCheckGatherer:
             api_key: Google API key. If None, reads from GOOGLE_API_KEY env var.
             max_results: Maximum number of fact-check results to return per claim.
             timeout: Request timeout in seconds.
+            http_client: Optional client to use instead of the shared fact_check_api pool.
 
         Raises:
             RuntimeError: If no API key is provided or found in environment.
@@ -126,6 +131,7 @@ class GoogleFactCheckGatherer:
 
         self.max_results = max_results
         self.timeout = timeout
+        self._http_client = http_client
         self.base_url = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
 
     @property
@@ -173,27 +179,13 @@ class GoogleFactCheckGatherer:
             print(f"[GOOGLE API] searching for claim: {claim.text}")
             print(f"{'='*80}")
 
-            # build request parameters
-            params = {
-                "query": claim.text,
-                "key": self.api_key,
-            }
-
             # log request details
             print(f"[GOOGLE API] request URL: {self.base_url}")
             print(f"[GOOGLE API] query parameter: {claim.text}")
             print(f"[GOOGLE API] max_results: {self.max_results}")
 
-            # make async HTTP request
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
-
-                # log response metadata
-                print(f"\n[GOOGLE API] response status: {response.status_code}")
-                response.raise_for_status()
-
-            # parse JSON response
-            data = response.json()
+            # cache-through HTTP request (shared with the agentic fact-check tool)
+            data = await cached_fact_check_search(claim.text, original_search_fn=self._fetch)
 
             # detailed response analysis
             print(f"\n[GOOGLE API] raw response keys: {list(data.keys())}")
@@ -266,6 +258,26 @@ class GoogleFactCheckGatherer:
             logger.error(f"unexpected error in google fact-check api: {e}")
             return []
 
+    async def _fetch(self, query: str) -> dict:
+        """
+        Make the raw API request for a single query.
+
+        Raises:
+            httpx.HTTPStatusError: On non-2xx responses (never cached).
+        """
+        params = {
+            "query": query,
+            "key": self.api_key,
+        }
+        client = self._http_client or get_http_client("fact_check_api")
+        async with governed("fact_check_api"):
+            response = await client.get(self.base_url, params=params, timeout=self.timeout)
+
+        # log response metadata
+        print(f"\n[GOOGLE API] response status: {response.status_code}")
+        response.raise_for_status()
+        return response.json()
+
     def _parse_response(self, data: dict) -> List[Citation]:
         """
         Parse Google Fact-Check API response into Citation objects.
@@ -395,5 +407,7 @@ class GoogleFactCheckGatherer:
         try:
             return loop.run_until_complete(self.gather(claim))
         finally:
+            # pooled clients are bound to this loop, release them before closing it
+            loop.run_until_complete(close_http_clients())
             loop.close()
             asyncio.set_event_loop(None)
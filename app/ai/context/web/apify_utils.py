@@ -6,14 +6,29 @@ import asyncio
 import os
 import re
 import logging
-import time
 from typing import Optional
 from enum import Enum
 
 import httpx
-from bs4 import BeautifulSoup
 from apify_client import ApifyClientAsync
 
+from app.clients.batching import get_batcher
+from app.clients.governor import governed
+from app.clients.http_pool import get_http_client
+from app.clients.page_content_cache import (
+    can_revalidate,
+    get_page_entry,
+    is_fresh,
+    make_entry,
+    store_page_entry,
+)
+from app.ai.context.web.html_extract import (
+    clean_non_printable,
+    extract_page,
+    get_extract_engine,
+    has_corruption,
+    run_extraction,
+)
 from app.ai.context.web.news_scrapers import (
     scrape_g1_article,
     scrape_estadao_article,
@@ -70,74 +85,10 @@ ACTOR_MEMORY_LIMITS = {
     PlatformType.GENERIC: 2048,      # websites with anti-scraping need full browser (2GB)
 }
 
-# compiled regex for fast non-printable character removal
-# matches any character that is NOT: printable, newline, carriage return, tab, or space
-NON_PRINTABLE_PATTERN = re.compile(r'[^\x20-\x7E\x0A\x0D\x09\u0080-\uFFFF]')
-
-
-def has_corruption(text: str, sample_size: int = 1000, threshold: float = 0.1) -> bool:
-    """
-    quickly check if text contains corrupted/binary content.
-    samples first N characters and checks for non-printable ratio.
-
-    args:
-        text: text to check
-        sample_size: number of characters to sample
-        threshold: ratio of non-printable chars that indicates corruption (0.0-1.0)
-
-    returns:
-        True if text appears corrupted
-    """
-    if not text:
-        return False
-
-    start_time = time.perf_counter()
-
-    sample = text[:sample_size]
-    # count non-printable chars (excluding whitespace)
-    non_printable = sum(1 for c in sample if not (c.isprintable() or c in '\n\r\t '))
-
-    elapsed_ms = (time.perf_counter() - start_time) * 1000
-    is_corrupt = (non_printable / len(sample)) > threshold
-
-    logger.info(
-        f"[BENCHMARK] corruption check: {elapsed_ms:.2f}ms | "
-        f"sample={len(sample)} chars | "
-        f"non_printable={non_printable} ({non_printable/len(sample)*100:.1f}%) | "
-        f"corrupt={is_corrupt}"
-    )
-
-    return is_corrupt
-
-
-def clean_non_printable(text: str) -> str:
-    """
-    remove non-printable characters from text using fast regex.
-    much faster than character-by-character iteration.
-    preserves: printable ASCII, whitespace, and unicode characters.
-
-    args:
-        text: text to clean
-
-    returns:
-        cleaned text
-    """
-    start_time = time.perf_counter()
-    original_length = len(text)
-
-    cleaned = NON_PRINTABLE_PATTERN.sub('', text)
-
-    elapsed_ms = (time.perf_counter() - start_time) * 1000
-    removed = original_length - len(cleaned)
-
-    logger.info(
-        f"[BENCHMARK] cleaned non-printable chars: {elapsed_ms:.2f}ms | "
-        f"original={original_length} chars | "
-        f"removed={removed} chars ({removed/original_length*100:.2f}%)"
-    )
-
-    return cleaned
-
+# social actors accept many start urls: urls of the same platform requested
+# within this window (by any request on the worker) share one actor run
+APIFY_BATCH_WINDOW_SECONDS = 0.3
+APIFY_BATCH_MAX_URLS = 10
 
 def detectPlatform(url: str) -> PlatformType:
     """detect platform type from url using regex"""
@@ -197,37 +148,144 @@ def getApifyClientAsync() -> ApifyClientAsync:
     return ApifyClientAsync(apifyToken)
 
 
+async def _call_actor(actorClient, runInput: dict, platform: PlatformType) -> Optional[dict]:
+    """run an actor inside the apify memory budget; queues while the plan is full."""
+    memory_mb = ACTOR_MEMORY_LIMITS[platform]
+    async with governed("apify", weight=memory_mb):
+        return await actorClient.call(
+            run_input=runInput,
+            timeout_secs=120,
+            memory_mbytes=memory_mb
+        )
+
+
+def _batch_run_input(platform: PlatformType, urls: list[str]) -> dict:
+    """actor input scraping every url in one run (one result per post).
+
+    the actors don't document whether their result limits apply per url or
+    per run, so every limit is sized to the whole batch — a post url yields a
+    single item either way.
+    """
+    limit = len(urls)
+    if platform == PlatformType.FACEBOOK:
+        return {
+            "startUrls": [{"url": u} for u in urls],
+            "resultsLimit": limit,
+            "maxPostCount": limit
+        }
+    if platform == PlatformType.INSTAGRAM:
+        return {"directUrls": urls, "resultsLimit": limit}
+    if platform == PlatformType.TWITTER:
+        return {"startUrls": urls, "maxItems": limit}
+    if platform == PlatformType.TIKTOK:
+        return {"postURLs": urls, "resultsPerPage": limit}
+    raise ValueError(f"no batch input for platform {platform.value}")
+
+
+# post ids shared by every url form of the same post (x.com vs twitter.com, etc.)
+_POST_ID_PATTERNS = [
+    re.compile(r'/status(?:es)?/(\d+)'),
+    re.compile(r'/video/(\d+)'),
+    re.compile(r'/(?:p|reel|reels|tv)/([A-Za-z0-9_-]+)'),
+]
+
+# dataset fields that may carry the input or canonical post url
+_ITEM_URL_FIELDS = (
+    "inputUrl", "facebookUrl", "submittedVideoUrl", "url",
+    "postUrl", "twitterUrl", "webVideoUrl", "topLevelUrl",
+)
+
+
+def _has_post_id(url: str) -> bool:
+    """whether url carries a post id that dataset items can be matched on."""
+    return any(pattern.search(url) for pattern in _POST_ID_PATTERNS)
+
+
+def _post_key(url: str) -> str:
+    """key identifying a post regardless of host alias, scheme or trailing slash."""
+    for pattern in _POST_ID_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    normalized = re.sub(r'^https?://', '', url.strip().lower())
+    normalized = re.sub(r'^(?:www|m|mobile)\.', '', normalized)
+    return normalized.split('#', 1)[0].rstrip('/')
+
+
+def _match_items(urls: list[str], items: list[dict]) -> dict[str, dict]:
+    """assign dataset items back to the urls they were scraped for."""
+    by_key: dict[str, dict] = {}
+    for item in items:
+        for field in _ITEM_URL_FIELDS:
+            value = item.get(field)
+            if isinstance(value, str) and value:
+                by_key.setdefault(_post_key(value), item)
+
+    matched = {url: by_key[_post_key(url)] for url in urls if _post_key(url) in by_key}
+    # a lone url keeps the old behaviour of taking the first item (short links
+    # like vm.tiktok.com don't carry the post id)
+    if len(urls) == 1 and not matched and items:
+        matched[urls[0]] = items[0]
+    return matched
+
+
+async def _run_actor_batch(platform: PlatformType, urls: list[str]) -> dict[str, dict]:
+    """one actor run for all urls; returns the dataset item found for each url."""
+    apifyClient = getApifyClientAsync()
+    actorClient = apifyClient.actor(ACTOR_MAP[platform])
+
+    callResult = await _call_actor(actorClient, _batch_run_input(platform, urls), platform)
+    if callResult is None:
+        raise RuntimeError("actor run failed")
+
+    datasetClient = apifyClient.dataset(callResult["defaultDatasetId"])
+    listItemsResult = await datasetClient.list_items()
+    items = listItemsResult.items if listItemsResult else []
+
+    matched = _match_items(urls, items or [])
+
+    # short and share links (vm.tiktok.com, fb.watch, facebook share urls) carry
+    # no post id to match on; a single-url run takes its first item, as before batching
+    unmatched = [u for u in urls if u not in matched and not _has_post_id(u)]
+    if len(urls) > 1 and unmatched:
+        logger.info(f"{platform.value} batch: {len(unmatched)} short link(s) retried in single-url runs")
+        retries = await asyncio.gather(
+            *(_run_actor_batch(platform, [u]) for u in unmatched), return_exceptions=True
+        )
+        for url, retry in zip(unmatched, retries):
+            if isinstance(retry, BaseException):
+                logger.warning(f"{platform.value} single-url run failed for {url}: {retry!r}")
+            else:
+                matched.update(retry)
+
+    if len(matched) < len(urls):
+        logger.warning(
+            f"{platform.value} batch: {len(urls) - len(matched)}/{len(urls)} url(s) without results"
+        )
+    return matched
+
+
+async def _fetch_actor_item(platform: PlatformType, url: str) -> Optional[dict]:
+    """dataset item for url, scraped in a micro-batch with concurrent urls of the platform."""
+    batcher = get_batcher(
+        f"apify:{platform.value}",
+        lambda urls: _run_actor_batch(platform, urls),
+        window=APIFY_BATCH_WINDOW_SECONDS,
+        max_batch=APIFY_BATCH_MAX_URLS,
+    )
+    return await batcher.submit(url)
+
+
 async def scrapeFacebookPost(url: str, maxChars: Optional[int] = None) -> dict:
     """scrape facebook post using apify actor"""
     try:
         logger.info(f"scraping facebook post: {url}")
         
-        apifyClient = getApifyClientAsync()
-        actorClient = apifyClient.actor(ACTOR_MAP[PlatformType.FACEBOOK])
-        
-        runInput = {
-            "startUrls": [{"url": url}],
-            "resultsLimit": 1,
-            "maxPostCount": 1
-        }
-
-        # limit memory to reduce RAM usage (8GB free tier optimization)
-        callResult = await actorClient.call(
-            run_input=runInput,
-            timeout_secs=120,
-            memory_mbytes=ACTOR_MEMORY_LIMITS[PlatformType.FACEBOOK]
-        )
-        
-        if callResult is None:
-            return {"success": False, "content": "", "metadata": {}, "error": "actor run failed"}
-        
-        datasetClient = apifyClient.dataset(callResult["defaultDatasetId"])
-        listItemsResult = await datasetClient.list_items()
-        
-        if not listItemsResult or not listItemsResult.items:
+        # batched with concurrent facebook urls into a single actor run
+        item = await _fetch_actor_item(PlatformType.FACEBOOK, url)
+        if item is None:
             return {"success": False, "content": "", "metadata": {}, "error": "no content extracted"}
-        
-        item = listItemsResult.items[0]
+
         content = item.get("text", "") or item.get("content", "") or item.get("postText", "")
         
         if maxChars and len(content) > maxChars:
@@ -258,28 +316,11 @@ async def scrapeInstagramPost(url: str, maxChars: Optional[int] = None) -> dict:
     try:
         logger.info(f"scraping instagram: {url}")
         
-        apifyClient = getApifyClientAsync()
-        actorClient = apifyClient.actor(ACTOR_MAP[PlatformType.INSTAGRAM])
-        
-        runInput = {"directUrls": [url], "resultsLimit": 1}
-
-        # limit memory to reduce RAM usage (8GB free tier optimization)
-        callResult = await actorClient.call(
-            run_input=runInput,
-            timeout_secs=120,
-            memory_mbytes=ACTOR_MEMORY_LIMITS[PlatformType.INSTAGRAM]
-        )
-        
-        if callResult is None:
-            return {"success": False, "content": "", "metadata": {}, "error": "actor run failed"}
-        
-        datasetClient = apifyClient.dataset(callResult["defaultDatasetId"])
-        listItemsResult = await datasetClient.list_items()
-        
-        if not listItemsResult or not listItemsResult.items:
+        # batched with concurrent instagram urls into a single actor run
+        item = await _fetch_actor_item(PlatformType.INSTAGRAM, url)
+        if item is None:
             return {"success": False, "content": "", "metadata": {}, "error": "no content extracted"}
-        
-        item = listItemsResult.items[0]
+
         content = item.get("caption", "") or item.get("text", "")
         
         if maxChars and len(content) > maxChars:
@@ -309,28 +350,11 @@ async def scrapeTwitterPost(url: str, maxChars: Optional[int] = None) -> dict:
     try:
         logger.info(f"scraping twitter: {url}")
         
-        apifyClient = getApifyClientAsync()
-        actorClient = apifyClient.actor(ACTOR_MAP[PlatformType.TWITTER])
-        
-        runInput = {"startUrls": [url], "maxItems": 1}
-
-        # limit memory to reduce RAM usage (8GB free tier optimization)
-        callResult = await actorClient.call(
-            run_input=runInput,
-            timeout_secs=120,
-            memory_mbytes=ACTOR_MEMORY_LIMITS[PlatformType.TWITTER]
-        )
-        
-        if callResult is None:
-            return {"success": False, "content": "", "metadata": {}, "error": "actor run failed"}
-        
-        datasetClient = apifyClient.dataset(callResult["defaultDatasetId"])
-        listItemsResult = await datasetClient.list_items()
-        
-        if not listItemsResult or not listItemsResult.items:
+        # batched with concurrent twitter urls into a single actor run
+        item = await _fetch_actor_item(PlatformType.TWITTER, url)
+        if item is None:
             return {"success": False, "content": "", "metadata": {}, "error": "no content extracted"}
-        
-        item = listItemsResult.items[0]
+
         content = item.get("text", "") or item.get("full_text", "")
         
         if maxChars and len(content) > maxChars:
@@ -361,28 +385,11 @@ async def scrapeTikTokPost(url: str, maxChars: Optional[int] = None) -> dict:
     try:
         logger.info(f"scraping tiktok: {url}")
         
-        apifyClient = getApifyClientAsync()
-        actorClient = apifyClient.actor(ACTOR_MAP[PlatformType.TIKTOK])
-        
-        runInput = {"postURLs": [url], "resultsPerPage": 1}
-
-        # limit memory to reduce RAM usage (8GB free tier optimization)
-        callResult = await actorClient.call(
-            run_input=runInput,
-            timeout_secs=120,
-            memory_mbytes=ACTOR_MEMORY_LIMITS[PlatformType.TIKTOK]
-        )
-        
-        if callResult is None:
-            return {"success": False, "content": "", "metadata": {}, "error": "actor run failed"}
-        
-        datasetClient = apifyClient.dataset(callResult["defaultDatasetId"])
-        listItemsResult = await datasetClient.list_items()
-        
-        if not listItemsResult or not listItemsResult.items:
+        # batched with concurrent tiktok urls into a single actor run
+        item = await _fetch_actor_item(PlatformType.TIKTOK, url)
+        if item is None:
             return {"success": False, "content": "", "metadata": {}, "error": "no content extracted"}
-        
-        item = listItemsResult.items[0]
+
         content = item.get("text", "") or item.get("description", "")
         
         if maxChars and len(content) > maxChars:
@@ -409,10 +416,53 @@ async def scrapeTikTokPost(url: str, maxChars: Optional[int] = None) -> dict:
         return {"success": False, "content": "", "metadata": {}, "error": str(e)}
 
 
-async def scrapeGenericSimple(url: str, maxChars: Optional[int] = None) -> dict:
+_DEFAULT_MAX_DOWNLOAD_BYTES = 2 * 1024 * 1024
+
+
+def _get_max_download_bytes() -> int:
+    """byte cap for simple scraping downloads from env, default 2 MiB. 0 disables it."""
+    raw = os.getenv("SIMPLE_SCRAPE_MAX_BYTES", "").strip()
+    if not raw:
+        return _DEFAULT_MAX_DOWNLOAD_BYTES
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("invalid SIMPLE_SCRAPE_MAX_BYTES=%r, using %d", raw, _DEFAULT_MAX_DOWNLOAD_BYTES)
+        return _DEFAULT_MAX_DOWNLOAD_BYTES
+
+
+async def _read_capped(response: httpx.Response, max_bytes: int) -> tuple[bytes, bool]:
+    """
+    read a streamed body (decompressed chunk by chunk) up to max_bytes.
+    returns (body, truncated); the rest of the body is never downloaded.
+    """
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        if max_bytes and size + len(chunk) > max_bytes:
+            chunks.append(chunk[:max_bytes - size])
+            return b"".join(chunks), True
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks), False
+
+
+async def scrapeGenericSimple(
+    url: str,
+    maxChars: Optional[int] = None,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> dict:
     """
     scrape generic website using simple http request (no browser).
     lightweight approach for static content - tries first before using apify.
+
+    when etag/last_modified are given the request is conditional; a 304 returns
+    success with "not_modified": True and no content.
+
+    the body is streamed: non-html responses are rejected from their headers
+    and at most SIMPLE_SCRAPE_MAX_BYTES are read (the page is cut there and
+    the metadata says "truncated": True).
     """
     try:
         logger.info(f"attempting simple scraping (no browser) for: {url}")
@@ -432,103 +482,97 @@ async def scrapeGenericSimple(url: str, maxChars: Optional[int] = None) -> dict:
             "Connection": "keep-alive",
             "Upgrade-Insecure-Requests": "1"
         }
-        
-        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            
-            # check if content is html
-            content_type = response.headers.get("content-type", "").lower()
-            if "text/html" not in content_type:
-                logger.warning(f"non-html content type: {content_type}")
-                return {
-                    "success": False,
-                    "content": "",
-                    "metadata": {},
-                    "error": f"unsupported content type: {content_type}"
-                }
-            
-            html_content = response.text
-
-            # detect if we got corrupted/binary content (decompression failure)
-            if has_corruption(html_content, sample_size=1000, threshold=0.2):
-                logger.warning("detected binary/corrupted content (decompression failure?)")
-                return {
-                    "success": False,
-                    "content": "",
-                    "metadata": {},
-                    "error": "received corrupted content - possible decompression failure"
-                }
-
-            # parse with beautifulsoup
-            soup = BeautifulSoup(html_content, "html.parser")
-            
-            # remove script and style elements
-            for script in soup(["script", "style", "iframe", "noscript"]):
-                script.decompose()
-            
-            # extract metadata
-            title = ""
-            if soup.title:
-                title = soup.title.string or ""
-            
-            description = ""
-            meta_desc = soup.find("meta", attrs={"name": "description"}) or \
-                       soup.find("meta", attrs={"property": "og:description"})
-            if meta_desc:
-                description = meta_desc.get("content", "")
-            
-            # try to extract main content (prioritize article/main tags)
-            main_content = soup.find("main") or soup.find("article") or soup.find("body")
-            
-            # use BeautifulSoup's get_text() instead of html2text
-            # this preserves encoding better and avoids corruption
-            if main_content:
-                text_content = main_content.get_text(separator='\n', strip=True)
-            else:
-                text_content = soup.get_text(separator='\n', strip=True)
-            
-            logger.info(f"extracted {len(text_content)} chars using BeautifulSoup get_text()")
-            
-            # clean up excessive whitespace
-            text_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', text_content)
-            text_content = text_content.strip()
-
-            # only clean non-printable chars if we detect issues (faster)
-            if has_corruption(text_content, sample_size=500, threshold=0.05):
-                logger.info("[BENCHMARK] corruption detected - cleaning non-printable characters")
-                text_content = clean_non_printable(text_content)
-            else:
-                logger.info("[BENCHMARK] content is clean - skipping character cleaning (performance optimization)")
-            
-            if not text_content or len(text_content) < 50:
-                logger.warning(f"extracted content too short: {len(text_content)} chars")
-                return {
-                    "success": False,
-                    "content": "",
-                    "metadata": {},
-                    "error": "extracted content too short or empty"
-                }
-            
-            # apply max chars limit
-            if maxChars and len(text_content) > maxChars:
-                text_content = text_content[:maxChars]
-            
-            logger.info(f"simple scraping successful: {len(text_content)} chars extracted")
-            
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        
+        # stream the body: headers are checked before anything is downloaded
+        # and reading stops at the byte cap, so pasted links to videos, pdfs
+        # or huge pages neither fill memory nor burn the whole timeout
+        client = get_http_client("scraping")
+        async with governed("scraping"):
+            async with client.stream("GET", url, headers=headers, timeout=30.0) as response:
+                if response.status_code == 304:
+                    logger.info("page not modified since cached copy (304)")
+                    return {
+                        "success": True,
+                        "not_modified": True,
+                        "content": "",
+                        "metadata": {},
+                        "error": None
+                    }
+
+                response.raise_for_status()
+
+                # check if content is html
+                content_type = response.headers.get("content-type", "").lower()
+                if "text/html" not in content_type:
+                    logger.warning(f"non-html content type: {content_type}")
+                    return {
+                        "success": False,
+                        "content": "",
+                        "metadata": {},
+                        "error": f"unsupported content type: {content_type}"
+                    }
+
+                body, truncated = await _read_capped(response, _get_max_download_bytes())
+
+        if truncated:
+            logger.info(f"page body cut at {len(body)} bytes (download cap)")
+
+        # parsing a large page blocks for a long time — do it in the extraction pool,
+        # stopping as soon as maxChars of text has been collected
+        extracted = await run_extraction(
+            extract_page, body, response.encoding, maxChars, get_extract_engine(),
+        )
+
+        # detect if we got corrupted/binary content (decompression failure)
+        if extracted["corrupt"]:
+            logger.warning("detected binary/corrupted content (decompression failure?)")
+            return {
+                "success": False,
+                "content": "",
+                "metadata": {},
+                "error": "received corrupted content - possible decompression failure"
+            }
+
+        title = extracted["title"]
+        description = extracted["description"]
+        text_content = extracted["text"]
+        logger.info(f"extracted {len(text_content)} chars")
+
+        if not text_content or len(text_content) < 50:
+            logger.warning(f"extracted content too short: {len(text_content)} chars")
             return {
-                "success": True,
-                "content": text_content,
-                "metadata": {
-                    "platform": "generic_simple",
-                    "url": str(response.url),
-                    "title": title.strip(),
-                    "description": description.strip(),
-                    "scraping_method": "simple_http"
-                },
-                "error": None
+                "success": False,
+                "content": "",
+                "metadata": {},
+                "error": "extracted content too short or empty"
             }
-            
+        
+        # apply max chars limit
+        if maxChars and len(text_content) > maxChars:
+            text_content = text_content[:maxChars]
+        
+        logger.info(f"simple scraping successful: {len(text_content)} chars extracted")
+        
+        return {
+            "success": True,
+            "content": text_content,
+            "metadata": {
+                "platform": "generic_simple",
+                "url": str(response.url),
+                "title": title,
+                "description": description,
+                "scraping_method": "simple_http",
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "truncated": truncated,
+            },
+            "error": None
+        }
+        
     except httpx.HTTPStatusError as e:
         logger.warning(f"http error during simple scraping: {e.response.status_code}")
         return {
@@ -573,11 +617,7 @@ async def scrapeGenericWebsite(url: str, maxChars: Optional[int] = None) -> dict
         }
 
         # limit memory to reduce RAM usage (8GB free tier optimization)
-        callResult = await actorClient.call(
-            run_input=runInput,
-            timeout_secs=120,
-            memory_mbytes=ACTOR_MEMORY_LIMITS[PlatformType.GENERIC]
-        )
+        callResult = await _call_actor(actorClient, runInput, PlatformType.GENERIC)
         
         if callResult is None:
             return {"success": False, "content": "", "metadata": {}, "error": "actor run failed"}
@@ -619,13 +659,55 @@ async def scrapeGenericWebsite(url: str, maxChars: Optional[int] = None) -> dict
         return {"success": False, "content": "", "metadata": {}, "error": str(e)}
 
 
+def _truncate_result(result: dict, maxChars: Optional[int]) -> dict:
+    """copy of a cached result with content cut to maxChars."""
+    content = result.get("content") or ""
+    if maxChars and len(content) > maxChars:
+        return {**result, "content": content[:maxChars]}
+    return dict(result)
+
+
 async def scrapeGenericUrl(url: str, maxChars: Optional[int] = None) -> dict:
     """
     main scraping function with automatic platform detection.
     detects platform via regex and routes to appropriate actor.
     for generic websites: tries simple http first, falls back to apify if needed.
+
+    successful results are cached by canonical URL (see page_content_cache).
+    stale entries scraped over plain http are revalidated with a conditional
+    request before falling back to a full scrape.
     """
     platform = detectPlatform(url)
+    entry = await get_page_entry(url)
+
+    if entry is not None:
+        if is_fresh(entry):
+            logger.info(f"page cache HIT for {url}")
+            return _truncate_result(entry["result"], maxChars)
+
+        if can_revalidate(entry):
+            revalidated = await scrapeGenericSimple(
+                url, None, etag=entry.get("etag"), last_modified=entry.get("last_modified"),
+            )
+            if revalidated.get("not_modified"):
+                logger.info(f"page cache revalidated (304) for {url}")
+                await store_page_entry(url, make_entry(entry["result"], entry["platform"]))
+                return _truncate_result(entry["result"], maxChars)
+            if revalidated["success"]:
+                await store_page_entry(url, make_entry(revalidated, platform.value))
+                return _truncate_result(revalidated, maxChars)
+
+    result = await _scrapeUrlUncached(url, platform, maxChars)
+
+    # only full (untruncated) successful scrapes are cached
+    if result["success"] and not maxChars:
+        await store_page_entry(url, make_entry(result, platform.value))
+
+    return result
+
+
+async def _scrapeUrlUncached(url: str, platform: PlatformType, maxChars: Optional[int]) -> dict:
+    """route to the platform scraper without consulting the cache."""
     logger.info(f"detected platform: {platform.value} for {url}")
     
     if platform == PlatformType.FACEBOOK:
@@ -9,6 +9,7 @@ from typing import Any, Dict
 
 import httpx
 
+from app.clients.http_pool import get_http_client
 from app.ai.context.web.serper_search import (
     serper_search,
     SerperSearchError,
@@ -75,8 +76,8 @@ async def _searchGoogleClaimInternal(claim: str, maxResults: int = 10, timeout:
         }
 
         base_url = "https://www.googleapis.com/customsearch/v1"
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(base_url, params=params)
+        client = get_http_client("google_search")
+        response = await client.get(base_url, params=params, timeout=timeout)
 
         if response.status_code != 200:
             error_msg = f"google api returned {response.status_code}: {response.text[:100]}"
@@ -303,8 +304,8 @@ async def _google_search_internal(
         params["lr"] = language
 
     base_url = "https://www.googleapis.com/customsearch/v1"
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.get(base_url, params=params)
+    client = get_http_client("google_search")
+    response = await client.get(base_url, params=params, timeout=timeout)
 
     if response.status_code != 200:
         raise GoogleSearchError(
@@ -0,0 +1,491 @@
+"""
+html parsing and text extraction, run off the event loop.
+
+two engines extract generic pages (HTML_EXTRACT_ENGINE):
+  - "soup" (default): the original BeautifulSoup html.parser tree + get_text.
+  - "fast" (opt-in): a single streaming pass with lxml's C parser and a
+    parser target — no tree is built, script/style/noscript/iframe are
+    dropped as they are parsed and title/meta/JSON-LD are picked up on the
+    way. when the caller passes max_chars (the scraping and research API
+    endpoints do; the agent's scrapes fetch whole pages so they can be
+    cached) parsing stops once that much body text has been collected.
+    pages where it finds almost nothing are retried with the soup engine.
+scripts/benchmark_html_extract.py compares them on saved pages.
+
+BeautifulSoup parsing, get_text, trafilatura and the corruption scans are
+cpu-bound and hold the GIL for tens to hundreds of ms on large pages. they
+run in a small dedicated process pool instead of on the loop or in the
+default to_thread executor shared with everything else.
+
+everything crossing the pool boundary is plain data: html bytes/str in, a
+dict or tuple of extracted text out. functions submitted to the pool must
+be module-level so they pickle by reference.
+
+HTML_PARSE_PROCESSES sets the pool size (default 2). 0 runs extraction in a
+thread instead, which keeps mocks working in tests. a broken pool (a worker
+killed by the OOM killer, say) is replaced on the next call and the failed
+extraction is retried in a thread.
+"""
+
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import re
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional, TypeVar
+
+from bs4 import BeautifulSoup
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_DEFAULT_POOL_SIZE = 2
+_DEFAULT_ENGINE = "soup"
+_ENGINES = ("fast", "soup")
+# recycle workers now and then — lxml/bs4 fragment the heap on huge pages
+_MAX_TASKS_PER_CHILD = 200
+
+# compiled regex for fast non-printable character removal
+# matches any character that is NOT: printable, newline, carriage return, tab, or space
+NON_PRINTABLE_PATTERN = re.compile(r'[^\x20-\x7E\x0A\x0D\x09\u0080-\uFFFF]')
+
+
+def has_corruption(text: str, sample_size: int = 1000, threshold: float = 0.1) -> bool:
+    """
+    quickly check if text contains corrupted/binary content.
+    samples first N characters and checks for non-printable ratio.
+
+    args:
+        text: text to check
+        sample_size: number of characters to sample
+        threshold: ratio of non-printable chars that indicates corruption (0.0-1.0)
+
+    returns:
+        True if text appears corrupted
+    """
+    if not text:
+        return False
+
+    start_time = time.perf_counter()
+
+    sample = text[:sample_size]
+    # count non-printable chars (excluding whitespace)
+    non_printable = sum(1 for c in sample if not (c.isprintable() or c in '\n\r\t '))
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    is_corrupt = (non_printable / len(sample)) > threshold
+
+    logger.info(
+        f"[BENCHMARK] corruption check: {elapsed_ms:.2f}ms | "
+        f"sample={len(sample)} chars | "
+        f"non_printable={non_printable} ({non_printable/len(sample)*100:.1f}%) | "
+        f"corrupt={is_corrupt}"
+    )
+
+    return is_corrupt
+
+
+def clean_non_printable(text: str) -> str:
+    """
+    remove non-printable characters from text using fast regex.
+    much faster than character-by-character iteration.
+    preserves: printable ASCII, whitespace, and unicode characters.
+
+    args:
+        text: text to clean
+
+    returns:
+        cleaned text
+    """
+    start_time = time.perf_counter()
+    original_length = len(text)
+
+    cleaned = NON_PRINTABLE_PATTERN.sub('', text)
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    removed = original_length - len(cleaned)
+
+    logger.info(
+        f"[BENCHMARK] cleaned non-printable chars: {elapsed_ms:.2f}ms | "
+        f"original={original_length} chars | "
+        f"removed={removed} chars ({removed/original_length*100:.2f}%)"
+    )
+
+    return cleaned
+
+
+def get_extract_engine() -> str:
+    """configured generic page engine: "fast" or "soup"."""
+    engine = os.getenv("HTML_EXTRACT_ENGINE", _DEFAULT_ENGINE).strip().lower()
+    if engine not in _ENGINES:
+        logger.warning("invalid HTML_EXTRACT_ENGINE=%r, using %s", engine, _DEFAULT_ENGINE)
+        return _DEFAULT_ENGINE
+    return engine
+
+
+def _finish_text(text_content: str, max_chars: Optional[int]) -> str:
+    """whitespace cleanup, conditional non-printable cleanup and truncation."""
+    # clean up excessive whitespace
+    text_content = re.sub(r'\n\s*\n\s*\n+', '\n\n', text_content)
+    text_content = text_content.strip()
+
+    # only clean non-printable chars if we detect issues (faster)
+    if has_corruption(text_content, sample_size=500, threshold=0.05):
+        text_content = clean_non_printable(text_content)
+
+    if max_chars and len(text_content) > max_chars:
+        text_content = text_content[:max_chars]
+    return text_content
+
+
+def extract_page(
+    content: bytes,
+    encoding: Optional[str] = None,
+    max_chars: Optional[int] = None,
+    engine: Optional[str] = None,
+) -> dict:
+    """
+    decode and extract a generic html page. runs in the extraction pool.
+
+    returns {"corrupt", "title", "description", "text"}; "corrupt" is True
+    when the raw html looks binary (decompression failure) and nothing else
+    was extracted. text is cut to max_chars when given.
+    """
+    html_content = content.decode(encoding or "utf-8", errors="replace")
+
+    # detect if we got corrupted/binary content (decompression failure)
+    if has_corruption(html_content, sample_size=1000, threshold=0.2):
+        return {"corrupt": True, "title": "", "description": "", "text": ""}
+
+    if (engine or get_extract_engine()) == "fast":
+        result = _extract_page_fast(html_content, max_chars)
+        if len(result["text"]) >= _FAST_MIN_TEXT_CHARS:
+            return result
+        # odd markup (text outside any element we track, broken nesting) —
+        # give the full tree a go before declaring the page empty
+    return _extract_page_soup(html_content, max_chars)
+
+
+def _extract_page_soup(html_content: str, max_chars: Optional[int]) -> dict:
+    """BeautifulSoup html.parser engine: full tree, then get_text."""
+    soup = BeautifulSoup(html_content, "html.parser")
+
+    # remove script and style elements
+    for script in soup(["script", "style", "iframe", "noscript"]):
+        script.decompose()
+
+    title = ""
+    if soup.title:
+        title = soup.title.string or ""
+
+    description = ""
+    meta_desc = soup.find("meta", attrs={"name": "description"}) or \
+               soup.find("meta", attrs={"property": "og:description"})
+    if meta_desc:
+        description = meta_desc.get("content", "")
+
+    # try to extract main content (prioritize article/main tags)
+    main_content = soup.find("main") or soup.find("article") or soup.find("body")
+
+    # use BeautifulSoup's get_text() instead of html2text
+    # this preserves encoding better and avoids corruption
+    if main_content:
+        text_content = main_content.get_text(separator='\n', strip=True)
+    else:
+        text_content = soup.get_text(separator='\n', strip=True)
+
+    return {
+        "corrupt": False,
+        "title": str(title).strip(),
+        "description": str(description).strip(),
+        "text": _finish_text(text_content, max_chars),
+    }
+
+
+# ── fast engine ─────────────────────────────────────────────────────
+
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "iframe", "template"})
+_FEED_CHUNK_CHARS = 16 * 1024
+# with no <main> seen yet, keep reading until the page body holds this many
+# times max_chars (the container may come after nav/header text, and a <main>
+# after an <article> still wins, as in the soup engine)
+_BODY_OVERSCAN = 4
+# below this the fast engine's result is not trusted and soup is tried
+_FAST_MIN_TEXT_CHARS = 50
+
+
+class _ExtractTarget:
+    """
+    lxml parser target collecting text nodes, title, meta and JSON-LD in one pass.
+
+    mirrors the soup engine's choices: the first <title> outside <body> (svg
+    titles don't count), and the text of the first <main>, else the first
+    <article>, else the whole body.
+    """
+
+    def __init__(self, max_chars: Optional[int]):
+        self.max_chars = max_chars
+        self.done = False
+
+        self.title_parts: list[str] = []
+        self.description = ""
+        self.og_description = ""
+        self.jsonld_blocks: list[str] = []
+
+        self.main: list[str] = []
+        self.main_chars = 0
+        self.article: list[str] = []
+        self.body: list[str] = []
+        self.body_chars = 0
+
+        self._skip_depth = 0
+        self._svg_depth = 0
+        self._in_body = False
+        self._in_title = False
+        self._title_seen = False
+        self._main_depth = 0
+        self._main_seen = False
+        self._article_depth = 0
+        self._article_seen = False
+        self._jsonld: Optional[list[str]] = None
+        self._text: list[str] = []
+
+    @property
+    def focused(self) -> list[str]:
+        """text of the preferred container, like soup.find("main") or soup.find("article")."""
+        return self.main or self.article
+
+    def start(self, tag, attrib) -> None:
+        self._flush()
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+            if tag == "script" and (attrib.get("type") or "").lower() == "application/ld+json":
+                self._jsonld = []
+        elif tag == "body":
+            self._in_body = True
+        elif tag == "svg":
+            self._svg_depth += 1
+        elif tag == "title":
+            if not self._title_seen and not self._in_body and not self._svg_depth:
+                self._title_seen = True
+                self._in_title = True
+        elif tag == "meta":
+            key = (attrib.get("name") or attrib.get("property") or "").lower()
+            content = attrib.get("content") or ""
+            if key == "description" and not self.description:
+                self.description = content
+            elif key == "og:description" and not self.og_description:
+                self.og_description = content
+        elif tag == "main":
+            if self._main_depth:
+                self._main_depth += 1
+            elif not self._main_seen:
+                self._main_seen = True
+                self._main_depth = 1
+        elif tag == "article":
+            if self._article_depth:
+                self._article_depth += 1
+            elif not self._article_seen and not self._main_seen:
+                self._article_seen = True
+                self._article_depth = 1
+
+    def end(self, tag) -> None:
+        self._flush()
+        if not isinstance(tag, str):
+            return
+        tag = tag.lower()
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+            if tag == "script" and self._jsonld is not None:
+                self.jsonld_blocks.append("".join(self._jsonld))
+                self._jsonld = None
+        elif tag == "svg":
+            self._svg_depth = max(0, self._svg_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag == "main" and self._main_depth:
+            self._main_depth -= 1
+            # the first <main> is complete and nothing later replaces it
+            if not self._main_depth and self.main_chars >= _FAST_MIN_TEXT_CHARS:
+                self.done = True
+        elif tag == "article" and self._article_depth:
+            self._article_depth -= 1
+
+    def data(self, data: str) -> None:
+        if self._jsonld is not None:
+            self._jsonld.append(data)
+        elif self._skip_depth:
+            return
+        elif self._in_title:
+            self.title_parts.append(data)
+        else:
+            self._text.append(data)
+
+    def close(self) -> None:
+        self._flush()
+
+    def _flush(self) -> None:
+        """end of a text node: keep it stripped, one entry per node like get_text(strip=True)."""
+        if not self._text:
+            return
+        text = "".join(self._text).strip()
+        self._text = []
+        if not text or self.done:
+            return
+
+        self.body.append(text)
+        self.body_chars += len(text) + 1
+        if self._main_depth:
+            self.main.append(text)
+            self.main_chars += len(text) + 1
+        if self._article_depth:
+            self.article.append(text)
+
+        if self.max_chars:
+            if self.main_chars >= self.max_chars:
+                self.done = True
+            elif self.body_chars >= self.max_chars * _BODY_OVERSCAN:
+                self.done = True
+
+
+def _jsonld_article(blocks: list[str]) -> dict:
+    """first JSON-LD node carrying articleBody/headline/description."""
+    for block in blocks:
+        try:
+            data = json.loads(block)
+        except (json.JSONDecodeError, TypeError):
+            continue
+        nodes = data if isinstance(data, list) else [data]
+        while nodes:
+            node = nodes.pop(0)
+            if not isinstance(node, dict):
+                continue
+            graph = node.get("@graph")
+            if isinstance(graph, list):
+                nodes.extend(graph)
+            if any(isinstance(node.get(k), str) for k in ("articleBody", "headline", "description")):
+                return node
+    return {}
+
+
+def _extract_page_fast(html_content: str, max_chars: Optional[int]) -> dict:
+    """lxml streaming engine: one pass, no tree, stops once max_chars is collected."""
+    target = _ExtractTarget(max_chars)
+    parser = etree.HTMLParser(target=target, remove_comments=True, remove_pis=True)
+
+    for offset in range(0, len(html_content), _FEED_CHUNK_CHARS):
+        parser.feed(html_content[offset:offset + _FEED_CHUNK_CHARS])
+        if target.done:
+            break
+    try:
+        parser.close()
+    except etree.LxmlError:
+        # truncated documents are expected when we stop early
+        pass
+
+    article = _jsonld_article(target.jsonld_blocks)
+
+    title = "".join(target.title_parts).strip() or str(article.get("headline") or "").strip()
+    description = (
+        target.description or target.og_description or str(article.get("description") or "")
+    ).strip()
+
+    text_content = "\n".join(target.focused or target.body)
+    article_body = article.get("articleBody")
+    if len(text_content) < _FAST_MIN_TEXT_CHARS and isinstance(article_body, str):
+        text_content = article_body
+
+    return {
+        "corrupt": False,
+        "title": title,
+        "description": description,
+        "text": _finish_text(text_content, max_chars),
+    }
+
+
+# ── pool ────────────────────────────────────────────────────────────
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool_size() -> int:
+    raw = os.getenv("HTML_PARSE_PROCESSES", "").strip()
+    if not raw:
+        return _DEFAULT_POOL_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        logger.warning("invalid HTML_PARSE_PROCESSES=%r, using %d", raw, _DEFAULT_POOL_SIZE)
+        return _DEFAULT_POOL_SIZE
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """the shared extraction pool, or None when extraction should run in a thread."""
+    global _pool
+    size = _get_pool_size()
+    if size == 0:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            # spawn: forking a process that runs an event loop and threads isn't safe
+            _pool = ProcessPoolExecutor(
+                max_workers=size,
+                mp_context=multiprocessing.get_context("spawn"),
+                max_tasks_per_child=_MAX_TASKS_PER_CHILD,
+            )
+            logger.info(f"html extraction pool started with {size} process(es)")
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def run_extraction(fn: Callable[..., T], *args: Any) -> T:
+    """run fn(*args) in the extraction pool without blocking the loop."""
+    pool = _get_pool()
+    if pool is None:
+        return await asyncio.to_thread(fn, *args)
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, fn, *args)
+    except BrokenProcessPool:
+        logger.warning("html extraction pool broke, restarting it")
+        _discard_pool(pool)
+        return await asyncio.to_thread(fn, *args)
+
+
+def run_extraction_sync(fn: Callable[..., T], *args: Any) -> T:
+    """blocking variant of run_extraction for code already running in a thread."""
+    pool = _get_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        logger.warning("html extraction pool broke, restarting it")
+        _discard_pool(pool)
+        return fn(*args)
+
+
+def shutdown_extraction_pool() -> None:
+    """stop the extraction pool (app shutdown, tests). it restarts lazily on next use."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -5,6 +5,9 @@ each scraper uses tailored CSS selectors and JSON-LD extraction
 for better content quality than generic BeautifulSoup fallback.
 all functions are synchronous and return the standard apify_utils dict:
   {"success": bool, "content": str, "metadata": dict, "error": str|None}
+
+fetching happens in the calling thread; parsing (lxml + trafilatura) goes
+through the html_extract process pool via _extract_article.
 """
 
 import json
@@ -18,6 +21,8 @@ import trafilatura
 from bs4 import BeautifulSoup
 from urllib.parse import urlparse, urlunparse
 
+from app.ai.context.web.html_extract import run_extraction_sync
+
 logger = logging.getLogger(__name__)
 
 _SESSION = requests.Session()
@@ -81,6 +86,31 @@ def _build_result(body_text: str, traf_text: str, title: str, tool_name: str) ->
     }
 
 
+def _extract_article(html: str, site: str) -> tuple[str, str, str]:
+    """
+    parse an article page with the site's body selectors plus trafilatura.
+    runs in the extraction pool, so it only takes and returns plain data.
+
+    returns (body_text, traf_text, title).
+    """
+    soup = BeautifulSoup(html, "lxml")
+
+    # title
+    title = ""
+    h1 = soup.find("h1")
+    if h1:
+        title = h1.get_text(strip=True)
+
+    body_text = "\n\n".join(_BODY_EXTRACTORS[site](soup))
+
+    # trafilatura is the most expensive step and _build_result only uses it
+    # when the selectors found nothing, so skip it otherwise
+    traf_text = ""
+    if not body_text.strip():
+        traf_text = trafilatura.extract(html, include_comments=False, favor_recall=True) or ""
+    return body_text, traf_text, title
+
+
 # ---------------------------------------------------------------------------
 # g1.globo.com
 # ---------------------------------------------------------------------------
@@ -89,6 +119,34 @@ def _build_result(body_text: str, traf_text: str, title: str, tool_name: str) ->
 _G1_NAV_MARKERS = {"veja também", "vídeos:", "veja mais", "assine"}
 
 
+def _g1_body(soup: BeautifulSoup) -> list[str]:
+    """iterate .content-text divs, stopping at navigation markers"""
+    body_paragraphs = []
+    stop = False
+    for div in soup.select(".content-text"):
+        if stop:
+            break
+        for child in div.children:
+            if not hasattr(child, "name") or not child.name:
+                continue
+            child_classes = set(child.get("class") or [])
+            txt = child.get_text(separator=" ", strip=True)
+
+            if child.name == "div" and "content-intertitle" in child_classes:
+                if any(m in txt.lower() for m in _G1_NAV_MARKERS):
+                    stop = True
+                    break
+                if len(txt) > 5:
+                    body_paragraphs.append(txt)
+            elif child.name == "p" and len(txt) > 30:
+                body_paragraphs.append(txt)
+            elif child.name == "ul" and "content-unordered-list" in child_classes and len(txt) > 30:
+                body_paragraphs.append(txt)
+            elif child.name == "blockquote" and "content-blockquote" in child_classes and len(txt) > 30:
+                body_paragraphs.append(txt)
+    return body_paragraphs
+
+
 def scrape_g1_article(url: str) -> dict:
     """
     scrape a g1.globo.com article using .content-text selectors.
@@ -99,42 +157,8 @@ def scrape_g1_article(url: str) -> dict:
         resp = _SESSION.get(url, timeout=_TIMEOUT)
         resp.raise_for_status()
         html = resp.text
-        soup = BeautifulSoup(html, "lxml")
-
-        # title
-        title = ""
-        h1 = soup.find("h1")
-        if h1:
-            title = h1.get_text(strip=True)
-
-        # body: iterate .content-text divs, stop at navigation markers
-        body_paragraphs = []
-        stop = False
-        for div in soup.select(".content-text"):
-            if stop:
-                break
-            for child in div.children:
-                if not hasattr(child, "name") or not child.name:
-                    continue
-                child_classes = set(child.get("class") or [])
-                txt = child.get_text(separator=" ", strip=True)
-
-                if child.name == "div" and "content-intertitle" in child_classes:
-                    if any(m in txt.lower() for m in _G1_NAV_MARKERS):
-                        stop = True
-                        break
-                    if len(txt) > 5:
-                        body_paragraphs.append(txt)
-                elif child.name == "p" and len(txt) > 30:
-                    body_paragraphs.append(txt)
-                elif child.name == "ul" and "content-unordered-list" in child_classes and len(txt) > 30:
-                    body_paragraphs.append(txt)
-                elif child.name == "blockquote" and "content-blockquote" in child_classes and len(txt) > 30:
-                    body_paragraphs.append(txt)
-
-        body_text = "\n\n".join(body_paragraphs)
-        traf_text = trafilatura.extract(html, include_comments=False, favor_recall=True) or ""
 
+        body_text, traf_text, title = run_extraction_sync(_extract_article, html, "g1")
         return _build_result(body_text, traf_text, title, "g1_scraper")
 
     except Exception as e:
@@ -153,6 +177,21 @@ _ESTADAO_NOISE_CLASSES = {
 }
 
 
+def _estadao_body(soup: BeautifulSoup) -> list[str]:
+    """all <p> inside div.news-body, excluding noise classes"""
+    body_paragraphs = []
+    news_body = soup.select_one("div.news-body")
+    if news_body:
+        for p in news_body.find_all("p"):
+            p_classes = set(p.get("class") or [])
+            if p_classes & _ESTADAO_NOISE_CLASSES:
+                continue
+            txt = p.get_text(strip=True)
+            if len(txt) > 40:
+                body_paragraphs.append(txt)
+    return body_paragraphs
+
+
 def scrape_estadao_article(url: str) -> dict:
     """scrape an estadao.com.br article using div.news-body with noise-class exclusion."""
     try:
@@ -160,29 +199,8 @@ def scrape_estadao_article(url: str) -> dict:
         resp = _SESSION.get(url, timeout=_TIMEOUT, allow_redirects=True)
         resp.raise_for_status()
         html = resp.text
-        soup = BeautifulSoup(html, "lxml")
-
-        # title
-        title = ""
-        h1 = soup.find("h1")
-        if h1:
-            title = h1.get_text(strip=True)
-
-        # body: all <p> inside div.news-body, excluding noise classes
-        body_paragraphs = []
-        news_body = soup.select_one("div.news-body")
-        if news_body:
-            for p in news_body.find_all("p"):
-                p_classes = set(p.get("class") or [])
-                if p_classes & _ESTADAO_NOISE_CLASSES:
-                    continue
-                txt = p.get_text(strip=True)
-                if len(txt) > 40:
-                    body_paragraphs.append(txt)
-
-        body_text = "\n\n".join(body_paragraphs)
-        traf_text = trafilatura.extract(html, include_comments=False, favor_recall=True) or ""
 
+        body_text, traf_text, title = run_extraction_sync(_extract_article, html, "estadao")
         return _build_result(body_text, traf_text, title, "estadao_scraper")
 
     except Exception as e:
@@ -205,6 +223,24 @@ def _normalize_folha_url(url: str) -> str:
 _FOLHA_BODY_SELECTORS = [".c-news__body", ".noticia__main--materia"]
 
 
+def _folha_body(soup: BeautifulSoup) -> list[str]:
+    """classless <p> inside the first body container that has any"""
+    body_paragraphs = []
+    for sel in _FOLHA_BODY_SELECTORS:
+        news_body = soup.select_one(sel)
+        if not news_body:
+            continue
+        for p in news_body.find_all("p"):
+            if p.get("class"):
+                continue
+            txt = p.get_text(strip=True)
+            if len(txt) > 40:
+                body_paragraphs.append(txt)
+        if body_paragraphs:
+            break
+    return body_paragraphs
+
+
 def scrape_folha_article(url: str) -> dict:
     """scrape a folha.uol.com.br article using .c-news__body, with URL normalization."""
     try:
@@ -214,32 +250,8 @@ def scrape_folha_article(url: str) -> dict:
         resp.raise_for_status()
         # always decode from bytes — requests mis-detects encoding as ISO-8859-1
         html = resp.content.decode("utf-8", errors="replace")
-        soup = BeautifulSoup(html, "lxml")
-
-        # title
-        title = ""
-        h1 = soup.find("h1")
-        if h1:
-            title = h1.get_text(strip=True)
-
-        # body: classless <p> inside body containers
-        body_paragraphs = []
-        for sel in _FOLHA_BODY_SELECTORS:
-            news_body = soup.select_one(sel)
-            if not news_body:
-                continue
-            for p in news_body.find_all("p"):
-                if p.get("class"):
-                    continue
-                txt = p.get_text(strip=True)
-                if len(txt) > 40:
-                    body_paragraphs.append(txt)
-            if body_paragraphs:
-                break
-
-        body_text = "\n\n".join(body_paragraphs)
-        traf_text = trafilatura.extract(html, include_comments=False, favor_recall=True) or ""
 
+        body_text, traf_text, title = run_extraction_sync(_extract_article, html, "folha")
         return _build_result(body_text, traf_text, title, "folha_scraper")
 
     except Exception as e:
@@ -250,7 +262,6 @@ def scrape_folha_article(url: str) -> dict:
 # ---------------------------------------------------------------------------
 # aosfatos.org
 # ---------------------------------------------------------------------------
-
 # permissive SSL context — needed because Python 3.14 TLS strictness causes
 # UNEXPECTED_EOF_WHILE_READING on aosfatos.org with requests/httpx
 _AOSFATOS_SSL_CTX = ssl.create_default_context()
@@ -277,35 +288,37 @@ def _fetch_aosfatos(url: str) -> tuple[str, int]:
         return html, resp.status
 
 
+def _aosfatos_body(soup: BeautifulSoup) -> list[str]:
+    """<p> with no class inside div.prose"""
+    body_paragraphs = []
+    prose = soup.select_one("div.prose")
+    if prose:
+        for p in prose.find_all("p"):
+            if p.get("class"):
+                continue
+            txt = p.get_text(strip=True)
+            if len(txt) > 30:
+                body_paragraphs.append(txt)
+    return body_paragraphs
+
+
 def scrape_aosfatos_article(url: str) -> dict:
     """scrape an aosfatos.org article using div.prose selectors."""
     try:
         logger.info(f"scraping aosfatos article: {url}")
         html, _ = _fetch_aosfatos(url)
-        soup = BeautifulSoup(html, "lxml")
-
-        # title
-        title = ""
-        h1 = soup.find("h1")
-        if h1:
-            title = h1.get_text(strip=True)
-
-        # body: <p> with no class inside div.prose
-        body_paragraphs = []
-        prose = soup.select_one("div.prose")
-        if prose:
-            for p in prose.find_all("p"):
-                if p.get("class"):
-                    continue
-                txt = p.get_text(strip=True)
-                if len(txt) > 30:
-                    body_paragraphs.append(txt)
-
-        body_text = "\n\n".join(body_paragraphs)
-        traf_text = trafilatura.extract(html, include_comments=False, favor_recall=True) or ""
 
+        body_text, traf_text, title = run_extraction_sync(_extract_article, html, "aosfatos")
         return _build_result(body_text, traf_text, title, "aosfatos_scraper")
 
     except Exception as e:
         logger.error(f"aosfatos scraping error: {e}")
         return {"success": False, "content": "", "metadata": {}, "error": str(e)}
+
+
+_BODY_EXTRACTORS = {
+    "g1": _g1_body,
+    "estadao": _estadao_body,
+    "folha": _folha_body,
+    "aosfatos": _aosfatos_body,
+}
@@ -6,7 +6,7 @@ import os
 import logging
 from typing import Any, Dict
 
-import httpx
+from app.clients.http_pool import get_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -99,8 +99,8 @@ async def serper_search(
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(SERPER_API_URL, json=payload, headers=headers)
+    client = get_http_client("serper")
+    response = await client.post(SERPER_API_URL, json=payload, headers=headers, timeout=timeout)
 
     if response.status_code != 200:
         raise SerperSearchError(
@@ -0,0 +1,140 @@
+"""
+tests for batched apify actor runs: one actor call per platform window,
+results matched back to each url, and failures fanned out.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.ai.context.web.apify_utils import (
+    PlatformType,
+    _match_items,
+    _post_key,
+    scrapeTikTokPost,
+    scrapeTwitterPost,
+)
+from app.clients.batching import reset_batchers
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    reset_batchers()
+    yield
+    reset_batchers()
+
+
+def _mock_apify(items, call_result={"defaultDatasetId": "ds"}):
+    client = MagicMock()
+    actor = MagicMock()
+    actor.call = AsyncMock(return_value=call_result)
+    client.actor.return_value = actor
+    dataset = MagicMock()
+    dataset.list_items = AsyncMock(return_value=MagicMock(items=items))
+    client.dataset.return_value = dataset
+    return client, actor
+
+
+class TestPostKey:
+    def test_twitter_aliases_share_key(self):
+        assert _post_key("https://x.com/user/status/123") == _post_key(
+            "https://twitter.com/user/status/123?s=20"
+        )
+
+    def test_fallback_normalizes_host_and_slash(self):
+        assert _post_key("https://www.facebook.com/page/posts/abc/") == _post_key(
+            "http://m.facebook.com/page/posts/abc"
+        )
+
+
+class TestMatchItems:
+    def test_items_matched_by_url_fields(self):
+        urls = ["https://x.com/a/status/1", "https://x.com/b/status/2"]
+        items = [
+            {"url": "https://twitter.com/b/status/2", "text": "two"},
+            {"url": "https://twitter.com/a/status/1", "text": "one"},
+        ]
+        matched = _match_items(urls, items)
+        assert matched[urls[0]]["text"] == "one"
+        assert matched[urls[1]]["text"] == "two"
+
+    def test_single_url_falls_back_to_first_item(self):
+        matched = _match_items(["https://vm.tiktok.com/ZM123/"], [{"text": "video"}])
+        assert matched == {"https://vm.tiktok.com/ZM123/": {"text": "video"}}
+
+    def test_unmatched_url_in_batch_is_missing(self):
+        urls = ["https://x.com/a/status/1", "https://x.com/b/status/2"]
+        matched = _match_items(urls, [{"url": "https://x.com/a/status/1"}])
+        assert urls[1] not in matched
+
+
+class TestBatchedScrapers:
+    @pytest.mark.asyncio
+    async def test_concurrent_posts_share_one_actor_run(self):
+        urls = ["https://x.com/a/status/1", "https://x.com/b/status/2"]
+        client, actor = _mock_apify([
+            {"url": "https://x.com/a/status/1", "text": "first tweet"},
+            {"url": "https://x.com/b/status/2", "text": "second tweet"},
+        ])
+
+        with patch("app.ai.context.web.apify_utils.getApifyClientAsync", return_value=client):
+            results = await asyncio.gather(*(scrapeTwitterPost(u) for u in urls))
+
+        assert [r["content"] for r in results] == ["first tweet", "second tweet"]
+        actor.call.assert_awaited_once()
+        run_input = actor.call.await_args.kwargs["run_input"]
+        assert run_input == {"startUrls": urls, "maxItems": 2}
+
+    @pytest.mark.asyncio
+    async def test_post_without_result_reports_no_content(self):
+        urls = ["https://x.com/a/status/1", "https://x.com/b/status/2"]
+        client, _actor = _mock_apify([{"url": "https://x.com/a/status/1", "text": "only"}])
+
+        with patch("app.ai.context.web.apify_utils.getApifyClientAsync", return_value=client):
+            results = await asyncio.gather(*(scrapeTwitterPost(u) for u in urls))
+
+        assert results[0]["success"] is True
+        assert results[1] == {
+            "success": False, "content": "", "metadata": {}, "error": "no content extracted",
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_run_fails_every_post(self):
+        urls = ["https://x.com/a/status/1", "https://x.com/b/status/2"]
+        client, _actor = _mock_apify([], call_result=None)
+
+        with patch("app.ai.context.web.apify_utils.getApifyClientAsync", return_value=client):
+            results = await asyncio.gather(*(scrapeTwitterPost(u) for u in urls))
+
+        assert all(r["error"] == "actor run failed" for r in results)
+
+    @pytest.mark.asyncio
+    async def test_short_link_in_batch_gets_a_single_url_run(self):
+        urls = ["https://www.tiktok.com/@user/video/111", "https://vm.tiktok.com/ZM123/"]
+        client = MagicMock()
+        actor = MagicMock()
+        actor.call = AsyncMock(side_effect=[{"defaultDatasetId": "batch"}, {"defaultDatasetId": "single"}])
+        client.actor.return_value = actor
+        datasets = {
+            # the short link resolves to a post whose url doesn't mention it
+            "batch": [
+                {"webVideoUrl": "https://www.tiktok.com/@user/video/111", "text": "long"},
+                {"webVideoUrl": "https://www.tiktok.com/@other/video/222", "text": "short"},
+            ],
+            "single": [{"webVideoUrl": "https://www.tiktok.com/@other/video/222", "text": "short"}],
+        }
+
+        def dataset(dataset_id):
+            ds = MagicMock()
+            ds.list_items = AsyncMock(return_value=MagicMock(items=datasets[dataset_id]))
+            return ds
+
+        client.dataset.side_effect = dataset
+
+        with patch("app.ai.context.web.apify_utils.getApifyClientAsync", return_value=client):
+            results = await asyncio.gather(*(scrapeTikTokPost(u) for u in urls))
+
+        assert [r["success"] for r in results] == [True, True]
+        assert actor.call.await_count == 2
+        assert actor.call.await_args_list[1].kwargs["run_input"]["postURLs"] == [urls[1]]
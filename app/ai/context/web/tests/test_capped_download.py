@@ -0,0 +1,120 @@
+"""
+tests for streamed simple scraping: non-html responses are rejected before
+the body is read and downloads stop at the byte cap.
+"""
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.ai.context.web.apify_utils import (
+    _DEFAULT_MAX_DOWNLOAD_BYTES,
+    _get_max_download_bytes,
+    _read_capped,
+    scrapeGenericSimple,
+)
+
+ARTICLE = (
+    "<html><head><title>Matéria</title></head><body><main>"
+    + "<p>Conteúdo da matéria com texto suficiente para passar do mínimo.</p>" * 50
+    + "</main></body></html>"
+).encode("utf-8")
+
+
+class _FakeStreamResponse:
+    """streamed response that records how many body chunks were pulled."""
+
+    def __init__(self, body: bytes, content_type: str = "text/html; charset=utf-8", chunk_size: int = 256):
+        self.status_code = 200
+        self.headers = {"content-type": content_type}
+        self.encoding = "utf-8"
+        self.url = "https://example.com/materia"
+        self._chunks = [body[i:i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.chunks_read = 0
+
+    def raise_for_status(self):
+        pass
+
+    async def aiter_bytes(self):
+        for chunk in self._chunks:
+            self.chunks_read += 1
+            yield chunk
+
+
+def _client_for(response: _FakeStreamResponse) -> MagicMock:
+    @asynccontextmanager
+    async def stream(method, url, **kwargs):
+        yield response
+
+    client = MagicMock()
+    client.stream = stream
+    return client
+
+
+@pytest.fixture(autouse=True)
+def _inline_extraction(monkeypatch):
+    monkeypatch.setenv("HTML_PARSE_PROCESSES", "0")
+
+
+class TestReadCapped:
+    @pytest.mark.asyncio
+    async def test_reads_whole_body_under_cap(self):
+        response = _FakeStreamResponse(b"x" * 1000)
+        body, truncated = await _read_capped(response, 1000)
+        assert body == b"x" * 1000
+        assert truncated is False
+
+    @pytest.mark.asyncio
+    async def test_stops_reading_at_cap(self):
+        response = _FakeStreamResponse(b"x" * 10_000, chunk_size=100)
+        body, truncated = await _read_capped(response, 550)
+        assert len(body) == 550
+        assert truncated is True
+        assert response.chunks_read == 6
+
+    @pytest.mark.asyncio
+    async def test_zero_cap_disables_limit(self):
+        response = _FakeStreamResponse(b"x" * 5000)
+        body, truncated = await _read_capped(response, 0)
+        assert len(body) == 5000 and truncated is False
+
+
+class TestStreamedSimpleScrape:
+    @pytest.mark.asyncio
+    async def test_non_html_rejected_without_reading_body(self):
+        response = _FakeStreamResponse(b"%PDF" * 100_000, content_type="application/pdf")
+        with patch("app.ai.context.web.apify_utils.get_http_client", return_value=_client_for(response)):
+            result = await scrapeGenericSimple("https://example.com/file.pdf")
+
+        assert result["success"] is False
+        assert "unsupported content type" in result["error"]
+        assert response.chunks_read == 0
+
+    @pytest.mark.asyncio
+    async def test_large_page_is_cut_at_byte_cap(self, monkeypatch):
+        monkeypatch.setenv("SIMPLE_SCRAPE_MAX_BYTES", "2048")
+        response = _FakeStreamResponse(ARTICLE * 20)
+        with patch("app.ai.context.web.apify_utils.get_http_client", return_value=_client_for(response)):
+            result = await scrapeGenericSimple("https://example.com/materia")
+
+        assert result["success"] is True
+        assert "Conteúdo da matéria" in result["content"]
+        assert response.chunks_read == 2048 // 256 + 1
+        assert len(result["content"]) < 2048
+        assert result["metadata"]["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_small_page_is_not_marked_truncated(self):
+        response = _FakeStreamResponse(ARTICLE)
+        with patch("app.ai.context.web.apify_utils.get_http_client", return_value=_client_for(response)):
+            result = await scrapeGenericSimple("https://example.com/materia")
+
+        assert result["success"] is True
+        assert result["metadata"]["truncated"] is False
+
+    def test_invalid_byte_cap_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("SIMPLE_SCRAPE_MAX_BYTES", "2MB")
+        assert _get_max_download_bytes() == _DEFAULT_MAX_DOWNLOAD_BYTES
+        monkeypatch.setenv("SIMPLE_SCRAPE_MAX_BYTES", "0")
+        assert _get_max_download_bytes() == 0
@@ -0,0 +1,187 @@
+"""
+tests for html_extract: generic page extraction with both engines, early
+truncation, and the extraction pool (inline thread mode and real worker
+processes).
+"""
+
+import pytest
+
+from app.ai.context.web import html_extract
+from app.ai.context.web.html_extract import (
+    extract_page,
+    get_extract_engine,
+    run_extraction,
+    run_extraction_sync,
+    shutdown_extraction_pool,
+)
+
+PAGE = """
+<html><head>
+<title> Vacina é segura </title>
+<meta name="description" content=" nota oficial ">
+<script>var tracking = 1;</script>
+</head>
+<body><nav>menu</nav>
+<main><h1>Vacina é segura</h1>
+<p>Primeiro parágrafo da matéria.</p>
+
+
+
+<p>Segundo parágrafo.</p></main>
+</body></html>
+"""
+
+# inline svg icons carry their own <title>; only the document title counts
+SVG_PAGE = """
+<html><head><title>Manchete do dia</title></head>
+<body><header><svg><title>Ícone de busca</title><path d="M0"/></svg></header>
+<article><h1>Manchete do dia</h1>
+<p>Texto da matéria principal com conteúdo suficiente para o teste.</p>
+<svg><title>Compartilhar</title></svg></article>
+</body></html>
+"""
+
+# a listing page: soup keeps the first <article> only
+MULTI_ARTICLE_PAGE = """
+<html><head><title>Notícias</title></head>
+<body>
+<article><p>Primeira matéria da lista, com texto suficiente para ser usada.</p></article>
+<article><p>Segunda matéria da lista.</p></article>
+</body></html>
+"""
+
+# a teaser <article> before <main>: soup prefers the <main>
+MAIN_AFTER_ARTICLE_PAGE = """
+<html><head><title>Página</title></head>
+<body>
+<article><p>Chamada de outra matéria.</p></article>
+<main><p>Conteúdo principal da página, longo o bastante para o teste.</p></main>
+</body></html>
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clean_pool():
+    shutdown_extraction_pool()
+    yield
+    shutdown_extraction_pool()
+
+
+ENGINES = ["fast", "soup"]
+
+
+class TestExtractPage:
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_extracts_title_description_and_main_text(self, engine):
+        result = extract_page(PAGE.encode("utf-8"), "utf-8", engine=engine)
+
+        assert result["corrupt"] is False
+        assert result["title"] == "Vacina é segura"
+        assert result["description"] == "nota oficial"
+        assert "Primeiro parágrafo" in result["text"]
+        assert "menu" not in result["text"]
+        assert "tracking" not in result["text"]
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_respects_declared_encoding(self, engine):
+        result = extract_page(PAGE.encode("latin-1"), "latin-1", engine=engine)
+        assert result["title"] == "Vacina é segura"
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_binary_content_is_flagged_corrupt(self, engine):
+        result = extract_page(bytes(range(0, 32)) * 50, "utf-8", engine=engine)
+        assert result == {"corrupt": True, "title": "", "description": "", "text": ""}
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_max_chars_truncates_text(self, engine):
+        result = extract_page(PAGE.encode("utf-8"), "utf-8", max_chars=20, engine=engine)
+        assert len(result["text"]) == 20
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_svg_titles_are_ignored(self, engine):
+        result = extract_page(SVG_PAGE.encode("utf-8"), "utf-8", engine=engine)
+        assert result["title"] == "Manchete do dia"
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_only_the_first_article_is_used(self, engine):
+        result = extract_page(MULTI_ARTICLE_PAGE.encode("utf-8"), "utf-8", engine=engine)
+        assert "Primeira matéria" in result["text"]
+        assert "Segunda matéria" not in result["text"]
+
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_main_is_preferred_over_an_earlier_article(self, engine):
+        result = extract_page(MAIN_AFTER_ARTICLE_PAGE.encode("utf-8"), "utf-8", engine=engine)
+        assert "Conteúdo principal" in result["text"]
+        assert "Chamada" not in result["text"]
+
+    @pytest.mark.parametrize("page", [SVG_PAGE, MULTI_ARTICLE_PAGE, MAIN_AFTER_ARTICLE_PAGE])
+    def test_engines_agree_on_focus_and_title(self, page):
+        fast = extract_page(page.encode("utf-8"), "utf-8", engine="fast")
+        soup = extract_page(page.encode("utf-8"), "utf-8", engine="soup")
+        assert fast == soup
+
+    def test_engines_agree_on_text(self):
+        fast = extract_page(PAGE.encode("utf-8"), "utf-8", engine="fast")
+        soup = extract_page(PAGE.encode("utf-8"), "utf-8", engine="soup")
+        assert fast == soup
+
+
+class TestFastEngine:
+    def test_stops_parsing_once_max_chars_collected(self):
+        paragraphs = "".join(f"<p>parágrafo número {i} da matéria</p>" for i in range(5000))
+        html = f"<html><body><article>{paragraphs}</article><p>TAIL</p></body></html>"
+
+        target = html_extract._ExtractTarget(max_chars=500)
+        parser = html_extract.etree.HTMLParser(target=target)
+        for offset in range(0, len(html), html_extract._FEED_CHUNK_CHARS):
+            parser.feed(html[offset:offset + html_extract._FEED_CHUNK_CHARS])
+            if target.done:
+                break
+
+        assert target.done
+        assert offset + html_extract._FEED_CHUNK_CHARS < len(html)
+        result = extract_page(html.encode("utf-8"), "utf-8", max_chars=500, engine="fast")
+        assert len(result["text"]) == 500
+        assert "TAIL" not in result["text"]
+
+    def test_uses_json_ld_when_markup_has_no_text(self):
+        html = """<html><head>
+        <script type="application/ld+json">
+        {"@context": "https://schema.org", "@graph": [
+          {"@type": "NewsArticle", "headline": "Manchete",
+           "articleBody": "Corpo completo da matéria vindo do JSON-LD, longo o bastante."}
+        ]}
+        </script></head><body><div id="app"></div></body></html>"""
+
+        result = extract_page(html.encode("utf-8"), "utf-8", engine="fast")
+
+        assert result["title"] == "Manchete"
+        assert result["text"].startswith("Corpo completo da matéria")
+
+    def test_falls_back_to_soup_when_nothing_found(self):
+        html = "<html><body><p>curto</p></body></html>"
+        assert extract_page(html.encode("utf-8"), "utf-8", engine="fast")["text"] == "curto"
+
+    def test_engine_selected_by_env(self, monkeypatch):
+        monkeypatch.delenv("HTML_EXTRACT_ENGINE", raising=False)
+        assert get_extract_engine() == "soup"
+        monkeypatch.setenv("HTML_EXTRACT_ENGINE", "fast")
+        assert get_extract_engine() == "fast"
+        monkeypatch.setenv("HTML_EXTRACT_ENGINE", "bogus")
+        assert get_extract_engine() == "soup"
+
+
+class TestExtractionPool:
+    @pytest.mark.asyncio
+    async def test_inline_mode_runs_without_processes(self, monkeypatch):
+        monkeypatch.setenv("HTML_PARSE_PROCESSES", "0")
+        result = await run_extraction(extract_page, PAGE.encode("utf-8"), "utf-8")
+        assert result["title"] == "Vacina é segura"
+        assert run_extraction_sync(len, "abc") == 3
+
+    @pytest.mark.asyncio
+    async def test_pool_mode_returns_same_result(self, monkeypatch):
+        monkeypatch.setenv("HTML_PARSE_PROCESSES", "1")
+        result = await run_extraction(extract_page, PAGE.encode("utf-8"), "utf-8")
+        assert result == extract_page(PAGE.encode("utf-8"), "utf-8")
+        assert run_extraction_sync(len, "abcd") == 4
@@ -14,6 +14,21 @@ from app.ai.context.web.news_scrapers import (
     scrape_aosfatos_article,
     _build_result,
 )
+from app.clients.page_content_cache import reset_local_cache
+
+
+@pytest.fixture(autouse=True)
+def _inline_extraction(monkeypatch):
+    """parse in-process so the trafilatura mocks apply (they don't cross into pool workers)."""
+    monkeypatch.setenv("HTML_PARSE_PROCESSES", "0")
+
+
+@pytest.fixture(autouse=True)
+def _clean_page_cache():
+    """routing tests reuse URLs with different mocks; keep the page cache out of it."""
+    reset_local_cache()
+    yield
+    reset_local_cache()
 
 
 # ---------------------------------------------------------------------------
@@ -78,11 +78,10 @@ async def test_serper_search_basic_params():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("test query", num=5)
 
@@ -101,11 +100,10 @@ async def test_serper_search_date_restrict_mapping():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("query", date_restrict="d7")
 
@@ -121,11 +119,10 @@ async def test_serper_search_language_mapping():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("query", language="lang_pt")
 
@@ -142,11 +139,10 @@ async def test_serper_search_unknown_language_ignored():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("query", language="lang_xx")
 
@@ -163,11 +159,10 @@ async def test_serper_search_num_capped_at_10():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("query", num=20)
 
@@ -204,11 +199,10 @@ async def test_serper_search_response_mapping():
     mock_response.json.return_value = serper_response
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             items = await serper_search("test")
 
@@ -233,11 +227,10 @@ async def test_serper_search_empty_organic():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             items = await serper_search("test")
 
@@ -262,11 +255,10 @@ async def test_serper_search_non_200():
     mock_response.text = "rate limit exceeded"
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(SerperSearchError, match="429"):
                 await serper_search("test")
@@ -276,11 +268,10 @@ async def test_serper_search_non_200():
 async def test_serper_search_timeout():
     """should propagate httpx.TimeoutException."""
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.side_effect = httpx.TimeoutException("timed out")
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             with pytest.raises(httpx.TimeoutException):
                 await serper_search("test")
@@ -294,11 +285,10 @@ async def test_serper_search_sends_correct_headers():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "my-secret-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("test")
 
@@ -316,11 +306,10 @@ async def test_serper_search_posts_to_correct_url():
     mock_response.json.return_value = {"organic": []}
 
     with patch.dict("os.environ", {"SERPER_API_KEY": "test-key"}):
-        with patch("app.ai.context.web.serper_search.httpx.AsyncClient") as mock_client_cls:
+        with patch("app.ai.context.web.serper_search.get_http_client") as mock_get_client:
             mock_client = AsyncMock()
             mock_client.post.return_value = mock_response
-            mock_client_cls.return_value.__aenter__ = AsyncMock(return_value=mock_client)
-            mock_client_cls.return_value.__aexit__ = AsyncMock(return_value=False)
+            mock_get_client.return_value = mock_client
 
             await serper_search("test")
 
@@ -5,6 +5,7 @@ import os
 
 import httpx
 
+from app.clients.http_pool import get_http_client, close_http_clients
 from app.models import (
     ExtractedClaim,
     Citation,
@@ -27,16 +28,25 @@ class WebSearchGatherer:
     Searches Google for the claim text and converts top results into citations.
     """
 
-    def __init__(self, max_results: int = 5, timeout: float = 45.0, allowed_domains:list[str] | None = None):
+    def __init__(
+        self,
+        max_results: int = 5,
+        timeout: float = 45.0,
+        allowed_domains: list[str] | None = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize web search gatherer.
 
         Args:
             max_results: Maximum number of search results to retrieve per claim
             timeout: Timeout in seconds for web search operations (default: 45.0)
+            allowed_domains: Domains to restrict the search to
+            http_client: Optional client to use instead of the shared google_search pool
         """
         self.max_results = min(max_results, 10)  # google api max is 10
         self.timeout = timeout
+        self._http_client = http_client
         self.api_key = os.environ.get("GOOGLE_SEARCH_API_KEY", "")
         self.cse_cx = os.environ.get("GOOGLE_CSE_CX", "")
         self.base_url = "https://www.googleapis.com/customsearch/v1"
@@ -80,8 +90,8 @@ class WebSearchGatherer:
             }
 
             # perform search with timeout
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(self.base_url, params=params)
+            client = self._http_client or get_http_client("google_search")
+            response = await client.get(self.base_url, params=params, timeout=self.timeout)
 
             # check response status
             if response.status_code != 200:
@@ -114,6 +124,8 @@ class WebSearchGatherer:
         try:
             return loop.run_until_complete(self.gather(claim))
         finally:
+            # pooled clients are bound to this loop, release them before closing it
+            loop.run_until_complete(close_http_clients())
             loop.close()
             asyncio.set_event_loop(None)
     
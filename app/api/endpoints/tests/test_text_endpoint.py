@@ -420,3 +420,128 @@ def test_no_deep_fake_kwarg_is_none(mock_run, mock_analytics):
     call_kwargs = mock_run.call_args
     df_arg = call_kwargs.kwargs.get("deep_fake_verification_result")
     assert df_arg is None
+
+
+# ---- test: verdict cache and in-flight coalescing ----
+
+@patch("app.api.endpoints.text.send_analytics_payload", new_callable=AsyncMock)
+@patch("app.api.endpoints.text.run_fact_check", new_callable=AsyncMock)
+def test_cached_verdict_skips_graph_with_fresh_message_id(mock_run, mock_analytics):
+    """a verdict cache hit returns the stored response under a new message_id."""
+    cached = AnalysisResponse(message_id="old-id", rationale="cached", responseWithoutLinks="cached")
+
+    with patch("app.api.endpoints.text.get_cached_verdict", new_callable=AsyncMock, return_value=cached):
+        resp = client.post("/text", json=_TEXT_PAYLOAD)
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["rationale"] == "cached"
+    assert data["message_id"] != "old-id"
+    mock_run.assert_not_called()
+
+
+@patch("app.api.endpoints.text.send_analytics_payload", new_callable=AsyncMock)
+@patch("app.api.endpoints.text.run_fact_check", new_callable=AsyncMock)
+def test_verdict_stored_after_successful_run(mock_run, mock_analytics):
+    """a successful analysis is written to the verdict cache."""
+    mock_run.return_value = _make_graph_output()
+
+    with patch("app.api.endpoints.text.store_verdict", new_callable=AsyncMock) as mock_store:
+        resp = client.post("/text", json=_TEXT_PAYLOAD)
+
+    assert resp.status_code == 200
+    mock_store.assert_awaited_once()
+    assert mock_store.call_args.args[1].message_id == resp.json()["message_id"]
+
+
+@patch("app.api.endpoints.text.run_fact_check", new_callable=AsyncMock)
+def test_graph_error_not_cached(mock_run):
+    """failed analyses are never written to the verdict cache."""
+    mock_run.return_value = _make_graph_output(error="Adjudication timed out")
+
+    with patch("app.api.endpoints.text.store_verdict", new_callable=AsyncMock) as mock_store:
+        resp = client.post("/text", json=_TEXT_PAYLOAD)
+
+    assert resp.status_code == 500
+    mock_store.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("app.api.endpoints.text.send_analytics_payload", new_callable=AsyncMock)
+async def test_concurrent_identical_requests_share_one_run(mock_analytics):
+    """identical requests in flight at the same time run the graph once."""
+    import asyncio
+    import httpx
+
+    calls = 0
+
+    async def _slow_run(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return _make_graph_output()
+
+    transport = httpx.ASGITransport(app=app)
+    with patch("app.api.endpoints.text.run_fact_check", side_effect=_slow_run):
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+            responses = await asyncio.gather(
+                *(ac.post("/text", json=_TEXT_PAYLOAD) for _ in range(4))
+            )
+
+    assert calls == 1
+    assert all(r.status_code == 200 for r in responses)
+    message_ids = {r.json()["message_id"] for r in responses}
+    assert len(message_ids) == 4
+
+
+# ---- test: /text/stream ----
+
+def _parse_sse(body: str) -> list[tuple[str, dict]]:
+    import json
+
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def _fake_stream(graph_output):
+    from app.agentic_ai.run import GraphEvent
+
+    async def _stream(*args, **kwargs):
+        yield GraphEvent(node="format_input", data={"pending_links": 0, "expanded_links": 0})
+        yield GraphEvent(node="adjudication", data={"claims": 1})
+        yield GraphEvent(node="done", output=graph_output)
+
+    return _stream
+
+
+@patch("app.api.endpoints.text.send_analytics_payload", new_callable=AsyncMock)
+def test_stream_emits_accepted_nodes_and_result(mock_analytics):
+    """stream emits accepted first, then node events, then the final response."""
+    with patch("app.api.endpoints.text.stream_fact_check", side_effect=_fake_stream(_make_graph_output())):
+        resp = client.post("/text/stream", json=_TEXT_PAYLOAD)
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(resp.text)
+
+    assert [name for name, _ in events] == ["accepted", "node", "node", "result"]
+    msg_id = events[0][1]["message_id"]
+    assert events[1][1]["node"] == "format_input"
+    assert "elapsed_ms" in events[1][1]
+    assert events[2][1]["claims"] == 1
+    assert events[-1][1]["message_id"] == msg_id
+    assert "Test claim" in events[-1][1]["rationale"]
+
+
+def test_stream_emits_error_event_on_graph_error():
+    """a graph error is reported as an SSE error event."""
+    graph_output = _make_graph_output(error="Adjudication timed out")
+    with patch("app.api.endpoints.text.stream_fact_check", side_effect=_fake_stream(graph_output)):
+        resp = client.post("/text/stream", json=_TEXT_PAYLOAD)
+
+    events = _parse_sse(resp.text)
+    assert events[-1][0] == "error"
+    assert "timed out" in events[-1][1]["detail"]
@@ -1,4 +1,6 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import json
 import time
 import traceback
 import asyncio
@@ -6,13 +8,22 @@ from app.models.api import Request, AnalysisResponse
 from app.clients import send_analytics_payload
 from app.observability.analytics import AnalyticsCollector
 from app.api.mapper import request_to_data_sources,fact_check_result_to_response, sanitize_request, sanitize_response
-from app.agentic_ai.run import run_fact_check
+from app.agentic_ai.run import GraphOutput, run_fact_check, stream_fact_check
 from app.observability.logger.logger import get_logger
 from app.utils.id_generator import generate_message_id
+from app.utils.singleflight import SingleFlight
+from app.clients.verdict_cache import (
+    build_verdict_cache_key,
+    get_cached_verdict,
+    store_verdict,
+)
 
 router = APIRouter()
 logger = get_logger(__name__)
 
+# concurrent identical requests share one graph run
+_inflight_verdicts: SingleFlight[AnalysisResponse] = SingleFlight("text_verdicts")
+
 
 def _log_request_details(msg_id: str, request: Request) -> None:
     """
@@ -36,6 +47,88 @@ def _log_request_details(msg_id: str, request: Request) -> None:
         logger.info(f"[{msg_id}] content[{idx}]: type={item.type}, text_length={len(item.textContent or '')}, preview='{content_preview}...')")
 
 
+def _build_response(
+    msg_id: str,
+    graph_output: GraphOutput,
+    analytics: AnalyticsCollector,
+) -> AnalysisResponse:
+    """turn a graph output into a sanitized AnalysisResponse and report analytics."""
+    if graph_output.error:
+        logger.error(f"[{msg_id}] agentic graph error: {graph_output.error}")
+        raise HTTPException(status_code=500, detail=graph_output.error)
+
+    fact_check_result = graph_output.result
+
+    analytics.populate_from_graph_output(
+        fact_check_result=graph_output.result,
+        fact_check_results=graph_output.fact_check_results,
+        search_results=graph_output.search_results,
+        scraped_pages=graph_output.scraped_pages,
+        source_numbers=graph_output.source_numbers,
+        collapsed_sources=graph_output.collapsed_sources,
+    )
+
+    # log results
+    total_claims = sum(len(ds_result.claim_verdicts) for ds_result in fact_check_result.results)
+    logger.info(f"[{msg_id}] extracted {total_claims} claim(s) from {len(fact_check_result.results)} data source(s)")
+
+    # step 3: build response
+    logger.info(f"[{msg_id}] building response")
+    response = fact_check_result_to_response(
+        msg_id,
+        fact_check_result,
+        fact_check_results=graph_output.fact_check_results,
+        search_results=graph_output.search_results,
+        scraped_pages=graph_output.scraped_pages,
+        source_numbers=graph_output.source_numbers,
+    )
+
+    # step 4: sanitize response to remove PII
+    sanitized_response = sanitize_response(response)
+
+    analytics.set_final_response(sanitized_response.rationale)
+
+    # only send analytics if claims were extracted
+    if analytics.has_extracted_claims():
+        logger.info(f"[{msg_id}] sending analytics payload (claims found)")
+        asyncio.create_task(send_analytics_payload(analytics))
+    else:
+        logger.info(f"[{msg_id}] skipping analytics payload (no claims extracted)")
+
+    return sanitized_response
+
+
+async def _analyze_and_cache(
+    msg_id: str,
+    sanitized_request: Request,
+    cache_key: str,
+) -> AnalysisResponse:
+    """run the agentic graph for a sanitized request, build the response and cache it."""
+    #init analytics for the pipeline
+    analytics = AnalyticsCollector(msg_id)
+    # step 1: convert API request to internal DataSource format
+    data_sources = request_to_data_sources(sanitized_request)
+    analytics.populate_from_data_sources(data_sources)
+
+    logger.info(f"[{msg_id}] created {len(data_sources)} data source(s)")
+
+    # step 2: run the agentic fact-checking graph
+    logger.info(f"[{msg_id}] starting agentic fact-check graph")
+    graph_start = time.time()
+    graph_output = await run_fact_check(
+        data_sources,
+        deep_fake_verification_result=sanitized_request.deep_fake_verification_result,
+    )
+    graph_duration = (time.time() - graph_start) * 1000
+    logger.info(f"[{msg_id}] graph completed in {graph_duration:.0f}ms")
+
+    sanitized_response = _build_response(msg_id, graph_output, analytics)
+
+    await store_verdict(cache_key, sanitized_response)
+
+    return sanitized_response
+
+
 @router.post("/text", response_model=AnalysisResponse)
 async def analyze_text(request: Request) -> AnalysisResponse:
     """
@@ -43,6 +136,8 @@ async def analyze_text(request: Request) -> AnalysisResponse:
 
     Accepts an array of content items, each with textContent and type.
     Returns detailed analysis with verdict, rationale, and citations.
+    Identical content is served from the verdict cache or joins an
+    in-flight analysis instead of running the graph again.
     """
     start_time = time.time()
     msg_id = generate_message_id()
@@ -55,72 +150,109 @@ async def analyze_text(request: Request) -> AnalysisResponse:
         # log full request for debugging
         _log_request_details(msg_id, sanitized_request)
 
-        #init analytics for the pipeline
-        analytics = AnalyticsCollector(msg_id)
-        # step 1: convert API request to internal DataSource format
-        data_sources = request_to_data_sources(sanitized_request)
-        analytics.populate_from_data_sources(data_sources)
-
-        logger.info(f"[{msg_id}] created {len(data_sources)} data source(s)")
+        cache_key = build_verdict_cache_key(sanitized_request)
+        cached = await get_cached_verdict(cache_key)
+        if cached is not None:
+            total_duration = (time.time() - start_time) * 1000
+            logger.info(f"[{msg_id}] served cached verdict ({cached.message_id}) in {total_duration:.0f}ms")
+            return cached.model_copy(update={"message_id": msg_id})
 
-        # step 2: run the agentic fact-checking graph
-        logger.info(f"[{msg_id}] starting agentic fact-check graph")
-        graph_start = time.time()
-        graph_output = await run_fact_check(
-            data_sources,
-            deep_fake_verification_result=sanitized_request.deep_fake_verification_result,
+        response, shared = await _inflight_verdicts.do(
+            cache_key,
+            lambda: _analyze_and_cache(msg_id, sanitized_request, cache_key),
         )
-        graph_duration = (time.time() - graph_start) * 1000
-        logger.info(f"[{msg_id}] graph completed in {graph_duration:.0f}ms")
+        if shared:
+            logger.info(f"[{msg_id}] joined in-flight analysis {response.message_id}")
+            response = response.model_copy(update={"message_id": msg_id})
 
-        if graph_output.error:
-            logger.error(f"[{msg_id}] agentic graph error: {graph_output.error}")
-            raise HTTPException(status_code=500, detail=graph_output.error)
+        total_duration = (time.time() - start_time) * 1000
+        logger.info(f"[{msg_id}] request completed successfully in {total_duration:.0f}ms")
 
-        fact_check_result = graph_output.result
+        return response
 
-        analytics.populate_from_graph_output(
-            fact_check_result=graph_output.result,
-            fact_check_results=graph_output.fact_check_results,
-            search_results=graph_output.search_results,
-            scraped_pages=graph_output.scraped_pages,
-        )
+    except Exception as e:
+        total_duration = (time.time() - start_time) * 1000
+        error_type = type(e).__name__
+        logger.error(f"[{msg_id}] request failed after {total_duration:.0f}ms: {error_type}: {str(e)}")
+        logger.error(f"[{msg_id}] traceback:\n{traceback.format_exc()}")
+        raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}") from e
 
-        # log results
-        total_claims = sum(len(ds_result.claim_verdicts) for ds_result in fact_check_result.results)
-        logger.info(f"[{msg_id}] extracted {total_claims} claim(s) from {len(fact_check_result.results)} data source(s)")
-
-        # step 3: build response
-        logger.info(f"[{msg_id}] building response")
-        response = fact_check_result_to_response(
-            msg_id,
-            fact_check_result,
-            fact_check_results=graph_output.fact_check_results,
-            search_results=graph_output.search_results,
-            scraped_pages=graph_output.scraped_pages,
-        )
 
-        # step 4: sanitize response to remove PII
-        sanitized_response = sanitize_response(response)
+def _sse_event(event: str, data: dict) -> str:
+    """format a single server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
-        analytics.set_final_response(sanitized_response.rationale)
 
-        # only send analytics if claims were extracted
-        if analytics.has_extracted_claims():
-            logger.info(f"[{msg_id}] sending analytics payload (claims found)")
-            asyncio.create_task(send_analytics_payload(analytics))
-        else:
-            logger.info(f"[{msg_id}] skipping analytics payload (no claims extracted)")
+async def _stream_analysis(msg_id: str, request: Request):
+    """generate SSE events for /text/stream: accepted, node events, then result or error."""
+    start_time = time.time()
+    yield _sse_event("accepted", {"message_id": msg_id})
 
-        total_duration = (time.time() - start_time) * 1000
-        logger.info(f"[{msg_id}] request completed successfully in {total_duration:.0f}ms")
+    try:
+        sanitized_request = sanitize_request(request)
+        _log_request_details(msg_id, sanitized_request)
+
+        cache_key = build_verdict_cache_key(sanitized_request)
+        cached = await get_cached_verdict(cache_key)
+        if cached is not None:
+            logger.info(f"[{msg_id}] served cached verdict ({cached.message_id}) via stream")
+            response = cached.model_copy(update={"message_id": msg_id})
+            yield _sse_event("result", response.model_dump())
+            return
 
-        return sanitized_response
+        analytics = AnalyticsCollector(msg_id)
+        data_sources = request_to_data_sources(sanitized_request)
+        analytics.populate_from_data_sources(data_sources)
+
+        logger.info(f"[{msg_id}] starting streamed agentic fact-check graph")
+        last_event_time = time.time()
+        graph_output = None
+        async for event in stream_fact_check(
+            data_sources,
+            deep_fake_verification_result=sanitized_request.deep_fake_verification_result,
+        ):
+            if event.output is not None:
+                graph_output = event.output
+                continue
+            now = time.time()
+            yield _sse_event("node", {
+                "node": event.node,
+                "elapsed_ms": round((now - start_time) * 1000),
+                "duration_ms": round((now - last_event_time) * 1000),
+                **event.data,
+            })
+            last_event_time = now
+
+        response = _build_response(msg_id, graph_output, analytics)
+        await store_verdict(cache_key, response)
+
+        total_duration = (time.time() - start_time) * 1000
+        logger.info(f"[{msg_id}] streamed request completed successfully in {total_duration:.0f}ms")
+        yield _sse_event("result", response.model_dump())
 
     except Exception as e:
         total_duration = (time.time() - start_time) * 1000
         error_type = type(e).__name__
-        logger.error(f"[{msg_id}] request failed after {total_duration:.0f}ms: {error_type}: {str(e)}")
+        detail = e.detail if isinstance(e, HTTPException) else str(e)
+        logger.error(f"[{msg_id}] streamed request failed after {total_duration:.0f}ms: {error_type}: {detail}")
         logger.error(f"[{msg_id}] traceback:\n{traceback.format_exc()}")
-        raise HTTPException(status_code=500, detail=f"Error processing request: {str(e)}") from e
+        yield _sse_event("error", {"message_id": msg_id, "detail": f"Error processing request: {detail}"})
+
+
+@router.post("/text/stream")
+async def analyze_text_stream(request: Request) -> StreamingResponse:
+    """
+    Same analysis as /text, streamed as server-sent events.
+
+    Emits "accepted" immediately, one "node" event per graph node transition
+    (with per-stage timing), and finally "result" with the AnalysisResponse
+    or "error" if the analysis failed.
+    """
+    msg_id = generate_message_id()
+    logger.info(f"[{msg_id}] received /text/stream request with {len(request.content)} content item(s)")
 
+    return StreamingResponse(
+        _stream_analysis(msg_id, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
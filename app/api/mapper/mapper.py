@@ -154,6 +154,7 @@ def _build_top_sources(
     fact_check_results: list,
     search_results: dict,
     scraped_pages: list,
+    source_numbers: dict | None = None,
 ) -> str:
     """build a short list of the top cited sources for whatsapp."""
     from app.agentic_ai.prompts.context_formatter import (
@@ -161,7 +162,9 @@ def _build_top_sources(
         filter_cited_references,
     )
 
-    source_refs = build_source_reference_list(fact_check_results, search_results, scraped_pages)
+    source_refs = build_source_reference_list(
+        fact_check_results, search_results, scraped_pages, numbering=source_numbers,
+    )
     if not source_refs:
         return ""
 
@@ -189,6 +192,7 @@ def _build_compact_whatsapp_rationale(
     fact_check_results: list,
     search_results: dict,
     scraped_pages: list,
+    source_numbers: dict | None = None,
 ) -> str:
     """build a compact whatsapp-ready rationale with short justifications and top sources."""
     parts = []
@@ -208,7 +212,7 @@ def _build_compact_whatsapp_rationale(
         parts.append(short)
 
     top_sources = _build_top_sources(
-        result, fact_check_results, search_results, scraped_pages,
+        result, fact_check_results, search_results, scraped_pages, source_numbers,
     )
     if top_sources:
         parts.append("\n\n*Principais fontes*:")
@@ -226,6 +230,7 @@ def fact_check_result_to_response(
     fact_check_results: list | None = None,
     search_results: dict | None = None,
     scraped_pages: list | None = None,
+    source_numbers: dict | None = None,
 ) -> AnalysisResponse:
         all_verdicts = []
         for ds_result in result.results:
@@ -270,6 +275,7 @@ def fact_check_result_to_response(
                 fact_check_results or [],
                 search_results or {},
                 scraped_pages or [],
+                source_numbers,
             )
             if citation_text:
                 rationale = rationale + citation_text
@@ -290,6 +296,7 @@ def fact_check_result_to_response(
                 fact_check_results or [],
                 search_results or {},
                 scraped_pages or [],
+                source_numbers,
             )
         else:
             resp_without_links = remove_link_like_substrings(rationale)
@@ -307,6 +314,7 @@ def _build_citations_from_source_refs(
     fact_check_results: list,
     search_results: dict,
     scraped_pages: list,
+    source_numbers: dict | None = None,
 ) -> str:
     """build the citation section using the same numbering as format_context.
 
@@ -320,7 +328,7 @@ def _build_citations_from_source_refs(
     )
 
     source_refs = build_source_reference_list(
-        fact_check_results, search_results, scraped_pages,
+        fact_check_results, search_results, scraped_pages, numbering=source_numbers,
     )
 
     if not source_refs:
@@ -842,3 +842,24 @@ def test_full_pipeline_citation_order_matches_cli():
     pos_3 = fontes.index("[3]")
     pos_5 = fontes.index("[5]")
     assert pos_1 < pos_2 < pos_3 < pos_5
+
+
+def test_citations_follow_incremental_source_numbers():
+    """with source_numbers from the graph, [N] maps to the source adjudication saw as [N]."""
+    fc = _make_fc_context(url="https://aosfatos.org/late-check")
+    sr = _make_search_context(title="Early Result", url="https://example.com/early")
+    verdict = _make_verdict(justification="Confirmed by [2].")
+    result = _make_fact_check_result(verdicts=[verdict])
+
+    resp = fact_check_result_to_response(
+        "msg-num", result,
+        fact_check_results=[fc],
+        search_results={"geral": [sr]},
+        scraped_pages=[],
+        source_numbers={"gs-1": 1, "fc-1": 2},
+    )
+
+    citations = resp.rationale.split("*Fontes*:")[-1]
+    assert "[2]" in citations
+    assert "https://aosfatos.org/late-check" in citations
+    assert "https://example.com/early" not in citations
@@ -1,6 +1,6 @@
-import httpx
 import os
 import logging,json
+from app.clients.http_pool import get_http_client
 from app.observability.analytics import AnalyticsCollector
 
 _URL_ENV_VAR  = os.getenv("ANALYTICS_SERVICE_URL") 
@@ -34,13 +34,14 @@ async def send_analytics_payload(collector: AnalyticsCollector)->None:
         json_val = collector.to_dict()
 
         logger.info("Analytics output URL %s", full_path)
-        async with httpx.AsyncClient(timeout=_TIMEOUT) as client:
-            resp = await client.post(
-                full_path,
-                json=json_val,
-                headers={"X-Bot-Api-Key": _BOT_API_KEY},
-            )
-            logger.info("Analytics status: %s", resp.status_code)
+        client = get_http_client("analytics")
+        resp = await client.post(
+            full_path,
+            json=json_val,
+            headers={"X-Bot-Api-Key": _BOT_API_KEY},
+            timeout=_TIMEOUT,
+        )
+        logger.info("Analytics status: %s", resp.status_code)
     except Exception as e:
         logger.exception("Failed to send analytics payload: %s", e)
     
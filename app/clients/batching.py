@@ -0,0 +1,143 @@
+"""
+micro-batching of keyed calls across concurrent requests.
+
+a MicroBatcher collects keys (e.g. post urls) submitted by any coroutine on
+the worker during a short window, runs a single batch call for all of them
+and fans each result back out to the callers waiting on that key. the batch
+is flushed early once max_batch distinct keys are queued.
+
+callers asking for a key that is already queued share its result. a caller
+that is cancelled does not cancel the batch — the other waiters still get
+their results.
+
+like governor, state is keyed by (name, loop) since asyncio futures are
+bound to the loop that created them.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# run_batch(keys) -> {key: result}; keys missing from the dict resolve to None
+BatchFn = Callable[[list[str]], Awaitable[dict[str, T]]]
+
+
+class MicroBatcher(Generic[T]):
+    """coalesces submit(key) calls into batched run_batch(keys) calls."""
+
+    def __init__(
+        self,
+        name: str,
+        run_batch: BatchFn,
+        *,
+        window: float = 0.3,
+        max_batch: int = 10,
+    ):
+        self.name = name
+        self.run_batch = run_batch
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._pending: dict[str, asyncio.Future] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: set[asyncio.Task] = set()
+
+        self.submitted = 0
+        self.batches = 0
+        self.keys_run = 0
+        self.max_batch_seen = 0
+
+    async def submit(self, key: str) -> Optional[T]:
+        """result of run_batch for key, batched with other keys queued in the window."""
+        self.submitted += 1
+        fut = self._pending.get(key)
+        if fut is None:
+            loop = asyncio.get_running_loop()
+            fut = loop.create_future()
+            # nobody may be left to read a failure if every waiter was cancelled
+            fut.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._pending[key] = fut
+            if len(self._pending) >= self.max_batch:
+                self._flush()
+            elif self._timer is None:
+                self._timer = loop.call_later(self.window, self._flush)
+        return await asyncio.shield(fut)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: dict[str, asyncio.Future]) -> None:
+        keys = list(batch)
+        self.batches += 1
+        self.keys_run += len(keys)
+        self.max_batch_seen = max(self.max_batch_seen, len(keys))
+        logger.info("%s: running batch of %d key(s)", self.name, len(keys))
+
+        try:
+            results = await self.run_batch(keys)
+        except BaseException as e:
+            for fut in batch.values():
+                if not fut.done():
+                    fut.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+
+        for key, fut in batch.items():
+            if not fut.done():
+                fut.set_result(results.get(key))
+
+    def stats(self) -> dict:
+        return {
+            "submitted": self.submitted,
+            "batches": self.batches,
+            "keys_run": self.keys_run,
+            "avg_batch": round(self.keys_run / self.batches, 2) if self.batches else 0.0,
+            "max_batch": self.max_batch_seen,
+            "queued": len(self._pending),
+        }
+
+
+_batchers: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, MicroBatcher]] = {}
+
+
+def get_batcher(name: str, run_batch: BatchFn, **kwargs) -> MicroBatcher:
+    """return the MicroBatcher for name on the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    key = (name, id(loop))
+
+    entry = _batchers.get(key)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    batcher = MicroBatcher(name, run_batch, **kwargs)
+    _batchers[key] = (loop, batcher)
+    # drop batchers whose loop has been closed
+    for k, (owner, _b) in list(_batchers.items()):
+        if owner.is_closed():
+            del _batchers[k]
+    return batcher
+
+
+def get_batching_stats() -> dict[str, dict]:
+    """batch counts and sizes per batcher."""
+    stats: dict[str, dict] = {}
+    for (name, _), (_loop, batcher) in _batchers.items():
+        stats.setdefault(name, batcher.stats())
+    return stats
+
+
+def reset_batchers() -> None:
+    """forget every batcher — useful for tests."""
+    _batchers.clear()
@@ -0,0 +1,105 @@
+"""
+caching layer for Google Fact-Check API lookups using Redis (GCP Memorystore).
+
+caches the raw API response (before parsing) per normalized query so both the
+agentic tool and the legacy gatherer share entries. responses with no claims
+are cached too (negative caching) with a shorter TTL, since a trending hoax
+usually gets its first review within hours.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from typing import Awaitable, Callable, Optional
+
+from app.clients.memorystore import safe_get, safe_set
+from app.clients.web_search_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "fact_check:v1"
+_MAX_INLINE_QUERY_LEN = 100
+
+
+def build_fact_check_cache_key(query: str) -> str:
+    """build a deterministic redis key from the query."""
+    nq = normalize_query(query)
+    if len(nq) > _MAX_INLINE_QUERY_LEN:
+        query_part = hashlib.sha256(nq.encode()).hexdigest()
+    else:
+        # replace spaces with underscores for readability
+        query_part = nq.replace(" ", "_")
+    return f"{_KEY_PREFIX}:{query_part}"
+
+
+def serialize(data: dict) -> bytes:
+    """json + zlib compress."""
+    raw = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(raw.encode("utf-8"), level=6)
+
+
+def deserialize(data: bytes) -> Optional[dict]:
+    """zlib decompress + json parse. returns None on corruption."""
+    try:
+        value = json.loads(zlib.decompress(data))
+    except Exception:
+        logger.warning("fact-check cache deserialization failed, treating as miss")
+        return None
+    return value if isinstance(value, dict) else None
+
+
+def is_empty_response(data: dict) -> bool:
+    """true when the API found no claims for the query."""
+    return not data.get("claims")
+
+
+def _get_ttl_seconds() -> int:
+    """read TTL from env (in minutes), default 360."""
+    minutes = int(os.getenv("FACT_CHECK_CACHE_TTL_MINUTES", "360"))
+    return max(minutes, 1) * 60
+
+
+def _get_negative_ttl_seconds() -> int:
+    """read TTL for empty responses from env (in minutes), default 30."""
+    minutes = int(os.getenv("FACT_CHECK_NEGATIVE_CACHE_TTL_MINUTES", "30"))
+    return max(minutes, 1) * 60
+
+
+async def cached_fact_check_search(
+    query: str,
+    *,
+    original_search_fn: Callable[[str], Awaitable[dict]],
+) -> dict:
+    """
+    cache-through wrapper for a raw fact-check API call.
+
+    on cache hit returns the stored response dict (possibly empty).
+    on miss calls original_search_fn(query) and caches the result; exceptions
+    from original_search_fn propagate and are never cached.
+    any redis error silently falls through to the original function.
+    """
+    key = build_fact_check_cache_key(query)
+
+    cached = await safe_get(key)
+    if cached is not None:
+        data = deserialize(cached)
+        if data is not None:
+            logger.debug(
+                "fact-check cache HIT for key=%s (%d claims)", key, len(data.get("claims", []))
+            )
+            return data
+
+    logger.debug("fact-check cache MISS for key=%s", key)
+    data = await original_search_fn(query)
+
+    # best-effort cache store; empty responses get the shorter negative TTL
+    if is_empty_response(data):
+        ttl = _get_negative_ttl_seconds()
+        await safe_set(key, serialize({}), ex=ttl)
+    else:
+        ttl = _get_ttl_seconds()
+        await safe_set(key, serialize(data), ex=ttl)
+
+    return data
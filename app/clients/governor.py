@@ -0,0 +1,321 @@
+"""
+per-upstream concurrency governor for outbound calls.
+
+every upstream (vertex, search server, fact check api, simple scraping,
+apify actors) gets a budget: a semaphore of capacity units plus an optional
+token bucket for rate. calls beyond the budget queue FIFO with a deadline
+instead of hitting the upstream and coming back as 429s or apify
+memory-limit failures; a call that can't be admitted in time raises
+GovernorTimeout (a TimeoutError, so existing timeout handling applies).
+
+apify capacity is counted in MB of actor memory. the plan is shared by all
+uvicorn workers: each worker's local budget is the plan split by
+WEB_CONCURRENCY, and the whole plan can also be enforced cluster-wide
+through per-call leases in redis (GOVERNOR_SHARED=1). redis errors fall back
+to the local budget — the governor never fails a call because redis is down.
+
+like http_pool, state is keyed by (upstream, loop) since asyncio futures are
+bound to the loop that created them.
+"""
+
+import asyncio
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+from app.clients.memorystore import safe_lease_acquire, safe_lease_release
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "governor:v1"
+# a crashed worker can't release its shared units; each lease expires this
+# long after it was taken. apify runs are capped at 120s, well inside it
+_SHARED_LEASE_SECONDS = 600
+_SHARED_POLL_INTERVAL = 0.25
+# waits longer than this are logged at info level
+_SLOW_WAIT_SECONDS = 1.0
+
+
+class GovernorTimeout(TimeoutError):
+    """raised when a call could not be admitted to its upstream before the deadline."""
+    pass
+
+
+@dataclass(frozen=True)
+class UpstreamBudget:
+    """concurrency/rate budget for a single upstream."""
+    max_concurrent: int = 10        # capacity units held by in-flight calls
+    rate_per_second: float = 0.0    # token bucket refill rate; 0 disables it
+    burst: int = 1                  # token bucket size
+    max_wait: float = 10.0          # default queueing deadline (seconds)
+    shared_capacity: int = 0        # cluster-wide units through redis; 0 = local only
+
+
+# apify: 8 GB plan, units are MB (ACTOR_MEMORY_LIMITS)
+_APIFY_PLAN_MB = 8192
+
+BUDGETS: dict[str, UpstreamBudget] = {
+    "vertex": UpstreamBudget(max_concurrent=16, rate_per_second=8.0, burst=16, max_wait=30.0),
+    "search_server": UpstreamBudget(max_concurrent=20, max_wait=15.0),
+    "fact_check_api": UpstreamBudget(max_concurrent=10, rate_per_second=10.0, burst=10),
+    "scraping": UpstreamBudget(max_concurrent=30, max_wait=15.0),
+    "apify": UpstreamBudget(
+        max_concurrent=_APIFY_PLAN_MB,
+        max_wait=60.0,
+        shared_capacity=_APIFY_PLAN_MB,
+    ),
+}
+
+_DEFAULT_BUDGET = UpstreamBudget()
+
+
+def _env_number(name: str, default: float) -> float:
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("invalid %s=%r, using %s", name, raw, default)
+        return default
+
+
+def _worker_count() -> int:
+    """uvicorn worker processes sharing the upstream budgets (WEB_CONCURRENCY)."""
+    return max(1, int(_env_number("WEB_CONCURRENCY", 1)))
+
+
+def get_budget(upstream: str) -> UpstreamBudget:
+    """budget for upstream, with GOVERNOR_<UPSTREAM>_* env overrides applied.
+
+    a budget with shared_capacity is split evenly between the workers locally.
+    """
+    base = BUDGETS.get(upstream, _DEFAULT_BUDGET)
+    prefix = f"GOVERNOR_{upstream.upper()}_"
+    shared_enabled = os.getenv("GOVERNOR_SHARED", "0").strip() == "1"
+    local = base.max_concurrent
+    if base.shared_capacity:
+        local = base.shared_capacity // _worker_count()
+    return UpstreamBudget(
+        max_concurrent=max(1, int(_env_number(prefix + "MAX_CONCURRENT", local))),
+        rate_per_second=max(0.0, _env_number(prefix + "RATE", base.rate_per_second)),
+        burst=max(1, int(_env_number(prefix + "BURST", base.burst))),
+        max_wait=max(0.0, _env_number(prefix + "MAX_WAIT", base.max_wait)),
+        shared_capacity=base.shared_capacity if shared_enabled else 0,
+    )
+
+
+class _Governor:
+    """FIFO weighted semaphore + token bucket for one upstream on one loop."""
+
+    def __init__(self, upstream: str, budget: UpstreamBudget):
+        self.upstream = upstream
+        self.budget = budget
+        self.in_use = 0
+        self._waiters: deque[tuple[int, asyncio.Future]] = deque()
+        self._tokens = float(budget.burst)
+        self._refilled_at = time.monotonic()
+
+        self.queue_depth = 0
+        self.max_queue_depth = 0
+        self.admitted = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    # ── token bucket ────────────────────────────────────────────────
+
+    async def _take_token(self, deadline: float) -> None:
+        rate = self.budget.rate_per_second
+        if rate <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.budget.burst),
+                self._tokens + (now - self._refilled_at) * rate,
+            )
+            self._refilled_at = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            delay = (1.0 - self._tokens) / rate
+            if now + delay > deadline:
+                raise GovernorTimeout(f"{self.upstream}: rate budget exhausted")
+            await asyncio.sleep(delay)
+
+    # ── local capacity ──────────────────────────────────────────────
+
+    def _wake(self) -> None:
+        """admit queued callers in order while capacity allows."""
+        while self._waiters:
+            weight, fut = self._waiters[0]
+            if fut.done():
+                self._waiters.popleft()
+                continue
+            if self.in_use + weight > self.budget.max_concurrent:
+                break
+            self._waiters.popleft()
+            self.in_use += weight
+            fut.set_result(None)
+
+    async def _acquire_local(self, weight: int, deadline: float) -> None:
+        if not self._waiters and self.in_use + weight <= self.budget.max_concurrent:
+            self.in_use += weight
+            return
+
+        fut = asyncio.get_running_loop().create_future()
+        self._waiters.append((weight, fut))
+        try:
+            await asyncio.wait_for(fut, timeout=max(0.0, deadline - time.monotonic()))
+        except asyncio.TimeoutError:
+            raise GovernorTimeout(f"{self.upstream}: no capacity before deadline") from None
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # admitted just as we were cancelled — give the units back
+                self._release_local(weight)
+            raise
+        finally:
+            if not fut.done():
+                fut.cancel()
+            self._wake()
+
+    def _release_local(self, weight: int) -> None:
+        self.in_use -= weight
+        self._wake()
+
+    # ── cluster-wide capacity (redis) ───────────────────────────────
+
+    def _shared_key(self) -> str:
+        return f"{_KEY_PREFIX}:{self.upstream}:leases"
+
+    async def _acquire_shared(self, weight: int, deadline: float) -> Optional[str]:
+        """lease weight units in redis; the lease id, or None when sharing is off or redis is unavailable."""
+        capacity = self.budget.shared_capacity
+        if capacity <= 0:
+            return None
+
+        key = self._shared_key()
+        lease_id = uuid.uuid4().hex
+        while True:
+            taken = await safe_lease_acquire(key, lease_id, weight, capacity, _SHARED_LEASE_SECONDS)
+            if taken is None:
+                return None
+            if taken:
+                return lease_id
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise GovernorTimeout(f"{self.upstream}: shared capacity exhausted")
+            await asyncio.sleep(min(_SHARED_POLL_INTERVAL, remaining))
+
+    async def _release_shared(self, lease_id: str, weight: int) -> None:
+        await safe_lease_release(self._shared_key(), lease_id, weight)
+
+    # ── admission ───────────────────────────────────────────────────
+
+    @asynccontextmanager
+    async def slot(self, weight: int, timeout: Optional[float]) -> AsyncIterator[None]:
+        weight = max(1, min(weight, self.budget.max_concurrent))
+        started = time.monotonic()
+        deadline = started + (timeout if timeout is not None else self.budget.max_wait)
+
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await self._take_token(deadline)
+            await self._acquire_local(weight, deadline)
+            try:
+                lease_id = await self._acquire_shared(weight, deadline)
+            except BaseException:
+                self._release_local(weight)
+                raise
+        except GovernorTimeout:
+            self.timeouts += 1
+            logger.warning(
+                "governor: %s call rejected after %.2fs (in_use=%d/%d, queued=%d)",
+                self.upstream, time.monotonic() - started,
+                self.in_use, self.budget.max_concurrent, self.queue_depth - 1,
+            )
+            raise
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+        if waited >= _SLOW_WAIT_SECONDS:
+            logger.info("governor: %s call queued %.2fs", self.upstream, waited)
+
+        try:
+            yield
+        finally:
+            self._release_local(weight)
+            if lease_id is not None:
+                await self._release_shared(lease_id, weight)
+
+    def stats(self) -> dict:
+        return {
+            "in_use": self.in_use,
+            "capacity": self.budget.max_concurrent,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "admitted": self.admitted,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.admitted * 1000, 1) if self.admitted else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+
+_governors: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, _Governor]] = {}
+
+
+def _get_governor(upstream: str) -> _Governor:
+    loop = asyncio.get_running_loop()
+    key = (upstream, id(loop))
+
+    entry = _governors.get(key)
+    if entry is not None and entry[0] is loop:
+        return entry[1]
+
+    governor = _Governor(upstream, get_budget(upstream))
+    _governors[key] = (loop, governor)
+    # drop governors whose loop has been closed
+    for k, (owner, _gov) in list(_governors.items()):
+        if owner.is_closed():
+            del _governors[k]
+    return governor
+
+
+@asynccontextmanager
+async def governed(
+    upstream: str,
+    *,
+    weight: int = 1,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[None]:
+    """hold weight units of upstream's budget for the duration of the block.
+
+    queues while the budget is exhausted; raises GovernorTimeout if not
+    admitted within timeout (defaults to the budget's max_wait).
+    """
+    async with _get_governor(upstream).slot(weight, timeout):
+        yield
+
+
+def get_governor_stats() -> dict[str, dict]:
+    """queue depth, wait time and admission counters per upstream."""
+    stats: dict[str, dict] = {}
+    for (upstream, _), (_loop, governor) in _governors.items():
+        stats.setdefault(upstream, governor.stats())
+    return stats
+
+
+def reset_governors() -> None:
+    """forget every governor — useful for tests."""
+    _governors.clear()
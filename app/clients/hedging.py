@@ -0,0 +1,211 @@
+"""
+hedged requests for tail-latency-sensitive upstreams.
+
+a Hedger tracks recent latencies for one endpoint. when a call runs longer
+than the observed quantile (p95 by default) a duplicate is fired and
+whichever finishes first wins; the other is cancelled. hedges are paid for
+from a budget that earns max_hedge_ratio tokens per call, so at most ~10%
+extra load reaches the upstream even when it is slow across the board.
+
+until min_samples latencies have been seen there is no quantile and calls
+are never hedged. latencies are those of primary attempts, timed inside
+their concurrency slot (see Hedger.run).
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import AsyncContextManager, Awaitable, Callable, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """sliding window of recent latencies with nearest-rank quantiles."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples: deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q-th quantile of the window, or None until min_samples are recorded."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(q * len(ordered) + 0.5) - 1))
+        return ordered[index]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+
+class Hedger:
+    """fires a backup call when the primary exceeds the latency quantile."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        quantile: float = 0.95,
+        max_hedge_ratio: float = 0.1,
+        min_delay: float = 0.1,
+        window: int = 200,
+        min_samples: int = 20,
+    ):
+        self.name = name
+        self.quantile = quantile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay = min_delay
+        self.tracker = LatencyTracker(window=window, min_samples=min_samples)
+        # retry-budget style: each call earns max_hedge_ratio, each hedge spends 1
+        self._budget = 1.0
+        self._max_budget = max(1.0, max_hedge_ratio * 10)
+
+        self.calls = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """seconds to wait before hedging, or None while there is no latency data."""
+        q = self.tracker.quantile(self.quantile)
+        if q is None:
+            return None
+        return max(q, self.min_delay)
+
+    def _take_hedge_token(self) -> bool:
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        return True
+
+    async def _attempt(
+        self,
+        call: Callable[[], Awaitable[T]],
+        slot: Optional[Callable[[], AsyncContextManager]],
+        entered: Optional[asyncio.Event] = None,
+    ) -> T:
+        """
+        one attempt, inside slot when given. with entered (the primary) the
+        latency is timed from inside the slot and recorded on success — or on
+        cancellation, as a lower bound, so a lost primary still shows the tail.
+        """
+        async with slot() if slot is not None else nullcontext():
+            started = time.monotonic()
+            if entered is not None:
+                entered.set()
+            try:
+                result = await call()
+            except asyncio.CancelledError:
+                if entered is not None:
+                    self.tracker.record(time.monotonic() - started)
+                raise
+            if entered is not None:
+                self.tracker.record(time.monotonic() - started)
+            return result
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        timeout: Optional[float] = None,
+        slot: Optional[Callable[[], AsyncContextManager]] = None,
+    ) -> T:
+        """
+        run call(), hedging it once if it is slower than the tracked quantile.
+
+        timeout bounds the primary and its backup together (asyncio.TimeoutError).
+        slot, e.g. lambda: governed("search_server"), is entered around each
+        attempt; the hedge delay and the recorded latency start inside it, so
+        queueing for a slot neither triggers a hedge nor skews the quantile.
+        """
+        if timeout is None:
+            return await self._run(call, slot)
+        return await asyncio.wait_for(self._run(call, slot), timeout)
+
+    async def _run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        slot: Optional[Callable[[], AsyncContextManager]],
+    ) -> T:
+        self.calls += 1
+        self._budget = min(self._max_budget, self._budget + self.max_hedge_ratio)
+
+        delay = self.hedge_delay()
+        entered = asyncio.Event()
+        primary = asyncio.ensure_future(self._attempt(call, slot, entered))
+
+        if delay is None:
+            return await primary
+
+        waiter = asyncio.ensure_future(entered.wait())
+        try:
+            await asyncio.wait({primary, waiter}, return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except BaseException:
+            primary.cancel()
+            raise
+        finally:
+            waiter.cancel()
+        if done or not self._take_hedge_token():
+            return await primary
+
+        self.hedges += 1
+        logger.debug("hedging %s call after %.2fs", self.name, delay)
+        backup = asyncio.ensure_future(self._attempt(call, slot))
+        pending = {primary, backup}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        continue
+                    if task is backup:
+                        self.hedge_wins += 1
+                    return task.result()
+            # both attempts failed: surface the primary's error
+            return primary.result()
+        finally:
+            for task in (primary, backup):
+                if not task.done():
+                    task.cancel()
+
+    def stats(self) -> dict:
+        p50 = self.tracker.quantile(0.5)
+        pq = self.tracker.quantile(self.quantile)
+        return {
+            "calls": self.calls,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "samples": len(self.tracker),
+            "p50_ms": round(p50 * 1000, 1) if p50 is not None else None,
+            f"p{int(self.quantile * 100)}_ms": round(pq * 1000, 1) if pq is not None else None,
+        }
+
+
+_hedgers: dict[str, Hedger] = {}
+
+
+def get_hedger(name: str, **kwargs) -> Hedger:
+    """return the process-wide Hedger for an endpoint, creating it on first use."""
+    hedger = _hedgers.get(name)
+    if hedger is None:
+        hedger = Hedger(name, **kwargs)
+        _hedgers[name] = hedger
+    return hedger
+
+
+def get_hedging_stats() -> dict[str, dict]:
+    """calls, hedges and latency quantiles per endpoint."""
+    return {name: hedger.stats() for name, hedger in _hedgers.items()}
+
+
+def reset_hedgers() -> None:
+    """forget all latency history — useful for tests."""
+    _hedgers.clear()
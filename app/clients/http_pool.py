@@ -0,0 +1,140 @@
+"""
+shared pooled httpx clients for outbound calls.
+
+one AsyncClient per upstream keeps TCP/TLS connections warm across requests
+instead of paying a fresh handshake per query. clients are bound to the event
+loop that created them (tests and gather_sync spin up their own loops), so the
+registry is keyed by (upstream, loop) and stale entries are replaced lazily.
+
+timeouts are passed per request by the call sites; the client only owns
+connection limits, keep-alive and protocol settings.
+
+a pooled client is shared by every request of every user, so clients that
+fetch arbitrary pages (scraping) keep no cookies: a session or consent cookie
+set for one user's page would otherwise be replayed on everyone's fetches.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class UpstreamPool:
+    """connection-pool settings for a single upstream."""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    follow_redirects: bool = False
+    store_cookies: bool = True
+
+
+# per-upstream limits. the search server and fact check api see most of the
+# traffic (several queries per run, same host), scraping fans out to many hosts.
+UPSTREAMS: dict[str, UpstreamPool] = {
+    "search_server": UpstreamPool(max_connections=30, max_keepalive_connections=20),
+    "fact_check_api": UpstreamPool(max_connections=20, max_keepalive_connections=10),
+    "google_search": UpstreamPool(max_connections=20, max_keepalive_connections=10),
+    "serper": UpstreamPool(max_connections=20, max_keepalive_connections=10),
+    "scraping": UpstreamPool(
+        max_connections=50,
+        max_keepalive_connections=10,
+        keepalive_expiry=15.0,
+        follow_redirects=True,
+        store_cookies=False,
+    ),
+    "analytics": UpstreamPool(max_connections=5, max_keepalive_connections=2, http2=False),
+}
+
+_DEFAULT_POOL = UpstreamPool()
+
+_clients: dict[tuple[str, int], tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _no_cookie_jar() -> CookieJar:
+    """a jar that refuses every cookie (an empty allow-list matches no domain)."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _build_client(upstream: str) -> httpx.AsyncClient:
+    cfg = UPSTREAMS.get(upstream, _DEFAULT_POOL)
+    limits = httpx.Limits(
+        max_connections=cfg.max_connections,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry,
+    )
+    logger.info(
+        "http client created for upstream=%s (max_conn=%d, keepalive=%d, http2=%s)",
+        upstream, cfg.max_connections, cfg.max_keepalive_connections,
+        cfg.http2 and HTTP2_AVAILABLE,
+    )
+    return httpx.AsyncClient(
+        limits=limits,
+        http2=cfg.http2 and HTTP2_AVAILABLE,
+        follow_redirects=cfg.follow_redirects,
+        cookies=None if cfg.store_cookies else _no_cookie_jar(),
+    )
+
+
+def get_http_client(upstream: str) -> httpx.AsyncClient:
+    """return the shared client for upstream on the running event loop.
+
+    must be called from inside a coroutine. do not use it as a context
+    manager — the registry owns the client's lifetime.
+    """
+    loop = asyncio.get_running_loop()
+    key = (upstream, id(loop))
+
+    entry = _clients.get(key)
+    if entry is not None:
+        owner, client = entry
+        if owner is loop and not client.is_closed:
+            return client
+
+    client = _build_client(upstream)
+    _clients[key] = (loop, client)
+    _prune_closed_loops()
+    return client
+
+
+def _prune_closed_loops() -> None:
+    """drop entries whose loop has been closed (their sockets are already gone)."""
+    for key, (loop, _client) in list(_clients.items()):
+        if loop.is_closed():
+            del _clients[key]
+
+
+async def close_http_clients() -> None:
+    """close every client owned by the running loop. called on app shutdown."""
+    loop = asyncio.get_running_loop()
+    for key, (owner, client) in list(_clients.items()):
+        if owner is not loop:
+            continue
+        del _clients[key]
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.warning("failed to close http client for %s: %s", key[0], e)
+
+
+def active_clients() -> int:
+    """number of live pooled clients across all loops."""
+    return len(_clients)
+
+
+def reset_http_clients() -> None:
+    """forget every client without closing — useful for tests."""
+    _clients.clear()
+
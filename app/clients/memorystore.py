@@ -117,6 +117,136 @@ async def safe_set(key: str, value: bytes, ex: int) -> bool:
         return False
 
 
+async def safe_mget_with_ttl(keys: list[str]) -> list[tuple[Optional[bytes], Optional[float]]]:
+    """
+    (value, remaining TTL in seconds) per key in one pipelined round trip
+    (GET + PTTL). the TTL is None when the key is missing or never expires.
+    all (None, None) on any error or if disabled.
+    """
+    if not keys:
+        return []
+    misses: list[tuple[Optional[bytes], Optional[float]]] = [(None, None)] * len(keys)
+    if _circuit_is_open():
+        return misses
+
+    client = get_redis_client()
+    if client is None:
+        return misses
+
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key in keys:
+            pipe.get(key)
+            pipe.pttl(key)
+        replies = await pipe.execute()
+        _record_success()
+    except Exception as e:
+        _record_failure()
+        logger.warning("redis GET/PTTL failed for %d key(s): %s", len(keys), e)
+        return misses
+
+    return [
+        (value, pttl / 1000 if value is not None and pttl is not None and pttl >= 0 else None)
+        for value, pttl in zip(replies[0::2], replies[1::2])
+    ]
+
+
+async def safe_mset(items: list[tuple[str, bytes]], ex: int) -> bool:
+    """set many values with TTL in one pipelined round trip. returns False on any error or if disabled."""
+    if not items:
+        return True
+    if _circuit_is_open():
+        return False
+
+    client = get_redis_client()
+    if client is None:
+        return False
+
+    try:
+        pipe = client.pipeline(transaction=False)
+        for key, value in items:
+            pipe.set(key, value, ex=ex)
+        await pipe.execute()
+        _record_success()
+        return True
+    except Exception as e:
+        _record_failure()
+        logger.warning("redis pipelined SET failed for %d key(s): %s", len(items), e)
+        return False
+
+
+# prune expired leases, then add this one if the live leases leave room.
+# members are "<lease id>:<weight>" scored by their expiry (redis clock, ms)
+_LEASE_ACQUIRE_SCRIPT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+local used = 0
+for _, member in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    used = used + tonumber(string.match(member, ':(%d+)$'))
+end
+local weight = tonumber(ARGV[2])
+if used + weight > tonumber(ARGV[3]) then
+    return 0
+end
+local lease_ms = tonumber(ARGV[4])
+redis.call('ZADD', KEYS[1], now + lease_ms, ARGV[1] .. ':' .. ARGV[2])
+if redis.call('PTTL', KEYS[1]) < lease_ms then
+    redis.call('PEXPIRE', KEYS[1], lease_ms)
+end
+return 1
+"""
+
+
+async def safe_lease_acquire(
+    key: str, lease_id: str, weight: int, capacity: int, ttl: float,
+) -> Optional[bool]:
+    """
+    take a weight-unit lease on a shared capacity if the live leases leave room.
+
+    every holder has its own lease, expiring ttl seconds after it was taken,
+    so units held by a crashed worker come back on their own while other
+    holders keep theirs. returns whether the lease was taken, None on any
+    error or if disabled.
+    """
+    if _circuit_is_open():
+        return None
+
+    client = get_redis_client()
+    if client is None:
+        return None
+
+    try:
+        taken = await client.eval(
+            _LEASE_ACQUIRE_SCRIPT, 1, key, lease_id, weight, capacity, int(ttl * 1000),
+        )
+        _record_success()
+        return bool(taken)
+    except Exception as e:
+        _record_failure()
+        logger.warning("redis lease acquire failed for key=%s: %s", key, e)
+        return None
+
+
+async def safe_lease_release(key: str, lease_id: str, weight: int) -> bool:
+    """give back a lease taken with safe_lease_acquire. False on any error or if disabled."""
+    if _circuit_is_open():
+        return False
+
+    client = get_redis_client()
+    if client is None:
+        return False
+
+    try:
+        await client.zrem(key, f"{lease_id}:{weight}")
+        _record_success()
+        return True
+    except Exception as e:
+        _record_failure()
+        logger.warning("redis lease release failed for key=%s: %s", key, e)
+        return False
+
+
 def reset_circuit_breaker() -> None:
     """reset circuit breaker state — useful for tests."""
     global _consecutive_failures, _circuit_open_until
@@ -0,0 +1,207 @@
+"""
+content cache for scraped pages, keyed by canonical URL.
+
+viral links are shared thousands of times and each Apify actor run costs
+seconds to minutes (and money), so successful scrapeGenericUrl results are
+cached per canonical URL with per-platform TTLs. storage is zlib-compressed
+JSON in Redis (GCP Memorystore) when configured, otherwise a bounded
+in-process LRU.
+
+entries scraped over plain HTTP keep their ETag/Last-Modified validators and
+are retained past their freshness window so callers can revalidate them with
+a conditional request instead of re-downloading and re-parsing the page.
+"""
+
+import json
+import logging
+import os
+import time
+import zlib
+from collections import OrderedDict
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.clients.memorystore import get_redis_client, safe_get, safe_set
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "page_content:v1"
+
+# freshness per platform (minutes). social posts gain comments/edits quickly,
+# news articles and generic pages change slowly.
+PLATFORM_TTL_MINUTES: dict[str, int] = {
+    "facebook": 180,
+    "instagram": 180,
+    "twitter": 60,
+    "tiktok": 180,
+    "g1": 720,
+    "estadao": 720,
+    "folha": 720,
+    "aosfatos": 1440,
+    "generic": 360,
+}
+_DEFAULT_TTL_MINUTES = 360
+
+# entries with validators are kept this many times longer than their
+# freshness window so they can be revalidated instead of re-scraped
+_REVALIDATION_RETENTION_FACTOR = 4
+
+# query parameters that never change page content, on any site (besides utm_*)
+_TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "mc_cid", "mc_eid"}
+
+# social platforms the cache targets: their mobile mirrors (m., mobile.)
+# serve the same post, and these share parameters don't change it. on other
+# sites an m. host or a ref/feature parameter may well be a different page
+_SOCIAL_HOSTS = ("facebook.com", "instagram.com", "twitter.com", "x.com", "tiktok.com")
+_SOCIAL_TRACKING_PARAMS = {
+    "igsh", "mibextid", "si", "ref", "ref_src", "ref_url", "__tn__", "feature", "share_id",
+}
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+_LOCAL_MAX_ENTRIES = 512
+
+
+def canonicalize_url(url: str) -> str:
+    """normalize a URL so shares of the same page map to one cache key.
+
+    lowercases scheme/host, drops default ports, fragments, tracking
+    parameters (utm_*, fbclid, ...) and trailing slashes, and sorts the
+    remaining query parameters. social platform urls also lose their mobile
+    host prefix and share parameters.
+    """
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "https").lower()
+    host = (parts.hostname or "").lower()
+    desktop = host.split(".", 1)[1] if host.startswith(("m.", "mobile.")) else host
+    social = any(desktop == h or desktop.endswith("." + h) for h in _SOCIAL_HOSTS)
+    if social:
+        host = desktop
+    dropped = _TRACKING_PARAMS | _SOCIAL_TRACKING_PARAMS if social else _TRACKING_PARAMS
+    port = parts.port
+    netloc = host if port is None or _DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in dropped
+    ]
+    query.sort()
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def build_page_cache_key(url: str) -> str:
+    return f"{_KEY_PREFIX}:{canonicalize_url(url)}"
+
+
+def get_ttl_seconds(platform: str) -> int:
+    """freshness window for a platform; PAGE_CACHE_TTL_MINUTES overrides all."""
+    override = os.getenv("PAGE_CACHE_TTL_MINUTES", "").strip()
+    minutes = int(override) if override else PLATFORM_TTL_MINUTES.get(platform, _DEFAULT_TTL_MINUTES)
+    return max(minutes, 1) * 60
+
+
+def is_enabled() -> bool:
+    return os.getenv("PAGE_CACHE_ENABLED", "true").strip().lower() not in ("0", "false", "no")
+
+
+# ── entry helpers ─────────────────────────────────────────────────────
+
+def is_fresh(entry: dict) -> bool:
+    return time.time() < entry.get("fresh_until", 0)
+
+
+def can_revalidate(entry: dict) -> bool:
+    return bool(entry.get("etag") or entry.get("last_modified"))
+
+
+def make_entry(result: dict, platform: str) -> dict:
+    """wrap a successful scrape result with freshness and validator info."""
+    metadata = result.get("metadata") or {}
+    return {
+        "result": result,
+        "platform": platform,
+        "fresh_until": time.time() + get_ttl_seconds(platform),
+        "etag": metadata.get("etag"),
+        "last_modified": metadata.get("last_modified"),
+    }
+
+
+def serialize(entry: dict) -> bytes:
+    """json + zlib compress."""
+    raw = json.dumps(entry, separators=(",", ":"), ensure_ascii=False)
+    return zlib.compress(raw.encode("utf-8"), level=6)
+
+
+def deserialize(data: bytes) -> Optional[dict]:
+    """zlib decompress + json parse. returns None on corruption."""
+    try:
+        entry = json.loads(zlib.decompress(data))
+    except Exception:
+        logger.warning("page cache deserialization failed, treating as miss")
+        return None
+    return entry if isinstance(entry, dict) and "result" in entry else None
+
+
+# ── storage ──────────────────────────────────────────────────────────
+
+# local fallback when redis is not configured: key → (expires_at, compressed entry)
+_local: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+
+
+def _local_get(key: str) -> Optional[bytes]:
+    item = _local.get(key)
+    if item is None:
+        return None
+    expires_at, data = item
+    if time.time() >= expires_at:
+        del _local[key]
+        return None
+    _local.move_to_end(key)
+    return data
+
+
+def _local_set(key: str, data: bytes, ex: int) -> None:
+    _local[key] = (time.time() + ex, data)
+    _local.move_to_end(key)
+    while len(_local) > _LOCAL_MAX_ENTRIES:
+        _local.popitem(last=False)
+
+
+def reset_local_cache() -> None:
+    """clear the in-process backend — useful for tests."""
+    _local.clear()
+
+
+async def get_page_entry(url: str) -> Optional[dict]:
+    """cached entry for url (fresh or revalidatable), or None."""
+    if not is_enabled():
+        return None
+    key = build_page_cache_key(url)
+    if get_redis_client() is not None:
+        data = await safe_get(key)
+    else:
+        data = _local_get(key)
+    if data is None:
+        logger.debug("page cache MISS for key=%s", key)
+        return None
+    return deserialize(data)
+
+
+async def store_page_entry(url: str, entry: dict) -> bool:
+    """best-effort store. returns False on any error or if disabled."""
+    if not is_enabled():
+        return False
+    key = build_page_cache_key(url)
+    ttl = get_ttl_seconds(entry.get("platform", "generic"))
+    if can_revalidate(entry):
+        ttl *= _REVALIDATION_RETENTION_FACTOR
+    data = serialize(entry)
+    if get_redis_client() is not None:
+        return await safe_set(key, data, ex=ttl)
+    _local_set(key, data, ttl)
+    return True
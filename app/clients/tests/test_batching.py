@@ -0,0 +1,114 @@
+"""
+tests for batching: window coalescing, early flush at max_batch, key
+dedup, result fan-out, error propagation and waiter cancellation.
+"""
+
+import asyncio
+
+import pytest
+
+from app.clients.batching import (
+    MicroBatcher,
+    get_batcher,
+    get_batching_stats,
+    reset_batchers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    reset_batchers()
+    yield
+    reset_batchers()
+
+
+def _recording_batch():
+    calls: list[list[str]] = []
+
+    async def run_batch(keys):
+        calls.append(list(keys))
+        return {k: f"result:{k}" for k in keys if k != "missing"}
+
+    return calls, run_batch
+
+
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_concurrent_keys_share_one_batch(self):
+        calls, run_batch = _recording_batch()
+        batcher = MicroBatcher("t", run_batch, window=0.05)
+
+        results = await asyncio.gather(*(batcher.submit(k) for k in ("a", "b", "c")))
+
+        assert results == ["result:a", "result:b", "result:c"]
+        assert calls == [["a", "b", "c"]]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_run_once(self):
+        calls, run_batch = _recording_batch()
+        batcher = MicroBatcher("t", run_batch, window=0.05)
+
+        results = await asyncio.gather(batcher.submit("a"), batcher.submit("a"))
+
+        assert results == ["result:a", "result:a"]
+        assert calls == [["a"]]
+
+    @pytest.mark.asyncio
+    async def test_flushes_early_at_max_batch(self):
+        calls, run_batch = _recording_batch()
+        batcher = MicroBatcher("t", run_batch, window=10.0, max_batch=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b")), timeout=1.0
+        )
+
+        assert results == ["result:a", "result:b"]
+        assert calls == [["a", "b"]]
+
+    @pytest.mark.asyncio
+    async def test_missing_key_resolves_to_none(self):
+        _calls, run_batch = _recording_batch()
+        batcher = MicroBatcher("t", run_batch, window=0.01)
+
+        assert await batcher.submit("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_waiter(self):
+        async def run_batch(keys):
+            raise RuntimeError("actor run failed")
+
+        batcher = MicroBatcher("t", run_batch, window=0.01)
+        results = await asyncio.gather(
+            batcher.submit("a"), batcher.submit("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_batch(self):
+        calls, run_batch = _recording_batch()
+        batcher = MicroBatcher("t", run_batch, window=0.05)
+
+        first = asyncio.ensure_future(batcher.submit("a"))
+        second = asyncio.ensure_future(batcher.submit("a"))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "result:a"
+        assert first.cancelled()
+        assert calls == [["a"]]
+
+
+class TestRegistry:
+    @pytest.mark.asyncio
+    async def test_get_batcher_reuses_instance_and_reports_stats(self):
+        _calls, run_batch = _recording_batch()
+        batcher = get_batcher("apify:test", run_batch, window=0.01)
+        assert get_batcher("apify:test", run_batch) is batcher
+
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+        stats = get_batching_stats()["apify:test"]
+        assert stats["batches"] == 1
+        assert stats["keys_run"] == 2
+        assert stats["avg_batch"] == 2.0
@@ -0,0 +1,140 @@
+"""
+tests for fact_check_cache: key building, serialization, negative caching,
+and cached_fact_check_search integration with mock redis.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from app.clients.fact_check_cache import (
+    build_fact_check_cache_key,
+    serialize,
+    deserialize,
+    cached_fact_check_search,
+    _get_ttl_seconds,
+    _get_negative_ttl_seconds,
+)
+
+
+@pytest.fixture
+def sample_response():
+    return {
+        "claims": [
+            {
+                "text": "vacina altera DNA",
+                "claimReview": [
+                    {
+                        "url": "https://lupa.uol.com.br/check",
+                        "title": "Vacina não altera DNA",
+                        "publisher": {"name": "Lupa"},
+                        "textualRating": "Falso",
+                    }
+                ],
+            }
+        ]
+    }
+
+
+# ── build_fact_check_cache_key ───────────────────────────────────────
+
+class TestBuildFactCheckCacheKey:
+    def test_own_namespace(self):
+        assert build_fact_check_cache_key("vacina").startswith("fact_check:v1:")
+
+    def test_normalized_queries_share_key(self):
+        assert build_fact_check_cache_key("  Vacina   Altera DNA ") == build_fact_check_cache_key("vacina altera dna")
+
+    def test_long_query_is_hashed(self):
+        key = build_fact_check_cache_key("palavra " * 50)
+        assert len(key.split(":")[-1]) == 64
+
+
+# ── serialize / deserialize ──────────────────────────────────────────
+
+class TestSerialization:
+    def test_roundtrip(self, sample_response):
+        assert deserialize(serialize(sample_response)) == sample_response
+
+    def test_corrupted_data_returns_none(self):
+        assert deserialize(b"not zlib") is None
+
+
+# ── TTLs ─────────────────────────────────────────────────────────────
+
+class TestTtl:
+    def test_negative_ttl_is_shorter_by_default(self, monkeypatch):
+        monkeypatch.delenv("FACT_CHECK_CACHE_TTL_MINUTES", raising=False)
+        monkeypatch.delenv("FACT_CHECK_NEGATIVE_CACHE_TTL_MINUTES", raising=False)
+        assert _get_negative_ttl_seconds() < _get_ttl_seconds()
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("FACT_CHECK_NEGATIVE_CACHE_TTL_MINUTES", "5")
+        assert _get_negative_ttl_seconds() == 300
+
+
+# ── cached_fact_check_search ─────────────────────────────────────────
+
+class TestCachedFactCheckSearch:
+    @pytest.mark.asyncio
+    @patch("app.clients.fact_check_cache.safe_set", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.fact_check_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    async def test_miss_calls_original_and_stores(self, mock_get, mock_set, sample_response, monkeypatch):
+        monkeypatch.delenv("FACT_CHECK_CACHE_TTL_MINUTES", raising=False)
+        fetch = AsyncMock(return_value=sample_response)
+
+        result = await cached_fact_check_search("vacina", original_search_fn=fetch)
+
+        assert result == sample_response
+        fetch.assert_called_once_with("vacina")
+        mock_set.assert_called_once()
+        assert mock_set.call_args.kwargs["ex"] == _get_ttl_seconds()
+
+    @pytest.mark.asyncio
+    @patch("app.clients.fact_check_cache.safe_set", new_callable=AsyncMock)
+    @patch("app.clients.fact_check_cache.safe_get", new_callable=AsyncMock)
+    async def test_hit_skips_original(self, mock_get, mock_set, sample_response):
+        mock_get.return_value = serialize(sample_response)
+        fetch = AsyncMock()
+
+        result = await cached_fact_check_search("vacina", original_search_fn=fetch)
+
+        assert result == sample_response
+        fetch.assert_not_called()
+        mock_set.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.clients.fact_check_cache.safe_set", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.fact_check_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    async def test_empty_response_cached_with_negative_ttl(self, mock_get, mock_set, monkeypatch):
+        monkeypatch.delenv("FACT_CHECK_NEGATIVE_CACHE_TTL_MINUTES", raising=False)
+        fetch = AsyncMock(return_value={})
+
+        result = await cached_fact_check_search("boato novo", original_search_fn=fetch)
+
+        assert result == {}
+        assert mock_set.call_args.kwargs["ex"] == _get_negative_ttl_seconds()
+
+    @pytest.mark.asyncio
+    @patch("app.clients.fact_check_cache.safe_set", new_callable=AsyncMock)
+    @patch("app.clients.fact_check_cache.safe_get", new_callable=AsyncMock)
+    async def test_negative_hit_returns_empty(self, mock_get, mock_set):
+        mock_get.return_value = serialize({})
+        fetch = AsyncMock()
+
+        result = await cached_fact_check_search("boato novo", original_search_fn=fetch)
+
+        assert result == {}
+        fetch.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch("app.clients.fact_check_cache.safe_set", new_callable=AsyncMock)
+    @patch("app.clients.fact_check_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    async def test_errors_propagate_and_are_not_cached(self, mock_get, mock_set):
+        fetch = AsyncMock(side_effect=httpx.TimeoutException("timeout"))
+
+        with pytest.raises(httpx.TimeoutException):
+            await cached_fact_check_search("vacina", original_search_fn=fetch)
+
+        mock_set.assert_not_called()
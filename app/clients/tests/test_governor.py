@@ -0,0 +1,228 @@
+"""
+tests for governor: per-upstream concurrency budget, FIFO queueing with
+deadlines, token bucket, redis-shared capacity, and stats.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.clients.governor import (
+    BUDGETS,
+    GovernorTimeout,
+    get_budget,
+    get_governor_stats,
+    governed,
+    reset_governors,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    for var in (
+        "GOVERNOR_SHARED", "GOVERNOR_TEST_MAX_CONCURRENT", "GOVERNOR_TEST_RATE",
+        "GOVERNOR_TEST_BURST", "GOVERNOR_APIFY_MAX_CONCURRENT", "WEB_CONCURRENCY",
+    ):
+        monkeypatch.delenv(var, raising=False)
+    reset_governors()
+    yield
+    reset_governors()
+
+
+# ── get_budget ───────────────────────────────────────────────────────
+
+class TestGetBudget:
+    def test_known_upstream_uses_table(self):
+        assert get_budget("search_server") == BUDGETS["search_server"]
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "3")
+        monkeypatch.setenv("GOVERNOR_TEST_RATE", "2.5")
+        budget = get_budget("test")
+        assert budget.max_concurrent == 3
+        assert budget.rate_per_second == 2.5
+
+    def test_invalid_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "lots")
+        assert get_budget("test").max_concurrent == get_budget("unknown").max_concurrent
+
+    def test_shared_capacity_off_by_default(self, monkeypatch):
+        assert get_budget("apify").shared_capacity == 0
+        monkeypatch.setenv("GOVERNOR_SHARED", "1")
+        assert get_budget("apify").shared_capacity == BUDGETS["apify"].shared_capacity
+
+    def test_shared_plan_split_between_workers(self, monkeypatch):
+        plan = BUDGETS["apify"].shared_capacity
+        assert get_budget("apify").max_concurrent == plan
+        monkeypatch.setenv("WEB_CONCURRENCY", "7")
+        assert get_budget("apify").max_concurrent == plan // 7
+
+
+# ── concurrency + queueing ───────────────────────────────────────────
+
+class TestGoverned:
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "2")
+        active = 0
+        peak = 0
+
+        async def call():
+            nonlocal active, peak
+            async with governed("test"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.02)
+                active -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+        assert peak == 2
+        stats = get_governor_stats()["test"]
+        assert stats["admitted"] == 6
+        assert stats["in_use"] == 0
+        assert stats["max_queue_depth"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_fifo_order(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "1")
+        order = []
+
+        async def call(i):
+            async with governed("test"):
+                order.append(i)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(call(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_weighted_units(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "4")
+        async with governed("test", weight=3):
+            with pytest.raises(GovernorTimeout):
+                async with governed("test", weight=2, timeout=0.02):
+                    pass
+            async with governed("test", weight=1, timeout=0.02):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_a_timeout_error(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "1")
+        async with governed("test"):
+            with pytest.raises(asyncio.TimeoutError):
+                async with governed("test", timeout=0.01):
+                    pass
+        assert get_governor_stats()["test"]["timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_capacity(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "1")
+
+        async def waiter():
+            async with governed("test"):
+                pass
+
+        async with governed("test"):
+            task = asyncio.create_task(waiter())
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        async with governed("test", timeout=0.01):
+            pass
+        assert get_governor_stats()["test"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_releases_on_exception(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_MAX_CONCURRENT", "1")
+        with pytest.raises(ValueError):
+            async with governed("test"):
+                raise ValueError("boom")
+        async with governed("test", timeout=0.01):
+            pass
+
+
+# ── token bucket ─────────────────────────────────────────────────────
+
+class TestRateLimit:
+    @pytest.mark.asyncio
+    async def test_rate_spaces_calls(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_RATE", "50")
+        monkeypatch.setenv("GOVERNOR_TEST_BURST", "1")
+        start = time.monotonic()
+        for _ in range(4):
+            async with governed("test"):
+                pass
+        # first call uses the burst token, the other 3 wait ~20ms each
+        assert time.monotonic() - start >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_rate_rejects_past_deadline(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_TEST_RATE", "1")
+        monkeypatch.setenv("GOVERNOR_TEST_BURST", "1")
+        async with governed("test"):
+            pass
+        with pytest.raises(GovernorTimeout):
+            async with governed("test", timeout=0.05):
+                pass
+
+
+# ── shared capacity (redis) ──────────────────────────────────────────
+
+class _FakeLeases:
+    """in-memory stand-in for the redis lease set."""
+
+    def __init__(self, used: int = 0):
+        self.used = used
+        self.leases: dict[str, int] = {}
+
+    async def acquire(self, key, lease_id, weight, capacity, ttl):
+        if self.used + sum(self.leases.values()) + weight > capacity:
+            return False
+        self.leases[lease_id] = weight
+        return True
+
+    async def release(self, key, lease_id, weight):
+        assert self.leases.pop(lease_id) == weight
+        return True
+
+
+class TestSharedCapacity:
+    @pytest.mark.asyncio
+    async def test_leases_and_releases_in_redis(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_SHARED", "1")
+        leases = _FakeLeases()
+
+        with patch("app.clients.governor.safe_lease_acquire", side_effect=leases.acquire), \
+             patch("app.clients.governor.safe_lease_release", side_effect=leases.release):
+            async with governed("apify", weight=512):
+                assert list(leases.leases.values()) == [512]
+        assert leases.leases == {}
+
+    @pytest.mark.asyncio
+    async def test_waits_while_cluster_is_full(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_SHARED", "1")
+        leases = _FakeLeases(used=BUDGETS["apify"].shared_capacity)
+
+        with patch("app.clients.governor.safe_lease_acquire", side_effect=leases.acquire), \
+             patch("app.clients.governor.safe_lease_release", side_effect=leases.release) as mock_release:
+            with pytest.raises(GovernorTimeout):
+                async with governed("apify", weight=256, timeout=0.05):
+                    pass
+        # nothing was leased, so nothing is released; the local units were handed back
+        mock_release.assert_not_called()
+        assert get_governor_stats()["apify"]["in_use"] == 0
+
+    @pytest.mark.asyncio
+    async def test_redis_unavailable_falls_back_to_local(self, monkeypatch):
+        monkeypatch.setenv("GOVERNOR_SHARED", "1")
+        with patch("app.clients.governor.safe_lease_acquire", new_callable=AsyncMock, return_value=None) as mock_acquire, \
+             patch("app.clients.governor.safe_lease_release", new_callable=AsyncMock) as mock_release:
+            async with governed("apify", weight=256):
+                pass
+        # only the lease attempt — nothing to release
+        mock_acquire.assert_awaited_once()
+        mock_release.assert_not_called()
@@ -0,0 +1,226 @@
+"""
+tests for hedging: latency quantiles, hedge trigger, first-wins with
+cancellation, error fallback, and the hedge budget.
+"""
+
+import asyncio
+
+import pytest
+
+from app.clients.hedging import (
+    Hedger,
+    LatencyTracker,
+    get_hedger,
+    get_hedging_stats,
+    reset_hedgers,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    reset_hedgers()
+    yield
+    reset_hedgers()
+
+
+def _warm(hedger: Hedger, seconds: float = 0.01, n: int = 20) -> None:
+    for _ in range(n):
+        hedger.tracker.record(seconds)
+
+
+# ── LatencyTracker ───────────────────────────────────────────────────
+
+class TestLatencyTracker:
+    def test_none_until_min_samples(self):
+        tracker = LatencyTracker(min_samples=5)
+        for _ in range(4):
+            tracker.record(1.0)
+        assert tracker.quantile(0.95) is None
+        tracker.record(1.0)
+        assert tracker.quantile(0.95) == 1.0
+
+    def test_nearest_rank_quantiles(self):
+        tracker = LatencyTracker(min_samples=1)
+        for i in range(1, 101):
+            tracker.record(float(i))
+        assert tracker.quantile(0.5) == 50.0
+        assert tracker.quantile(0.95) == 95.0
+
+    def test_window_drops_old_samples(self):
+        tracker = LatencyTracker(window=3, min_samples=1)
+        for value in (10.0, 1.0, 1.0, 1.0):
+            tracker.record(value)
+        assert tracker.quantile(1.0) == 1.0
+
+
+# ── Hedger.run ───────────────────────────────────────────────────────
+
+class TestHedger:
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_data(self):
+        hedger = Hedger("test", min_delay=0.0)
+        calls = 0
+
+        async def call():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        assert await hedger.run(call) == "ok"
+        assert calls == 1
+        assert hedger.hedges == 0
+        assert len(hedger.tracker) == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.05)
+
+        async def call():
+            return "fast"
+
+        assert await hedger.run(call) == "fast"
+        assert hedger.hedges == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_backup_and_is_cancelled(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.01)
+        attempts = []
+        cancelled = []
+
+        async def call():
+            attempt = len(attempts)
+            attempts.append(attempt)
+            try:
+                await asyncio.sleep(1.0 if attempt == 0 else 0.01)
+            except asyncio.CancelledError:
+                cancelled.append(attempt)
+                raise
+            return f"attempt-{attempt}"
+
+        assert await hedger.run(call) == "attempt-1"
+        await asyncio.sleep(0)
+        assert hedger.hedges == 1
+        assert hedger.hedge_wins == 1
+        assert cancelled == [0]
+
+    @pytest.mark.asyncio
+    async def test_failed_backup_waits_for_primary(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.01)
+        attempts = []
+
+        async def call():
+            attempt = len(attempts)
+            attempts.append(attempt)
+            if attempt == 1:
+                raise RuntimeError("backup failed")
+            await asyncio.sleep(0.05)
+            return "primary"
+
+        assert await hedger.run(call) == "primary"
+
+    @pytest.mark.asyncio
+    async def test_both_failed_raises_primary_error(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.01)
+        attempts = []
+
+        async def call():
+            attempt = len(attempts)
+            attempts.append(attempt)
+            await asyncio.sleep(0.03 if attempt == 0 else 0.0)
+            raise ValueError(f"attempt-{attempt}")
+
+        with pytest.raises(ValueError, match="attempt-0"):
+            await hedger.run(call)
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_caps_hedge_rate(self):
+        hedger = Hedger("test", min_delay=0.0, max_hedge_ratio=0.1)
+        _warm(hedger, 0.001, n=200)
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "slow"
+
+        for _ in range(20):
+            await hedger.run(call)
+
+        # initial token + 0.1 per call
+        assert hedger.hedges <= 3
+        assert hedger.calls == 20
+
+
+    @pytest.mark.asyncio
+    async def test_timeout_bounds_primary_and_backup_together(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.05)
+
+        async def call():
+            await asyncio.sleep(1.0)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await hedger.run(call, timeout=0.15)
+        assert hedger.hedges == 1
+        assert loop.time() - started < 0.5
+
+    @pytest.mark.asyncio
+    async def test_latency_is_timed_inside_the_slot(self):
+        hedger = Hedger("test", min_delay=0.0, min_samples=1)
+        gate = asyncio.Lock()
+
+        class _Slot:
+            async def __aenter__(self):
+                await gate.acquire()
+
+            async def __aexit__(self, *exc):
+                gate.release()
+
+        async def call():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        await gate.acquire()
+        run = asyncio.ensure_future(hedger.run(call, slot=_Slot))
+        await asyncio.sleep(0.2)  # queued for the slot, not upstream latency
+        gate.release()
+
+        assert await run == "ok"
+        assert hedger.tracker.quantile(1.0) < 0.1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_primary_latency_is_recorded(self):
+        hedger = Hedger("test", min_delay=0.0)
+        _warm(hedger, 0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(None)
+            await asyncio.sleep(1.0 if len(attempts) == 1 else 0.05)
+            return "ok"
+
+        await hedger.run(call)
+        await asyncio.sleep(0)
+        # the primary's elapsed time, not the backup's 0.05s
+        assert len(hedger.tracker) == 21
+        assert hedger.tracker.quantile(1.0) >= 0.05
+
+
+# ── registry ─────────────────────────────────────────────────────────
+
+class TestRegistry:
+    def test_same_name_same_hedger(self):
+        assert get_hedger("a") is get_hedger("a")
+        assert get_hedger("a") is not get_hedger("b")
+
+    def test_stats_per_endpoint(self):
+        hedger = get_hedger("search", min_samples=1)
+        hedger.tracker.record(0.2)
+        stats = get_hedging_stats()["search"]
+        assert stats["samples"] == 1
+        assert stats["p95_ms"] == 200.0
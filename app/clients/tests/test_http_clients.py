@@ -0,0 +1,109 @@
+"""
+tests for http_pool: per-upstream shared clients, event-loop binding,
+and shutdown.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.clients.http_pool import (
+    UPSTREAMS,
+    active_clients,
+    close_http_clients,
+    get_http_client,
+    reset_http_clients,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+    reset_http_clients()
+    yield
+    reset_http_clients()
+
+
+class TestGetHttpClient:
+    @pytest.mark.asyncio
+    async def test_same_upstream_returns_same_client(self):
+        a = get_http_client("search_server")
+        b = get_http_client("search_server")
+        assert a is b
+        assert isinstance(a, httpx.AsyncClient)
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_different_upstreams_get_separate_clients(self):
+        a = get_http_client("search_server")
+        b = get_http_client("fact_check_api")
+        assert a is not b
+        assert active_clients() == 2
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_scraping_client_follows_redirects(self):
+        assert UPSTREAMS["scraping"].follow_redirects is True
+        assert get_http_client("scraping").follow_redirects is True
+        assert get_http_client("search_server").follow_redirects is False
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_scraping_client_keeps_no_cookies(self):
+        def set_cookie(client: httpx.AsyncClient) -> None:
+            request = httpx.Request("GET", "https://example.com/page")
+            response = httpx.Response(200, headers={"set-cookie": "session=abc; Path=/"}, request=request)
+            client.cookies.extract_cookies(response)
+
+        scraping = get_http_client("scraping")
+        set_cookie(scraping)
+        assert dict(scraping.cookies) == {}
+
+        search = get_http_client("search_server")
+        set_cookie(search)
+        assert dict(search.cookies) == {"session": "abc"}
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_unknown_upstream_uses_default_pool(self):
+        client = get_http_client("somewhere_else")
+        assert isinstance(client, httpx.AsyncClient)
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        first = get_http_client("serper")
+        await first.aclose()
+        second = get_http_client("serper")
+        assert second is not first
+        await close_http_clients()
+
+    def test_new_event_loop_gets_new_client(self):
+        async def _grab():
+            return get_http_client("google_search")
+
+        loop_a = asyncio.new_event_loop()
+        loop_b = asyncio.new_event_loop()
+        try:
+            a = loop_a.run_until_complete(_grab())
+            b = loop_b.run_until_complete(_grab())
+            assert a is not b
+        finally:
+            loop_a.run_until_complete(close_http_clients())
+            loop_b.run_until_complete(close_http_clients())
+            loop_a.close()
+            loop_b.close()
+
+    def test_requires_running_loop(self):
+        with pytest.raises(RuntimeError):
+            get_http_client("search_server")
+
+
+class TestCloseHttpClients:
+    @pytest.mark.asyncio
+    async def test_closes_and_forgets_clients(self):
+        client = get_http_client("analytics")
+        await close_http_clients()
+        assert client.is_closed
+        assert active_clients() == 0
+
@@ -1,5 +1,6 @@
 """
-tests for memorystore: singleton client, safe_get/safe_set,
+tests for memorystore: singleton client, safe_get/safe_set, batched mget/mset,
+get with remaining TTL,
 and circuit breaker behavior.
 """
 
@@ -13,6 +14,10 @@ from app.clients.memorystore import (
     get_redis_client,
     safe_get,
     safe_set,
+    safe_mget_with_ttl,
+    safe_mset,
+    safe_lease_acquire,
+    safe_lease_release,
     reset_circuit_breaker,
     reset_client,
     _record_failure,
@@ -293,6 +298,137 @@ class TestSafeSet:
         mock_client.set.assert_not_called()
 
 
+# ── safe_mget_with_ttl / safe_mset ───────────────────────────────────
+
+class TestSafeMgetWithTtl:
+    @pytest.mark.asyncio
+    async def test_returns_misses_when_no_host(self, monkeypatch):
+        monkeypatch.delenv("REDIS_HOST", raising=False)
+        assert await safe_mget_with_ttl([]) == []
+        assert await safe_mget_with_ttl(["a"]) == [(None, None)]
+
+    @pytest.mark.asyncio
+    async def test_pipelines_get_and_pttl_per_key(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"1", 2500, None, -2, b"3", -1])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+        memorystore._redis_client = client
+
+        assert await safe_mget_with_ttl(["a", "b", "c"]) == [(b"1", 2.5), (None, None), (b"3", None)]
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.get.call_count == 3
+        pipe.pttl.assert_any_call("a")
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_misses_and_records_failure_on_exception(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=TimeoutError("timed out"))
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+        memorystore._redis_client = client
+
+        assert await safe_mget_with_ttl(["a", "b"]) == [(None, None), (None, None)]
+        assert memorystore._consecutive_failures == 1
+
+
+class TestSafeMset:
+    @staticmethod
+    def _client_with_pipeline(execute_side_effect=None):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=execute_side_effect)
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+        return client, pipe
+
+    @pytest.mark.asyncio
+    async def test_returns_false_when_no_host(self, monkeypatch):
+        monkeypatch.delenv("REDIS_HOST", raising=False)
+        assert await safe_mset([("a", b"1")], ex=60) is False
+
+    @pytest.mark.asyncio
+    async def test_pipelines_all_sets_in_one_execute(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client, pipe = self._client_with_pipeline()
+        memorystore._redis_client = client
+
+        result = await safe_mset([("a", b"1"), ("b", b"2")], ex=120)
+        assert result is True
+        client.pipeline.assert_called_once_with(transaction=False)
+        assert pipe.set.call_count == 2
+        pipe.set.assert_any_call("a", b"1", ex=120)
+        pipe.set.assert_any_call("b", b"2", ex=120)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_returns_false_and_records_failure_on_exception(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client, _ = self._client_with_pipeline(ConnectionError("refused"))
+        memorystore._redis_client = client
+
+        assert await safe_mset([("a", b"1")], ex=60) is False
+        assert memorystore._consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_call_when_circuit_open(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client, _ = self._client_with_pipeline()
+        memorystore._redis_client = client
+
+        for _ in range(_FAILURE_THRESHOLD):
+            _record_failure()
+
+        assert await safe_mset([("a", b"1")], ex=60) is False
+        client.pipeline.assert_not_called()
+
+
+# ── safe_lease_acquire / safe_lease_release ──────────────────────────
+
+class TestSafeLeases:
+    @pytest.mark.asyncio
+    async def test_returns_none_when_no_host(self, monkeypatch):
+        monkeypatch.delenv("REDIS_HOST", raising=False)
+        assert await safe_lease_acquire("k", "lease", 1, 10, ttl=60) is None
+        assert await safe_lease_release("k", "lease", 1) is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_runs_the_lease_script(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client = AsyncMock()
+        client.eval.return_value = 1
+        memorystore._redis_client = client
+
+        assert await safe_lease_acquire("k", "lease", 512, 8192, ttl=600) is True
+        script, numkeys, *args = client.eval.call_args.args
+        assert "ZREMRANGEBYSCORE" in script
+        assert (numkeys, *args) == (1, "k", "lease", 512, 8192, 600_000)
+
+        client.eval.return_value = 0
+        assert await safe_lease_acquire("k", "lease", 512, 8192, ttl=600) is False
+
+    @pytest.mark.asyncio
+    async def test_release_removes_only_its_own_lease(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client = AsyncMock()
+        memorystore._redis_client = client
+
+        assert await safe_lease_release("k", "lease", 512) is True
+        client.zrem.assert_awaited_once_with("k", "lease:512")
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_exception(self, monkeypatch):
+        monkeypatch.setenv("REDIS_HOST", "localhost")
+        client = AsyncMock()
+        client.eval.side_effect = ConnectionError("refused")
+        memorystore._redis_client = client
+
+        assert await safe_lease_acquire("k", "lease", 1, 10, ttl=60) is None
+        assert memorystore._consecutive_failures == 1
+
+
 # ── circuit breaker + safe_get/safe_set integration ──────────────────
 
 class TestCircuitBreakerIntegration:
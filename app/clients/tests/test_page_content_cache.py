@@ -0,0 +1,172 @@
+"""
+tests for page_content_cache: URL canonicalization, TTLs, local backend,
+and scrapeGenericUrl cache-through with conditional revalidation.
+"""
+
+import time
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.clients.page_content_cache import (
+    build_page_cache_key,
+    canonicalize_url,
+    get_page_entry,
+    get_ttl_seconds,
+    make_entry,
+    reset_local_cache,
+    serialize,
+    deserialize,
+    store_page_entry,
+)
+from app.ai.context.web.apify_utils import scrapeGenericUrl
+
+
+@pytest.fixture(autouse=True)
+def _clean_state(monkeypatch):
+    monkeypatch.delenv("REDIS_HOST", raising=False)
+    monkeypatch.delenv("PAGE_CACHE_TTL_MINUTES", raising=False)
+    monkeypatch.delenv("PAGE_CACHE_ENABLED", raising=False)
+    reset_local_cache()
+    yield
+    reset_local_cache()
+
+
+def _ok(content="conteudo da pagina " * 10, **metadata):
+    return {"success": True, "content": content, "metadata": metadata, "error": None}
+
+
+# ── canonicalize_url ─────────────────────────────────────────────────
+
+class TestCanonicalizeUrl:
+    def test_strips_tracking_params_and_fragment(self):
+        assert (
+            canonicalize_url("https://Example.com/a/?utm_source=wa&id=3&fbclid=x#top")
+            == "https://example.com/a?id=3"
+        )
+
+    def test_sorts_query_and_drops_default_port(self):
+        assert canonicalize_url("https://example.com:443/p?b=2&a=1") == "https://example.com/p?a=1&b=2"
+
+    def test_mobile_host_maps_to_main_host(self):
+        assert canonicalize_url("https://m.facebook.com/post/1") == canonicalize_url("https://facebook.com/post/1")
+
+    def test_social_only_normalization_leaves_other_sites_alone(self):
+        assert canonicalize_url("https://m.uol.com.br/x") == "https://m.uol.com.br/x"
+        assert canonicalize_url("https://news.com/a?ref=home") == "https://news.com/a?ref=home"
+        assert canonicalize_url("https://www.instagram.com/p/1?igsh=abc") == "https://www.instagram.com/p/1"
+        assert canonicalize_url("https://mobile.x.com/u/status/1?ref_src=twsrc") == "https://x.com/u/status/1"
+
+    def test_shares_of_same_page_share_key(self):
+        assert build_page_cache_key("https://g1.globo.com/x.ghtml?utm_medium=share") == build_page_cache_key(
+            "https://g1.globo.com/x.ghtml"
+        )
+
+
+# ── ttl / serialization ──────────────────────────────────────────────
+
+class TestTtlAndSerialization:
+    def test_social_posts_expire_sooner_than_news(self):
+        assert get_ttl_seconds("twitter") < get_ttl_seconds("g1")
+
+    def test_env_override(self, monkeypatch):
+        monkeypatch.setenv("PAGE_CACHE_TTL_MINUTES", "2")
+        assert get_ttl_seconds("aosfatos") == 120
+
+    def test_roundtrip(self):
+        entry = make_entry(_ok(etag='"abc"'), "generic")
+        assert deserialize(serialize(entry)) == entry
+
+    def test_corrupted_returns_none(self):
+        assert deserialize(b"garbage") is None
+
+
+# ── local backend ────────────────────────────────────────────────────
+
+class TestLocalBackend:
+    @pytest.mark.asyncio
+    async def test_store_and_get(self):
+        await store_page_entry("https://example.com/a", make_entry(_ok(), "generic"))
+        entry = await get_page_entry("https://example.com/a?utm_source=x")
+        assert entry is not None
+        assert entry["result"]["success"] is True
+
+    @pytest.mark.asyncio
+    async def test_disabled(self, monkeypatch):
+        monkeypatch.setenv("PAGE_CACHE_ENABLED", "false")
+        assert await store_page_entry("https://example.com/a", make_entry(_ok(), "generic")) is False
+        assert await get_page_entry("https://example.com/a") is None
+
+
+# ── scrapeGenericUrl cache-through ───────────────────────────────────
+
+class TestScrapeGenericUrlCache:
+    @pytest.mark.asyncio
+    async def test_second_call_served_from_cache(self):
+        with patch(
+            "app.ai.context.web.apify_utils.scrapeFacebookPost",
+            new_callable=AsyncMock, return_value=_ok(platform="facebook"),
+        ) as mock_fb:
+            first = await scrapeGenericUrl("https://www.facebook.com/post/123?fbclid=a")
+            second = await scrapeGenericUrl("https://www.facebook.com/post/123?fbclid=b")
+
+        assert mock_fb.await_count == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        failed = {"success": False, "content": "", "metadata": {}, "error": "boom"}
+        with patch(
+            "app.ai.context.web.apify_utils.scrapeFacebookPost",
+            new_callable=AsyncMock, return_value=failed,
+        ) as mock_fb:
+            await scrapeGenericUrl("https://www.facebook.com/post/123")
+            await scrapeGenericUrl("https://www.facebook.com/post/123")
+
+        assert mock_fb.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_result_respects_max_chars(self):
+        with patch(
+            "app.ai.context.web.apify_utils.scrapeFacebookPost",
+            new_callable=AsyncMock, return_value=_ok(content="a" * 100),
+        ):
+            await scrapeGenericUrl("https://www.facebook.com/post/1")
+            short = await scrapeGenericUrl("https://www.facebook.com/post/1", maxChars=10)
+
+        assert short["content"] == "a" * 10
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_revalidated_with_304(self):
+        url = "https://example.com/artigo"
+        entry = make_entry(_ok(scraping_method="simple_http", etag='"v1"'), "generic")
+        entry["fresh_until"] = time.time() - 1
+        await store_page_entry(url, entry)
+
+        not_modified = {"success": True, "not_modified": True, "content": "", "metadata": {}, "error": None}
+        with patch(
+            "app.ai.context.web.apify_utils.scrapeGenericSimple",
+            new_callable=AsyncMock, return_value=not_modified,
+        ) as mock_simple:
+            result = await scrapeGenericUrl(url)
+
+        assert mock_simple.call_args.kwargs["etag"] == '"v1"'
+        assert result["content"] == entry["result"]["content"]
+        refreshed = await get_page_entry(url)
+        assert refreshed["fresh_until"] > time.time()
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_replaced_when_modified(self):
+        url = "https://example.com/artigo"
+        entry = make_entry(_ok(content="antigo " * 20, etag='"v1"'), "generic")
+        entry["fresh_until"] = time.time() - 1
+        await store_page_entry(url, entry)
+
+        with patch(
+            "app.ai.context.web.apify_utils.scrapeGenericSimple",
+            new_callable=AsyncMock, return_value=_ok(content="novo " * 20, etag='"v2"'),
+        ):
+            result = await scrapeGenericUrl(url)
+
+        assert result["content"].startswith("novo")
+        assert (await get_page_entry(url))["etag"] == '"v2"'
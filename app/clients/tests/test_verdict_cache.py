@@ -0,0 +1,109 @@
+"""
+tests for verdict_cache: key building, serialization and
+get/store integration with mock redis.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.clients.verdict_cache import (
+    build_verdict_cache_key,
+    serialize_response,
+    deserialize_response,
+    get_cached_verdict,
+    store_verdict,
+)
+from app.models.api import (
+    AnalysisResponse,
+    ContentItem,
+    ContentType,
+    DeepFakeResult,
+    DeepFakeVerificationResult,
+    Request,
+)
+
+
+def _request(text: str, content_type: ContentType = ContentType.TEXT, deep_fake=None) -> Request:
+    return Request(
+        content=[ContentItem(textContent=text, type=content_type)],
+        deep_fake_verification_result=deep_fake,
+    )
+
+
+def _response(msg_id: str = "abc") -> AnalysisResponse:
+    return AnalysisResponse(
+        message_id=msg_id,
+        rationale="Notícia falsa [1].",
+        responseWithoutLinks="Notícia falsa.",
+    )
+
+
+# ── build_verdict_cache_key ──────────────────────────────────────────
+
+class TestBuildVerdictCacheKey:
+    def test_prefix(self):
+        assert build_verdict_cache_key(_request("claim")).startswith("verdict:v1:")
+
+    def test_identical_requests_same_key(self):
+        assert build_verdict_cache_key(_request("Vacina causa X")) == build_verdict_cache_key(_request("Vacina causa X"))
+
+    def test_whitespace_and_case_normalized(self):
+        k1 = build_verdict_cache_key(_request("  Vacina   causa\nX "))
+        k2 = build_verdict_cache_key(_request("vacina causa x"))
+        assert k1 == k2
+
+    def test_different_text_different_key(self):
+        assert build_verdict_cache_key(_request("claim a")) != build_verdict_cache_key(_request("claim b"))
+
+    def test_content_type_is_part_of_key(self):
+        k1 = build_verdict_cache_key(_request("same", ContentType.TEXT))
+        k2 = build_verdict_cache_key(_request("same", ContentType.AUDIO))
+        assert k1 != k2
+
+    def test_deep_fake_result_is_part_of_key(self):
+        df = DeepFakeVerificationResult(results=[DeepFakeResult(
+            label="fake", score=0.9, model_used="m", media_type="video", processing_time_ms=1.0,
+        )])
+        assert build_verdict_cache_key(_request("same")) != build_verdict_cache_key(_request("same", deep_fake=df))
+
+
+# ── serialize / deserialize ──────────────────────────────────────────
+
+class TestSerialization:
+    def test_roundtrip(self):
+        response = _response()
+        assert deserialize_response(serialize_response(response)) == response
+
+    def test_corrupted_data_returns_none(self):
+        assert deserialize_response(b"not valid zlib data") is None
+
+
+# ── get_cached_verdict / store_verdict ───────────────────────────────
+
+class TestCacheIntegration:
+    @pytest.mark.asyncio
+    async def test_miss_returns_none(self):
+        with patch("app.clients.verdict_cache.safe_get", new_callable=AsyncMock, return_value=None):
+            assert await get_cached_verdict("verdict:v1:x") is None
+
+    @pytest.mark.asyncio
+    async def test_hit_returns_response(self):
+        stored = serialize_response(_response("original"))
+        with patch("app.clients.verdict_cache.safe_get", new_callable=AsyncMock, return_value=stored):
+            cached = await get_cached_verdict("verdict:v1:x")
+        assert cached.message_id == "original"
+
+    @pytest.mark.asyncio
+    async def test_store_uses_ttl_from_env(self, monkeypatch):
+        monkeypatch.setenv("VERDICT_CACHE_TTL_MINUTES", "5")
+        with patch("app.clients.verdict_cache.safe_set", new_callable=AsyncMock, return_value=True) as mock_set:
+            assert await store_verdict("verdict:v1:x", _response())
+        assert mock_set.call_args.kwargs["ex"] == 300
+
+    @pytest.mark.asyncio
+    async def test_store_falls_back_on_invalid_ttl(self, monkeypatch):
+        monkeypatch.setenv("VERDICT_CACHE_TTL_MINUTES", "half an hour")
+        with patch("app.clients.verdict_cache.safe_set", new_callable=AsyncMock, return_value=True) as mock_set:
+            assert await store_verdict("verdict:v1:x", _response())
+        assert mock_set.call_args.kwargs["ex"] == 30 * 60
@@ -4,6 +4,7 @@ and cached_custom_search integration with mock redis.
 """
 
 import json
+import time
 import zlib
 from unittest.mock import AsyncMock, patch
 
@@ -16,9 +17,23 @@ from app.clients.web_search_cache import (
     serialize,
     deserialize,
     cached_custom_search,
+    cached_custom_search_many,
+    SearchRequest,
+    get_cache_stats,
+    reset_l1_cache,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clean_l1(monkeypatch):
+    """each test starts with an empty in-process tier and default limits."""
+    for var in ("WEB_SEARCH_L1_TTL_SECONDS", "WEB_SEARCH_L1_MAX_BYTES", "WEB_SEARCH_CACHE_TTL_MINUTES"):
+        monkeypatch.delenv(var, raising=False)
+    reset_l1_cache()
+    yield
+    reset_l1_cache()
+
+
 # ── normalize_query ──────────────────────────────────────────────────
 
 class TestNormalizeQuery:
@@ -151,8 +166,8 @@ def mock_search_fn(sample_results):
 
 class TestCachedCustomSearch:
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock, return_value=None)
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
     async def test_cache_miss_calls_original(self, mock_set, mock_get, mock_search_fn, sample_results):
         result = await cached_custom_search(
             "test query", num=10, domains=None, timeout=15.0,
@@ -163,11 +178,11 @@ class TestCachedCustomSearch:
         mock_set.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock)
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
     async def test_cache_hit_skips_original(self, mock_get, mock_set, mock_search_fn, sample_results):
         # simulate cached compressed data
-        mock_get.return_value = serialize(sample_results)
+        mock_get.return_value = [(serialize(sample_results), 3600.0)]
 
         result = await cached_custom_search(
             "test query", num=10, domains=None, timeout=15.0,
@@ -178,10 +193,10 @@ class TestCachedCustomSearch:
         mock_set.assert_not_called()
 
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock, return_value=True)
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
     async def test_redis_unavailable_on_get_falls_through(self, mock_get, mock_set, mock_search_fn, sample_results):
-        # safe_get returns None (redis unavailable) — should call original
+        # safe_mget_with_ttl returns no value (redis unavailable) — should call original
         result = await cached_custom_search(
             "test query", num=10, domains=None, timeout=15.0,
             original_search_fn=mock_search_fn,
@@ -190,10 +205,10 @@ class TestCachedCustomSearch:
         mock_search_fn.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock, return_value=False)
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=False)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
     async def test_redis_error_on_set_still_returns_result(self, mock_get, mock_set, mock_search_fn, sample_results):
-        # safe_set returns False (redis error) — result should still be returned
+        # safe_mset returns False (redis error) — result should still be returned
         result = await cached_custom_search(
             "test query", num=10, domains=None, timeout=15.0,
             original_search_fn=mock_search_fn,
@@ -201,11 +216,11 @@ class TestCachedCustomSearch:
         assert result == sample_results
 
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock)
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
     async def test_corrupted_cache_treated_as_miss(self, mock_get, mock_set, mock_search_fn, sample_results):
         # return corrupted data — should fall through to original
-        mock_get.return_value = b"corrupted data"
+        mock_get.return_value = [(b"corrupted data", 3600.0)]
 
         result = await cached_custom_search(
             "test query", num=10, domains=None, timeout=15.0,
@@ -215,8 +230,8 @@ class TestCachedCustomSearch:
         mock_search_fn.assert_called_once()
 
     @pytest.mark.asyncio
-    @patch("app.clients.web_search_cache.safe_set", new_callable=AsyncMock, return_value=True)
-    @patch("app.clients.web_search_cache.safe_get", new_callable=AsyncMock, return_value=None)
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
     async def test_empty_results_not_cached(self, mock_get, mock_set):
         empty_fn = AsyncMock(return_value=[])
         result = await cached_custom_search(
@@ -225,3 +240,195 @@ class TestCachedCustomSearch:
         )
         assert result == []
         mock_set.assert_not_called()
+
+
+# ── L1 in-process tier ───────────────────────────────────────────────
+
+class TestL1Cache:
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
+    async def test_repeat_query_served_from_l1(self, mock_get, mock_set, mock_search_fn, sample_results):
+        for _ in range(3):
+            result = await cached_custom_search(
+                "Test  Query", num=10, domains=None, timeout=15.0,
+                original_search_fn=mock_search_fn,
+            )
+            assert result == sample_results
+
+        mock_search_fn.assert_called_once()
+        mock_get.assert_called_once()
+        stats = get_cache_stats()
+        assert stats["l1_hits"] == 2
+        assert stats["l1_misses"] == 1
+        assert stats["l2_misses"] == 1
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_l2_hit_promoted_to_l1(self, mock_get, mock_set, mock_search_fn, sample_results):
+        mock_get.return_value = [(serialize(sample_results), 3600.0)]
+
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+
+        mock_get.assert_called_once()
+        stats = get_cache_stats()
+        assert stats["l2_hits"] == 1
+        assert stats["l1_hits"] == 1
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_promoted_entry_expires_with_redis_copy(self, mock_get, mock_set, mock_search_fn, sample_results):
+        import app.clients.web_search_cache as wsc
+
+        mock_get.return_value = [(serialize(sample_results), 5.0)]
+        before = time.monotonic()
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+
+        (expires_at, _), = wsc._l1.values()
+        assert expires_at - before <= 5.0 + 1
+        assert wsc._get_l1_ttl_seconds() > 5
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=False)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
+    async def test_l1_works_while_redis_down(self, mock_get, mock_set, mock_search_fn):
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+        mock_search_fn.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
+    async def test_byte_budget_evicts_lru(self, mock_get, mock_set, mock_search_fn, sample_results, monkeypatch):
+        entry_size = len(serialize(sample_results))
+        monkeypatch.setenv("WEB_SEARCH_L1_MAX_BYTES", str(entry_size * 2))
+
+        for q in ("a", "b", "c"):
+            await cached_custom_search(q, num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+
+        stats = get_cache_stats()
+        assert stats["l1_entries"] == 2
+        assert stats["l1_bytes"] <= entry_size * 2
+
+        # "a" was evicted, so it goes back to the origin
+        await cached_custom_search("a", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+        assert mock_search_fn.call_count == 4
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock, return_value=[(None, None)])
+    async def test_expired_l1_entry_is_a_miss(self, mock_get, mock_set, mock_search_fn):
+        import app.clients.web_search_cache as wsc
+
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+        for key, (_, data) in list(wsc._l1.items()):
+            wsc._l1[key] = (0.0, data)
+        await cached_custom_search("q", num=10, domains=None, timeout=15.0, original_search_fn=mock_search_fn)
+
+        assert mock_search_fn.call_count == 2
+
+    def test_l1_ttl_capped_by_redis_ttl(self, monkeypatch):
+        from app.clients.web_search_cache import _get_l1_ttl_seconds
+
+        monkeypatch.setenv("WEB_SEARCH_CACHE_TTL_MINUTES", "1")
+        monkeypatch.setenv("WEB_SEARCH_L1_TTL_SECONDS", "600")
+        assert _get_l1_ttl_seconds() == 60
+
+
+# ── cached_custom_search_many (batched) ──────────────────────────────
+
+class TestCachedCustomSearchMany:
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_single_mget_and_only_misses_dispatched(
+        self, mock_mget, mock_mset, mock_search_fn, sample_results,
+    ):
+        searches = [
+            SearchRequest("hit", 10, None),
+            SearchRequest("miss", 10, ["a.com"]),
+        ]
+        mock_mget.return_value = [(serialize(sample_results), 3600.0), (None, None)]
+
+        results = await cached_custom_search_many(
+            searches, timeout=15.0, original_search_fn=mock_search_fn,
+        )
+
+        assert results == [sample_results, sample_results]
+        mock_mget.assert_awaited_once_with([
+            build_cache_key("hit", None),
+            build_cache_key("miss", ["a.com"]),
+        ])
+        mock_search_fn.assert_called_once_with("miss", num=10, domains=["a.com"], timeout=15.0)
+        mock_mset.assert_awaited_once()
+        stored = mock_mset.call_args.args[0]
+        assert [k for k, _ in stored] == [build_cache_key("miss", ["a.com"])]
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_l1_hits_skip_redis(self, mock_mget, mock_mset, mock_search_fn, sample_results):
+        mock_mget.side_effect = lambda keys: [(None, None)] * len(keys)
+        searches = [SearchRequest("q", 10, None), SearchRequest("q", 10, ["a.com"])]
+
+        await cached_custom_search_many(searches, timeout=15.0, original_search_fn=mock_search_fn)
+        await cached_custom_search_many(searches, timeout=15.0, original_search_fn=mock_search_fn)
+
+        assert mock_search_fn.call_count == 2
+        mock_mget.assert_awaited_once()
+        assert get_cache_stats()["l1_hits"] == 2
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_duplicate_keys_fetched_once(self, mock_mget, mock_mset, mock_search_fn, sample_results):
+        mock_mget.side_effect = lambda keys: [(None, None)] * len(keys)
+        searches = [SearchRequest("Same  Query", 10, None), SearchRequest("same query", 5, None)]
+
+        results = await cached_custom_search_many(
+            searches, timeout=15.0, original_search_fn=mock_search_fn,
+        )
+
+        assert results == [sample_results, sample_results]
+        mock_search_fn.assert_called_once()
+        assert mock_mget.call_args.args[0] == [build_cache_key("same query", None)]
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_errors_returned_per_search_and_not_cached(
+        self, mock_mget, mock_mset, sample_results,
+    ):
+        mock_mget.side_effect = lambda keys: [(None, None)] * len(keys)
+        error = RuntimeError("server down")
+
+        async def search_fn(query, *, num, domains, timeout):
+            if query == "bad":
+                raise error
+            return sample_results
+
+        results = await cached_custom_search_many(
+            [SearchRequest("good", 10, None), SearchRequest("bad", 10, None)],
+            timeout=15.0, original_search_fn=search_fn,
+        )
+
+        assert results == [sample_results, error]
+        stored = mock_mset.call_args.args[0]
+        assert [k for k, _ in stored] == [build_cache_key("good", None)]
+
+    @pytest.mark.asyncio
+    @patch("app.clients.web_search_cache.safe_mset", new_callable=AsyncMock, return_value=True)
+    @patch("app.clients.web_search_cache.safe_mget_with_ttl", new_callable=AsyncMock)
+    async def test_empty_results_not_cached(self, mock_mget, mock_mset):
+        mock_mget.side_effect = lambda keys: [(None, None)] * len(keys)
+        search_fn = AsyncMock(return_value=[])
+
+        results = await cached_custom_search_many(
+            [SearchRequest("q", 10, None)], timeout=15.0, original_search_fn=search_fn,
+        )
+
+        assert results == [[]]
+        mock_mset.assert_not_called()
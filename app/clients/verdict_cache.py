@@ -0,0 +1,82 @@
+"""
+caching layer for /text verdicts using Redis (GCP Memorystore).
+
+forwarded hoaxes arrive as identical payloads many times within minutes.
+the cache key is a hash of the sanitized, whitespace-normalized content
+(plus any deep-fake results, since they change the verdict), and the stored
+AnalysisResponse is zlib-compressed JSON.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import zlib
+from typing import Optional
+
+from app.clients.memorystore import safe_get, safe_set
+from app.clients.web_search_cache import normalize_query
+from app.models.api import AnalysisResponse, Request
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "verdict:v1"
+_DEFAULT_TTL_MINUTES = 30
+
+
+def build_verdict_cache_key(request: Request) -> str:
+    """build a deterministic redis key from a (sanitized) request."""
+    items = [
+        [item.type.value, normalize_query(item.textContent or "")]
+        for item in request.content
+    ]
+    payload: dict = {"content": items}
+    if request.deep_fake_verification_result:
+        payload["deep_fake"] = request.deep_fake_verification_result.model_dump(mode="json")
+
+    raw = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, sort_keys=True)
+    digest = hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return f"{_KEY_PREFIX}:{digest}"
+
+
+def serialize_response(response: AnalysisResponse) -> bytes:
+    """json + zlib compress."""
+    return zlib.compress(response.model_dump_json().encode("utf-8"), level=6)
+
+
+def deserialize_response(data: bytes) -> Optional[AnalysisResponse]:
+    """zlib decompress + validate. returns None on corruption."""
+    try:
+        return AnalysisResponse.model_validate_json(zlib.decompress(data))
+    except Exception:
+        logger.warning("verdict cache deserialization failed, treating as miss")
+        return None
+
+
+def _get_ttl_seconds() -> int:
+    """read TTL from env (in minutes), default 30."""
+    raw = os.getenv("VERDICT_CACHE_TTL_MINUTES", "").strip()
+    minutes = _DEFAULT_TTL_MINUTES
+    if raw:
+        try:
+            minutes = int(raw)
+        except ValueError:
+            logger.warning("invalid VERDICT_CACHE_TTL_MINUTES=%r, using %d", raw, _DEFAULT_TTL_MINUTES)
+    return max(minutes, 1) * 60
+
+
+async def get_cached_verdict(key: str) -> Optional[AnalysisResponse]:
+    """return the cached response for key, or None on miss/error."""
+    cached = await safe_get(key)
+    if cached is None:
+        logger.debug("verdict cache MISS for key=%s", key)
+        return None
+    response = deserialize_response(cached)
+    if response is not None:
+        logger.info("verdict cache HIT for key=%s", key)
+    return response
+
+
+async def store_verdict(key: str, response: AnalysisResponse) -> bool:
+    """best-effort cache store. returns False on any error or if disabled."""
+    return await safe_set(key, serialize_response(response), ex=_get_ttl_seconds())
@@ -3,17 +3,29 @@ caching layer for web search queries using Redis (GCP Memorystore).
 
 normalizes queries, builds deterministic cache keys, and stores results
 as zlib-compressed JSON to minimize memory usage.
+
+a bounded in-process L1 tier (LRU by bytes, short TTL) sits in front of
+redis so repeated queries on the same worker skip the network round trip,
+and keep hitting cache while the redis circuit breaker is open.
+
+cached_custom_search_many() resolves every search of a tool call together:
+one pipelined GET for all L1 misses, the remaining misses dispatched concurrently,
+and a single pipelined SET to write them back. cached_custom_search() is the
+single-query form of the same path.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import re
+import time
 import zlib
-from typing import Callable, Awaitable, Optional
+from collections import OrderedDict
+from typing import Callable, Awaitable, NamedTuple, Optional
 
-from app.clients.memorystore import safe_get, safe_set
+from app.clients.memorystore import safe_mget_with_ttl, safe_mset
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +84,167 @@ def _get_ttl_seconds() -> int:
     return max(minutes, 1) * 60
 
 
+def _get_l1_ttl_seconds() -> int:
+    """L1 TTL from env (in seconds), default 300, never longer than the redis TTL."""
+    seconds = int(os.getenv("WEB_SEARCH_L1_TTL_SECONDS", "300"))
+    return max(1, min(seconds, _get_ttl_seconds()))
+
+
+def _get_l1_max_bytes() -> int:
+    """L1 size limit from env (compressed bytes), default 8 MiB. 0 disables L1."""
+    return max(0, int(os.getenv("WEB_SEARCH_L1_MAX_BYTES", str(8 * 1024 * 1024))))
+
+
+# ── L1: in-process LRU/TTL tier ──────────────────────────────────────
+
+# key → (expires_at, compressed bytes); ordered oldest → most recently used
+_l1: "OrderedDict[str, tuple[float, bytes]]" = OrderedDict()
+_l1_bytes: int = 0
+
+_stats: dict[str, int] = {
+    "l1_hits": 0,
+    "l1_misses": 0,
+    "l2_hits": 0,
+    "l2_misses": 0,
+}
+
+
+def _l1_get(key: str) -> Optional[bytes]:
+    global _l1_bytes
+    item = _l1.get(key)
+    if item is None:
+        return None
+    expires_at, data = item
+    if time.monotonic() >= expires_at:
+        del _l1[key]
+        _l1_bytes -= len(data)
+        return None
+    _l1.move_to_end(key)
+    return data
+
+
+def _l1_set(key: str, data: bytes, ttl: Optional[float] = None) -> None:
+    """store data for the L1 TTL, or for ttl seconds when that is shorter."""
+    global _l1_bytes
+    max_bytes = _get_l1_max_bytes()
+    if len(data) > max_bytes:
+        return
+    previous = _l1.pop(key, None)
+    if previous is not None:
+        _l1_bytes -= len(previous[1])
+    l1_ttl = _get_l1_ttl_seconds() if ttl is None else min(_get_l1_ttl_seconds(), ttl)
+    _l1[key] = (time.monotonic() + l1_ttl, data)
+    _l1_bytes += len(data)
+    # evict least recently used until under the byte budget
+    while _l1_bytes > max_bytes and _l1:
+        _, (_, evicted) = _l1.popitem(last=False)
+        _l1_bytes -= len(evicted)
+
+
+def get_cache_stats() -> dict[str, int]:
+    """hit/miss counters per tier plus current L1 size."""
+    return {**_stats, "l1_entries": len(_l1), "l1_bytes": _l1_bytes}
+
+
+def reset_l1_cache() -> None:
+    """clear the L1 tier and counters — useful for tests."""
+    global _l1_bytes
+    _l1.clear()
+    _l1_bytes = 0
+    for name in _stats:
+        _stats[name] = 0
+
+
+class SearchRequest(NamedTuple):
+    """one search of a batch passed to cached_custom_search_many()."""
+    query: str
+    num: int
+    domains: list[str] | None
+
+
+async def cached_custom_search_many(
+    searches: list[SearchRequest],
+    *,
+    timeout: float,
+    original_search_fn: Callable[..., Awaitable[list[dict]]],
+) -> list[list[dict] | BaseException]:
+    """
+    batched cache-through wrapper for _custom_search().
+
+    checks L1 for every key, then fetches all L1 misses from redis with a
+    single pipelined GET + PTTL (promoted L2 hits keep their remaining
+    redis TTL in L1). only keys missing from both tiers are dispatched to
+    original_search_fn (concurrently, once per distinct key), and fresh
+    results are written back with one pipelined SET.
+
+    returns one entry per search, in order: the results, or the exception
+    raised by original_search_fn for that search.
+    """
+    keys = [build_cache_key(s.query, s.domains) for s in searches]
+    unique_keys = list(dict.fromkeys(keys))
+    resolved: dict[str, list[dict]] = {}
+
+    # try L1
+    for key in unique_keys:
+        cached = _l1_get(key)
+        results = deserialize(cached) if cached is not None else None
+        if results is not None:
+            _stats["l1_hits"] += 1
+            resolved[key] = results
+        else:
+            _stats["l1_misses"] += 1
+
+    # try L2 — one round trip for every L1 miss, none when L1 had them all
+    pending = [key for key in unique_keys if key not in resolved]
+    l2 = await safe_mget_with_ttl(pending) if pending else []
+    for key, (cached, remaining) in zip(pending, l2):
+        results = deserialize(cached) if cached is not None else None
+        if results is not None:
+            _stats["l2_hits"] += 1
+            _l1_set(key, cached, remaining)
+            resolved[key] = results
+        else:
+            _stats["l2_misses"] += 1
+
+    # cache miss — call original once per distinct key
+    to_fetch: dict[str, SearchRequest] = {}
+    for key, search in zip(keys, searches):
+        if key not in resolved:
+            to_fetch.setdefault(key, search)
+
+    errors: dict[str, BaseException] = {}
+    if to_fetch:
+        logger.debug(
+            "batched search: %d L1 hit(s), %d L2 hit(s), %d miss(es)",
+            len(unique_keys) - len(pending),
+            len(pending) - len(to_fetch),
+            len(to_fetch),
+        )
+        fetched = await asyncio.gather(
+            *(
+                original_search_fn(s.query, num=s.num, domains=s.domains, timeout=timeout)
+                for s in to_fetch.values()
+            ),
+            return_exceptions=True,
+        )
+
+        # best-effort cache store
+        to_store: list[tuple[str, bytes]] = []
+        for key, outcome in zip(to_fetch, fetched):
+            if isinstance(outcome, BaseException):
+                errors[key] = outcome
+                continue
+            resolved[key] = outcome
+            if outcome:
+                compressed = serialize(outcome)
+                _l1_set(key, compressed)
+                to_store.append((key, compressed))
+        if to_store:
+            await safe_mset(to_store, ex=_get_ttl_seconds())
+
+    return [resolved[key] if key in resolved else errors[key] for key in keys]
+
+
 async def cached_custom_search(
     query: str,
     *,
@@ -81,32 +254,17 @@ async def cached_custom_search(
     original_search_fn: Callable[..., Awaitable[list[dict]]],
 ) -> list[dict]:
     """
-    cache-through wrapper for _custom_search().
+    cache-through wrapper for a single _custom_search() call.
 
-    on cache hit returns deserialized results directly.
-    on miss calls original_search_fn and caches the result.
-    any redis error silently falls through to the original function.
+    a batch of one through cached_custom_search_many(), so both entry points
+    share the same L1 → L2 → original_search_fn path. re-raises the error
+    of original_search_fn, if any.
     """
-    key = build_cache_key(query, domains)
-
-    # try cache
-    cached = await safe_get(key)
-    if cached is not None:
-        results = deserialize(cached)
-        if results is not None:
-            logger.debug("cache HIT for key=%s (%d results)", key, len(results))
-            return results
-
-    # cache miss — call original
-    logger.debug("cache MISS for key=%s", key)
-    results = await original_search_fn(
-        query, num=num, domains=domains, timeout=timeout,
+    (outcome,) = await cached_custom_search_many(
+        [SearchRequest(query, num, domains)],
+        timeout=timeout,
+        original_search_fn=original_search_fn,
     )
-
-    # best-effort cache store
-    if results:
-        ttl = _get_ttl_seconds()
-        compressed = serialize(results)
-        await safe_set(key, compressed, ex=ttl)
-
-    return results
+    if isinstance(outcome, BaseException):
+        raise outcome
+    return outcome
@@ -1,5 +1,5 @@
 """custom llm helpers for the fact-checking pipeline."""
 
-from app.llms.vertex import make_vertex_chat
+from app.llms.vertex import clear_vertex_chat_registry, get_vertex_chat, make_vertex_chat
 
-__all__ = ["make_vertex_chat"]
+__all__ = ["make_vertex_chat", "get_vertex_chat", "clear_vertex_chat_registry"]
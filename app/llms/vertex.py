@@ -4,12 +4,17 @@ centralizes project/location/vertexai config so call sites stay compact.
 auth resolves automatically via GOOGLE_APPLICATION_CREDENTIALS (the SA JSON path).
 """
 
+import threading
 from typing import Any
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 
 from app.core.config import get_settings
 
+# process-wide client registry: (model, sorted kwargs) → client
+_chat_registry: dict[tuple, ChatGoogleGenerativeAI] = {}
+_registry_lock = threading.Lock()
+
 
 def make_vertex_chat(model: str, **kwargs: Any) -> ChatGoogleGenerativeAI:
     """build a ChatGoogleGenerativeAI in Vertex mode with project/location from settings.
@@ -26,3 +31,28 @@ def make_vertex_chat(model: str, **kwargs: Any) -> ChatGoogleGenerativeAI:
         location=settings.VERTEX_LOCATION,
         **kwargs,
     )
+
+
+def get_vertex_chat(model: str, **kwargs: Any) -> ChatGoogleGenerativeAI:
+    """return a shared client for (model, kwargs), creating it on first use.
+
+    reuses the underlying gRPC/auth channel across requests instead of
+    paying the setup cost per call. kwargs must be hashable.
+    """
+    key = (model, tuple(sorted(kwargs.items())))
+    client = _chat_registry.get(key)
+    if client is not None:
+        return client
+
+    with _registry_lock:
+        client = _chat_registry.get(key)
+        if client is None:
+            client = make_vertex_chat(model, **kwargs)
+            _chat_registry[key] = client
+    return client
+
+
+def clear_vertex_chat_registry() -> None:
+    """drop all cached clients — useful for tests and config reloads."""
+    with _registry_lock:
+        _chat_registry.clear()
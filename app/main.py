@@ -1,14 +1,33 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import scraping, research, text, test
+from app.agentic_ai.utils.link_expander import get_link_task_stats
+from app.ai.context.web.html_extract import shutdown_extraction_pool
+from app.clients.batching import get_batching_stats
+from app.clients.governor import get_governor_stats
+from app.clients.hedging import get_hedging_stats
+from app.clients.http_pool import close_http_clients
+from app.clients.web_search_cache import get_cache_stats
 from app.core.config import get_settings
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # pooled outbound http clients and the html extraction pool are created lazily on first use
+    yield
+    await close_http_clients()
+    shutdown_extraction_pool()
+
+
 app = FastAPI(
     title="Fake News Detector API - Web Scraping",
     description="API de Web Scraping com Apify integrado",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -33,3 +52,15 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/metrics")
+async def metrics():
+    """in-process counters of the outbound clients and background link tasks."""
+    return {
+        "search_cache": get_cache_stats(),
+        "governors": get_governor_stats(),
+        "hedging": get_hedging_stats(),
+        "batching": get_batching_stats(),
+        "link_tasks": get_link_task_stats(),
+    }
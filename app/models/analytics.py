@@ -127,6 +127,12 @@ class PipelineAnalytics(BaseModel):
     )
     ResponseByDataSource: list[DataSourceResponseAnalytics] = Field(default_factory=list,description="Judgment response by Data Source")
 
+    # near-duplicate sources collapsed before reaching the LLM
+    CollapsedSources: dict[str, list[str]] = Field(
+        default_factory=dict,
+        description="representative source url → urls of the near-duplicates collapsed into it"
+    )
+
     model_config = ConfigDict(
         json_encoders={
             datetime: lambda v: v.isoformat()
@@ -317,6 +317,8 @@ class AnalyticsCollector:
         fact_check_results: list,
         search_results: dict,
         scraped_pages: list,
+        source_numbers: dict | None = None,
+        collapsed_sources: dict | None = None,
     ) -> None:
         """
         populate analytics from graph output.
@@ -329,6 +331,8 @@ class AnalyticsCollector:
             fact_check_results: list of FactCheckApiContext entries
             search_results: dict mapping domain keys to list of GoogleSearchContext
             scraped_pages: list of WebScrapeContext entries
+            source_numbers: entry id → [N] used by adjudication, if numbered incrementally
+            collapsed_sources: representative url → near-duplicate urls collapsed into it
         """
         from app.agentic_ai.prompts.context_formatter import build_source_reference_list, filter_cited_references
 
@@ -339,6 +343,9 @@ class AnalyticsCollector:
             if entry.extraction_status == "success":
                 self.add_scraped_link(url=entry.url, success=True, text=entry.content)
 
+        if collapsed_sources:
+            self.analytics.CollapsedSources = dict(collapsed_sources)
+
         # b) adjudication output — fills ResponseByDataSource + ResponseByClaim + CommentAboutCompleteContext
         self.populate_from_adjudication(fact_check_result)
         self.populate_from_fact_check_result(fact_check_result)
@@ -356,7 +363,9 @@ class AnalyticsCollector:
             if entry.url not in _url_meta:
                 _url_meta[entry.url] = ("", "")
 
-        source_refs = build_source_reference_list(fact_check_results, search_results, scraped_pages)
+        source_refs = build_source_reference_list(
+            fact_check_results, search_results, scraped_pages, numbering=source_numbers,
+        )
 
         claim_index = 1
         for ds_idx, ds_result in enumerate(fact_check_result.results):
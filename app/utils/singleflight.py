@@ -0,0 +1,54 @@
+"""
+singleflight: collapses concurrent async calls with the same key into one execution.
+
+the first caller for a key starts the work as a task; callers arriving while
+it is still running await the same task. the task is shielded, so a cancelled
+caller never cancels the shared work for the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """worker-local in-flight map: key → shared asyncio.Task."""
+
+    def __init__(self, name: str = "singleflight"):
+        self.name = name
+        self._inflight: dict[str, asyncio.Task] = {}
+
+    def in_flight(self) -> int:
+        """number of keys currently being executed."""
+        return len(self._inflight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """run fn once per in-flight key. returns (result, shared).
+
+        shared is True when this caller joined an execution started by another.
+        exceptions raised by fn propagate to every caller.
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._on_done(key, t))
+        else:
+            logger.info(f"{self.name}: joining in-flight execution for key={key[:40]}")
+
+        return await asyncio.shield(task), shared
+
+    def _on_done(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,76 @@
+"""
+benchmark the generic html extraction engines on saved pages.
+
+compares the "soup" engine (BeautifulSoup html.parser tree + get_text) with
+the "fast" engine (single lxml streaming pass with early truncation) on every
+.html file in a directory, and reports per-page timings and how much of the
+text each engine returned.
+
+usage:
+    python scripts/benchmark_html_extract.py path/to/pages [--max-chars 10000] [--repeat 5]
+
+save pages with e.g. `curl -L -o pages/g1.html https://g1.globo.com/...`.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# allow imports from project root
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.ai.context.web.html_extract import extract_page
+
+ENGINES = ("soup", "fast")
+
+
+def _time_engine(content: bytes, engine: str, max_chars: int | None, repeat: int) -> tuple[float, dict]:
+    """median wall time in ms over `repeat` runs, plus the last result."""
+    timings = []
+    result: dict = {}
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = extract_page(content, "utf-8", max_chars, engine)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", type=Path, help="directory with saved .html pages")
+    parser.add_argument("--max-chars", type=int, default=None, help="truncate extracted text (enables early stop)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per page and engine (median is reported)")
+    args = parser.parse_args()
+
+    files = sorted(args.pages.glob("*.html"))
+    if not files:
+        print(f"no .html files in {args.pages}")
+        return 1
+
+    print(f"{'page':40} {'KB':>7} {'soup ms':>9} {'fast ms':>9} {'speedup':>8} {'soup chars':>11} {'fast chars':>11}")
+    totals = {engine: 0.0 for engine in ENGINES}
+    for path in files:
+        content = path.read_bytes()
+        row = {engine: _time_engine(content, engine, args.max_chars, args.repeat) for engine in ENGINES}
+        for engine in ENGINES:
+            totals[engine] += row[engine][0]
+
+        soup_ms, soup_result = row["soup"]
+        fast_ms, fast_result = row["fast"]
+        print(
+            f"{path.name[:40]:40} {len(content) / 1024:7.1f} {soup_ms:9.2f} {fast_ms:9.2f} "
+            f"{soup_ms / fast_ms if fast_ms else float('inf'):7.1f}x "
+            f"{len(soup_result['text']):11d} {len(fast_result['text']):11d}"
+        )
+
+    print(
+        f"\ntotal: soup {totals['soup']:.1f} ms, fast {totals['fast']:.1f} ms "
+        f"({totals['soup'] / totals['fast'] if totals['fast'] else float('inf'):.1f}x) over {len(files)} page(s)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())